@@ -6,6 +6,7 @@ Python package for interacting with Cloud OS (https://cloudos.lifebit.ai/)
 """
 
 from .clos import Cloudos
+from .clos_async import AsyncCloudos
 from ._version import __version__
 
-__all__ = ['jobs', 'utils', 'clos', 'queue', 'configure', 'datasets', 'import_wf', 'interactive_session']
+__all__ = ['jobs', 'utils', 'clos', 'clos_async', 'queue', 'configure', 'datasets', 'import_wf', 'interactive_session']
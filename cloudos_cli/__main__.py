@@ -11,7 +11,8 @@ from cloudos_cli.configure.configure import (
 from cloudos_cli.utils.cli_helpers import (
     custom_exception_handler,
     pass_debug_to_subcommands,
-    setup_debug
+    setup_debug,
+    setup_no_cache
 )
 
 # Import all command groups from their cli modules
@@ -26,6 +27,7 @@ from cloudos_cli.datasets.cli import datasets
 from cloudos_cli.configure.cli import configure
 from cloudos_cli.link.cli import link
 from cloudos_cli.interactive_session.cli import interactive_session
+from cloudos_cli.cache.cli import cache
 
 
 # Install the custom exception handler
@@ -35,6 +37,8 @@ sys.excepthook = custom_exception_handler
 @click.group(cls=pass_debug_to_subcommands())
 @click.option('--debug', is_flag=True, help='Show detailed error information and tracebacks',
               is_eager=True, expose_value=False, callback=setup_debug)
+@click.option('--no-cache', is_flag=True, help='Bypass the local metadata cache (~/.cloudos/cache)',
+              is_eager=True, expose_value=False, callback=setup_no_cache)
 @click.version_option(__version__)
 @click.pass_context
 def run_cloudos_cli(ctx):
@@ -65,6 +69,7 @@ run_cloudos_cli.add_command(datasets)
 run_cloudos_cli.add_command(configure)
 run_cloudos_cli.add_command(link)
 run_cloudos_cli.add_command(interactive_session)
+run_cloudos_cli.add_command(cache)
 
 if __name__ == '__main__':
     run_cloudos_cli()
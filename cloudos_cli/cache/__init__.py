@@ -0,0 +1 @@
+"""Local metadata cache CLI commands."""
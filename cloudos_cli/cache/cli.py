@@ -0,0 +1,25 @@
+"""CLI commands for the local metadata cache."""
+
+import rich_click as click
+from cloudos_cli.constants import CACHE_TTLS
+from cloudos_cli.utils.cache import get_cache
+from cloudos_cli.utils.cli_helpers import pass_debug_to_subcommands
+
+
+@click.group(cls=pass_debug_to_subcommands())
+def cache():
+    """Manage the local cache of Lifebit Platform metadata."""
+    print(cache.__doc__ + '\n')
+
+
+@cache.command('clear')
+@click.option('--resource',
+              help=('Only clear the cached entries of this resource type. ' +
+                    'By default, the whole cache is cleared.'),
+              type=click.Choice(sorted(CACHE_TTLS), case_sensitive=False),
+              default=None)
+def clear_cache(resource):
+    """Remove the cached project, workflow, queue, user and cloud metadata."""
+    local_cache = get_cache()
+    removed = local_cache.clear(resource)
+    click.secho(f'Removed {removed} cached entries from {local_cache.cache_dir}', fg='green', bold=True)
@@ -3,16 +3,440 @@ This is the main class of the package.
 """
 
 import requests
-import time
 import json
-from dataclasses import dataclass
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from cloudos_cli.utils.cloud import find_cloud
 from cloudos_cli.utils.errors import BadRequestException, JoBNotCompletedException, NotAuthorisedException, JobAccessDeniedException
-from cloudos_cli.utils.requests import retry_requests_get, retry_requests_post, retry_requests_put
+from cloudos_cli.utils.requests import retry_requests_get, retry_requests_post, retry_requests_put, ensure_pool_size
 import pandas as pd
+import numpy as np
 from cloudos_cli.utils.last_wf import youngest_workflow_id_by_name
+from cloudos_cli.utils.cache import get_cache, DiskCache
+from cloudos_cli.utils.polling import PollSchedule
+from cloudos_cli.utils.crawl import walk_tree
 from datetime import datetime, timezone
-from cloudos_cli.constants import JOB_COMPLETED, JOB_FAILED, JOB_ABORTED
+from cloudos_cli.constants import JOB_COMPLETED, JOB_FAILED, JOB_ABORTED, JOB_LIST_PREFETCH_WORKERS
+
+MODULE_GROUPS = ['system-tools',
+                 'data-factory-data-connection-etl',
+                 'data-factory',
+                 'data-factory-omics-etl',
+                 'drug-discovery',
+                 'data-factory-omics-insights',
+                 'intermediate'
+                 ]
+
+
+@dataclass
+class ResolvedWorkflow:
+    """A workflow looked up once and shared by every step of a submission.
+
+    Parameters
+    ----------
+    name : string
+        Name of the workflow.
+    last : bool
+        Whether the last imported workflow was selected when several
+        workflows share the same name.
+    content : dict
+        The workflow content, as returned by Cloudos.get_workflow_content.
+    """
+    name: str
+    last: bool
+    content: dict
+
+    def query(self, query):
+        """Return the values of a field for the workflows matching the name."""
+        return [wf.get(query) for wf in self.content.get("workflows", []) if wf.get("name") == self.name]
+
+    @property
+    def workflow_type(self):
+        """The workflow type: nextflow, wdl or docker."""
+        wt = list(dict.fromkeys(self.query("workflowType")))
+        if len(wt) > 1:
+            raise ValueError(f'More than one workflow type ("{wt}") detected for "{self.name}". ')
+        return str(wt[0])
+
+    @property
+    def is_module(self):
+        """Whether the workflow is a Lifebit Platform system module."""
+        return self.query("group")[0] in MODULE_GROUPS
+
+    def find_id(self, mainfile=None, importsfile=None, repository_platform='github'):
+        """Return the id of the workflow matching the given repository and files.
+
+        Parameters
+        ----------
+        mainfile : string
+            The name of the mainFile used by the workflow. Required for WDL
+            pipelines as different mainFiles could be loaded for a single pipeline.
+        importsfile : string
+            The name of the importsFile used by the workflow. Optional and only
+            used for WDL pipelines.
+        repository_platform : string
+            The name of the repository platform of the workflow resides.
+
+        Returns
+        -------
+        workflow_id : string
+            The Lifebit Platform workflow id.
+        """
+        for element in self.content["workflows"]:
+            if (element["name"] == self.name and element["workflowType"] == "docker" and
+                    not element["archived"]["status"]):
+                return element["_id"]  # no mainfile or importsfile
+            if (element["name"] == self.name and
+                    element["repository"]["platform"] == repository_platform and
+                    not element["archived"]["status"]):
+                if mainfile is None:
+                    return element["_id"]
+                elif element["mainFile"] == mainfile:
+                    if importsfile is None and "importsFile" not in element.keys():
+                        return element["_id"]
+                    elif "importsFile" in element.keys() and element["importsFile"] == importsfile:
+                        return element["_id"]
+        if mainfile is not None:
+            raise ValueError(f'A workflow named \'{self.name}\' with a mainFile \'{mainfile}\'' +
+                             f' and an importsFile \'{importsfile}\' was not found')
+        else:
+            raise ValueError(f'No {self.name} element in workflows was found')
+
+
+# Columns of the job list kept by Cloudos.process_job_list when not all fields are requested
+JOB_LIST_COLUMNS = ['status',
+                    'name',
+                    'project.name',
+                    'user.name',
+                    'user.surname',
+                    'workflow.name',
+                    '_id',
+                    'startTime',
+                    'endTime',
+                    'createdAt',
+                    'updatedAt',
+                    'revision.commit',
+                    'realInstancesExecutionCost',
+                    'masterInstance.usedInstance.type',
+                    'storageMode',
+                    'workflow.repository.url',
+                    'nextflowVersion',
+                    'batch.enabled',
+                    'storageSizeInGb',
+                    'batch.jobQueue',
+                    'usesFusionFileSystem'
+                    ]
+
+
+def _parse_time(value):
+    """Parse an ISO 8601 time from the API, or return None."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def job_runtime(job):
+    """Return the run time of a job in seconds, or None if it has not started.
+
+    Jobs still running are measured up to now.
+    """
+    start = _parse_time(job.get('startTime'))
+    if start is None:
+        return None
+    end = _parse_time(job.get('endTime')) or datetime.now(timezone.utc)
+    return (end - start).total_seconds()
+
+
+def job_cost(job):
+    """Return the cost of a job in the units shown by `job list`, or None if unknown.
+
+    This is the Cost column of `job list` (realInstancesExecutionCost), used
+    by the --min-cost/--max-cost filters both online and in the job index.
+    """
+    try:
+        return float(job.get('realInstancesExecutionCost')) / 100
+    except (TypeError, ValueError):
+        return None
+
+
+def job_matcher(queue_id=None, name_regex=None, min_cost=None, max_cost=None,
+                min_runtime=None, max_runtime=None):
+    """Build a predicate for the job filters that the API cannot apply.
+
+    Parameters
+    ----------
+    queue_id : string, optional
+        Keep only the jobs sent to this batch queue.
+    name_regex : string, optional
+        Keep only the jobs whose name matches this regular expression.
+    min_cost, max_cost : float, optional
+        Keep only the jobs whose cost, in the units shown by `job list`, is
+        within these bounds. Jobs without a cost are dropped.
+    min_runtime, max_runtime : float, optional
+        Keep only the jobs whose run time in seconds is within these bounds.
+        Jobs not started yet are dropped.
+
+    Returns
+    -------
+    callable or None
+        Function receiving a job dict and returning whether it matches, or
+        None when no filter is given.
+    """
+    checks = []
+    if queue_id:
+        def queue_matches(job):
+            # jobQueue is a dict like {"id": "...", "name": "...", ...}
+            job_queue = (job.get('batch') or {}).get('jobQueue', {})
+            job_queue_id = job_queue.get('id') if isinstance(job_queue, dict) else job_queue
+            return job_queue_id == queue_id
+        checks.append(queue_matches)
+    if name_regex:
+        try:
+            pattern = re.compile(name_regex)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression '{name_regex}'. {e}")
+        checks.append(lambda job: pattern.search(job.get('name') or '') is not None)
+    if min_cost is not None or max_cost is not None:
+        def cost_matches(job):
+            cost = job_cost(job)
+            if cost is None:
+                return False
+            return ((min_cost is None or cost >= min_cost) and
+                    (max_cost is None or cost <= max_cost))
+        checks.append(cost_matches)
+    if min_runtime is not None or max_runtime is not None:
+        def runtime_matches(job):
+            runtime = job_runtime(job)
+            return (runtime is not None and
+                    (min_runtime is None or runtime >= min_runtime) and
+                    (max_runtime is None or runtime <= max_runtime))
+        checks.append(runtime_matches)
+    if not checks:
+        return None
+    return lambda job: all(check(job) for check in checks)
+
+
+# Time strings as returned by the API. Other values are parsed one by one with
+# datetime.fromisoformat when formatting the job list.
+_ISO_TIME = (r'^(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})(?:\.(\d{3}|\d{6}))?'
+             r'(Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?$')
+
+
+def _objects(series):
+    """Return a Series of Python objects, with None for missing values."""
+    return pd.Series(series.to_numpy(dtype=object, na_value=None), index=series.index, dtype=object)
+
+
+def _is_text(series):
+    """Whether each value is a non-empty string."""
+    return series.map(lambda x: isinstance(x, str) and x != '', na_action='ignore').fillna(False).astype(bool)
+
+
+def _parse_iso_times(series):
+    """Vectorised datetime.fromisoformat for the time strings of the API.
+
+    Returns
+    -------
+    pandas.DataFrame
+        With the columns 'date' and 'time' (text of the wall-clock time),
+        'instant' (int64 nanoseconds since the epoch, in UTC for times
+        with an offset), 'aware' (whether the time has an offset), 'text'
+        (whether the value is a non-empty string) and 'parsed' (whether
+        the value was parsed here).
+    """
+    is_text = _is_text(series)
+    if is_text.any():
+        parts = series.where(is_text).str.extract(_ISO_TIME)
+    else:
+        parts = pd.DataFrame(np.nan, index=series.index, columns=range(4), dtype=object)
+    wall = pd.to_datetime(parts[0] + ' ' + parts[1], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    # Dates out of the nanosecond range are left to datetime.fromisoformat
+    parsed = wall.notna() & wall.dt.year.between(1700, 2200)
+    instant = wall.where(parsed, pd.Timestamp(0)).to_numpy(dtype='datetime64[ns]').astype('int64')
+    has_fraction = parts[2].notna().to_numpy()
+    if has_fraction.any():
+        instant[has_fraction] += parts[2][has_fraction].str.ljust(9, '0').astype('int64').to_numpy()
+    # Times from the API are in UTC ('Z'): only explicit offsets need shifting
+    has_offset = (parts[3].notna() & (parts[3] != 'Z')).to_numpy()
+    if has_offset.any():
+        offset = parts[3][has_offset]
+        minutes = offset.str[1:3].astype(int) * 60 + offset.str[4:6].astype(int)
+        instant[has_offset] -= (minutes * np.where(offset.str[0] == '-', -1, 1)).to_numpy() * 60 * 10**9
+    return pd.DataFrame({
+        'date': parts[0],
+        'time': parts[1],
+        'instant': instant,
+        'aware': parts[3].notna(),
+        'text': is_text,
+        'parsed': parsed
+    }, index=series.index)
+
+
+def _format_time(x):
+    """Format a single time value of the job list."""
+    if pd.notna(x) and isinstance(x, str) and x:
+        try:
+            return datetime.fromisoformat(x.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')
+        except (ValueError, TypeError):
+            return x  # Return original value if parsing fails
+    return None
+
+
+def _format_times(series, parsed):
+    """Format a time column of the job list as 'YYYY-mm-dd HH:MM:SS UTC'."""
+    formatted = _objects((parsed['date'] + ' ' + parsed['time'] + ' UTC').where(parsed['parsed']))
+    # Values that are not plain API time strings keep the per-value behaviour
+    other = parsed['text'] & ~parsed['parsed']
+    if other.any():
+        formatted[other] = series[other].map(_format_time)
+    return formatted
+
+
+def _format_cost(x):
+    """Format a single cost value of the job list."""
+    if pd.notna(x) and x != '' and x is not None:
+        try:
+            return f"{float(x) / 100:.4f}"
+        except (ValueError, TypeError):
+            return x  # Return original value if conversion fails
+    return None
+
+
+def _format_costs(series):
+    """Format the cost column of the job list (divided by 100, 4 decimals)."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        costs = series.astype(float) / 100
+        return _objects(costs.map('{:.4f}'.format, na_action='ignore'))
+    return _objects(series.map(_format_cost))
+
+
+def _format_runtime(start_time, end_time):
+    """Format the run time of a single job, as 'Hh Mm Ss'."""
+    try:
+        start_dt = datetime.fromisoformat(str(start_time).replace('Z', '+00:00'))
+        end_dt = datetime.fromisoformat(str(end_time).replace('Z', '+00:00'))
+        total_seconds = int((end_dt - start_dt).total_seconds())
+    except (ValueError, TypeError):
+        return None
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def _format_runtimes(start, end, start_parsed, end_parsed, index):
+    """Format the run time (endTime - startTime) of every job, as 'Hh Mm Ss'.
+
+    Times with and without an offset cannot be subtracted, so such jobs get
+    no run time, as with datetime objects.
+    """
+    start, end = start.reset_index(drop=True), end.reset_index(drop=True)
+    start_parsed, end_parsed = start_parsed.reset_index(drop=True), end_parsed.reset_index(drop=True)
+    both = start_parsed['text'] & end_parsed['text']
+    fast = both & start_parsed['parsed'] & end_parsed['parsed']
+    comparable = fast & (start_parsed['aware'] == end_parsed['aware'])
+
+    # int(timedelta.total_seconds()) truncates towards zero
+    duration = (end_parsed['instant'] - start_parsed['instant']).to_numpy()
+    total = np.where(duration >= 0, duration // 10**9, -(-duration // 10**9))
+    hours, minutes, seconds = total // 3600, (total % 3600) // 60, total % 60
+    h, m, s = (pd.Series(v).astype(str) for v in (hours, minutes, seconds))
+    text = np.select([hours > 0, minutes > 0],
+                     [h + 'h ' + m + 'm ' + s + 's', m + 'm ' + s + 's'],
+                     s + 's')
+    runtimes = pd.Series(np.where(comparable, text, None), dtype=object)
+    # Values that are not plain API time strings keep the per-value behaviour
+    other = both & ~fast
+    if other.any():
+        runtimes[other] = [_format_runtime(a, b) for a, b in zip(start[other], end[other])]
+    runtimes.index = index
+    return runtimes
+
+
+@dataclass
+class JobListQuery:
+    """Job list filters resolved to IDs once, shared by every page request.
+
+    Parameters
+    ----------
+    workspace_id : string
+        The Lifebit Platform workspace id.
+    params : dict
+        Server-side query parameters of /api/v2/jobs, without page and limit.
+    queue_id : string, optional
+        ID of the queue filter, which is applied client-side.
+    """
+    workspace_id: str
+    params: dict
+    queue_id: str = None
+
+
+@dataclass
+class JobSnapshot:
+    """The document of a job (/api/v1/jobs/{id}), fetched once and shared.
+
+    Parameters
+    ----------
+    job_id : string
+        The Lifebit Platform job id.
+    workspace_id : string
+        The Lifebit Platform workspace id the job was requested from.
+    response : requests.models.Response
+        The server response with the job document.
+    """
+    job_id: str
+    workspace_id: str
+    response: requests.models.Response
+    _document: dict = field(init=False, repr=False, compare=False, default=None)
+
+    @property
+    def document(self):
+        """The job document, parsed once."""
+        if self._document is None:
+            self._document = self.response.json()
+        return self._document
+
+    def get(self, key, default=None):
+        """Return a field of the job document."""
+        return self.document.get(key, default)
+
+    @property
+    def name(self):
+        return self.document.get("name")
+
+    @property
+    def status(self):
+        return self.document.get("status")
+
+    @property
+    def team(self):
+        return self.document.get("team")
+
+    @property
+    def logs(self):
+        return self.document.get("logs")
+
+    @property
+    def results(self):
+        return self.document.get("results")
+
+    @property
+    def work_directory(self):
+        return self.document.get("workDirectory")
+
+    @property
+    def analysis_results(self):
+        return self.document.get("analysisResults")
+
 
 @dataclass
 class Cloudos:
@@ -30,10 +454,15 @@ class Cloudos:
     cloudos_url: str
     apikey: str
     cromwell_token: str
+    _resolved_workflows: dict = field(init=False, repr=False, compare=False, default_factory=dict)
+    _job_snapshots: dict = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def get_job_status(self, j_id, workspace_id=None, verify=True):
         """Get job status from Lifebit Platform.
 
+        Always requests the job, and keeps the response as the job snapshot
+        returned by get_job_snapshot.
+
         Parameters
         ----------
         j_id : string
@@ -65,12 +494,55 @@ class Cloudos:
             self._handle_job_access_denied(j_id, workspace_id, verify)
         elif r.status_code >= 400:
             raise BadRequestException(r)
+        self._job_snapshots[(j_id, workspace_id)] = JobSnapshot(j_id, workspace_id, r)
         return r
 
+    def get_job_snapshot(self, j_id, workspace_id=None, verify=True, refresh=False):
+        """Get the document of a job, requesting it only once.
+
+        The job is requested on first use (or with `refresh`) and the same
+        snapshot is returned afterwards, until a call that changes the job
+        (abort, archive, deletion of results...) invalidates it.
+
+        Parameters
+        ----------
+        j_id : string
+            The Lifebit Platform job id.
+        workspace_id : string
+            The Lifebit Platform workspace id.
+        verify: [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        refresh : bool
+            Whether to request the job again.
+
+        Returns
+        -------
+        JobSnapshot
+            The job document and its accessors.
+        """
+        snapshot = self._job_snapshots.get((j_id, workspace_id))
+        if snapshot is None or refresh:
+            self.get_job_status(j_id, workspace_id, verify)
+            snapshot = self._job_snapshots[(j_id, workspace_id)]
+        return snapshot
+
+    def invalidate_job_snapshot(self, j_id=None):
+        """Forget the snapshot of a job (of every job if j_id is None)."""
+        if j_id is None:
+            self._job_snapshots.clear()
+            return
+        for key in [key for key in self._job_snapshots if key[0] == j_id]:
+            del self._job_snapshots[key]
+
     def wait_job_completion(self, job_id, workspace_id, wait_time=3600, request_interval=30, verbose=False,
-                            verify=True):
+                            verify=True, expected_runtime=None):
         """Checks job status from Lifebit Platform and wait for its complation.
 
+        Requests are spaced out with a PollSchedule: more often while the
+        job is initialising, less often during long running phases.
+
         Parameters
         ----------
         job_id : string
@@ -80,13 +552,17 @@ class Cloudos:
         wait_time : int
             Max time to wait (in seconds) to job completion.
         request_interval : int
-            Time interval (in seconds) to request job status.
+            Base time interval (in seconds) to request job status.
         verbose : bool
             Whether to output status on every request or not.
         verify: [bool|string]
             Whether to use SSL verification or not. Alternatively, if
             a string is passed, it will be interpreted as the path to
             the SSL certificate file.
+        expected_runtime : float, optional
+            Predicted time (in seconds) until the job ends, e.g. the median
+            run time of previous jobs of the same workflow. A status request
+            is then made around that time.
 
         Returns
         -------
@@ -94,16 +570,15 @@ class Cloudos:
             A dict with three elements collected from the job status: 'name', 'id', 'status'.
         """
         j_url = f'{self.cloudos_url}/app/advanced-analytics/analyses/{job_id}'
-        elapsed = 0
         j_status_h_old = ''
-        # make sure user doesn't surpass the wait time
-        if request_interval > wait_time:
-            request_interval = wait_time
-        while elapsed < wait_time:
+        schedule = PollSchedule(request_interval, timeout=wait_time,
+                                expected_duration=expected_runtime)
+        while not schedule.expired():
             j_status = self.get_job_status(job_id, workspace_id, verify)
             j_status_content = json.loads(j_status.content)
             j_status_h = j_status_content["status"]
             j_name = j_status_content["name"]
+            elapsed = round(schedule.elapsed())
             if j_status_h == JOB_COMPLETED:
                 if verbose:
                     print(f'\tYour job "{j_name}" (ID: {job_id}) took {elapsed} seconds to complete ' +
@@ -118,12 +593,11 @@ class Cloudos:
                     print(f'\tYour job "{j_name}" (ID: {job_id}) took {elapsed} seconds to abort.')
                 return {'name': j_name, 'id': job_id, 'status': j_status_h}
             else:
-                elapsed += request_interval
                 if j_status_h != j_status_h_old:
                     if verbose:
                         print(f'\tYour current job "{j_name}" (ID: {job_id}) status is: {j_status_h}.')
                     j_status_h_old = j_status_h
-                time.sleep(request_interval)
+                schedule.wait(j_status_h)
         j_status = self.get_job_status(job_id, workspace_id, verify)
         j_status_content = json.loads(j_status.content)
         j_status_h = j_status_content["status"]
@@ -204,12 +678,11 @@ class Cloudos:
             "Content-type": "application/json",
             "apikey": apikey
         }
-        r = self.get_job_status(j_id, workspace_id, verify)
-        r_json = r.json()
-        job_workspace = r_json["team"]
-        if job_workspace != workspace_id:
+        snapshot = self.get_job_snapshot(j_id, workspace_id, verify)
+        r_json = snapshot.document
+        if snapshot.team != workspace_id:
             raise ValueError("Workspace provided or configured is different from workspace where the job was executed")
-        if r_json["status"] =='initializing' or r_json["status"] =='scheduled':
+        if snapshot.status =='initializing' or snapshot.status =='scheduled':
             raise ValueError("Working directories are not yet available. The job is still initializing.")
 
         if "resumeWorkDir" not in r_json:
@@ -303,7 +776,7 @@ class Cloudos:
         if "logs" in r_json:
             # Get workdir information from logs object using the same pattern as get_job_logs
             logs_obj = r_json["logs"]
-            cloud_name, cloud_meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, logs_obj)
+            cloud_name, cloud_meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, logs_obj, verify)
             container_name = cloud_storage["container"]
             prefix_name = cloud_storage["prefix"]
             logs_bucket = logs_obj[container_name]
@@ -377,7 +850,8 @@ class Cloudos:
 
         try:
             # Try to get job info from job list to see the owner
-            result = self.get_job_list(workspace_id, last_n_jobs='all', verify=verify)
+            result = self.get_job_list(workspace_id, last_n_jobs=1, verify=verify,
+                                       filter_job_id=job_id)
             jobs = result['jobs']  # Extract jobs list from the dictionary
             job_owner_name = None
 
@@ -407,19 +881,18 @@ class Cloudos:
             "Content-type": "application/json",
             "apikey": apikey
         }
-        r = self.get_job_status(j_id, workspace_id, verify)
-        r_json = r.json()
+        snapshot = self.get_job_snapshot(j_id, workspace_id, verify)
+        r_json = snapshot.document
 
-        job_workspace = r_json["team"]
-        if job_workspace != workspace_id:
+        if snapshot.team != workspace_id:
             raise ValueError("Workspace provided or configured is different from workspace where the job was executed")
-        if r_json["status"] =='initializing' or r_json["status"] =='scheduled':
+        if snapshot.status =='initializing' or snapshot.status =='scheduled':
             raise ValueError("Logs are not yet available. The job is still initializing.")
         if "logs" not in r_json:
             raise ValueError("Logs are not available.")
         else:
-            logs_obj = r_json["logs"]
-            cloud_name, cloud_meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, logs_obj)
+            logs_obj = snapshot.logs
+            cloud_name, cloud_meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, logs_obj, verify)
             container_name = cloud_storage["container"]
             prefix_name = cloud_storage["prefix"]
             logs_bucket = logs_obj[container_name]
@@ -446,20 +919,34 @@ class Cloudos:
         """
         Get the location of the results for the specified job
         """
-        cloudos_url = self.cloudos_url
-        apikey = self.apikey
-        headers = {
-            "Content-type": "application/json",
-            "apikey": apikey
-        }
-        status = self.get_job_status(j_id, workspace_id, verify).json()["status"]
-        if status != JOB_COMPLETED:
-            raise JoBNotCompletedException(j_id, status)
-
-        r = self.get_job_status(j_id, workspace_id, verify)
-        req_obj = r.json()
-        job_workspace = req_obj["team"]
-        if job_workspace != workspace_id:
+        return self.get_job_results_location(j_id, workspace_id, verify)["uri"]
+
+    def get_job_results_location(self, j_id, workspace_id, verify=True):
+        """Find the results directory of a completed job in its cloud storage.
+
+        Parameters
+        ----------
+        j_id : string
+            The Lifebit Platform job id.
+        workspace_id : string
+            The Lifebit Platform workspace id.
+        verify: [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+
+        Returns
+        -------
+        dict
+            'cloud' and 'meta' (as returned by find_cloud), the 'container'
+            and 'path' of the results directory, and its 'uri'.
+        """
+        snapshot = self.get_job_snapshot(j_id, workspace_id, verify)
+        if snapshot.status != JOB_COMPLETED:
+            raise JoBNotCompletedException(j_id, snapshot.status)
+
+        req_obj = snapshot.document
+        if snapshot.team != workspace_id:
             raise ValueError("Workspace provided or configured is different from workspace where the job was executed")
 
         # Check if analysis results have been deleted or scheduled for deletion
@@ -508,7 +995,7 @@ class Cloudos:
                     raise ValueError(error_msg)
                 # If status is "ready" or None, don't raise error - let the code continue to retrieve the results path
 
-        cloud_name, meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, req_obj["logs"])
+        cloud_name, meta, cloud_storage = find_cloud(self.cloudos_url, self.apikey, workspace_id, req_obj["logs"], verify)
         # cont_name
         results_obj = req_obj["results"]
         results_container = results_obj[cloud_storage["container"]]
@@ -519,18 +1006,75 @@ class Cloudos:
         storage_account_prefix = ''
         if scheme == 'az':
             storage_account_prefix = f'{workspace_id}.blob.core.windows.net/'
-        # Find the results directory - typically there should be only one
-        for item in contents_obj:
-            if item["isDir"] and item["name"] == "results":
-                return f"{scheme}://{storage_account_prefix}{results_container}/{item['path']}"
+        # Find the results directory - typically there should be only one,
+        # falling back to the first directory
+        results_dirs = ([item for item in contents_obj if item["isDir"] and item["name"] == "results"] +
+                        [item for item in contents_obj if item["isDir"]])
+        if not results_dirs:
+            raise ValueError("No result directories found for this job")
+        item = results_dirs[0]
+        return {
+            "cloud": cloud_name,
+            "meta": meta,
+            "container": results_container,
+            "path": item["path"],
+            "uri": f"{scheme}://{storage_account_prefix}{results_container}/{item['path']}"
+        }
+
+    def walk_storage(self, cloud_name, cloud_meta, container, path, workspace_id, verify=True,
+                     max_depth=None, max_workers=8, exclude=None, on_error=None):
+        """Crawl a storage prefix breadth-first, yielding objects as directories are listed.
+
+        Directories are listed concurrently on a bounded thread pool, through
+        get_storage_contents. Only the directories still to be listed are
+        kept in memory.
+
+        Parameters
+        ----------
+        cloud_name : str
+            The name of the cloud service ('aws' or 'azure').
+        cloud_meta : dict
+            The cloud metadata, as returned by find_cloud.
+        container : str
+            The name of the bucket or blob container.
+        path : str
+            The directory to crawl.
+        workspace_id : str
+            The Lifebit Platform workspace id.
+        verify: [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        max_depth : int, optional
+            Maximum depth to descend to, 1 being the content of `path`. No
+            limit if None.
+        max_workers : int
+            Maximum number of directories listed at the same time.
+        exclude : callable, optional
+            Predicate receiving the relative path of a directory. Matching
+            directories are not descended into.
+        on_error : callable, optional
+            Called with the relative path of a sub-directory and the
+            exception raised while listing it. If None, the exception is
+            raised. A failure to list `path` itself is always raised.
+
+        Yields
+        ------
+        tuple
+            (relative path, item, depth) for every file and directory found.
+        """
+        ensure_pool_size(max_workers)
 
-        # Fallback: if no "results" directory found, return the first directory
-        for item in contents_obj:
-            if item["isDir"]:
-                return f"{scheme}://{storage_account_prefix}{results_container}/{item['path']}"
+        def list_folder(rel_path, full_path):
+            return self.get_storage_contents(cloud_name, cloud_meta, container, full_path,
+                                             workspace_id, verify)
 
-        # If no directories found, raise an error
-        raise ValueError("No result directories found for this job")
+        def children(contents):
+            return ((item["name"].rstrip('/'), item,
+                     item["path"].rstrip('/') if item.get("isDir") else None)
+                    for item in contents)
+        return walk_tree(path.rstrip('/'), list_folder, children, max_depth=max_depth,
+                         max_workers=max_workers, exclude=exclude, on_error=on_error)
 
     def get_folder_items_deletion_status(self, folder_id, workspace_id, verify=True):
         """Get deletion status of items within a folder.
@@ -615,8 +1159,7 @@ class Cloudos:
             If the job's results folder is not found.
         """
         # First, get job details to find the project and job name
-        job_status = self.get_job_status(job_id, workspace_id, verify)
-        job_data = json.loads(job_status.content)
+        job_data = self.get_job_snapshot(job_id, workspace_id, verify).document
         job_name = job_data.get("name", job_id)
         project_info = job_data.get("project")
 
@@ -816,8 +1359,7 @@ class Cloudos:
             If the job's working directory is not found or not accessible.
         """
         # First, get job details to find the working directory folder ID
-        job_status = self.get_job_status(job_id, workspace_id, verify)
-        job_data = json.loads(job_status.content)
+        job_data = self.get_job_snapshot(job_id, workspace_id, verify).document
         job_name = job_data.get("name", job_id)
 
         # Try to get the workdir folder ID from workDirectory.folderId first (new format)
@@ -997,18 +1539,132 @@ class Cloudos:
         """
         cloudos_url = self.cloudos_url
         headers = self._create_cromwell_header()
-        r = requests.put("{}/api/v1/cromwell/{}?teamId={}".format(cloudos_url,
-                                                                  action,
-                                                                  workspace_id),
-                         headers=headers, verify=verify)
+        r = retry_requests_put("{}/api/v1/cromwell/{}?teamId={}".format(cloudos_url,
+                                                                        action,
+                                                                        workspace_id),
+                               headers=headers, verify=verify)
         if r.status_code >= 400:
             raise BadRequestException(r)
         return r
 
+    def prepare_job_list_query(self, workspace_id, archived=False, verify=True, filter_status=None,
+                               filter_job_name=None, filter_project=None, filter_workflow=None,
+                               filter_job_id=None, filter_only_mine=False, filter_owner=None,
+                               filter_queue=None, last=False):
+        """Resolve the job list filters to IDs once, to fetch any number of pages.
+
+        Parameters
+        ----------
+        workspace_id : string
+            The Lifebit Platform workspace id from to collect the jobs.
+        archived : bool, default=False
+            When True, only the archived jobs are retrieved.
+        verify: [bool|string], default=True
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        filter_status, filter_job_name, filter_project, filter_workflow, filter_job_id,
+        filter_only_mine, filter_owner, filter_queue, last
+            The filters, as described in get_job_list.
+
+        Returns
+        -------
+        JobListQuery
+            The query with every filter resolved.
+        """
+        if not workspace_id or not isinstance(workspace_id, str):
+            raise ValueError("Invalid workspace_id: must be a non-empty string")
+
+        # Validate filter_status values
+        if filter_status:
+            valid_statuses = ['completed', 'running', 'failed', 'aborted', 'queued', 'pending', 'initializing']
+            if filter_status.lower() not in valid_statuses:
+                raise ValueError(f"Invalid filter_status '{filter_status}'. Valid values: {', '.join(valid_statuses)}")
+
+        # Build query parameters for server-side filtering
+        params = {
+            "teamId": workspace_id,
+            "archived.status": str(archived).lower()
+        }
+
+        # Add simple server-side filters
+        if filter_status:
+            params["status"] = filter_status.lower()
+        if filter_job_name:
+            params["name"] = filter_job_name
+        if filter_job_id:
+            params["id"] = filter_job_id
+
+        # Resolve project name to ID
+        if filter_project:
+            try:
+                project_id = self.get_project_id_from_name(workspace_id, filter_project, verify=verify)
+                if project_id:
+                    params["project.id"] = project_id
+                else:
+                    raise ValueError(f"Project '{filter_project}' not found.")
+            except Exception as e:
+                raise ValueError(f"Error resolving project '{filter_project}'. {str(e)}")
+
+        # Resolve workflow name to ID
+        if filter_workflow:
+            try:
+                workflow_content = self.get_workflow_content(workspace_id, filter_workflow, verify=verify, last=last)
+                if workflow_content and workflow_content.get("workflows"):
+                    # Extract the first (and should be only) workflow from the list
+                    workflow = workflow_content["workflows"][0]
+                    workflow_id = workflow.get("_id")
+                    if workflow_id:
+                        params["workflow.id"] = workflow_id
+                    else:
+                        raise ValueError(f"Workflow '{filter_workflow}' not found.")
+                else:
+                    raise ValueError(f"Workflow '{filter_workflow}' not found.")
+            except Exception as e:
+                raise ValueError(f"Error resolving workflow '{filter_workflow}'. {str(e)}")
+
+        # Get current user ID for filter_only_mine
+        if filter_only_mine:
+            try:
+                user_info = self.get_user_info(verify=verify)
+                user_id = user_info.get("id") or user_info.get("_id")
+                if user_id:
+                    params["user.id"] = user_id
+                else:
+                    raise ValueError("Could not retrieve current user information.")
+            except Exception as e:
+                raise ValueError(f"Error getting current user info. {str(e)}")
+
+        # Resolve owner username to user ID
+        if filter_owner:
+            user_id = self.resolve_user_id(filter_owner, workspace_id, verify)
+            params["user.id"] = user_id
+
+        # --- Resolve queue ID (for local filtering during pagination) ---
+        queue_id = None
+        if filter_queue:
+            try:
+                from cloudos_cli.queue.queue import Queue
+                queue_api = Queue(self.cloudos_url, self.apikey, self.cromwell_token, workspace_id, verify)
+                queues = queue_api.get_job_queues()
+
+                for queue in queues:
+                    if queue.get("label") == filter_queue or queue.get("name") == filter_queue:
+                        queue_id = queue.get("id") or queue.get("_id")
+                        break
+
+                if not queue_id:
+                    raise ValueError(f"Queue with name '{filter_queue}' not found in workspace '{workspace_id}'")
+            except Exception as e:
+                raise ValueError(f"Error resolving queue '{filter_queue}'. {str(e)}")
+
+        return JobListQuery(workspace_id=workspace_id, params=params, queue_id=queue_id)
+
     def get_job_list(self, workspace_id, last_n_jobs=None, page=None, page_size=None, archived=False,
                      verify=True, filter_status=None, filter_job_name=None,
                      filter_project=None, filter_workflow=None, filter_job_id=None,
-                     filter_only_mine=False, filter_owner=None, filter_queue=None, last=False):
+                     filter_only_mine=False, filter_owner=None, filter_queue=None, last=False,
+                     query=None, timeout=None):
         """Get jobs from a Lifebit Platform workspace with optional filtering.
 
         Fetches jobs page by page, applies all filters after fetching.
@@ -1053,6 +1709,12 @@ class Cloudos:
             Non-batch jobs are preserved in results as they don't use queues.
         last : bool, optional
             When workflows are duplicated, use the latest imported workflow (by date).
+        query : JobListQuery, optional
+            A query prepared with prepare_job_list_query. When given, the
+            archived and filter_* arguments are ignored and no filter is
+            resolved again.
+        timeout : float, optional
+            Timeout in seconds of every page request. No timeout if None.
 
         Returns
         -------
@@ -1105,111 +1767,42 @@ class Cloudos:
             if current_page_size > 100:
                 raise ValueError('Please, use a page_size value <= 100')
 
-        # Validate filter_status values
-        if filter_status:
-            valid_statuses = ['completed', 'running', 'failed', 'aborted', 'queued', 'pending', 'initializing']
-            if filter_status.lower() not in valid_statuses:
-                raise ValueError(f"Invalid filter_status '{filter_status}'. Valid values: {', '.join(valid_statuses)}")
+        if query is None:
+            query = self.prepare_job_list_query(workspace_id, archived=archived, verify=verify,
+                                                filter_status=filter_status,
+                                                filter_job_name=filter_job_name,
+                                                filter_project=filter_project,
+                                                filter_workflow=filter_workflow,
+                                                filter_job_id=filter_job_id,
+                                                filter_only_mine=filter_only_mine,
+                                                filter_owner=filter_owner,
+                                                filter_queue=filter_queue, last=last)
+        queue_id = query.queue_id
+        queue_matches = job_matcher(queue_id=queue_id)
 
         headers = {
             "Content-type": "application/json",
             "apikey": self.apikey
         }
-
-        # Build query parameters for server-side filtering
-        params = {
-            "teamId": workspace_id,
-            "archived.status": str(archived).lower(),
-            "page": current_page,
-            "limit": current_page_size
-        }
-
-        # --- Resolve IDs once (before pagination loop) ---
-
-        # Add simple server-side filters
-        if filter_status:
-            params["status"] = filter_status.lower()
-        if filter_job_name:
-            params["name"] = filter_job_name
-        if filter_job_id:
-            params["id"] = filter_job_id
-
-        # Resolve project name to ID
-        if filter_project:
-            try:
-                project_id = self.get_project_id_from_name(workspace_id, filter_project, verify=verify)
-                if project_id:
-                    params["project.id"] = project_id
-                else:
-                    raise ValueError(f"Project '{filter_project}' not found.")
-            except Exception as e:
-                raise ValueError(f"Error resolving project '{filter_project}'. {str(e)}")
-
-        # Resolve workflow name to ID
-        if filter_workflow:
-            try:
-                workflow_content = self.get_workflow_content(workspace_id, filter_workflow, verify=verify, last=last)
-                if workflow_content and workflow_content.get("workflows"):
-                    # Extract the first (and should be only) workflow from the list
-                    workflow = workflow_content["workflows"][0]
-                    workflow_id = workflow.get("_id")
-                    if workflow_id:
-                        params["workflow.id"] = workflow_id
-                    else:
-                        raise ValueError(f"Workflow '{filter_workflow}' not found.")
-                else:
-                    raise ValueError(f"Workflow '{filter_workflow}' not found.")
-            except Exception as e:
-                raise ValueError(f"Error resolving workflow '{filter_workflow}'. {str(e)}")
-
-        # Get current user ID for filter_only_mine
-        if filter_only_mine:
-            try:
-                user_info = self.get_user_info(verify=verify)
-                user_id = user_info.get("id") or user_info.get("_id")
-                if user_id:
-                    params["user.id"] = user_id
-                else:
-                    raise ValueError("Could not retrieve current user information.")
-            except Exception as e:
-                raise ValueError(f"Error getting current user info. {str(e)}")
-
-        # Resolve owner username to user ID
-        if filter_owner:
-            user_id = self.resolve_user_id(filter_owner, workspace_id, verify)
-            params["user.id"] = user_id
-
-        # --- Resolve queue ID before pagination (for local filtering during pagination) ---
-        queue_id = None
-        if filter_queue:
-            try:
-                from cloudos_cli.queue.queue import Queue
-                queue_api = Queue(self.cloudos_url, self.apikey, self.cromwell_token, workspace_id, verify)
-                queues = queue_api.get_job_queues()
-
-                for queue in queues:
-                    if queue.get("label") == filter_queue or queue.get("name") == filter_queue:
-                        queue_id = queue.get("id") or queue.get("_id")
-                        break
-
-                if not queue_id:
-                    raise ValueError(f"Queue with name '{filter_queue}' not found in workspace '{workspace_id}'")
-            except Exception as e:
-                raise ValueError(f"Error resolving queue '{filter_queue}'. {str(e)}")
+        params = {**query.params, "page": current_page, "limit": current_page_size}
 
         # --- Fetch jobs page by page ---
         all_jobs = []
         params["limit"] = current_page_size
         last_pagination_metadata = None  # Track the last pagination metadata
 
-        while True:
-            params["page"] = current_page
-
-            r = retry_requests_get(f"{self.cloudos_url}/api/v2/jobs", params=params, headers=headers, verify=verify)
-            if r.status_code >= 400:
-                raise BadRequestException(r)
+        # Without the queue filter the number of pages needed is known in advance
+        if queue_id:
+            max_pages = None
+        elif not use_pagination_mode:
+            max_pages = 1
+        elif target_job_count != 'all':
+            max_pages = -(-int(target_job_count) // current_page_size)
+        else:
+            max_pages = None
 
-            content = r.json()
+        pages = self._iter_job_pages(params, headers, verify, max_pages=max_pages, timeout=timeout)
+        for content in pages:
             page_jobs = content.get('jobs', [])
 
             # Capture pagination metadata
@@ -1221,15 +1814,8 @@ class Cloudos:
 
             # Apply queue filter during pagination (if specified)
             # jobQueue is a dict with "id" and "name" keys, extract the id for comparison
-            if filter_queue and queue_id:
-                filtered_jobs = []
-                for job in page_jobs:
-                    job_queue = job.get("batch", {}).get("jobQueue", {})
-                    # jobQueue is a dict like {"id": "...", "name": "...", ...}
-                    job_queue_id = job_queue.get("id") if isinstance(job_queue, dict) else job_queue
-                    if job_queue_id == queue_id:
-                        filtered_jobs.append(job)
-                page_jobs = filtered_jobs
+            if queue_id:
+                page_jobs = [job for job in page_jobs if queue_matches(job)]
 
             all_jobs.extend(page_jobs)
 
@@ -1239,7 +1825,7 @@ class Cloudos:
                 if target_job_count != 'all' and len(all_jobs) >= target_job_count:
                     break
             else:
-                if not filter_queue and len(all_jobs) >= current_page_size:
+                if not queue_id and len(all_jobs) >= current_page_size:
                     break
 
             # Check if we reached the last page (fewer jobs than requested page size)
@@ -1248,8 +1834,8 @@ class Cloudos:
             raw_page_jobs = content.get('jobs', [])
             if len(raw_page_jobs) < params["limit"]:
                 break  # Last page
-
-            current_page += 1
+        # Stop the pages still being prefetched
+        pages.close()
 
         # --- Apply limit after all filtering ---
         if use_pagination_mode and target_job_count != 'all' and isinstance(target_job_count, int) and target_job_count > 0:
@@ -1258,7 +1844,7 @@ class Cloudos:
         # --- Adjust pagination metadata for client-side filtering ---
         # When filter_queue is applied, we've fetched multiple API pages and filtered them.
         # We need to return all filtered jobs so the CLI can handle pagination client-side.
-        if filter_queue and last_pagination_metadata:
+        if queue_id and last_pagination_metadata:
             # Mark this as client-filtered so the CLI knows to handle pagination differently
             last_pagination_metadata = {
                 'Pagination-Count': len(all_jobs),  # Total filtered jobs collected  
@@ -1269,6 +1855,232 @@ class Cloudos:
 
         return {'jobs': all_jobs, 'pagination_metadata': last_pagination_metadata}
 
+    def iter_jobs(self, workspace_id, limit=None, page_size=100, verify=True, query=None,
+                  name_regex=None, min_cost=None, max_cost=None, min_runtime=None,
+                  max_runtime=None, **filters):
+        """Yield the jobs of a workspace one by one, fetching pages lazily.
+
+        Server-side filters are resolved once and sent with every page
+        request. The queue filter and the filters the API does not support
+        are applied while streaming. No page is requested once the consumer
+        stops iterating (or `limit` jobs were yielded), apart from the few
+        already being prefetched, which are cancelled.
+
+        Parameters
+        ----------
+        workspace_id : string
+            The Lifebit Platform workspace id from to collect the jobs.
+        limit : [int | 'all'], optional
+            Maximum number of matching jobs to yield. No limit if None or 'all'.
+        page_size : int, default=100
+            Number of jobs requested per page. Maximum allowed value is 100.
+        verify: [bool|string], default=True
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        query : JobListQuery, optional
+            A query prepared with prepare_job_list_query. When given,
+            `filters` are ignored.
+        name_regex, min_cost, max_cost, min_runtime, max_runtime : optional
+            Client-side filters, as described in job_matcher.
+        **filters
+            Keyword arguments of prepare_job_list_query (archived,
+            filter_status, filter_project, filter_queue...).
+
+        Yields
+        ------
+        dict
+            Every matching job, newest first.
+        """
+        if limit == 'all':
+            limit = None
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                raise ValueError("last_n_jobs must be a positive integer or 'all'")
+            if limit <= 0:
+                raise ValueError("last_n_jobs must be a positive integer or 'all'")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 100:
+            raise ValueError('Please, use a page_size value between 1 and 100')
+        if query is None:
+            query = self.prepare_job_list_query(workspace_id, verify=verify, **filters)
+        matches = job_matcher(queue_id=query.queue_id, name_regex=name_regex,
+                              min_cost=min_cost, max_cost=max_cost,
+                              min_runtime=min_runtime, max_runtime=max_runtime)
+
+        # Without client-side filters the number of pages needed is known in advance
+        max_pages = None
+        if matches is None and limit is not None:
+            page_size = min(page_size, limit)
+            max_pages = -(-limit // page_size)
+
+        headers = {
+            "Content-type": "application/json",
+            "apikey": self.apikey
+        }
+        params = {**query.params, "page": 1, "limit": page_size}
+        pages = self._iter_job_pages(params, headers, verify, max_pages=max_pages)
+        yielded = 0
+        try:
+            for content in pages:
+                page_jobs = content.get('jobs', [])
+                for job in page_jobs:
+                    if matches is not None and not matches(job):
+                        continue
+                    yield job
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+                if len(page_jobs) < page_size:
+                    return  # Last page
+        finally:
+            pages.close()
+
+    def save_job_stream_to_json(self, jobs, filename='my_jobs.json'):
+        """Write jobs to a JSON list as they are received.
+
+        Parameters
+        ----------
+        jobs : iterable
+            The job dicts, e.g. from iter_jobs.
+        filename : str
+            The name of the JSON file.
+
+        Returns
+        -------
+        int
+            The number of jobs written.
+        """
+        n_jobs = 0
+        with open(filename, 'w') as o:
+            o.write('[')
+            for job in jobs:
+                if n_jobs:
+                    o.write(', ')
+                o.write(json.dumps(job))
+                n_jobs += 1
+            o.write(']')
+        print(f'\tJob list collected with a total of {n_jobs} jobs.')
+        print(f'\tJob list saved to {filename}')
+        return n_jobs
+
+    def save_job_stream_to_csv(self, jobs, filename='my_jobs.csv', chunk_size=100):
+        """Write jobs to a CSV file in chunks, as they are received.
+
+        Every chunk is formatted with reorder_job_list. All the
+        JOB_LIST_COLUMNS are written, so that every chunk has the same
+        columns. Use save_job_list_to_csv for all fields.
+
+        Parameters
+        ----------
+        jobs : iterable
+            The job dicts, e.g. from iter_jobs.
+        filename : str
+            The name of the CSV file.
+        chunk_size : int
+            Number of jobs formatted at a time.
+
+        Returns
+        -------
+        int
+            The number of jobs written.
+        """
+        n_jobs = 0
+        chunk = []
+
+        def flush():
+            df = pd.json_normalize(chunk).reindex(columns=JOB_LIST_COLUMNS)
+            # The header is only written with the first chunk
+            self.reorder_job_list(df, filename).to_csv(out, index=False, header=n_jobs <= chunk_size)
+            chunk.clear()
+
+        with open(filename, 'w', newline='') as out:
+            for job in jobs:
+                chunk.append(job)
+                n_jobs += 1
+                if len(chunk) == chunk_size:
+                    flush()
+            if chunk:
+                flush()
+        print(f'\tJob list collected with a total of {n_jobs} jobs.')
+        print(f'\tJob list saved to {filename}')
+        return n_jobs
+
+    def _iter_job_pages(self, params, headers, verify=True, max_pages=None,
+                        max_workers=JOB_LIST_PREFETCH_WORKERS, timeout=None):
+        """Yield the content of consecutive /api/v2/jobs pages, in order.
+
+        The first page (params['page']) is fetched alone. When the next one
+        is requested and the first page's paginationMetadata gives the total
+        number of jobs, the remaining pages are fetched concurrently ahead of
+        the consumer, at most `max_workers` at a time. Otherwise (or with
+        max_workers=1) pages are fetched one by one, only when the consumer
+        asks for them.
+
+        Parameters
+        ----------
+        params : dict
+            The query parameters of the request, including page and limit.
+        headers : dict
+            The request headers.
+        verify: [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        max_pages : int, optional
+            Maximum number of pages to fetch. No limit if None.
+        max_workers : int
+            Maximum number of pages fetched at the same time.
+        timeout : float, optional
+            Timeout in seconds of every page request. No timeout if None.
+
+        Yields
+        ------
+        dict
+            The JSON content of every page.
+        """
+        params = dict(params)
+
+        def fetch(page):
+            r = retry_requests_get(f"{self.cloudos_url}/api/v2/jobs", params={**params, "page": page},
+                                   headers=headers, verify=verify, timeout=timeout)
+            if r.status_code >= 400:
+                raise BadRequestException(r)
+            return r.json()
+
+        first_page = params["page"]
+        content = fetch(first_page)
+        yield content
+        total = (content.get('paginationMetadata') or {}).get('Pagination-Count')
+        last_page = None if max_pages is None else first_page + max_pages - 1
+        if isinstance(total, int) and content.get('jobs'):
+            total_pages = -(-total // params["limit"])
+            last_page = total_pages if last_page is None else min(last_page, total_pages)
+        if last_page is None or max_workers <= 1:
+            # The number of pages is unknown, or no page is fetched ahead:
+            # fetch them one at a time
+            page = first_page + 1
+            while last_page is None or page <= last_page:
+                yield fetch(page)
+                page += 1
+            return
+
+        ensure_pool_size(max_workers)
+        futures = deque()
+        next_page = first_page + 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                while futures or next_page <= last_page:
+                    while next_page <= last_page and len(futures) < max_workers:
+                        futures.append(pool.submit(fetch, next_page))
+                        next_page += 1
+                    yield futures.popleft().result()
+            finally:
+                # The consumer may stop early: drop the pages not requested yet
+                for future in futures:
+                    future.cancel()
+
     @staticmethod
     def process_job_list(r, all_fields=False):
         """Process a job list from a self.get_job_list call.
@@ -1286,28 +2098,7 @@ class Cloudos:
         df : pandas.DataFrame
             A DataFrame with the requested columns from the jobs.
         """
-        COLUMNS = ['status',
-                   'name',
-                   'project.name',
-                   'user.name',
-                   'user.surname',
-                   'workflow.name',
-                   '_id',
-                   'startTime',
-                   'endTime',
-                   'createdAt',
-                   'updatedAt',
-                   'revision.commit',
-                   'realInstancesExecutionCost',
-                   'masterInstance.usedInstance.type',
-                   'storageMode',
-                   'workflow.repository.url',
-                   'nextflowVersion',
-                   'batch.enabled',
-                   'storageSizeInGb',
-                   'batch.jobQueue',
-                   'usesFusionFileSystem'
-                   ]
+        COLUMNS = JOB_LIST_COLUMNS
         df_full = pd.json_normalize(r)
         if df_full.empty:
             return df_full
@@ -1350,74 +2141,40 @@ class Cloudos:
 
         # 1. Fusion user.name and user.surname into user
         if 'user.name' in jobs_df.columns and 'user.surname' in jobs_df.columns:
-            jobs_df['user'] = jobs_df.apply(
-                lambda row: f"{row.get('user.name', '')} {row.get('user.surname', '')}".strip()
-                if pd.notna(row.get('user.name')) or pd.notna(row.get('user.surname'))
-                else None, axis=1
-            )
+            name, surname = jobs_df['user.name'], jobs_df['user.surname']
+            # str() of every value, as in an f-string (None -> 'None')
+            user = np.char.strip(np.char.add(np.char.add(name.to_numpy(dtype=object).astype(str), ' '),
+                                             surname.to_numpy(dtype=object).astype(str)))
+            user = pd.Series(user, index=jobs_df.index, dtype=object)
+            jobs_df['user'] = _objects(user.where(name.notna() | surname.notna()))
             # Remove original columns
             jobs_df = jobs_df.drop(columns=['user.name', 'user.surname'], errors='ignore')
 
         # 2. Convert time fields to human-readable format
         time_columns = ['startTime', 'endTime', 'createdAt', 'updatedAt']
+        parsed_times = {}
         for col in time_columns:
             if col in jobs_df.columns:
-                def format_time(x):
-                    if pd.notna(x) and isinstance(x, str) and x:
-                        try:
-                            return datetime.fromisoformat(x.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')
-                        except (ValueError, TypeError):
-                            return x  # Return original value if parsing fails
-                    return None
-                jobs_df[col] = jobs_df[col].apply(format_time)
+                parsed_times[col] = _parse_iso_times(jobs_df[col])
+                jobs_df[col] = _format_times(jobs_df[col], parsed_times[col])
 
         # 3. Format realInstancesExecutionCost (divide by 100, show 4 decimals)
         if 'realInstancesExecutionCost' in jobs_df.columns:
-            def format_cost(x):
-                if pd.notna(x) and x != '' and x is not None:
-                    try:
-                        return f"{float(x) / 100:.4f}"
-                    except (ValueError, TypeError):
-                        return x  # Return original value if conversion fails
-                return None
-            jobs_df['realInstancesExecutionCost'] = jobs_df['realInstancesExecutionCost'].apply(format_cost)
+            jobs_df['realInstancesExecutionCost'] = _format_costs(jobs_df['realInstancesExecutionCost'])
 
         # 4. Calculate Run time (endTime - startTime)
         if 'startTime' in jobs_df.columns and 'endTime' in jobs_df.columns:
-            def calculate_runtime(row):
-                start_time = row.get('startTime')
-                end_time = row.get('endTime')
-                if pd.notna(start_time) and pd.notna(end_time) and start_time and end_time:
-                    # Use original times from the original DataFrame for calculation
-                    original_start = my_jobs_df.iloc[row.name].get('startTime') if row.name < len(my_jobs_df) else start_time
-                    original_end = my_jobs_df.iloc[row.name].get('endTime') if row.name < len(my_jobs_df) else end_time
-                    if pd.notna(original_start) and pd.notna(original_end) and original_start and original_end:
-                        try:
-                            start_dt = datetime.fromisoformat(str(original_start).replace('Z', '+00:00'))
-                            end_dt = datetime.fromisoformat(str(original_end).replace('Z', '+00:00'))
-                            duration = end_dt - start_dt
-                            # Format duration as hours:minutes:seconds
-                            total_seconds = int(duration.total_seconds())
-                            hours = total_seconds // 3600
-                            minutes = (total_seconds % 3600) // 60
-                            seconds = total_seconds % 60
-                            if hours > 0:
-                                return f"{hours}h {minutes}m {seconds}s"
-                            elif minutes > 0:
-                                return f"{minutes}m {seconds}s"
-                            else:
-                                return f"{seconds}s"
-                        except (ValueError, TypeError):
-                            return None
-                return None
-
-            jobs_df['Run time'] = jobs_df.apply(calculate_runtime, axis=1)
+            jobs_df['Run time'] = _format_runtimes(my_jobs_df['startTime'], my_jobs_df['endTime'],
+                                                   parsed_times['startTime'], parsed_times['endTime'],
+                                                   jobs_df.index)
 
         # 5. Format batch.enabled (True -> "Batch", else "N/A")
         if 'batch.enabled' in jobs_df.columns:
-            jobs_df['batch.enabled'] = jobs_df['batch.enabled'].apply(
-                lambda x: "Batch" if x is True else "N/A"
-            )
+            enabled = jobs_df['batch.enabled']
+            if enabled.dtype == bool:
+                jobs_df['batch.enabled'] = _objects(pd.Series(np.where(enabled, "Batch", "N/A"), index=enabled.index))
+            else:
+                jobs_df['batch.enabled'] = enabled.apply(lambda x: "Batch" if x is True else "N/A")
 
         # 6. Rename columns using the provided dictionary
         column_name_mapping = {
@@ -1601,13 +2358,7 @@ class Cloudos:
         wt : string ['nextflow'|'wdl']
             The workflow type detected
         """
-        # get list with workflow types
-        wt_all = self.workflow_content_query(workspace_id, workflow_name, verify=verify, query="workflowType", last=last)
-        # make unique
-        wt = list(dict.fromkeys(wt_all))
-        if len(wt) > 1:
-            raise ValueError(f'More than one workflow type ("{wt}") detected for "{workflow_name}". ')
-        return str(wt[0])
+        return self.resolve_workflow(workspace_id, workflow_name, verify=verify, last=last).workflow_type
 
     def is_module(self, workflow_name, workspace_id, verify=True, last=False):
         """Detects whether the workflow is a system module or not.
@@ -1631,21 +2382,7 @@ class Cloudos:
         bool
             True, if the workflow is a system module, false otherwise.
         """
-        # get a list of all groups
-        group = self.workflow_content_query(workspace_id, workflow_name, verify=verify, query="group", last=last)
-
-        module_groups = ['system-tools',
-                         'data-factory-data-connection-etl',
-                         'data-factory',
-                         'data-factory-omics-etl',
-                         'drug-discovery',
-                         'data-factory-omics-insights',
-                         'intermediate'
-                         ]
-        if group[0] in module_groups:
-            return True
-        else:
-            return False
+        return self.resolve_workflow(workspace_id, workflow_name, verify=verify, last=last).is_module
 
     def get_project_list(self, workspace_id, verify=True, get_all=True,
                          page=1, page_size=10, max_page_size=100):
@@ -1829,10 +2566,12 @@ class Cloudos:
                              'your workspace has support for importing workflows using cloudos-cli')
         elif r.status_code >= 400:
             raise BadRequestException(r)
+        get_cache().invalidate('workflow', self.cloudos_url, workspace_id)
+        self._resolved_workflows.clear()
         content = json.loads(r.content)
         return content['_id']
 
-    def get_user_info(self, verify=True):
+    def get_user_info(self, verify=True, refresh=False):
         """Gets user information from users/me endpoint
 
         Parameters
@@ -1841,6 +2580,10 @@ class Cloudos:
             Whether to use SSL verification or not. Alternatively, if
             a string is passed, it will be interpreted as the path to
             the SSL certificate file.
+        refresh : bool
+            Whether to request the user information again instead of
+            reading it from the cache, e.g. to check credentials the user
+            may have just linked.
 
         Returns
         -------
@@ -1851,11 +2594,18 @@ class Cloudos:
             "Content-type": "application/json",
             "apikey": self.apikey
         }
+        cache = get_cache()
+        cache_key = DiskCache.make_key(self.cloudos_url, self.apikey, None, 'users/me')
+        user_info = None if refresh else cache.get('user_info', cache_key)
+        if user_info is not None:
+            return user_info
         r = retry_requests_get("{}/api/v1/users/me".format(self.cloudos_url),
                                headers=headers, verify=verify)
         if r.status_code >= 400:
             raise BadRequestException(r)
-        return json.loads(r.content)
+        user_info = json.loads(r.content)
+        cache.set('user_info', cache_key, user_info, self.cloudos_url)
+        return user_info
 
     def abort_job(self, job, workspace_id, verify=True, force=False):
         """Abort a job.
@@ -1885,6 +2635,7 @@ class Cloudos:
         force_abort = "true" if force else "false"
         r = retry_requests_put("{}/api/v2/jobs/{}/abort?forceAbort={}&teamId={}".format(cloudos_url, job, force_abort, workspace_id),
                                headers=headers, verify=verify)
+        self.invalidate_job_snapshot(job)
         if r.status_code >= 400:
             raise BadRequestException(r)
         return r
@@ -1935,6 +2686,8 @@ class Cloudos:
             data=json.dumps(payload),
             verify=verify
         )
+        for job_id in job_ids:
+            self.invalidate_job_snapshot(job_id)
         if r.status_code >= 400:
             # Raise specific exceptions based on HTTP status code
             if r.status_code == 401:
@@ -2097,6 +2850,11 @@ class Cloudos:
             "Content-type": "application/json",
             "apikey": self.apikey
         }
+        cache = get_cache()
+        cache_key = DiskCache.make_key(self.cloudos_url, self.apikey, workspace_id, 'project', project_name)
+        project_id = cache.get('project_id', cache_key)
+        if project_id is not None:
+            return project_id
         url = f"{self.cloudos_url}/api/v2/projects?teamId={workspace_id}&search={project_name}"
         response = retry_requests_get(url, headers=headers, verify=verify)
         if response.status_code >= 400:
@@ -2107,6 +2865,7 @@ class Cloudos:
         if project_id is None:
             raise ValueError(f"Project '{project_name}' was not found in workspace '{workspace_id}'")
 
+        cache.set('project_id', cache_key, project_id, self.cloudos_url, workspace_id)
         return project_id
 
     def create_project(self, workspace_id, project_name, verify=True):
@@ -2152,6 +2911,7 @@ class Cloudos:
                              'in your workspace, please use another name for the new project')
         elif r.status_code >= 400:
             raise BadRequestException(r)
+        get_cache().invalidate('project_id', self.cloudos_url, workspace_id)
         content = json.loads(r.content)
         return content['_id']
 
@@ -2225,6 +2985,12 @@ class Cloudos:
             "Content-type": "application/json",
             "apikey": self.apikey
         }
+        cache = get_cache()
+        cache_key = DiskCache.make_key(self.cloudos_url, self.apikey, workspace_id, 'workflow',
+                                       workflow_name, last)
+        content = cache.get('workflow', cache_key)
+        if content is not None:
+            return content
         max_pagination = self.get_workflow_max_pagination(workspace_id, workflow_name, verify=verify)
 
         # get all the matching content
@@ -2254,14 +3020,43 @@ class Cloudos:
                              "To run the last imported workflow use '--last' flag.")
         else:
             content = youngest_workflow_id_by_name(content, workflow_name)
+        cache.set('workflow', cache_key, content, self.cloudos_url, workspace_id)
         return content
 
+    def resolve_workflow(self, workspace_id, workflow_name, verify=True, last=False):
+        """Look up a workflow once and reuse it for the lifetime of this object.
+
+        Parameters
+        ----------
+        workspace_id : str
+            The Lifebit Platform workspace ID to search for the workflow.
+        workflow_name : str
+            The name of the workflow to search for.
+        verify : [bool | str], optional
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file. Default is True.
+        last : bool
+            Whether to select the last imported workflow when several share the name.
+
+        Returns
+        -------
+        ResolvedWorkflow
+            The resolved workflow, shared by detect_workflow, is_module and
+            Job.fetch_cloudos_id.
+        """
+        key = (workspace_id, workflow_name, last)
+        if key not in self._resolved_workflows:
+            content = self.get_workflow_content(workspace_id, workflow_name, verify=verify, last=last)
+            self._resolved_workflows[key] = ResolvedWorkflow(workflow_name, last, content)
+        return self._resolved_workflows[key]
+
     def workflow_content_query(self, workspace_id, workflow_name, verify=True, query="workflowType", last=False):
 
-        content = self.get_workflow_content(workspace_id, workflow_name, verify=verify, last=last)
+        workflow = self.resolve_workflow(workspace_id, workflow_name, verify=verify, last=last)
 
         # use 'query' to look in the content
-        return [wf.get(query) for wf in content.get("workflows", []) if wf.get("name") == workflow_name]
+        return workflow.query(query)
 
     def get_interactive_session_list(self, team_id, page=None, limit=None, status=None, 
                                      owner_only=False, include_archived=False, verify=True):
@@ -0,0 +1,157 @@
+"""
+Asyncio client to run many Lifebit Platform API calls concurrently.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.utils.requests import ensure_pool_size
+from cloudos_cli.constants import ASYNC_MAX_CONCURRENCY
+
+
+@dataclass
+class AsyncCloudos:
+    """Asyncio counterpart of the Cloudos class for fan-out workloads.
+
+    Every coroutine runs the corresponding Cloudos method on a dedicated
+    thread pool sharing the process-wide pooled HTTP sessions, so at most
+    `max_concurrency` requests are in flight at any time.
+
+    Parameters
+    ----------
+    cloudos_url : string
+        The Lifebit Platform service url.
+    apikey : string
+        Your Lifebit Platform API key.
+    cromwell_token : string
+        Cromwell server token. If None, apikey will be used instead.
+    max_concurrency : int
+        Maximum number of concurrent requests.
+
+    Examples
+    --------
+    >>> async def poll(job_ids):
+    ...     async with AsyncCloudos(cloudos_url, apikey, None) as acl:
+    ...         return await acl.get_jobs_status(job_ids, workspace_id)
+    >>> statuses = asyncio.run(poll(['id1', 'id2']))
+    """
+    cloudos_url: str
+    apikey: str
+    cromwell_token: str = None
+    max_concurrency: int = ASYNC_MAX_CONCURRENCY
+    _client: Cloudos = field(init=False, repr=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False, default=None)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False, default=None)
+    _loop: asyncio.AbstractEventLoop = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError('max_concurrency must be a positive integer.')
+        self._client = Cloudos(self.cloudos_url, self.apikey, self.cromwell_token)
+        ensure_pool_size(self.max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker threads of the client."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking call on the worker pool, bounded by the semaphore."""
+        loop = asyncio.get_running_loop()
+        # Semaphores are bound to the loop they are first used in
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix='cloudos')
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor,
+                                              functools.partial(func, *args, **kwargs))
+
+    async def get_job_status(self, j_id, workspace_id=None, verify=True):
+        """Asynchronous version of Cloudos.get_job_status."""
+        return await self._call(self._client.get_job_status, j_id, workspace_id, verify)
+
+    async def get_job_list(self, workspace_id, **kwargs):
+        """Asynchronous version of Cloudos.get_job_list.
+
+        Keyword arguments are passed through to Cloudos.get_job_list.
+        """
+        return await self._call(self._client.get_job_list, workspace_id, **kwargs)
+
+    async def abort_job(self, job, workspace_id, verify=True, force=False):
+        """Asynchronous version of Cloudos.abort_job."""
+        return await self._call(self._client.abort_job, job, workspace_id, verify, force)
+
+    async def get_workflow_content(self, workspace_id, workflow_name, verify=True, last=False,
+                                   max_page_size=100):
+        """Asynchronous version of Cloudos.get_workflow_content."""
+        return await self._call(self._client.get_workflow_content, workspace_id, workflow_name,
+                                verify, last, max_page_size)
+
+    async def get_project_list(self, workspace_id, verify=True, get_all=True, page=1,
+                               page_size=10, max_page_size=100):
+        """Asynchronous version of Cloudos.get_project_list."""
+        return await self._call(self._client.get_project_list, workspace_id, verify, get_all,
+                                page, page_size, max_page_size)
+
+    async def get_storage_contents(self, cloud_name, cloud_meta, container, path, workspace_id,
+                                   verify=True):
+        """Asynchronous version of Cloudos.get_storage_contents."""
+        return await self._call(self._client.get_storage_contents, cloud_name, cloud_meta,
+                                container, path, workspace_id, verify)
+
+    async def gather(self, coros):
+        """Await several coroutines concurrently.
+
+        Parameters
+        ----------
+        coros : iterable
+            The coroutines to run, e.g. [acl.get_job_status(j, ws) for j in ids].
+
+        Returns
+        -------
+        list
+            The results in the same order as `coros`. Failed calls are
+            returned as their exception instead of being raised.
+        """
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    async def get_jobs_status(self, job_ids, workspace_id, verify=True):
+        """Get the status of many jobs concurrently.
+
+        Returns
+        -------
+        dict
+            Job id -> requests.models.Response, or the exception raised
+            while retrieving that job.
+        """
+        results = await self.gather(self.get_job_status(j, workspace_id, verify) for j in job_ids)
+        return dict(zip(job_ids, results))
+
+    async def abort_jobs(self, job_ids, workspace_id, verify=True, force=False):
+        """Abort many jobs concurrently.
+
+        Returns
+        -------
+        dict
+            Job id -> requests.models.Response, or the exception raised
+            while aborting that job.
+        """
+        results = await self.gather(self.abort_job(j, workspace_id, verify, force) for j in job_ids)
+        return dict(zip(job_ids, results))
+
+
+def run_async(coro):
+    """Run a coroutine from synchronous code (e.g. a CLI command) and return its result."""
+    return asyncio.run(coro)
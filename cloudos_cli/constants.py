@@ -23,6 +23,32 @@ ABORT_JOB_STATES = ['running', 'initializing']
 # Request interval for Cromwell
 REQUEST_INTERVAL_CROMWELL = 30
 
+# HTTP connection pooling (overridable with CLOUDOS_HTTP_* environment variables)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_KEEP_ALIVE = True
+
+# Default number of concurrent requests issued by AsyncCloudos
+ASYNC_MAX_CONCURRENCY = 20
+
+# Number of job list pages fetched concurrently when listing many jobs
+JOB_LIST_PREFETCH_WORKERS = 8
+
+# Timeout in seconds of the job list page fetched in the background by `job list`
+JOB_LIST_PAGE_TIMEOUT = 60
+
+# On-disk metadata cache: time-to-live in seconds per resource and size caps
+CACHE_TTLS = {
+    'project_id': 24 * 3600,
+    'workflow': 3600,
+    'job_queues': 3600,
+    'user_info': 24 * 3600,
+    'cloud': 24 * 3600,
+    'datasets': 60
+}
+CACHE_MAX_ENTRIES = 1000
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+
 # Global constants for CloudOS CLI
 CLOUDOS_URL = 'https://cloudos.lifebit.ai'
 INIT_PROFILE = 'initialisingProfile'
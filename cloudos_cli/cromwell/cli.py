@@ -2,12 +2,12 @@
 
 import rich_click as click
 import json
-import time
 import sys
 from cloudos_cli.clos import Cloudos
 from cloudos_cli.utils.resources import ssl_selector
 from cloudos_cli.configure.configure import with_profile_config, CLOUDOS_URL
 from cloudos_cli.utils.cli_helpers import pass_debug_to_subcommands
+from cloudos_cli.utils.polling import PollSchedule
 from cloudos_cli.constants import REQUEST_INTERVAL_CROMWELL
 
 
@@ -136,11 +136,10 @@ def cromwell_restart(ctx,
     c_status = cl.get_cromwell_status(workspace_id, verify_ssl)
     c_status_h = json.loads(c_status.content)["status"]
     print(f'\tCurrent Cromwell server status is: {c_status_h}\n')
-    elapsed = 0
-    while elapsed < wait_time and c_status_h != 'Running':
+    schedule = PollSchedule(REQUEST_INTERVAL_CROMWELL, timeout=wait_time)
+    while not schedule.expired() and c_status_h != 'Running':
         c_status_old = c_status_h
-        time.sleep(REQUEST_INTERVAL_CROMWELL)
-        elapsed += REQUEST_INTERVAL_CROMWELL
+        schedule.wait(c_status_h)
         c_status = cl.get_cromwell_status(workspace_id, verify_ssl)
         c_status_h = json.loads(c_status.content)["status"]
         if c_status_h != c_status_old:
@@ -2,8 +2,10 @@
 
 import rich_click as click
 import csv
+import json
 import sys
 from cloudos_cli.datasets import Datasets
+from cloudos_cli.datasets.datasets import path_matcher
 from cloudos_cli.link import Link
 from cloudos_cli.utils.resources import ssl_selector, format_bytes
 from cloudos_cli.configure.configure import with_profile_config, CLOUDOS_URL
@@ -19,10 +21,201 @@ from cloudos_cli.utils.cli_helpers import pass_debug_to_subcommands
 def datasets(ctx):
     """Lifebit Platform datasets functionality."""
     update_command_context_from_click(ctx)
-    if ctx.args and ctx.args[0] != 'ls':
+    if ctx.args and ctx.args[0] not in ('ls', 'du'):
         print(datasets.__doc__ + '\n')
 
 
+def describe_item(item):
+    """Extract the displayed details of a listed file or folder.
+
+    Parameters
+    ----------
+    item : dict
+        An item as returned by Datasets.list_folder_content.
+
+    Returns
+    -------
+    dict
+        The type, owner, size, raw_size, updated, name, storage_path and
+        is_folder of the item.
+    """
+    is_folder = "folderType" in item or item.get("isDir", False)
+    type_ = "folder" if is_folder else "file"
+
+    # Enhanced type information
+    if is_folder:
+        folder_type = item.get("folderType")
+        if folder_type == "VirtualFolder":
+            type_ = "virtual folder"
+        elif folder_type == "S3Folder":
+            type_ = "s3 folder"
+        elif folder_type == "AzureBlobFolder":
+            type_ = "azure folder"
+        else:
+            type_ = "folder"
+    else:
+        # Check if file is managed by Lifebit (user uploaded)
+        is_managed_by_lifebit = item.get("isManagedByLifebit", False)
+        if is_managed_by_lifebit:
+            type_ = "file (user uploaded)"
+        else:
+            type_ = "file (virtual copy)"
+
+    user = item.get("user", {})
+    if isinstance(user, dict):
+        name = user.get("name", "").strip()
+        surname = user.get("surname", "").strip()
+    else:
+        name = surname = ""
+    if name and surname:
+        owner = f"{name} {surname}"
+    elif name:
+        owner = name
+    elif surname:
+        owner = surname
+    else:
+        owner = "-"
+
+    raw_size = item.get("sizeInBytes", item.get("size"))
+    size = format_bytes(raw_size) if not is_folder and raw_size is not None else "-"
+
+    updated = item.get("updatedAt") or item.get("lastModified", "-")
+    filepath = item.get("name", "-")
+
+    if item.get("fileType") == "S3File" or item.get("folderType") == "S3Folder":
+        bucket = item.get("s3BucketName")
+        key = item.get("s3ObjectKey") or item.get("s3Prefix")
+        storage_path = f"s3://{bucket}/{key}" if bucket and key else "-"
+    elif item.get("fileType") == "AzureBlobFile" or item.get("folderType") == "AzureBlobFolder":
+        account = item.get("blobStorageAccountName")
+        container = item.get("blobContainerName")
+        key = item.get("blobName") if item.get("fileType") == "AzureBlobFile" else item.get("blobPrefix")
+        storage_path = f"az://{account}.blob.core.windows.net/{container}/{key}" if account and container and key else "-"
+    else:
+        storage_path = "-"
+
+    return {
+        'type': type_,
+        'owner': owner,
+        'size': size,
+        'raw_size': raw_size,
+        'updated': updated,
+        'name': filepath,
+        'storage_path': storage_path,
+        'is_folder': is_folder
+    }
+
+
+CSV_HEADER = ['Name', 'Storage Path']
+CSV_DETAILS_HEADER = ['Type', 'Owner', 'Size', 'Size (bytes)', 'Last Updated', 'Virtual Name', 'Storage Path']
+
+
+def csv_row(item, details=False):
+    """Return the CSV row of an item described by describe_item."""
+    if not details:
+        return [item['name'], item['storage_path']]
+    return [item['type'], item['owner'], item['size'],
+            item['raw_size'] if item['raw_size'] is not None else '',
+            item['updated'], item['name'], item['storage_path']]
+
+
+def ndjson_record(item, depth=None):
+    """Return the NDJSON record of an item described by describe_item."""
+    record = {
+        'name': item['name'],
+        'type': item['type'],
+        'is_folder': item['is_folder'],
+        'owner': item['owner'],
+        'size_bytes': item['raw_size'],
+        'updated': item['updated'],
+        'storage_path': item['storage_path']
+    }
+    if depth is not None:
+        record['depth'] = depth
+    return record
+
+
+def stream_recursive_listing(datasets, path, details, output_format, output_basename,
+                             max_depth=None, include=(), exclude=(), max_workers=8):
+    """Crawl a folder tree and write every item as soon as it is listed.
+
+    Parameters
+    ----------
+    datasets : Datasets
+        The Datasets object of the project.
+    path : str
+        The folder to crawl. The whole project if None.
+    details : bool
+        Whether to write the details of the items or only their paths.
+    output_format : str
+        One of 'stdout', 'csv' or 'ndjson'.
+    output_basename : str
+        Base name of the csv or ndjson file.
+    max_depth : int, optional
+        Maximum depth to descend to, 1 being the content of `path`.
+    include : tuple
+        Patterns of the paths to write. All the paths if empty.
+    exclude : tuple
+        Patterns of the paths to skip. Excluded folders are not crawled.
+    max_workers : int
+        Maximum number of folders listed concurrently.
+
+    Returns
+    -------
+    int
+        The number of items written.
+    """
+    includes = [path_matcher(p) for p in include]
+    excludes = [path_matcher(p) for p in exclude]
+
+    def is_excluded(item_path):
+        return any(match(item_path) for match in excludes)
+
+    def on_error(folder_path, error):
+        click.secho(f"Failed to list '{folder_path}': {error}", fg='red', err=True)
+
+    out = None
+    writer = None
+    filename = None
+    if output_format == 'csv':
+        filename = f'{output_basename}.csv'
+        out = open(filename, 'w', newline='', encoding='utf-8')
+        writer = csv.writer(out)
+        writer.writerow(CSV_DETAILS_HEADER if details else CSV_HEADER)
+    elif output_format == 'ndjson':
+        filename = f'{output_basename}.ndjson'
+        out = open(filename, 'w', encoding='utf-8')
+    count = 0
+    try:
+        for item_path, item, depth in datasets.walk(path, max_depth=max_depth, max_workers=max_workers,
+                                                    exclude=is_excluded if excludes else None,
+                                                    on_error=on_error):
+            if is_excluded(item_path):
+                continue
+            if includes and not any(match(item_path) for match in includes):
+                continue
+            info = describe_item(item)
+            info['name'] = item_path
+            count += 1
+            if writer is not None:
+                writer.writerow(csv_row(info, details))
+            elif out is not None:
+                out.write(json.dumps(ndjson_record(info, depth)) + '\n')
+            else:
+                line = '\t'.join([info['type'], info['size'], str(info['updated']), item_path,
+                                  info['storage_path']]) if details else item_path
+                if info['is_folder']:
+                    click.secho(line, fg='blue', underline=True)
+                else:
+                    click.echo(line)
+    finally:
+        if out is not None:
+            out.close()
+    if filename is not None:
+        click.secho(f'\nDatasets list saved to: {filename} ({count} items)', fg='green', bold=True)
+    return count
+
+
 @datasets.command(name="ls")
 @click.argument("path", required=False, nargs=1)
 @click.option('-k',
@@ -55,13 +248,33 @@ def datasets(ctx):
 @click.option('--output-format',
               help=('The desired display for the output, either directly in standard output or saved as file. ' +
                     'Default=stdout.'),
-              type=click.Choice(['stdout', 'csv'], case_sensitive=False),
+              type=click.Choice(['stdout', 'csv', 'ndjson'], case_sensitive=False),
               default='stdout')
 @click.option('--output-basename',
               help=('Output file base name to save jobs details. ' +
                     'Default=datasets_ls'),
               default='datasets_ls',
               required=False)
+@click.option('--recursive',
+              help=('List the content of all the sub-folders too. Items are written as soon ' +
+                    'as their folder is listed, with their path relative to PATH.'),
+              is_flag=True)
+@click.option('--max-depth',
+              help='With --recursive, maximum depth to descend to, 1 being the content of PATH.',
+              type=click.IntRange(min=1))
+@click.option('--include',
+              help=('With --recursive, only list the paths matching this glob pattern, regular ' +
+                    'expression or name. You can use this option several times.'),
+              multiple=True)
+@click.option('--exclude',
+              help=('With --recursive, skip the paths matching this glob pattern, regular ' +
+                    'expression or name. Excluded folders are not crawled. You can use this ' +
+                    'option several times.'),
+              multiple=True)
+@click.option('--max-workers',
+              help='With --recursive, maximum number of folders listed concurrently. Default=8.',
+              type=click.IntRange(min=1),
+              default=8)
 @click.pass_context
 @with_profile_config(required_params=['apikey', 'workspace_id', 'project_name'])
 def list_files(ctx,
@@ -75,7 +288,12 @@ def list_files(ctx,
                path,
                details,
                output_format,
-               output_basename):
+               output_basename,
+               recursive,
+               max_depth,
+               include,
+               exclude,
+               max_workers):
     """List contents of a path within a Lifebit Platform workspace dataset."""
     verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
 
@@ -88,6 +306,15 @@ def list_files(ctx,
         cromwell_token=None
     )
 
+    if recursive:
+        try:
+            stream_recursive_listing(datasets, path, details, output_format, output_basename,
+                                     max_depth=max_depth, include=include, exclude=exclude,
+                                     max_workers=max_workers)
+        except Exception as e:
+            raise ValueError(f"Failed to list files for project '{project_name}'. {str(e)}")
+        return
+
     try:
         result = datasets.list_folder_content(path)
         contents = result.get("contents") or result.get("datasets", [])
@@ -95,106 +322,27 @@ def list_files(ctx,
         if not contents:
             contents = result.get("files", []) + result.get("folders", [])
 
-        # Process items to extract data
-        processed_items = []
-        for item in contents:
-            is_folder = "folderType" in item or item.get("isDir", False)
-            type_ = "folder" if is_folder else "file"
-
-            # Enhanced type information
-            if is_folder:
-                folder_type = item.get("folderType")
-                if folder_type == "VirtualFolder":
-                    type_ = "virtual folder"
-                elif folder_type == "S3Folder":
-                    type_ = "s3 folder"
-                elif folder_type == "AzureBlobFolder":
-                    type_ = "azure folder"
-                else:
-                    type_ = "folder"
-            else:
-                # Check if file is managed by Lifebit (user uploaded)
-                is_managed_by_lifebit = item.get("isManagedByLifebit", False)
-                if is_managed_by_lifebit:
-                    type_ = "file (user uploaded)"
-                else:
-                    type_ = "file (virtual copy)"
-
-            user = item.get("user", {})
-            if isinstance(user, dict):
-                name = user.get("name", "").strip()
-                surname = user.get("surname", "").strip()
-            else:
-                name = surname = ""
-            if name and surname:
-                owner = f"{name} {surname}"
-            elif name:
-                owner = name
-            elif surname:
-                owner = surname
-            else:
-                owner = "-"
-
-            raw_size = item.get("sizeInBytes", item.get("size"))
-            size = format_bytes(raw_size) if not is_folder and raw_size is not None else "-"
-
-            updated = item.get("updatedAt") or item.get("lastModified", "-")
-            filepath = item.get("name", "-")
-
-            if item.get("fileType") == "S3File" or item.get("folderType") == "S3Folder":
-                bucket = item.get("s3BucketName")
-                key = item.get("s3ObjectKey") or item.get("s3Prefix")
-                storage_path = f"s3://{bucket}/{key}" if bucket and key else "-"
-            elif item.get("fileType") == "AzureBlobFile" or item.get("folderType") == "AzureBlobFolder":
-                account = item.get("blobStorageAccountName")
-                container = item.get("blobContainerName")
-                key = item.get("blobName") if item.get("fileType") == "AzureBlobFile" else item.get("blobPrefix")
-                storage_path = f"az://{account}.blob.core.windows.net/{container}/{key}" if account and container and key else "-"
-            else:
-                storage_path = "-"
-
-            processed_items.append({
-                'type': type_,
-                'owner': owner,
-                'size': size,
-                'raw_size': raw_size,
-                'updated': updated,
-                'name': filepath,
-                'storage_path': storage_path,
-                'is_folder': is_folder
-            })
+        processed_items = [describe_item(item) for item in contents]
 
         # Output handling
         if output_format == 'csv':
             csv_filename = f'{output_basename}.csv'
 
-            if details:
-                # CSV with all details
-                with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['Type', 'Owner', 'Size', 'Size (bytes)', 'Last Updated', 'Virtual Name', 'Storage Path']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                    for item in processed_items:
-                        writer.writerow({
-                            'Type': item['type'],
-                            'Owner': item['owner'],
-                            'Size': item['size'],
-                            'Size (bytes)': item['raw_size'] if item['raw_size'] is not None else '',
-                            'Last Updated': item['updated'],
-                            'Virtual Name': item['name'],
-                            'Storage Path': item['storage_path']
-                        })
-            else:
-                # CSV with just names
-                with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Name', 'Storage Path'])
-                    for item in processed_items:
-                        writer.writerow([item['name'], item['storage_path']])
+            with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_DETAILS_HEADER if details else CSV_HEADER)
+                for item in processed_items:
+                    writer.writerow(csv_row(item, details))
 
             click.secho(f'\nDatasets list saved to: {csv_filename}', fg='green', bold=True)
 
+        elif output_format == 'ndjson':
+            ndjson_filename = f'{output_basename}.ndjson'
+            with open(ndjson_filename, 'w', encoding='utf-8') as fh:
+                for item in processed_items:
+                    fh.write(json.dumps(ndjson_record(item)) + '\n')
+            click.secho(f'\nDatasets list saved to: {ndjson_filename}', fg='green', bold=True)
+
         else:  # stdout
             if details:
                 console = Console(width=None)
@@ -232,6 +380,106 @@ def list_files(ctx,
         raise ValueError(f"Failed to list files for project '{project_name}'. {str(e)}")
 
 
+@datasets.command(name="du")
+@click.argument("path", required=False, nargs=1)
+@click.option('-k',
+              '--apikey',
+              help='Your Lifebit Platform API key.',
+              required=True)
+@click.option('-c',
+              '--cloudos-url',
+              help=(f'The Lifebit Platform url you are trying to access to. Default={CLOUDOS_URL}.'),
+              default=CLOUDOS_URL,
+              required=True)
+@click.option('--workspace-id',
+              help='The specific Lifebit Platform workspace id.',
+              required=True)
+@click.option('--disable-ssl-verification',
+              help=('Disable SSL certificate verification. Please, remember that this option is ' +
+                    'not generally recommended for security reasons.'),
+              is_flag=True)
+@click.option('--ssl-cert',
+              help='Path to your SSL certificate file.')
+@click.option('--project-name',
+              help='The name of a Lifebit Platform project.',
+              required=True)
+@click.option('--profile', help='Profile to use from the config file', default=None)
+@click.option('--top',
+              help='Number of heaviest folders to show. Default=10.',
+              type=click.IntRange(min=1),
+              default=10)
+@click.option('--max-depth',
+              help=('Only show the folders up to this depth, 1 being the folders directly inside PATH. ' +
+                    'Sizes always include the whole tree.'),
+              type=click.IntRange(min=1))
+@click.option('--max-workers',
+              help='Maximum number of folders listed concurrently. Default=8.',
+              type=click.IntRange(min=1),
+              default=8)
+@click.option('--output-format',
+              help='The desired display for the output. Default=stdout.',
+              type=click.Choice(['stdout', 'json'], case_sensitive=False),
+              default='stdout')
+@click.pass_context
+@with_profile_config(required_params=['apikey', 'workspace_id', 'project_name'])
+def disk_usage(ctx,
+               apikey,
+               cloudos_url,
+               workspace_id,
+               disable_ssl_verification,
+               ssl_cert,
+               project_name,
+               profile,
+               path,
+               top,
+               max_depth,
+               max_workers,
+               output_format):
+    """Show the heaviest sub-folders of a path within a Lifebit Platform workspace dataset."""
+    verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+
+    datasets = Datasets(
+        cloudos_url=cloudos_url,
+        apikey=apikey,
+        workspace_id=workspace_id,
+        project_name=project_name,
+        verify=verify_ssl,
+        cromwell_token=None
+    )
+
+    failed = []
+
+    def on_error(folder_path, error):
+        failed.append(folder_path)
+        click.secho(f"Failed to list '{folder_path}': {error}", fg='red', err=True)
+
+    try:
+        usage = datasets.disk_usage(path, max_workers=max_workers, on_error=on_error)
+    except Exception as e:
+        raise ValueError(f"Failed to compute the size of '{path or project_name}'. {str(e)}")
+
+    if output_format == 'json':
+        result = usage.to_dict(top, max_depth)
+        result['path'] = path or ''
+        result['incomplete_folders'] = failed
+        click.echo(json.dumps(result, indent=2))
+        return
+
+    console = Console()
+    table = Table(show_header=True, header_style="bold white")
+    table.add_column("Size", style="magenta", justify="right", no_wrap=True)
+    table.add_column("Files", style="cyan", justify="right", no_wrap=True)
+    table.add_column("Folder", style="bold", overflow="fold")
+    for i in usage.top(top, max_depth):
+        table.add_row(format_bytes(int(usage.total_bytes[i])), str(int(usage.total_files[i])),
+                      usage.paths[i])
+    console.print(table)
+    console.print(f"Total: [bold]{format_bytes(int(usage.total_bytes[0]))}[/bold] in "
+                  f"{int(usage.total_files[0])} files under '{path or project_name}'")
+    if failed:
+        console.print(f"[yellow]{len(failed)} folders could not be listed, so sizes are incomplete.[/yellow]")
+
+
 @datasets.command(name="mv")
 @click.argument("source_path", required=True)
 @click.argument("destination_path", required=True)
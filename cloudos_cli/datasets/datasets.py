@@ -2,11 +2,19 @@
 This is the main class for file explorer (datasets).
 """
 
-from dataclasses import dataclass
+import copy
+import fnmatch
+import re
+import threading
+from dataclasses import dataclass, field
 from typing import Union
+import numpy as np
 from cloudos_cli.clos import Cloudos
 from cloudos_cli.utils.errors import BadRequestException
 from cloudos_cli.utils.requests import retry_requests_get, retry_requests_put, retry_requests_post, retry_requests_delete
+from cloudos_cli.utils.cache import get_cache, DiskCache
+from cloudos_cli.utils.array_job import classify_pattern
+from cloudos_cli.utils.crawl import walk_tree
 import json
 
 
@@ -35,6 +43,9 @@ class Datasets(Cloudos):
     project_name: str
     verify: Union[bool, str] = True
     project_id: str = None
+    _folder_trie: dict = field(init=False, repr=False, compare=False, default_factory=dict)
+    _trie_lock: threading.Lock = field(init=False, repr=False, compare=False,
+                                       default_factory=threading.Lock)
 
     @property
     def project_id(self) -> str:
@@ -76,6 +87,49 @@ class Datasets(Cloudos):
         """
         return self.get_project_id_from_name(workspace_id, project_name, verify=verify)
 
+    def _invalidate_cache(self):
+        """Drop the cached dataset listings of the workspace after a mutation."""
+        with self._trie_lock:
+            self._folder_trie.clear()
+        get_cache().invalidate('datasets', self.cloudos_url, self.workspace_id)
+
+    def _cached_listing(self, parts, fetch):
+        """Return the listing of a folder, fetching it at most once.
+
+        Listings are kept in a trie of path components, so resolving a path
+        N levels deep lists each level once and later lookups of the same
+        folders or of their ancestors are free. Listings are also persisted in
+        the 'datasets' entries of the on-disk cache.
+
+        Parameters
+        ----------
+        parts : tuple
+            Path components of the folder, () being the project root.
+        fetch : callable
+            Function returning the listing when it is not cached.
+
+        Returns
+        -------
+        dict
+            A copy of the folder listing, so callers can modify it freely.
+        """
+        with self._trie_lock:
+            node = self._folder_trie
+            for name in parts:
+                node = node.setdefault('children', {}).setdefault(name, {})
+            content = node.get('content')
+        if content is None:
+            cache = get_cache()
+            cache_key = DiskCache.make_key(self.cloudos_url, self.apikey, self.workspace_id,
+                                           'datasets', self.project_id, *parts)
+            content = cache.get('datasets', cache_key)
+            if content is None:
+                content = fetch()
+                cache.set('datasets', cache_key, content, self.cloudos_url, self.workspace_id)
+            with self._trie_lock:
+                node['content'] = content
+        return copy.deepcopy(content)
+
     def list_project_content(self):
         """
         Fetch the information of the directories present in the projects.
@@ -91,6 +145,10 @@ class Datasets(Cloudos):
         project_id
             The specific project id
         """
+        return self._cached_listing((), self._fetch_project_content)
+
+    def _fetch_project_content(self):
+        """Request the top-level folders of the project."""
         headers = {
             "Content-type": "application/json",
             "apikey": self.apikey
@@ -106,11 +164,10 @@ class Datasets(Cloudos):
         #  Normalize response
         for item in datasets:
             item["folderType"] = True
-        response = {
+        return {
                 "folders": datasets,
                 "files": []
             }
-        return response
 
     def list_datasets_content(self, folder_name):
         """Uses
@@ -126,6 +183,12 @@ class Datasets(Cloudos):
         folder_name : string
             The requested folder name
         """
+        if folder_name == 'AnalysesResults':
+            folder_name = 'Analyses Results'
+        return self._cached_listing((folder_name,), lambda: self._fetch_datasets_content(folder_name))
+
+    def _fetch_datasets_content(self, folder_name):
+        """Request the items of a top-level folder of the project."""
         # Prepare api request for Lifebit Platform to fetch dataset info
         headers = {
             "Content-type": "application/json",
@@ -134,9 +197,6 @@ class Datasets(Cloudos):
         pro_fol = self.list_project_content()
         folder_id = None
 
-        if folder_name == 'AnalysesResults':
-            folder_name = 'Analyses Results'
-
         for folder in pro_fol.get("folders", []):
             if folder['name'] == folder_name:
                 folder_id = folder['_id']
@@ -296,65 +356,24 @@ class Datasets(Cloudos):
             return self.list_project_content()
 
         parts = path.strip('/').split('/')
-
-        if len(parts) == 1:
-            return self.list_datasets_content(parts[0])
+        if parts[0] == 'AnalysesResults':
+            parts[0] = 'Analyses Results'
 
         dataset_name = parts[0]
         folder_content = self.list_datasets_content(dataset_name)
 
-        path_depth = 1
-        while path_depth < len(parts):
+        # Each level is listed from the descriptor found in its parent listing,
+        # so a path N levels deep costs at most N listings
+        for path_depth in range(1, len(parts)):
             job_name = parts[path_depth]
-            found = False
-
-            # First, check if this is a folder
-            for job_folder in folder_content.get("folders", []):
-                if job_folder["name"] == job_name:
-                    found = True
-                    folder_type = job_folder.get("folderType")
-
-                    if folder_type == "S3Folder":
-                        s3_bucket_name = job_folder['s3BucketName']
-                        s3_relative_path = job_folder['s3Prefix']
-                        if path_depth == len(parts) - 1:
-                            return self.list_s3_folder_content(s3_bucket_name, s3_relative_path)
-                        else:
-                            sub_path = '/'.join(parts[0:path_depth+1])
-                            folder_content = self.list_folder_content(sub_path)
-                            path_depth += 1
-                            break
-
-                    elif folder_type == "VirtualFolder":
-                        folder_id = job_folder['_id']
-                        if path_depth == len(parts) - 1:
-                            return self.list_virtual_folder_content(folder_id)
-                        else:
-                            sub_path = '/'.join(parts[0:path_depth+1])
-                            folder_content = self.list_folder_content(sub_path)
-                            path_depth += 1
-                            break
-
-                    elif folder_type == "AzureBlobFolder":
-                        container_name = job_folder['blobContainerName']
-                        storage_account_name = job_folder['blobStorageAccountName']
-                        blob_prefix = job_folder['blobPrefix']
-                        # trailing slash is mandatory for azure, otherwise it will not list the content of thefolde, just the folder
-                        if not blob_prefix.endswith('/'):
-                            blob_prefix += '/'
-
-                        if path_depth == len(parts) - 1:
-                            return self.list_azure_container_content(container_name, storage_account_name, blob_prefix)
-                        else:
-                            sub_path = '/'.join(parts[0:path_depth+1])
-                            folder_content = self.list_folder_content(sub_path)
-                            path_depth += 1
-                            break
-                    else:
-                        raise ValueError(f"Unsupported folder type '{folder_type}' for path '{path}'")
+            job_folder = next((f for f in folder_content.get("folders", []) if f["name"] == job_name), None)
+            if job_folder is not None:
+                folder_content = self._cached_listing(tuple(parts[:path_depth + 1]),
+                                                      lambda: self._list_folder(job_folder, path))
+                continue
 
             # If not found as a folder and this is the last part of the path, check if it's a file
-            if not found and path_depth == len(parts) - 1:
+            if path_depth == len(parts) - 1:
                 for file_item in folder_content.get("files", []):
                     if file_item["name"] == job_name:
                         # Return the file as a single-item result
@@ -370,16 +389,113 @@ class Datasets(Cloudos):
                             "files": [item],
                             "folders": []
                         }
-
-            if not found:
-                # Check if we're looking for a file but it's not the last part (invalid path)
-                if path_depth < len(parts) - 1:
-                    raise ValueError(f"Folder '{job_name}' not found under dataset '{dataset_name}'")
-                else:
-                    raise ValueError(f"File or folder '{job_name}' not found under dataset '{dataset_name}'")
+                raise ValueError(f"File or folder '{job_name}' not found under dataset '{dataset_name}'")
+            # Looking for a file but it's not the last part (invalid path)
+            raise ValueError(f"Folder '{job_name}' not found under dataset '{dataset_name}'")
 
         return folder_content
 
+    def _list_folder(self, folder, path):
+        """List a folder from its descriptor in the listing of its parent.
+
+        Parameters
+        ----------
+        folder : dict
+            The folder descriptor (S3Folder, VirtualFolder or AzureBlobFolder).
+        path : str
+            The path being resolved, used in error messages.
+        """
+        folder_type = folder.get("folderType")
+        if folder_type == "S3Folder":
+            return self.list_s3_folder_content(folder['s3BucketName'], folder['s3Prefix'])
+        if folder_type == "VirtualFolder":
+            return self.list_virtual_folder_content(folder['_id'])
+        if folder_type == "AzureBlobFolder":
+            blob_prefix = folder['blobPrefix']
+            # trailing slash is mandatory for azure, otherwise it will not list the content of thefolde, just the folder
+            if not blob_prefix.endswith('/'):
+                blob_prefix += '/'
+            return self.list_azure_container_content(folder['blobContainerName'],
+                                                     folder['blobStorageAccountName'], blob_prefix)
+        raise ValueError(f"Unsupported folder type '{folder_type}' for path '{path}'")
+
+    def walk(self, path=None, max_depth=None, max_workers=8, exclude=None, on_error=None):
+        """Crawl a folder tree breadth-first, yielding items as folders are listed.
+
+        Sub-folders are listed concurrently on a bounded thread pool. Only the
+        folders still to be listed are kept in memory, so trees with millions
+        of objects can be streamed. Sub-folder listings bypass the listing
+        cache for the same reason.
+
+        Parameters
+        ----------
+        path : str, optional
+            The folder to crawl. If None, the whole project is crawled.
+        max_depth : int, optional
+            Maximum depth to descend to, 1 being the content of `path`. No
+            limit if None.
+        max_workers : int
+            Maximum number of folders listed at the same time.
+        exclude : callable, optional
+            Predicate receiving the relative path of a folder. Matching
+            folders are not descended into.
+        on_error : callable, optional
+            Called with the relative path of a sub-folder and the exception
+            raised while listing it. If None, the exception is raised. A
+            failure to list `path` itself is always raised.
+
+        Yields
+        ------
+        tuple
+            (relative path, item, depth) for every file and folder found.
+        """
+        def list_folder(folder_path, folder):
+            if folder is None:
+                return self.list_folder_content(path)
+            return self._list_walk_folder(folder, folder_path)
+
+        def children(content):
+            return ((item.get('name'), item, item if self._is_walkable(item) else None)
+                    for item in self._listing_items(content))
+        return walk_tree(None, list_folder, children, max_depth=max_depth, max_workers=max_workers,
+                         exclude=exclude, on_error=on_error)
+
+    def disk_usage(self, path=None, max_workers=8, on_error=None):
+        """Aggregate the size of the files of a folder tree per sub-folder.
+
+        Parameters
+        ----------
+        path : str, optional
+            The folder to measure. If None, the whole project is measured.
+        max_workers : int
+            Maximum number of folders listed at the same time.
+        on_error : callable, optional
+            As in walk.
+
+        Returns
+        -------
+        FolderUsage
+            The size and number of files of every folder of the tree.
+        """
+        return FolderUsage.from_walk(self.walk(path, max_workers=max_workers, on_error=on_error))
+
+    @staticmethod
+    def _listing_items(content):
+        """Return the items of a listing, whatever the format of the endpoint."""
+        items = content.get("contents") or content.get("datasets", [])
+        return items or content.get("files", []) + content.get("folders", [])
+
+    @staticmethod
+    def _is_walkable(item):
+        """Whether a listed item is a folder whose content can be listed."""
+        return item.get("folderType") in (True, "S3Folder", "VirtualFolder", "AzureBlobFolder")
+
+    def _list_walk_folder(self, folder, path):
+        """List a folder found while walking, without caching its content."""
+        if folder.get("folderType") is True:
+            return self.list_datasets_content(folder['name'])
+        return self._list_folder(folder, path)
+
     def move_files_and_folders(self, source_id: str, source_kind: str, target_id: str, target_kind: str):
         """
         Move a file to another dataset in Lifebit Platform.
@@ -416,6 +532,7 @@ class Datasets(Cloudos):
         response = retry_requests_put(url, headers=headers, data=json.dumps(payload), verify=self.verify)
         if response.status_code >= 400:
             raise BadRequestException(response)
+        self._invalidate_cache()
         return response
 
     def rename_item(self, item_id: str, new_name: str, kind: str):
@@ -455,6 +572,7 @@ class Datasets(Cloudos):
         response = retry_requests_put(url, headers=headers, data=json.dumps(payload), verify=self.verify)
         if response.status_code >= 400:
             raise BadRequestException(response)
+        self._invalidate_cache()
         return response
 
     def copy_item(self, item, destination_id, destination_kind):
@@ -523,6 +641,7 @@ class Datasets(Cloudos):
         response = retry_requests_post(url, headers=headers, json=payload)
         if response.status_code >= 400:
             raise BadRequestException(response)
+        self._invalidate_cache()
         return response
 
     def create_virtual_folder(self, name: str, parent_id: str, parent_kind: str):
@@ -565,6 +684,7 @@ class Datasets(Cloudos):
         response = retry_requests_post(url, headers=headers, json=payload, verify=self.verify)
         if response.status_code >= 400:
             raise BadRequestException(response)
+        self._invalidate_cache()
         return response
 
     def delete_item(self, item_id: str, kind: str):
@@ -597,4 +717,128 @@ class Datasets(Cloudos):
         response = retry_requests_delete(url, headers=headers, verify=self.verify)
         if response.status_code >= 400:
             raise BadRequestException(response)
+        self._invalidate_cache()
         return response
+
+
+def path_matcher(pattern):
+    """Build a predicate matching a relative path against a pattern.
+
+    The pattern is classified with classify_pattern: regular expressions are
+    searched in the path, glob patterns are matched against the whole path or
+    its last component, and exact names must be equal to the last component
+    or to the whole path.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression, glob pattern or exact name.
+
+    Returns
+    -------
+    callable
+        Predicate receiving a relative path and returning a bool.
+    """
+    kind = classify_pattern(pattern)
+    if kind == "regex":
+        regex = re.compile(pattern)
+        return lambda p: regex.search(p) is not None
+    if kind == "glob":
+        return lambda p: fnmatch.fnmatchcase(p, pattern) or fnmatch.fnmatchcase(p.rsplit('/', 1)[-1], pattern)
+    return lambda p: p == pattern or p.rsplit('/', 1)[-1] == pattern
+
+
+@dataclass
+class FolderUsage:
+    """Sizes of the folders of a tree, stored as one numeric array per measure.
+
+    Folder i has path paths[i], relative to the measured folder, which is
+    folder 0 with path ''.
+
+    Parameters
+    ----------
+    paths : list
+        Relative path of every folder.
+    parent : numpy.ndarray
+        Index of the parent of every folder, -1 for the measured folder.
+    depth : numpy.ndarray
+        Depth of every folder, 0 for the measured folder.
+    own_bytes : numpy.ndarray
+        Size of the files directly inside every folder.
+    own_files : numpy.ndarray
+        Number of files directly inside every folder.
+    total_bytes : numpy.ndarray
+        Size of all the files below every folder.
+    total_files : numpy.ndarray
+        Number of files below every folder.
+    """
+    paths: list
+    parent: np.ndarray
+    depth: np.ndarray
+    own_bytes: np.ndarray
+    own_files: np.ndarray
+    total_bytes: np.ndarray = None
+    total_files: np.ndarray = None
+
+    def __post_init__(self):
+        if self.total_bytes is None or self.total_files is None:
+            self.total_bytes, self.total_files = self._aggregate()
+
+    @classmethod
+    def from_walk(cls, items):
+        """Build the folder sizes from the items yielded by Datasets.walk."""
+        index = {'': 0}
+        paths, parent, depth, own_bytes, own_files = [''], [-1], [0], [0], [0]
+        for item_path, item, item_depth in items:
+            folder_path = item_path.rsplit('/', 1)[0] if '/' in item_path else ''
+            if "folderType" in item or item.get("isDir", False):
+                index[item_path] = len(paths)
+                paths.append(item_path)
+                parent.append(index.get(folder_path, 0))
+                depth.append(item_depth)
+                own_bytes.append(0)
+                own_files.append(0)
+                continue
+            folder = index.get(folder_path, 0)
+            own_bytes[folder] += int(item.get("sizeInBytes", item.get("size")) or 0)
+            own_files[folder] += 1
+        return cls(paths, np.array(parent, dtype=np.int64), np.array(depth, dtype=np.int64),
+                   np.array(own_bytes, dtype=np.int64), np.array(own_files, dtype=np.int64))
+
+    def _aggregate(self):
+        """Sum the sizes bottom-up, one depth level at a time."""
+        total_bytes = self.own_bytes.copy()
+        total_files = self.own_files.copy()
+        for level in range(int(self.depth.max(initial=0)), 0, -1):
+            idx = np.flatnonzero(self.depth == level)
+            np.add.at(total_bytes, self.parent[idx], total_bytes[idx])
+            np.add.at(total_files, self.parent[idx], total_files[idx])
+        return total_bytes, total_files
+
+    def top(self, n=10, max_depth=None):
+        """Return the indexes of the heaviest sub-folders, heaviest first.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of folders to return.
+        max_depth : int, optional
+            Only consider the folders up to this depth, 1 being the folders
+            directly inside the measured folder.
+        """
+        mask = self.depth >= 1
+        if max_depth is not None:
+            mask &= self.depth <= max_depth
+        idx = np.flatnonzero(mask)
+        return idx[np.argsort(-self.total_bytes[idx], kind='stable')][:n]
+
+    def to_dict(self, n=10, max_depth=None):
+        """Return the total and the heaviest sub-folders as JSON-serialisable data."""
+        return {
+            'total_bytes': int(self.total_bytes[0]),
+            'total_files': int(self.total_files[0]),
+            'folders': [{'path': self.paths[i],
+                         'depth': int(self.depth[i]),
+                         'bytes': int(self.total_bytes[i]),
+                         'files': int(self.total_files[i])} for i in self.top(n, max_depth)]
+        }
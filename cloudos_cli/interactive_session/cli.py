@@ -2,7 +2,6 @@
 
 import rich_click as click
 import json
-import time
 from cloudos_cli.clos import Cloudos
 from cloudos_cli.datasets import Datasets
 from cloudos_cli.utils.errors import BadRequestException
@@ -34,6 +33,7 @@ from cloudos_cli.interactive_session.interactive_session import (
 )
 from cloudos_cli.configure.configure import with_profile_config, CLOUDOS_URL
 from cloudos_cli.utils.cli_helpers import pass_debug_to_subcommands
+from cloudos_cli.utils.polling import PollSchedule
 
 
 def validate_file_explorer_folder(cloudos_url, apikey, workspace_id, folder_project, 
@@ -850,13 +850,13 @@ def get_session_status(ctx,
             else:
                 # Print initial status message before starting watch
                 click.echo(f'Session {session_id} currently is in {display_status}...')
-                start_time = time.time()
+                schedule = PollSchedule(watch_interval, timeout=max_wait_time_seconds)
                 previous_status = display_status  # Track previous status to detect changes
                 while True:
                     # Get current status
                     api_status = session_response.get('status', '')
                     display_status = map_status(api_status)
-                    elapsed = time.time() - start_time
+                    elapsed = schedule.elapsed()
                     if verbose:
                         print(f'\tPolling... Status: {display_status} | Elapsed: {int(elapsed)}s')
                     # Print status change message
@@ -871,7 +871,7 @@ def get_session_status(ctx,
                         click.secho(f'⚠ Session reached terminal state: {display_status}', fg='yellow')
                         break
                     # Check timeout AFTER evaluating current status
-                    if elapsed > max_wait_time_seconds:
+                    if schedule.expired():
                         click.secho(
                             f'Timeout: Session did not reach running state within {max_wait_time}. '
                             f'Current status: {display_status}. Exiting watch mode.',
@@ -880,7 +880,7 @@ def get_session_status(ctx,
                         )
                         break
                     # Wait before next poll
-                    time.sleep(watch_interval)
+                    schedule.wait(api_status)
                     # Fetch updated status for next iteration
                     session_response = get_interactive_session_status(
                         cloudos_url=cloudos_url,
@@ -10,9 +10,8 @@ from rich.table import Table
 from rich.console import Console
 from rich.panel import Panel
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from cloudos_cli.utils.requests import retry_requests_get
+from cloudos_cli.utils.requests import retry_requests_get, get_session
+from cloudos_cli.utils.polling import PollSchedule
 
 
 def validate_instance_type(instance_type, execution_platform='aws'):
@@ -1415,22 +1414,10 @@ class InteractiveSessionAPI:
         self.cloudos_url = cloudos_url.rstrip('/')
         self.apikey = apikey
         self.verify_ssl = verify_ssl
-        self.session = self._create_session()
-
-    def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy."""
-        session = requests.Session()
-        # Configure retry strategy with exponential backoff
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=['GET']
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
+        # Reuse the process-wide pooled session for this Lifebit Platform host,
+        # retrying GET requests with exponential backoff
+        self.session = get_session(self.cloudos_url, verify=verify_ssl, total=3, backoff_factor=1,
+                                   allowed_methods=['GET'])
 
     def get_session_status(self, session_id: str, team_id: str) -> dict:
         """Retrieve session status from API endpoint.
@@ -1600,6 +1587,7 @@ class WatchModeManager:
         """
         spinner_chars = ['◜', '◝', '◞', '◟']
         spinner_index = 0
+        schedule = PollSchedule(self.interval)
 
         try:
             while True:
@@ -1632,7 +1620,7 @@ class WatchModeManager:
                     return response
                 # Wait before next poll
                 spinner_index += 1
-                time.sleep(self.interval)
+                schedule.wait(status)
         except KeyboardInterrupt:
             print("\n⚠ Watch mode interrupted by user.")
             raise
@@ -1900,11 +1888,10 @@ def poll_session_termination(cloudos_url: str, apikey: str, session_id: str, tea
         If session doesn't reach terminal state within max_wait
     """
     console = Console()
-    start_time = time.time()
+    schedule = PollSchedule(poll_interval, timeout=max_wait)
     previous_status = None
     with console.status("[bold yellow]Pausing session...", spinner='dots'):
         while True:
-            elapsed = time.time() - start_time
             # Fetch current status
             session_response = get_interactive_session_status(
                 cloudos_url=cloudos_url,
@@ -1924,13 +1911,13 @@ def poll_session_termination(cloudos_url: str, apikey: str, session_id: str, tea
                 console.print("[bold green]✓ Session paused successfully")
                 return session_response
             # Check timeout
-            if elapsed > max_wait:
+            if schedule.expired():
                 raise TimeoutError(
                     f"Session did not reach terminal state within {max_wait} seconds. "
                     f"Current status: {current_status}"
                 )
             # Wait before next poll
-            time.sleep(poll_interval)
+            schedule.wait(current_status)
 
 
 def fetch_interactive_session_page(cl, workspace_id, page_num, limit, filter_status, filter_only_mine, archived, verify_ssl):
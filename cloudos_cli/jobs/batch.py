@@ -0,0 +1,207 @@
+"""
+Manifest-driven bulk job submission.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cloudos_cli.utils.concurrency import RateLimiter
+
+# Manifest columns with a special meaning. Any other column is passed to the
+# workflow as a parameter (column name = parameter name).
+RESERVED_COLUMNS = ['job_name', 'job_id', 'git_commit', 'git_tag', 'git_branch', 'nextflow_profile']
+
+
+def read_manifest(manifest):
+    """Read the rows of a CSV or JSONL manifest.
+
+    Parameters
+    ----------
+    manifest : str
+        Path to a .csv file with a header or to a .jsonl file with one JSON
+        object per line.
+
+    Returns
+    -------
+    list
+        A list of dicts, one per manifest row. Empty values are set to None.
+    """
+    ext = os.path.splitext(manifest)[1].lower()
+    rows = []
+    with open(manifest, newline='') as fh:
+        if ext == '.csv':
+            reader = csv.DictReader(fh)
+            rows = [dict(row) for row in reader]
+        elif ext in ('.jsonl', '.ndjson'):
+            for n, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f'Invalid JSON in line {n} of {manifest}: {e}')
+                if not isinstance(row, dict):
+                    raise ValueError(f'Line {n} of {manifest} is not a JSON object.')
+                rows.append(row)
+        else:
+            raise ValueError('Please, provide a .csv or .jsonl file for --manifest.')
+    return [{k.strip(): (None if v is None or str(v).strip() == '' else str(v).strip())
+             for k, v in row.items() if k is not None} for row in rows]
+
+
+def row_keys(rows):
+    """Return the key identifying each manifest row in the results file.
+
+    The key is a hash of the content of the row (every column but job_id),
+    numbered among identical rows, so that the rows of an edited manifest
+    (inserted, deleted or reordered rows) are still matched to their jobs.
+
+    Returns
+    -------
+    list
+        One key per row, in the same order.
+    """
+    keys = []
+    seen = {}
+    for row in rows:
+        content = json.dumps({k: v for k, v in row.items() if k != 'job_id'}, sort_keys=True)
+        digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+        seen[digest] = seen.get(digest, 0) + 1
+        keys.append(f'{digest}-{seen[digest]}')
+    return keys
+
+
+def load_submitted_rows(results):
+    """Return the manifest rows already submitted according to a results file.
+
+    Parameters
+    ----------
+    results : str
+        Path to the JSONL results file written by submit_manifest.
+
+    Returns
+    -------
+    dict
+        Row key (see row_keys) -> job id. Records written without a key
+        are returned under the key None.
+    """
+    submitted = {}
+    if not os.path.exists(results):
+        return submitted
+    with open(results) as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('job_id'):
+                submitted[record.get('key')] = record['job_id']
+    return submitted
+
+
+def row_parameters(row, shared_parameters=()):
+    """Merge the shared -p parameters with the parameters of a manifest row.
+
+    Row values take precedence over shared parameters with the same name.
+
+    Returns
+    -------
+    tuple
+        Parameters in the form ('name=value', ...).
+    """
+    params = {}
+    for p in shared_parameters:
+        params[p.split('=')[0]] = p
+    for name, value in row.items():
+        if name not in RESERVED_COLUMNS and value is not None:
+            params[name] = f'{name}={value}'
+    return tuple(params.values())
+
+
+def submit_manifest(job, rows, build_payload, results, max_workers=4, rate_limit=2.0,
+                    verify=True, on_result=None):
+    """Submit the pending rows of a manifest through a bounded worker pool.
+
+    Rows with a job_id column, or already recorded with a job id in the
+    results file, are skipped so an interrupted run can simply be re-run.
+    Rows are matched to the results file by content (see row_keys). If the
+    results file records jobs for rows that are no longer in the manifest,
+    nothing is submitted and a ValueError is raised.
+
+    Parameters
+    ----------
+    job : cloudos_cli.jobs.job.Job
+        Job object with the project and workflow already resolved.
+    rows : list
+        The manifest rows, as returned by read_manifest.
+    build_payload : callable
+        Function receiving a manifest row and returning its job payload.
+    results : str
+        Path to the JSONL results file. One line per submitted or failed row
+        is appended as soon as it is known.
+    max_workers : int
+        Maximum number of concurrent submissions.
+    rate_limit : float
+        Maximum number of submissions per second. 0 disables the limit.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    on_result : callable, optional
+        Called with every result record, e.g. to report progress.
+
+    Returns
+    -------
+    dict
+        Number of 'submitted', 'failed' and 'skipped' rows.
+    """
+    keys = row_keys(rows)
+    submitted = load_submitted_rows(results)
+    unknown = set(submitted) - set(keys)
+    if unknown:
+        raise ValueError(f'{results} records {len(unknown)} submitted jobs for rows that are not in '
+                         'the manifest (the rows were edited, or the file was written for another '
+                         'manifest). Please, use another --output file to submit this manifest.')
+    summary = {'submitted': 0, 'failed': 0, 'skipped': 0}
+    limiter = RateLimiter(rate_limit)
+    lock = threading.Lock()
+
+    def record(row_n, row, job_id=None, error=None):
+        result = {
+            'row': row_n,
+            'key': keys[row_n - 1],
+            'job_name': row.get('job_name'),
+            'job_id': job_id,
+            'status': 'submitted' if job_id else 'failed',
+            'error': error
+        }
+        with lock:
+            summary[result['status']] += 1
+            out.write(json.dumps(result) + '\n')
+            out.flush()
+            if on_result is not None:
+                on_result(result)
+
+    def submit(row_n, row, payload):
+        limiter.wait()
+        try:
+            record(row_n, row, job_id=job.post_job(payload, verify=verify))
+        except Exception as e:
+            record(row_n, row, error=str(e))
+
+    with open(results, 'a') as out, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for row_n, row in enumerate(rows, start=1):
+            if row.get('job_id') or keys[row_n - 1] in submitted:
+                summary['skipped'] += 1
+                continue
+            # Payloads are built up front so that invalid rows fail without a request
+            try:
+                payload = build_payload(row)
+            except Exception as e:
+                record(row_n, row, error=str(e))
+                continue
+            pool.submit(submit, row_n, row, payload)
+    return summary
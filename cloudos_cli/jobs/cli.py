@@ -2,15 +2,29 @@
 
 import rich_click as click
 import cloudos_cli.jobs.job as jb
+from cloudos_cli.jobs.batch import read_manifest, row_parameters, submit_manifest
+from cloudos_cli.jobs.export import write_ndjson, write_parquet, parquet_available
+from cloudos_cli.jobs.index import JobIndex, index_path
+from cloudos_cli.jobs.stats import (STATS_GROUPS, jobs_frame, job_stats, stats_records, format_duration,
+                                   expected_runtime)
+from cloudos_cli.jobs.wait import TERMINAL_STATUSES, wait_jobs
+from cloudos_cli.jobs.watch import JobListWatcher, watch_job_list
+from cloudos_cli.jobs.paths import iter_job_paths, write_job_paths, iter_results_tree
+from cloudos_cli.jobs.logs import MirrorLogStorage, download_job_logs
+from cloudos_cli.datasets.datasets import path_matcher
 from cloudos_cli.jobs.job import (
     fetch_job_page,
     create_api_pagination_callback,
-    create_client_pagination_callback
+    create_stream_pagination_callback,
+    create_index_pagination_callback
 )
 from cloudos_cli.clos import Cloudos
+from cloudos_cli.clos_async import AsyncCloudos, run_async
 from cloudos_cli.utils.errors import BadRequestException
-from cloudos_cli.utils.resources import ssl_selector
-from cloudos_cli.utils.details import create_job_details, create_job_list_table
+from cloudos_cli.utils.resources import ssl_selector, format_bytes
+from cloudos_cli.utils.concurrency import run_lookups, raise_lookup_errors
+from cloudos_cli.utils.polling import PollSchedule
+from cloudos_cli.utils.details import create_job_details, create_job_list_table, create_job_watch_table
 from cloudos_cli.utils.nextflow_version import resolve_nextflow_version
 from cloudos_cli.cost.cost import CostViewer
 from cloudos_cli.related_analyses.related_analyses import related_analyses
@@ -18,15 +32,19 @@ from cloudos_cli.configure.configure import with_profile_config, CLOUDOS_URL
 from cloudos_cli.link import Link
 from cloudos_cli.constants import (
     JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_ABORTED,
     REQUEST_INTERVAL_CROMWELL,
     ABORT_JOB_STATES
 )
 import json
 import copy
-import time
+import itertools
+import os
 from cloudos_cli.queue.queue import Queue
 import sys
 from rich.console import Console
+from rich.table import Table
 from cloudos_cli.utils.cli_helpers import pass_debug_to_subcommands
 
 
@@ -276,11 +294,31 @@ def run(ctx,
     else:
         use_mountpoints = False
     if verbose:
-        print('\t...Detecting workflow type')
+        print('\t...Resolving workflow, project, job queue and user details')
     cl = Cloudos(cloudos_url, apikey, cromwell_token)
-    workflow_type = cl.detect_workflow(workflow_name, workspace_id, verify_ssl, last)
-    is_module = cl.is_module(workflow_name, workspace_id, verify_ssl, last)
-    
+    queue = Queue(cloudos_url=cloudos_url, apikey=apikey, cromwell_token=cromwell_token,
+                  workspace_id=workspace_id, verify=verify_ssl)
+    # These lookups are independent, so run them concurrently
+    lookups = {
+        'workflow': lambda: cl.resolve_workflow(workspace_id, workflow_name, verify_ssl, last),
+        'project': lambda: cl.get_project_id_from_name(workspace_id, project_name, verify_ssl)
+    }
+    if batch:
+        lookups['job queues'] = queue.get_job_queues
+    if use_private_docker_repository:
+        # Read fresh, so that Docker credentials linked since the last run are seen
+        lookups['user info'] = lambda: cl.get_user_info(verify=verify_ssl, refresh=True)
+    if wdl_mainfile is not None and execution_platform != 'hpc':
+        lookups['cromwell status'] = lambda: cl.get_cromwell_status(workspace_id, verify_ssl)
+    resolved, lookup_errors, lookup_timings = run_lookups(lookups)
+    if verbose:
+        for name, elapsed in lookup_timings.items():
+            print(f'\t\t{name}: {elapsed:.2f}s')
+    raise_lookup_errors(lookup_errors, required=['workflow', 'project'])
+    workflow = resolved['workflow']
+    workflow_type = workflow.workflow_type
+    is_module = workflow.is_module
+
     # Resolve and validate Nextflow version
     nextflow_version = resolve_nextflow_version(
         nextflow_version=nextflow_version,
@@ -289,7 +327,7 @@ def run(ctx,
         workflow_name=workflow_name,
         verbose=verbose
     )
-    
+
     if execution_platform == 'hpc' and workflow_type == 'wdl':
         raise ValueError(f'The workflow {workflow_name} is a WDL workflow. ' +
                          'WDL is not supported on HPC execution platform.')
@@ -297,17 +335,17 @@ def run(ctx,
         print('WDL workflow detected')
         if wdl_mainfile is None:
             raise ValueError('Please, specify WDL mainFile using --wdl-mainfile <mainFile>.')
-        c_status = cl.get_cromwell_status(workspace_id, verify_ssl)
+        raise_lookup_errors(lookup_errors, required=['cromwell status'])
+        c_status = resolved['cromwell status']
         c_status_h = json.loads(c_status.content)["status"]
         print(f'\tCurrent Cromwell server status is: {c_status_h}\n')
         if c_status_h == 'Stopped':
             print('\tStarting Cromwell server...\n')
             cl.cromwell_switch(workspace_id, 'restart', verify_ssl)
-            elapsed = 0
-            while elapsed < 300 and c_status_h != 'Running':
+            schedule = PollSchedule(REQUEST_INTERVAL_CROMWELL, timeout=300)
+            while not schedule.expired() and c_status_h != 'Running':
                 c_status_old = c_status_h
-                time.sleep(REQUEST_INTERVAL_CROMWELL)
-                elapsed += REQUEST_INTERVAL_CROMWELL
+                schedule.wait(c_status_h)
                 c_status = cl.get_cromwell_status(workspace_id, verify_ssl)
                 c_status_h = json.loads(c_status.content)["status"]
                 if c_status_h != c_status_old:
@@ -327,9 +365,12 @@ def run(ctx,
         cromwell_id = None
     if verbose:
         print('\t...Preparing objects')
+    # Reuse the already resolved workflow and project instead of looking them up again
+    workflow_id = workflow.find_id(wdl_mainfile, wdl_importsfile, repository_platform)
     j = jb.Job(cloudos_url, apikey, None, workspace_id, project_name, workflow_name,
                mainfile=wdl_mainfile, importsfile=wdl_importsfile,
-               repository_platform=repository_platform, verify=verify_ssl, last=last)
+               repository_platform=repository_platform, verify=verify_ssl, last=last,
+               project_id=resolved['project'], workflow_id=workflow_id)
     if verbose:
         print('\tThe following Job object was created:')
         print('\t' + str(j))
@@ -347,17 +388,19 @@ def run(ctx,
                   'azure-worker-instance-type, azure-worker-instance-disk and ' +
                   'azure-worker-instance-spot are not taking effect.')
     else:
-        queue = Queue(cloudos_url=cloudos_url, apikey=apikey, cromwell_token=cromwell_token,
-                      workspace_id=workspace_id, verify=verify_ssl)
+        if batch:
+            raise_lookup_errors(lookup_errors, required=['job queues'])
         job_queue_id = queue.fetch_job_queue_id(workflow_type=workflow_type, batch=batch,
-                                                job_queue=job_queue)
+                                                job_queue=job_queue,
+                                                job_queues=resolved.get('job queues'))
     if use_private_docker_repository:
         if is_module:
             print(f'Workflow "{workflow_name}" is a Lifebit Platform module. ' +
                   'Option --use-private-docker-repository will be ignored.')
             docker_login = False
         else:
-            me = j.get_user_info(verify=verify_ssl)['dockerRegistriesCredentials']
+            raise_lookup_errors(lookup_errors, required=['user info'])
+            me = resolved['user info']['dockerRegistriesCredentials']
             if len(me) == 0:
                 raise Exception('User private Docker repository has been selected but your user ' +
                                 'credentials have not been configured yet. Please, link your ' +
@@ -406,12 +449,15 @@ def run(ctx,
     if wait_completion:
         print('\tPlease, wait until job completion (max wait time of ' +
               f'{wait_time} seconds).\n')
+        # Previous runs of the workflow in the local job index, if any, tell
+        # when the job is likely to end
         j_status = j.wait_job_completion(job_id=j_id,
                                          workspace_id=workspace_id,
                                          wait_time=wait_time,
                                          request_interval=request_interval,
                                          verbose=verbose,
-                                         verify=verify_ssl)
+                                         verify=verify_ssl,
+                                         expected_runtime=expected_runtime(workspace_id, workflow_name))
         j_name = j_status['name']
         j_final_s = j_status['status']
         if j_final_s == JOB_COMPLETED:
@@ -431,6 +477,214 @@ def run(ctx,
               f'\t\t--job-id {j_id}\n')
 
 
+@job.command('run-batch', cls=click.RichCommand)
+@click.option('-k',
+              '--apikey',
+              help='Your Lifebit Platform API key',
+              required=True)
+@click.option('-c',
+              '--cloudos-url',
+              help=(f'The Lifebit Platform url you are trying to access to. Default={CLOUDOS_URL}.'),
+              default=CLOUDOS_URL,
+              required=True)
+@click.option('--workspace-id',
+              help='The specific Lifebit Platform workspace id.',
+              required=True)
+@click.option('--project-name',
+              help='The name of a Lifebit Platform project.',
+              required=True)
+@click.option('--workflow-name',
+              help='The name of a Lifebit Platform Nextflow workflow or pipeline.',
+              required=True)
+@click.option('--manifest',
+              help=('A .csv or .jsonl file with one job per row. The job_name, git_commit, ' +
+                    'git_tag, git_branch and nextflow_profile columns set those options for the ' +
+                    'job, rows with a job_id are skipped and any other column is passed to the ' +
+                    'job as a parameter, overriding -p parameters with the same name.'),
+              type=click.Path(exists=True, dir_okay=False),
+              required=True)
+@click.option('--output',
+              help=('JSONL file where one line per submitted job (row, job_name, job_id, ' +
+                    'status, error) is appended. Re-running with the same file skips the rows ' +
+                    'already submitted. Default=<manifest>.results.jsonl.'))
+@click.option('--max-workers',
+              help='Maximum number of concurrent submissions. Default=4.',
+              type=click.IntRange(min=1),
+              default=4)
+@click.option('--rate-limit',
+              help='Maximum number of submissions per second (0 for no limit). Default=2.',
+              type=click.FloatRange(min=0),
+              default=2.0)
+@click.option('--last',
+              help=('When the workflows are duplicated, use the latest imported workflow (by date).'),
+              is_flag=True)
+@click.option('--job-config',
+              help=('A config file similar to a nextflow.config file, ' +
+                    'but only with the parameters shared by all the jobs.'))
+@click.option('-p',
+              '--parameter',
+              multiple=True,
+              help=('A parameter shared by all the jobs, in the form ' +
+                    'parameter_name=parameter_value. You can use this option as many ' +
+                    'times as parameters you want to include.'))
+@click.option('--nextflow-profile',
+              help=('A comma separated string indicating the nextflow profile/s ' +
+                    'to use with the jobs.'))
+@click.option('--nextflow-version',
+              help=('Nextflow version to use when executing the workflow in Lifebit Platform. ' +
+                    'Defaults to 22.10.8 for Platform Workflows or 24.04.4 for user-imported Workflows.'),
+              type=click.Choice(['22.10.8', '24.04.4', '25.04.8', '25.10.4', '22.11.1-edge', 'latest']),
+              default=None)
+@click.option('--git-commit',
+              help='The git commit hash to run for the selected pipeline.')
+@click.option('--git-tag',
+              help='The tag to run for the selected pipeline.')
+@click.option('--git-branch',
+              help='The branch to run for the selected pipeline.')
+@click.option('--resumable',
+              help='Whether to make the jobs able to be resumed or not.',
+              is_flag=True)
+@click.option('--do-not-save-logs',
+              help=('Avoids process log saving. If you select this option, your job process ' +
+                    'logs will not be stored.'),
+              is_flag=True)
+@click.option('--job-queue',
+              help='Name of the job queue to use with the batch jobs.')
+@click.option('--instance-type',
+              help=('The type of compute instance to use as master node. ' +
+                    'Default=c5.xlarge(aws)|Standard_D4as_v4(azure).'),
+              default='NONE_SELECTED')
+@click.option('--instance-disk',
+              help='The disk space of the master node instance, in GB. Default=500.',
+              type=int,
+              default=500)
+@click.option('--execution-platform',
+              help='Name of the execution platform implemented in your Lifebit Platform. Default=aws.',
+              type=click.Choice(['aws', 'azure']),
+              default='aws')
+@click.option('--cost-limit',
+              help='Add a cost limit to each job. Default=30.0 (For no cost limit please use -1).',
+              type=float,
+              default=30.0)
+@click.option('--verbose',
+              help='Whether to print information messages or not.',
+              is_flag=True)
+@click.option('--disable-ssl-verification',
+              help=('Disable SSL certificate verification. Please, remember that this option is ' +
+                    'not generally recommended for security reasons.'),
+              is_flag=True)
+@click.option('--ssl-cert',
+              help='Path to your SSL certificate file.')
+@click.option('--profile', help='Profile to use from the config file', default=None)
+@click.pass_context
+@with_profile_config(required_params=['apikey', 'workspace_id', 'workflow_name', 'project_name'])
+def run_batch(ctx,
+              apikey,
+              cloudos_url,
+              workspace_id,
+              project_name,
+              workflow_name,
+              manifest,
+              output,
+              max_workers,
+              rate_limit,
+              last,
+              job_config,
+              parameter,
+              nextflow_profile,
+              nextflow_version,
+              git_commit,
+              git_tag,
+              git_branch,
+              resumable,
+              do_not_save_logs,
+              job_queue,
+              instance_type,
+              instance_disk,
+              execution_platform,
+              cost_limit,
+              verbose,
+              disable_ssl_verification,
+              ssl_cert,
+              profile):
+    """Submit one Nextflow job per row of a manifest file."""
+    verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+    rows = read_manifest(manifest)
+    if output is None:
+        output = os.path.splitext(manifest)[0] + '.results.jsonl'
+    if instance_type == 'NONE_SELECTED':
+        instance_type = 'c5.xlarge' if execution_platform == 'aws' else 'Standard_D4as_v4'
+    batch = execution_platform == 'aws'
+    if verbose:
+        print('\t...Resolving workflow, project and job queue details')
+    # Everything shared by the jobs is resolved once for the whole manifest
+    cl = Cloudos(cloudos_url, apikey, None)
+    queue = Queue(cloudos_url=cloudos_url, apikey=apikey, cromwell_token=None,
+                  workspace_id=workspace_id, verify=verify_ssl)
+    lookups = {
+        'workflow': lambda: cl.resolve_workflow(workspace_id, workflow_name, verify_ssl, last),
+        'project': lambda: cl.get_project_id_from_name(workspace_id, project_name, verify_ssl)
+    }
+    if batch:
+        lookups['job queues'] = queue.get_job_queues
+    resolved, lookup_errors, lookup_timings = run_lookups(lookups)
+    if verbose:
+        for name, elapsed in lookup_timings.items():
+            print(f'\t\t{name}: {elapsed:.2f}s')
+    raise_lookup_errors(lookup_errors, required=['workflow', 'project'])
+    workflow = resolved['workflow']
+    if workflow.workflow_type != 'nextflow':
+        raise ValueError(f'The workflow {workflow_name} is a {workflow.workflow_type} workflow. ' +
+                         'Only Nextflow workflows are supported by run-batch.')
+    is_module = workflow.is_module
+    nextflow_version = resolve_nextflow_version(
+        nextflow_version=nextflow_version,
+        execution_platform=execution_platform,
+        is_module=is_module,
+        workflow_name=workflow_name,
+        verbose=verbose
+    )
+    project_id = resolved['project']
+    workflow_id = workflow.find_id(None, None, 'github')
+    if is_module:
+        job_queue_id = None
+    else:
+        if batch:
+            raise_lookup_errors(lookup_errors, required=['job queues'])
+        job_queue_id = queue.fetch_job_queue_id(workflow_type='nextflow', batch=batch,
+                                                job_queue=job_queue,
+                                                job_queues=resolved.get('job queues'))
+    j = jb.Job(cloudos_url, apikey, None, workspace_id, project_name, workflow_name,
+               verify=verify_ssl, last=last, project_id=project_id, workflow_id=workflow_id)
+
+    def build_payload(row):
+        return j.convert_nextflow_to_json(
+            job_config, None, row_parameters(row, parameter), None, None, is_module, [],
+            row.get('git_commit') or git_commit, row.get('git_tag') or git_tag,
+            row.get('git_branch') or git_branch, project_id, workflow_id,
+            row.get('job_name') or 'new_job', resumable, not do_not_save_logs, batch,
+            job_queue_id, row.get('nextflow_profile') or nextflow_profile, nextflow_version,
+            instance_type, instance_disk, execution_platform, None, 'nextflow', None,
+            'Standard_D4as_v4', 100, False, cost_limit, False, False, False,
+            command=None, cpus=1, memory=4)
+
+    def report(result):
+        if result['job_id']:
+            print(f"\tRow {result['row']}: job {result['job_id']} submitted")
+        else:
+            print(f"\tRow {result['row']}: failed - {result['error']}")
+
+    print(f'\nSubmitting {len(rows)} jobs from {manifest}...')
+    print(f'\tNextflow version: {nextflow_version}')
+    summary = submit_manifest(j, rows, build_payload, output, max_workers=max_workers,
+                              rate_limit=rate_limit, verify=verify_ssl, on_result=report)
+    print(f"\n\tSubmitted: {summary['submitted']}, failed: {summary['failed']}, " +
+          f"skipped: {summary['skipped']}")
+    print(f'\tResults written to {output}')
+    if summary['failed']:
+        sys.exit(1)
+
+
 @job.command('status')
 @click.option('-k',
               '--apikey',
@@ -493,6 +747,144 @@ def job_status(ctx,
         raise ValueError(f"Failed to retrieve working directory for job '{job_id}'. {str(e)}")
 
 
+def bulk_job_options(func):
+    """Options selecting many jobs, shared by `job logs`, `job results` and `job workdir`."""
+    options = [
+        click.option('--job-ids',
+                     help=('Comma-separated list of job ids to resolve at once, instead of --job-id. ' +
+                           'E.g. id1,id2,id3')),
+        click.option('--filter-status',
+                     help='Resolve the jobs with this status (e.g., completed, running, failed, aborted).'),
+        click.option('--filter-project', help='Resolve the jobs of this project.'),
+        click.option('--filter-workflow', help='Resolve the jobs of this workflow/pipeline.'),
+        click.option('--filter-job-name', help='Resolve the jobs whose name contains this text ( case insensitive ).'),
+        click.option('--filter-owner', help='Resolve the jobs of this owner username.'),
+        click.option('--filter-only-mine', help='Resolve only your jobs.', is_flag=True),
+        click.option('--last-n-jobs',
+                     help=("With job filters, resolve only the last N matching jobs. Default: all " +
+                           "the matching jobs.")),
+        click.option('--output-basename',
+                     help=('With --job-ids or job filters, output file base name of the NDJSON file, ' +
+                           'with one line per job. Default=job_<command>.')),
+        click.option('--max-workers',
+                     help=('Maximum number of jobs (directories with --tree, files with --download) ' +
+                           'processed concurrently. Default=8.'),
+                     type=click.IntRange(min=1),
+                     default=8)
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def select_job_ids(cl, workspace_id, verify_ssl, job_id, job_ids, filters, last_n_jobs):
+    """Return the ids of the jobs selected with --job-id, --job-ids or the job filters.
+
+    The jobs matching the filters are listed lazily, as they are consumed.
+    """
+    bulk = job_ids or last_n_jobs or any(filters.values())
+    if not (bulk or job_id):
+        raise click.UsageError('Please, provide --job-id, --job-ids or job filters.')
+    if bulk and job_id:
+        raise click.UsageError('--job-id cannot be combined with --job-ids or job filters.')
+    if job_ids and (last_n_jobs or any(filters.values())):
+        raise click.UsageError('--job-ids cannot be combined with job filters.')
+    if job_id:
+        return [job_id]
+    if job_ids:
+        return list(dict.fromkeys(j.strip() for j in job_ids.split(',') if j.strip()))
+    jobs = cl.iter_jobs(workspace_id, limit=last_n_jobs, verify=verify_ssl, **filters)
+    return (job['_id'] for job in jobs)
+
+
+def bulk_job_paths(kind, cloudos_url, apikey, workspace_id, verify_ssl, job_id, job_ids,
+                   single_job_flags, filters, last_n_jobs, output_basename, max_workers, verbose):
+    """Write the `kind` location of many jobs to an NDJSON file.
+
+    Returns
+    -------
+    bool
+        False if a single job (--job-id) was requested instead.
+    """
+    if job_id and not (job_ids or last_n_jobs or any(filters.values())):
+        return False
+    cl = Cloudos(cloudos_url, apikey, None)
+    ids = select_job_ids(cl, workspace_id, verify_ssl, job_id, job_ids, filters, last_n_jobs)
+    used = [flag for flag, value in single_job_flags.items() if value]
+    if used:
+        raise click.UsageError(f"{', '.join(used)} can only be used with --job-id.")
+    print(f'Executing {kind}...')
+    outfile = f"{output_basename or f'job_{kind}'}.ndjson"
+    if verbose:
+        print(f'\tResolving the {kind} of the jobs with up to {max_workers} concurrent workers...')
+    with open(outfile, 'w') as fh:
+        n_jobs, n_errors = write_job_paths(
+            iter_job_paths(cl, workspace_id, ids, kind, verify=verify_ssl, max_workers=max_workers), fh)
+    print(f'\tThe {kind} of {n_jobs} jobs have been written to {outfile}.')
+    if n_errors:
+        click.secho(f'\t{n_errors} of them could not be resolved, see their "error" field.',
+                    fg='yellow')
+    return True
+
+
+def print_downloaded_logs(cl, workspace_id, ids, directory, storage, verify_ssl, max_workers):
+    """Download the log files of the selected jobs, printing one line per job."""
+    print('Executing logs...')
+    n_files = n_bytes = n_cached = n_errors = 0
+    for summary in download_job_logs(cl, workspace_id, ids, directory, storage, verify=verify_ssl,
+                                     max_workers=max_workers):
+        if 'error' in summary:
+            n_errors += 1
+            click.secho(f"\t{summary['job_id']}: {summary['error']}", fg='red')
+            continue
+        n_files += len(summary['files'])
+        n_bytes += summary['bytes']
+        n_cached += summary['cached']
+        state = 'already downloaded' if summary['cached'] else f"{format_bytes(summary['bytes'])} downloaded"
+        print(f"\t{summary['job_id']} ({summary['status']}): {len(summary['files'])} files, "
+              f"{state} to {summary['directory']}")
+    click.secho(f'\n{n_files} log files in {directory}: {format_bytes(n_bytes)} downloaded, '
+                f'{n_cached} finished jobs already cached.', fg='green', bold=True)
+    if n_errors:
+        click.secho(f'{n_errors} jobs could not be downloaded.', fg='yellow')
+        sys.exit(1)
+
+
+def print_results_tree(cl, workspace_id, job_id, verify_ssl, max_depth, include, exclude, max_workers):
+    """Print every object of the results directory of a job, with the total size."""
+    includes = [path_matcher(p) for p in include]
+    excludes = [path_matcher(p) for p in exclude]
+
+    def is_excluded(item_path):
+        return any(match(item_path) for match in excludes)
+
+    def on_error(folder_path, error):
+        click.secho(f"Failed to list '{folder_path}': {error}", fg='red', err=True)
+
+    print('Executing results...')
+    n_files = total_bytes = 0
+    try:
+        for entry in iter_results_tree(cl, workspace_id, job_id, verify_ssl, max_depth=max_depth,
+                                       max_workers=max_workers,
+                                       exclude=is_excluded if excludes else None, on_error=on_error):
+            if is_excluded(entry['path']):
+                continue
+            if includes and not any(match(entry['path']) for match in includes):
+                continue
+            if entry['is_dir']:
+                click.secho(f"{'-':>10}\t{entry['uri']}/", fg='blue', underline=True)
+                continue
+            n_files += 1
+            total_bytes += entry['size']
+            click.echo(f"{format_bytes(entry['size']):>10}\t{entry['uri']}")
+    except BadRequestException as e:
+        raise ValueError(f"Job '{job_id}' not found or not accessible. {str(e)}")
+    except Exception as e:
+        raise ValueError(f"Failed to retrieve results for job '{job_id}'. {str(e)}")
+    click.secho(f'\nTotal: {format_bytes(total_bytes)} ({total_bytes} bytes) in {n_files} files',
+                fg='green', bold=True)
+
+
 @job.command('workdir')
 @click.option('-k',
               '--apikey',
@@ -507,8 +899,8 @@ def job_status(ctx,
               help='The specific Lifebit Platform workspace id.',
               required=True)
 @click.option('--job-id',
-              help='The job id in Lifebit Platform to search for.',
-              required=True)
+              help='The job id in Lifebit Platform to search for.')
+@bulk_job_options
 @click.option('--link',
               help='Link the working directory to an interactive session.',
               is_flag=True)
@@ -541,6 +933,16 @@ def job_workdir(ctx,
                 cloudos_url,
                 workspace_id,
                 job_id,
+                job_ids,
+                filter_status,
+                filter_project,
+                filter_workflow,
+                filter_job_name,
+                filter_owner,
+                filter_only_mine,
+                last_n_jobs,
+                output_basename,
+                max_workers,
                 link,
                 delete,
                 yes,
@@ -556,6 +958,14 @@ def job_workdir(ctx,
 
     verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
 
+    if bulk_job_paths('workdir', cloudos_url, apikey, workspace_id, verify_ssl, job_id, job_ids,
+                      {'--link': link, '--delete': delete, '--status': status},
+                      dict(filter_status=filter_status, filter_project=filter_project,
+                           filter_workflow=filter_workflow, filter_job_name=filter_job_name,
+                           filter_owner=filter_owner, filter_only_mine=filter_only_mine),
+                      last_n_jobs, output_basename, max_workers, verbose):
+        return
+
     # Handle --status flag
     if status:
         console = Console()
@@ -727,8 +1137,19 @@ def job_workdir(ctx,
               help='The specific Lifebit Platform workspace id.',
               required=True)
 @click.option('--job-id',
-              help='The job id in Lifebit Platform to search for.',
-              required=True)
+              help='The job id in Lifebit Platform to search for.')
+@bulk_job_options
+@click.option('--download',
+              help=('Download the log files of the jobs to this directory, one sub-directory per ' +
+                    'job. The logs of finished jobs already downloaded are not downloaded again. ' +
+                    'Requires --mirror-root.'),
+              type=click.Path(file_okay=False))
+@click.option('--mirror-root',
+              help=('With --download, local or mounted directory holding a copy of the buckets: ' +
+                    's3://<bucket>/<key> is read from <mirror-root>/<bucket>/<key> and ' +
+                    'az://<account>.blob.core.windows.net/<container>/<blob> from ' +
+                    '<mirror-root>/<container>/<blob>.'),
+              type=click.Path(exists=True, file_okay=False))
 @click.option('--link',
               help='Link the logs directories to an interactive session.',
               is_flag=True)
@@ -752,6 +1173,18 @@ def job_logs(ctx,
              cloudos_url,
              workspace_id,
              job_id,
+             job_ids,
+             filter_status,
+             filter_project,
+             filter_workflow,
+             filter_job_name,
+             filter_owner,
+             filter_only_mine,
+             last_n_jobs,
+             output_basename,
+             max_workers,
+             download,
+             mirror_root,
              link,
              session_id,
              verbose,
@@ -762,6 +1195,33 @@ def job_logs(ctx,
     # apikey, cloudos_url, and workspace_id are now automatically resolved by the decorator
     # session_id is also resolved if provided in profile
 
+    if download:
+        if link:
+            raise click.UsageError('--download cannot be combined with --link.')
+        if not mirror_root:
+            raise click.UsageError('--download requires --mirror-root.')
+        verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+        cl = Cloudos(cloudos_url, apikey, None)
+        ids = select_job_ids(cl, workspace_id, verify_ssl, job_id, job_ids,
+                             dict(filter_status=filter_status, filter_project=filter_project,
+                                  filter_workflow=filter_workflow, filter_job_name=filter_job_name,
+                                  filter_owner=filter_owner, filter_only_mine=filter_only_mine),
+                             last_n_jobs)
+        print_downloaded_logs(cl, workspace_id, ids, download, MirrorLogStorage(mirror_root),
+                              verify_ssl, max_workers)
+        return
+    if mirror_root:
+        raise click.UsageError('--mirror-root can only be used with --download.')
+
+    if bulk_job_paths('logs', cloudos_url, apikey, workspace_id,
+                      ssl_selector(disable_ssl_verification, ssl_cert), job_id, job_ids,
+                      {'--link': link},
+                      dict(filter_status=filter_status, filter_project=filter_project,
+                           filter_workflow=filter_workflow, filter_job_name=filter_job_name,
+                           filter_owner=filter_owner, filter_only_mine=filter_only_mine),
+                      last_n_jobs, output_basename, max_workers, verbose):
+        return
+
     # Validate link flag requirements AFTER loading profile
     if link and not session_id:
         raise click.ClickException("--session-id is required when using --link flag")
@@ -835,8 +1295,8 @@ def job_logs(ctx,
               help='The specific Lifebit Platform workspace id.',
               required=True)
 @click.option('--job-id',
-              help='The job id in Lifebit Platform to search for.',
-              required=True)
+              help='The job id in Lifebit Platform to search for.')
+@bulk_job_options
 @click.option('--link',
               help='Link the results directories to an interactive session.',
               is_flag=True)
@@ -852,6 +1312,22 @@ def job_logs(ctx,
 @click.option('--status',
               help='Check the deletion status of the job results.',
               is_flag=True)
+@click.option('--tree',
+              help=('List every file of the results directory recursively, with its size. ' +
+                    'Directories are listed concurrently (--max-workers).'),
+              is_flag=True)
+@click.option('--include',
+              help=('With --tree, only list the paths matching this glob pattern, regular ' +
+                    'expression or name. You can use this option several times.'),
+              multiple=True)
+@click.option('--exclude',
+              help=('With --tree, skip the paths matching this glob pattern, regular ' +
+                    'expression or name. Excluded directories are not crawled. You can use this ' +
+                    'option several times.'),
+              multiple=True)
+@click.option('--max-depth',
+              help='With --tree, maximum depth to descend to, 1 being the content of the results directory.',
+              type=click.IntRange(min=1))
 @click.option('--verbose',
               help='Whether to print information messages or not.',
               is_flag=True)
@@ -869,11 +1345,25 @@ def job_results(ctx,
                 cloudos_url,
                 workspace_id,
                 job_id,
+                job_ids,
+                filter_status,
+                filter_project,
+                filter_workflow,
+                filter_job_name,
+                filter_owner,
+                filter_only_mine,
+                last_n_jobs,
+                output_basename,
+                max_workers,
                 link,
                 delete,
                 yes,
                 session_id,
                 status,
+                tree,
+                include,
+                exclude,
+                max_depth,
                 verbose,
                 disable_ssl_verification,
                 ssl_cert,
@@ -884,6 +1374,23 @@ def job_results(ctx,
 
     verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
 
+    if bulk_job_paths('results', cloudos_url, apikey, workspace_id, verify_ssl, job_id, job_ids,
+                      {'--link': link, '--delete': delete, '--status': status, '--tree': tree},
+                      dict(filter_status=filter_status, filter_project=filter_project,
+                           filter_workflow=filter_workflow, filter_job_name=filter_job_name,
+                           filter_owner=filter_owner, filter_only_mine=filter_only_mine),
+                      last_n_jobs, output_basename, max_workers, verbose):
+        return
+
+    if tree:
+        if link or delete or status:
+            raise click.UsageError('--tree cannot be combined with --link, --delete or --status.')
+        print_results_tree(Cloudos(cloudos_url, apikey, None), workspace_id, job_id, verify_ssl,
+                           max_depth, include, exclude, max_workers)
+        return
+    if include or exclude or max_depth:
+        raise click.UsageError('--include, --exclude and --max-depth can only be used with --tree.')
+
     # Handle --status flag
     if status:
         console = Console()
@@ -1108,7 +1615,7 @@ def job_details(ctx,
 
     # check if the API gives a 403 error/forbidden error
     try:
-        j_details = cl.get_job_status(job_id, workspace_id, verify_ssl)
+        j_details = cl.get_job_snapshot(job_id, workspace_id, verify_ssl)
     except BadRequestException as e:
         if '403' in str(e) or 'Forbidden' in str(e):
             raise ValueError("API can only show job details of your own jobs, cannot see other user's job details.")
@@ -1116,7 +1623,7 @@ def job_details(ctx,
             raise ValueError(f"Job '{job_id}' not found or not accessible. {str(e)}")
     except Exception as e:
         raise ValueError(f"Failed to retrieve details for job '{job_id}'. {str(e)}")
-    create_job_details(json.loads(j_details.content), job_id, output_format, output_basename, parameters, cloudos_url)
+    create_job_details(j_details.document, job_id, output_format, output_basename, parameters, cloudos_url)
 
 
 @job.command('list')
@@ -1138,8 +1645,10 @@ def job_details(ctx,
               default='joblist',
               required=False)
 @click.option('--output-format',
-              help='The desired output format. For json option --all-fields will be automatically set to True. Default=stdout.',
-              type=click.Choice(['stdout', 'csv', 'json'], case_sensitive=False),
+              help=('The desired output format. For json option --all-fields will be automatically set to True. ' +
+                    'ndjson and parquet write one record per job with a fixed set of columns, as pages ' +
+                    'are received (parquet requires pyarrow). Default=stdout.'),
+              type=click.Choice(['stdout', 'csv', 'json', 'ndjson', 'parquet'], case_sensitive=False),
               default='stdout')
 @click.option('--table-columns',
               help=('Comma-separated list of columns to display in the table. Only applicable when --output-format=stdout. ' +
@@ -1149,7 +1658,7 @@ def job_details(ctx,
 @click.option('--all-fields',
               help=('Whether to collect all available fields from jobs or ' +
                     'just the preconfigured selected fields. Only applicable ' +
-                    'when --output-format=csv. Automatically enabled for json output.'),
+                    'when --output-format=csv or ndjson. Automatically enabled for json output.'),
               is_flag=True)
 @click.option('--last-n-jobs',
               help=("The number of last workspace jobs to retrieve. You can use 'all' to " +
@@ -1188,6 +1697,37 @@ def job_details(ctx,
               help='Filter jobs by queue name. Only applies to jobs running in batch environment. Non-batch jobs are preserved in results.')
 @click.option('--filter-owner',
               help='Filter jobs by owner username.')
+@click.option('--filter-name-regex',
+              help='Filter jobs whose name matches a regular expression. Applied client-side.')
+@click.option('--min-cost',
+              help='Filter jobs with a cost greater than or equal to this value. Applied client-side.',
+              type=float)
+@click.option('--max-cost',
+              help='Filter jobs with a cost lower than or equal to this value. Applied client-side.',
+              type=float)
+@click.option('--min-runtime',
+              help='Filter jobs running for at least this number of seconds. Applied client-side.',
+              type=float)
+@click.option('--max-runtime',
+              help='Filter jobs running for at most this number of seconds. Applied client-side.',
+              type=float)
+@click.option('--from-index',
+              help=('Answer the query from the local job index instead of the API. Works offline. ' +
+                    'The index is created and updated with "cloudos job sync".'),
+              is_flag=True)
+@click.option('--since',
+              help='Only jobs submitted on or after this date (YYYY-MM-DD or ISO 8601). Requires --from-index.')
+@click.option('--until',
+              help='Only jobs submitted on or before this date (YYYY-MM-DD or ISO 8601). Requires --from-index.')
+@click.option('--watch',
+              help=('Keep the table on screen and refresh it every --watch-interval seconds, until ' +
+                    'Ctrl+C. Only the jobs updated since the previous refresh are requested. Shows ' +
+                    '--last-n-jobs jobs (default: --page-size). Only with --output-format=stdout.'),
+              is_flag=True)
+@click.option('--watch-interval',
+              help='Time (in seconds) between refreshes with --watch. Default=10.',
+              type=click.IntRange(min=1),
+              default=10)
 @click.option('--verbose',
               help='Whether to print information messages or not.',
               is_flag=True)
@@ -1221,6 +1761,16 @@ def list_jobs(ctx,
               filter_only_mine,
               filter_owner,
               filter_queue,
+              filter_name_regex,
+              min_cost,
+              max_cost,
+              min_runtime,
+              max_runtime,
+              from_index,
+              since,
+              until,
+              watch,
+              watch_interval,
               verbose,
               disable_ssl_verification,
               ssl_cert,
@@ -1235,6 +1785,10 @@ def list_jobs(ctx,
     # Only set outfile if not using stdout
     if output_format != 'stdout':
         outfile = output_basename + '.' + output_format
+    if output_format == 'parquet' and not parquet_available():
+        click.secho('Error: Parquet output requires pyarrow. Please install it with: ' +
+                    'pip install "cloudos_cli[parquet]"', fg='red', err=True)
+        raise SystemExit(1)
 
     print('Executing list...')
     if verbose:
@@ -1258,20 +1812,103 @@ def list_jobs(ctx,
         click.secho('Error: Page size cannot exceed 100. Please use --page-size with a value <= 100', fg='red', err=True)
         raise SystemExit(1)
 
-    result = cl.get_job_list(workspace_id, last_n_jobs, page, page_size, archived, verify_ssl,
-                             filter_status=filter_status,
-                             filter_job_name=filter_job_name,
-                             filter_project=filter_project,
-                             filter_workflow=filter_workflow,
-                             filter_job_id=filter_job_id,
-                             filter_only_mine=filter_only_mine,
-                             filter_owner=filter_owner,
-                             filter_queue=filter_queue,
-                             last=last)
-
-    # Extract jobs and pagination metadata from result
-    my_jobs_r = result['jobs']
-    pagination_metadata = result['pagination_metadata']
+    if (since or until) and not from_index:
+        click.secho('Error: --since and --until can only be used with --from-index.', fg='red', err=True)
+        raise SystemExit(1)
+
+    if watch:
+        if output_format != 'stdout' or from_index:
+            click.secho('Error: --watch can only be used with --output-format=stdout and without ' +
+                        '--from-index.', fg='red', err=True)
+            raise SystemExit(1)
+        watch_limit = page_size
+        if last_n_jobs is not None:
+            watch_limit = int(last_n_jobs) if str(last_n_jobs).isdigit() else 0
+            if watch_limit < 1:
+                click.secho('Error: --last-n-jobs must be a positive integer with --watch.',
+                            fg='red', err=True)
+                raise SystemExit(1)
+
+    client_filters = dict(name_regex=filter_name_regex, min_cost=min_cost, max_cost=max_cost,
+                          min_runtime=min_runtime, max_runtime=max_runtime)
+    client_filtered = bool(filter_queue) or any(v is not None for v in client_filters.values())
+    fetch_page = None
+    if from_index:
+        if not os.path.exists(index_path(workspace_id)):
+            click.secho(f'Error: No local job index found for workspace {workspace_id}. ' +
+                        'Please, run "cloudos job sync" first.', fg='red', err=True)
+            raise SystemExit(1)
+        index = JobIndex.for_workspace(workspace_id)
+        index_filters = dict(archived=archived, status=filter_status, project=filter_project,
+                             workflow=filter_workflow, owner=filter_owner,
+                             only_mine=filter_only_mine, queue=filter_queue,
+                             job_name=filter_job_name, job_id=filter_job_id, since=since,
+                             until=until, **client_filters)
+        try:
+            if last_n_jobs is not None:
+                print('[Warning] When using --last-n-jobs option, --page and --page-size are ignored. ' +
+                      'To use --page and --page-size, please remove --last-n-jobs option.\n')
+                limit = None
+                if last_n_jobs != 'all':
+                    limit = int(last_n_jobs) if str(last_n_jobs).isdigit() else 0
+                    if limit < 1:
+                        raise ValueError("--last-n-jobs must be a positive integer or 'all'.")
+                my_jobs_r = index.query(limit=limit, **index_filters)
+                pagination_metadata = None
+            else:
+                fetch_page = create_index_pagination_callback(index, page_size, index_filters)
+                result = fetch_page(page)
+                my_jobs_r = result['jobs']
+                pagination_metadata = result['pagination_metadata']
+        except ValueError as e:
+            click.secho(f'Error: {e}', fg='red', err=True)
+            raise SystemExit(1)
+        jobs = my_jobs_r
+        streaming = False
+    else:
+        # Filters are resolved to IDs once and reused by the interactive pagination
+        query = cl.prepare_job_list_query(workspace_id, archived=archived, verify=verify_ssl,
+                                          filter_status=filter_status,
+                                          filter_job_name=filter_job_name,
+                                          filter_project=filter_project,
+                                          filter_workflow=filter_workflow,
+                                          filter_job_id=filter_job_id,
+                                          filter_only_mine=filter_only_mine,
+                                          filter_owner=filter_owner,
+                                          filter_queue=filter_queue,
+                                          last=last)
+        if watch:
+            watcher = JobListWatcher(cl, workspace_id, query, limit=watch_limit, verify=verify_ssl,
+                                     **client_filters)
+            row_cache = {}
+            try:
+                watch_job_list(watcher, lambda jobs, status_line: create_job_watch_table(
+                    jobs, cloudos_url, selected_columns, row_cache=row_cache,
+                    status_line=status_line), interval=watch_interval)
+            except KeyboardInterrupt:
+                print('\nStopped watching jobs.')
+            return
+        # Jobs are streamed page by page when filtered client-side, or when writing
+        # the last N jobs to a file, so that memory does not grow with the workspace
+        streaming = client_filtered or (last_n_jobs is not None and output_format != 'stdout')
+        if streaming:
+            if last_n_jobs is not None:
+                print('[Warning] When using --last-n-jobs option, --page and --page-size are ignored. ' +
+                      'To use --page and --page-size, please remove --last-n-jobs option.\n')
+            jobs = cl.iter_jobs(workspace_id, limit=last_n_jobs, verify=verify_ssl, query=query,
+                                **client_filters)
+            # Read the first job ahead, to report empty results as usual
+            first_job = next(jobs, None)
+            my_jobs_r = [] if first_job is None else [first_job]
+            jobs = itertools.chain(my_jobs_r, jobs)
+            pagination_metadata = None
+        else:
+            result = cl.get_job_list(workspace_id, last_n_jobs, page, page_size, archived, verify_ssl,
+                                     query=query)
+
+            # Extract jobs and pagination metadata from result
+            my_jobs_r = result['jobs']
+            pagination_metadata = result['pagination_metadata']
 
     # Validate requested page exists
     if pagination_metadata:
@@ -1295,16 +1932,24 @@ def list_jobs(ctx,
             filter_job_id,
             filter_only_mine,
             filter_owner,
-            filter_queue
+            filter_queue,
+            client_filtered,
+            since,
+            until
         ])
         if output_format == 'stdout':
             # For stdout, always show a user-friendly message
             # Create callback for interactive pagination using helper function
-            fetch_page = create_api_pagination_callback(
-                cl, workspace_id, page_size, archived, verify_ssl,
-                filter_status, filter_job_name, filter_project, filter_workflow,
-                filter_job_id, filter_only_mine, filter_owner, filter_queue, last
-            )
+            if streaming:
+                fetch_page = create_stream_pagination_callback(jobs, page_size)
+                pagination_metadata = fetch_page(1)['pagination_metadata']
+            elif not from_index:
+                fetch_page = create_api_pagination_callback(
+                    cl, workspace_id, page_size, archived, verify_ssl,
+                    filter_status, filter_job_name, filter_project, filter_workflow,
+                    filter_job_id, filter_only_mine, filter_owner, filter_queue, last,
+                    query=query
+                )
             create_job_list_table([], cloudos_url, pagination_metadata, selected_columns, fetch_page_callback=fetch_page)
         else:
             if filters_used:
@@ -1319,40 +1964,401 @@ def list_jobs(ctx,
     elif output_format == 'stdout':
         # Display as table with interactive pagination
         
-        # Check if results are client-side filtered (e.g., by queue)
-        is_client_filtered = pagination_metadata and pagination_metadata.get('_client_filtered', False)
-        
-        if is_client_filtered:
-            # For client-filtered results, we have all jobs already
-            # Create a callback that paginates them client-side using helper function
-            fetch_page = create_client_pagination_callback(my_jobs_r, page_size)
-            
-            # Show first page of filtered results
-            first_page_jobs = my_jobs_r[:page_size]
-            first_page_metadata = {
-                'Pagination-Count': len(my_jobs_r),
-                'Pagination-Page': 1,
-                'Pagination-Limit': page_size
-            }
-            create_job_list_table(first_page_jobs, cloudos_url, first_page_metadata, selected_columns, fetch_page_callback=fetch_page)
+        if streaming:
+            # For client-filtered results, only the pages viewed are fetched
+            fetch_page = create_stream_pagination_callback(jobs, page_size)
+            first_page = fetch_page(1)
+            create_job_list_table(first_page['jobs'], cloudos_url, first_page['pagination_metadata'],
+                                  selected_columns, fetch_page_callback=fetch_page)
         else:
-            # For normal (non-filtered) results, use API pagination with helper function
-            fetch_page = create_api_pagination_callback(
-                cl, workspace_id, page_size, archived, verify_ssl,
-                filter_status, filter_job_name, filter_project, filter_workflow,
-                filter_job_id, filter_only_mine, filter_owner, filter_queue, last
-            )
+            if not from_index:
+                # For normal (non-filtered) results, use API pagination with helper function
+                fetch_page = create_api_pagination_callback(
+                    cl, workspace_id, page_size, archived, verify_ssl,
+                    filter_status, filter_job_name, filter_project, filter_workflow,
+                    filter_job_id, filter_only_mine, filter_owner, filter_queue, last,
+                    query=query
+                )
             create_job_list_table(my_jobs_r, cloudos_url, pagination_metadata, selected_columns, fetch_page_callback=fetch_page)
     elif output_format == 'csv':
-        my_jobs = cl.process_job_list(my_jobs_r, all_fields)
-        cl.save_job_list_to_csv(my_jobs, outfile)
+        if streaming and not all_fields:
+            cl.save_job_stream_to_csv(jobs, outfile)
+        else:
+            # All fields are only known once every job has been read
+            my_jobs = cl.process_job_list(list(jobs) if streaming else my_jobs_r, all_fields)
+            cl.save_job_list_to_csv(my_jobs, outfile)
     elif output_format == 'json':
-        with open(outfile, 'w') as o:
-            o.write(json.dumps(my_jobs_r))
-        print(f'\tJob list collected with a total of {len(my_jobs_r)} jobs.')
+        if streaming:
+            cl.save_job_stream_to_json(jobs, outfile)
+        else:
+            with open(outfile, 'w') as o:
+                o.write(json.dumps(my_jobs_r))
+            print(f'\tJob list collected with a total of {len(my_jobs_r)} jobs.')
+            print(f'\tJob list saved to {outfile}')
+    elif output_format in ('ndjson', 'parquet'):
+        if output_format == 'ndjson':
+            n_jobs = write_ndjson(jobs if streaming else my_jobs_r, outfile, all_fields=all_fields)
+        else:
+            n_jobs = write_parquet(jobs if streaming else my_jobs_r, outfile)
+        print(f'\tJob list collected with a total of {n_jobs} jobs.')
         print(f'\tJob list saved to {outfile}')
     else:
-        raise ValueError('Unrecognised output format. Please use one of [stdout|csv|json]')
+        raise ValueError('Unrecognised output format. Please use one of [stdout|csv|json|ndjson|parquet]')
+
+
+@job.command('sync')
+@click.option('-k',
+              '--apikey',
+              help='Your Lifebit Platform API key',
+              required=True)
+@click.option('-c',
+              '--cloudos-url',
+              help=(f'The Lifebit Platform url you are trying to access to. Default={CLOUDOS_URL}.'),
+              default=CLOUDOS_URL,
+              required=True)
+@click.option('--workspace-id',
+              help='The specific Lifebit Platform workspace id.',
+              required=True)
+@click.option('--full',
+              help=('Fetch every job of the workspace again, instead of only the jobs updated ' +
+                    'since the last sync.'),
+              is_flag=True)
+@click.option('--verbose',
+              help='Whether to print information messages or not.',
+              is_flag=True)
+@click.option('--disable-ssl-verification',
+              help=('Disable SSL certificate verification. Please, remember that this option is ' +
+                    'not generally recommended for security reasons.'),
+              is_flag=True)
+@click.option('--ssl-cert',
+              help='Path to your SSL certificate file.')
+@click.option('--profile', help='Profile to use from the config file', default=None)
+@click.pass_context
+@with_profile_config(required_params=['apikey', 'workspace_id'])
+def sync_jobs(ctx,
+              apikey,
+              cloudos_url,
+              workspace_id,
+              full,
+              verbose,
+              disable_ssl_verification,
+              ssl_cert,
+              profile):
+    """Update the local job index of a workspace, used by 'job list --from-index'."""
+    verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+    cl = Cloudos(cloudos_url, apikey, None)
+    path = index_path(workspace_id)
+    print('Synchronising the local job index...')
+    if verbose:
+        print(f'\tIndex file: {path}')
+
+    def on_page(n_jobs):
+        if verbose:
+            print(f'\t...{n_jobs} jobs stored')
+    with JobIndex(path) as index:
+        try:
+            result = index.sync(cl, workspace_id, verify=verify_ssl, full=full, on_page=on_page)
+        except BadRequestException as e:
+            click.secho(f'Error: The job index could not be synchronised. {e}', fg='red', err=True)
+            raise SystemExit(1)
+    print(f'\t{result["fetched"]} new or updated jobs stored. The index holds {result["total"]} jobs.')
+    if result['watermark']:
+        print(f'\tLatest job update: {result["watermark"]}')
+    print(f'\tIndex saved to {path}')
+
+
+@job.command('stats')
+@click.option('-k',
+              '--apikey',
+              help='Your Lifebit Platform API key',
+              required=True)
+@click.option('-c',
+              '--cloudos-url',
+              help=(f'The Lifebit Platform url you are trying to access to. Default={CLOUDOS_URL}.'),
+              default=CLOUDOS_URL,
+              required=True)
+@click.option('--workspace-id',
+              help='The specific Lifebit Platform workspace id.',
+              required=True)
+@click.option('--group-by',
+              help=('Aggregate jobs by this field. Can be used several times to group by ' +
+                    'several fields (e.g. --group-by project --group-by workflow). Default=workflow.'),
+              type=click.Choice(list(STATS_GROUPS), case_sensitive=False),
+              multiple=True,
+              default=('workflow',))
+@click.option('--output-basename',
+              help=('Output file base name to save the statistics. ' +
+                    'Default=job_stats'),
+              default='job_stats',
+              required=False)
+@click.option('--output-format',
+              help='The desired output format. Default=stdout.',
+              type=click.Choice(['stdout', 'csv', 'json'], case_sensitive=False),
+              default='stdout')
+@click.option('--last-n-jobs',
+              help=("Only aggregate the last N workspace jobs matching the filters. " +
+                    "Default=all."),
+              default='all')
+@click.option('--since',
+              help='Only jobs submitted on or after this date (YYYY-MM-DD or ISO 8601).')
+@click.option('--until',
+              help='Only jobs submitted on or before this date (YYYY-MM-DD or ISO 8601).')
+@click.option('--archived',
+              help=('When this flag is used, only archived jobs are aggregated.'),
+              is_flag=True)
+@click.option('--filter-status',
+              help='Filter jobs by status (e.g., completed, running, failed, aborted).')
+@click.option('--filter-job-name',
+              help='Filter jobs by job name ( case insensitive ).')
+@click.option('--filter-project',
+              help='Filter jobs by project name.')
+@click.option('--filter-workflow',
+              help='Filter jobs by workflow/pipeline name.')
+@click.option('--last',
+              help=('When workflows are duplicated, use the latest imported workflow (by date).'),
+              is_flag=True)
+@click.option('--filter-only-mine',
+              help='Filter to show only jobs belonging to the current user.',
+              is_flag=True)
+@click.option('--filter-queue',
+              help='Filter jobs by queue name. Only applies to jobs running in batch environment.')
+@click.option('--filter-owner',
+              help='Filter jobs by owner username.')
+@click.option('--filter-name-regex',
+              help='Filter jobs whose name matches a regular expression. Applied client-side.')
+@click.option('--min-cost',
+              help='Filter jobs with a cost greater than or equal to this value. Applied client-side.',
+              type=float)
+@click.option('--max-cost',
+              help='Filter jobs with a cost lower than or equal to this value. Applied client-side.',
+              type=float)
+@click.option('--min-runtime',
+              help='Filter jobs running for at least this number of seconds. Applied client-side.',
+              type=float)
+@click.option('--max-runtime',
+              help='Filter jobs running for at most this number of seconds. Applied client-side.',
+              type=float)
+@click.option('--from-index',
+              help=('Aggregate the jobs of the local job index instead of fetching them from the API. ' +
+                    'The index is created and updated with "cloudos job sync".'),
+              is_flag=True)
+@click.option('--verbose',
+              help='Whether to print information messages or not.',
+              is_flag=True)
+@click.option('--disable-ssl-verification',
+              help=('Disable SSL certificate verification. Please, remember that this option is ' +
+                    'not generally recommended for security reasons.'),
+              is_flag=True)
+@click.option('--ssl-cert',
+              help='Path to your SSL certificate file.')
+@click.option('--profile', help='Profile to use from the config file', default=None)
+@click.pass_context
+@with_profile_config(required_params=['apikey', 'workspace_id'])
+def job_stats_command(ctx,
+                      apikey,
+                      cloudos_url,
+                      workspace_id,
+                      group_by,
+                      output_basename,
+                      output_format,
+                      last_n_jobs,
+                      since,
+                      until,
+                      archived,
+                      filter_status,
+                      filter_job_name,
+                      filter_project,
+                      filter_workflow,
+                      last,
+                      filter_only_mine,
+                      filter_queue,
+                      filter_owner,
+                      filter_name_regex,
+                      min_cost,
+                      max_cost,
+                      min_runtime,
+                      max_runtime,
+                      from_index,
+                      verbose,
+                      disable_ssl_verification,
+                      ssl_cert,
+                      profile):
+    """Aggregate run time, cost and failure rate of workspace jobs by workflow, project..."""
+    verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+    group_by = [key.lower() for key in group_by]
+    client_filters = dict(name_regex=filter_name_regex, min_cost=min_cost, max_cost=max_cost,
+                          min_runtime=min_runtime, max_runtime=max_runtime)
+    print('Executing stats...')
+    try:
+        if from_index:
+            if not os.path.exists(index_path(workspace_id)):
+                click.secho(f'Error: No local job index found for workspace {workspace_id}. ' +
+                            'Please, run "cloudos job sync" first.', fg='red', err=True)
+                raise SystemExit(1)
+            with JobIndex.for_workspace(workspace_id) as index:
+                frame = index.frame(archived=archived, status=filter_status,
+                                    project=filter_project, workflow=filter_workflow,
+                                    owner=filter_owner, only_mine=filter_only_mine,
+                                    queue=filter_queue, job_name=filter_job_name,
+                                    since=since, until=until, **client_filters)
+            if last_n_jobs != 'all':
+                if not str(last_n_jobs).isdigit() or int(last_n_jobs) < 1:
+                    raise ValueError("last_n_jobs must be a positive integer or 'all'")
+                frame = frame.head(int(last_n_jobs))
+        else:
+            cl = Cloudos(cloudos_url, apikey, None)
+            if verbose:
+                print(f'\tCollecting the jobs of workspace {workspace_id}')
+            jobs = cl.iter_jobs(workspace_id, limit=last_n_jobs, verify=verify_ssl,
+                                archived=archived, filter_status=filter_status,
+                                filter_job_name=filter_job_name, filter_project=filter_project,
+                                filter_workflow=filter_workflow,
+                                filter_only_mine=filter_only_mine, filter_owner=filter_owner,
+                                filter_queue=filter_queue, last=last, **client_filters)
+            frame = jobs_frame(jobs, since=since, until=until)
+        stats = job_stats(frame, group_by)
+    except ValueError as e:
+        click.secho(f'Error: {e}', fg='red', err=True)
+        raise SystemExit(1)
+    if verbose:
+        print(f'\t{len(frame)} jobs aggregated in {len(stats)} groups')
+
+    if output_format == 'stdout':
+        console = Console()
+        if stats.empty:
+            console.print('[yellow]No jobs found matching the filters.[/yellow]')
+            return
+        table = Table(title=f'Job statistics ({len(frame)} jobs)')
+        for key in group_by:
+            table.add_column(key.capitalize(), style='cyan', overflow='fold')
+        table.add_column('Jobs', justify='right')
+        table.add_column('Failed', justify='right', style='red')
+        table.add_column('Failure rate', justify='right', style='red')
+        table.add_column('Run time p50', justify='right', style='green')
+        table.add_column('Run time p95', justify='right', style='green')
+        table.add_column('Total cost', justify='right', style='yellow')
+        table.add_column('Mean cost', justify='right', style='yellow')
+        for row in stats_records(stats):
+            table.add_row(
+                *[str(row[key]) for key in group_by],
+                str(row['jobs']),
+                str(row['failed']),
+                '-' if row['failure_rate'] is None else f"{row['failure_rate']:.1%}",
+                format_duration(row['runtime_p50']),
+                format_duration(row['runtime_p95']),
+                '-' if row['total_cost'] is None else f"{row['total_cost']:.4f}",
+                '-' if row['mean_cost'] is None else f"{row['mean_cost']:.4f}"
+            )
+        console.print(table)
+    elif output_format == 'csv':
+        outfile = f'{output_basename}.csv'
+        stats.to_csv(outfile, index=False)
+        print(f'\tJob statistics saved to {outfile}')
+    else:
+        outfile = f'{output_basename}.json'
+        with open(outfile, 'w') as o:
+            o.write(json.dumps(stats_records(stats)))
+        print(f'\tJob statistics saved to {outfile}')
+
+
+@job.command('wait')
+@click.option('-k',
+              '--apikey',
+              help='Your Lifebit Platform API key',
+              required=True)
+@click.option('-c',
+              '--cloudos-url',
+              help=(f'The Lifebit Platform url you are trying to access to. Default={CLOUDOS_URL}.'),
+              default=CLOUDOS_URL,
+              required=True)
+@click.option('--workspace-id',
+              help='The specific Lifebit Platform workspace id.',
+              required=True)
+@click.option('--job-ids',
+              help=('One or more job ids to wait for. If more than ' +
+                    'one is provided, they must be provided as ' +
+                    'a comma separated list of ids. E.g. id1,id2,id3'),
+              required=True)
+@click.option('--wait-time',
+              help=('Max time to wait (in seconds) for all the jobs to end. ' +
+                    'Default=3600.'),
+              type=int,
+              default=3600)
+@click.option('--request-interval',
+              help=('Time interval to request (in seconds) the job statuses. All the jobs are ' +
+                    'refreshed together, usually with a single request. Default=30.'),
+              type=int,
+              default=30)
+@click.option('--fail-fast',
+              help='Stop waiting as soon as one of the jobs fails or is aborted.',
+              is_flag=True)
+@click.option('--verbose',
+              help='Whether to print information messages or not.',
+              is_flag=True)
+@click.option('--disable-ssl-verification',
+              help=('Disable SSL certificate verification. Please, remember that this option is ' +
+                    'not generally recommended for security reasons.'),
+              is_flag=True)
+@click.option('--ssl-cert',
+              help='Path to your SSL certificate file.')
+@click.option('--profile', help='Profile to use from the config file', default=None)
+@click.pass_context
+@with_profile_config(required_params=['apikey', 'workspace_id'])
+def wait_jobs_command(ctx,
+                      apikey,
+                      cloudos_url,
+                      workspace_id,
+                      job_ids,
+                      wait_time,
+                      request_interval,
+                      fail_fast,
+                      verbose,
+                      disable_ssl_verification,
+                      ssl_cert,
+                      profile):
+    """Wait for one or more jobs to end and report their final status."""
+    verify_ssl = ssl_selector(disable_ssl_verification, ssl_cert)
+    job_ids = list(dict.fromkeys(j.strip() for j in job_ids.split(',') if j.strip()))
+    if not job_ids:
+        click.secho('Error: Please, provide at least one job id with --job-ids.', fg='red', err=True)
+        raise SystemExit(1)
+    cl = Cloudos(cloudos_url, apikey, None)
+    print(f'Waiting for {len(job_ids)} job(s) to end (max wait time of {wait_time} seconds)...')
+
+    def report(job):
+        if job['status'] in TERMINAL_STATUSES:
+            print(f'\tJob "{job["name"]}" (ID: {job["id"]}) ended with status {job["status"]} ' +
+                  f'after {job["elapsed"]} seconds of waiting.')
+            if fail_fast and job['status'] != JOB_COMPLETED:
+                print('\tStopping, as --fail-fast was used.')
+
+    try:
+        results = wait_jobs(cl, workspace_id, job_ids, wait_time=wait_time,
+                            request_interval=request_interval, fail_fast=fail_fast,
+                            verbose=verbose, verify=verify_ssl, on_job_end=report)
+    except BadRequestException as e:
+        click.secho(f'Error: The job statuses could not be retrieved. {e}', fg='red', err=True)
+        raise SystemExit(1)
+
+    table = Table(title='Job wait summary')
+    table.add_column('ID', style='cyan', no_wrap=True)
+    table.add_column('Name', overflow='fold')
+    table.add_column('Status')
+    table.add_column('Waited', justify='right')
+    table.add_column('Run time', justify='right')
+    colours = {JOB_COMPLETED: 'green', JOB_FAILED: 'red', JOB_ABORTED: 'red'}
+    for job in results:
+        status = job.get('status') or 'unknown'
+        table.add_row(job['id'], job.get('name') or '-',
+                      f'[{colours.get(status, "yellow")}]{status}[/]',
+                      format_duration(job['elapsed']), format_duration(job.get('runtime')))
+    Console().print(table)
+    running = [job['id'] for job in results if job.get('status') not in TERMINAL_STATUSES]
+    if running and not (fail_fast and any(job.get('status') in (JOB_FAILED, JOB_ABORTED)
+                                          for job in results)):
+        print(f'\tThe selected wait-time of {wait_time} seconds was exceeded for {len(running)} ' +
+              'job(s). Please, consider to set a longer wait-time.')
+    sys.exit(0 if all(job.get('status') == JOB_COMPLETED for job in results) else 1)
 
 
 @job.command('abort')
@@ -1421,11 +2427,24 @@ def abort_jobs(ctx,
     if force:
         click.secho(f"Warning: Using --force to abort jobs. Some data might be lost.", fg='yellow', bold=True)
 
+    # Retrieve all the statuses concurrently, then abort the eligible jobs concurrently
+    acl = AsyncCloudos(cloudos_url, apikey, None)
+    try:
+        statuses = run_async(acl.get_jobs_status(jobs, workspace_id, verify_ssl))
+        to_abort = []
+        for job in jobs:
+            if isinstance(statuses[job], Exception):
+                continue
+            if json.loads(statuses[job].content)['status'] in ABORT_JOB_STATES:
+                to_abort.append(job)
+        aborted = run_async(acl.abort_jobs(to_abort, workspace_id, verify_ssl, force)) if to_abort else {}
+    finally:
+        acl.close()
+
     for job in jobs:
-        try:
-            j_status = cl.get_job_status(job, workspace_id, verify_ssl)
-        except Exception as e:
-            click.secho(f"Failed to get status for job {job}, please make sure it exists in the workspace: {e}", fg='yellow', bold=True)
+        j_status = statuses[job]
+        if isinstance(j_status, Exception):
+            click.secho(f"Failed to get status for job {job}, please make sure it exists in the workspace: {j_status}", fg='yellow', bold=True)
             continue
 
         j_status_content = json.loads(j_status.content)
@@ -1442,12 +2461,10 @@ def abort_jobs(ctx,
         if not is_abortable:
             click.secho(f"Job {job} is not in a state that can be aborted and is ignored. " +
                   f"Current status: {job_status}", fg='yellow', bold=True)
+        elif isinstance(aborted[job], Exception):
+            click.secho(f"Failed to abort job {job}. Error: {aborted[job]}", fg='red', bold=True)
         else:
-            try:
-                cl.abort_job(job, workspace_id, verify_ssl, force)
-                click.secho(f"Job '{job}' aborted successfully.", fg='green', bold=True)
-            except Exception as e:
-                click.secho(f"Failed to abort job {job}. Error: {e}", fg='red', bold=True)
+            click.secho(f"Job '{job}' aborted successfully.", fg='green', bold=True)
 
 
 @job.command('cost')
@@ -0,0 +1,168 @@
+"""
+Streaming export of job lists to NDJSON and Parquet.
+"""
+
+import json
+from datetime import datetime, timezone
+import pandas as pd
+from cloudos_cli.clos import JOB_LIST_COLUMNS
+
+# Type of every JOB_LIST_COLUMNS column in the exported records. Columns not
+# listed here are strings.
+JOB_LIST_TYPES = {
+    'startTime': 'timestamp',
+    'endTime': 'timestamp',
+    'createdAt': 'timestamp',
+    'updatedAt': 'timestamp',
+    'realInstancesExecutionCost': 'float',
+    'storageSizeInGb': 'float',
+    'batch.enabled': 'bool',
+    'usesFusionFileSystem': 'bool'
+}
+
+
+def job_record(job):
+    """Return the JOB_LIST_COLUMNS values of a job, as a flat dict.
+
+    Nested fields are read following the dots of the column names (e.g.
+    'project.name'). Missing fields are None and nested objects, such as
+    'batch.jobQueue', are reduced to their id.
+
+    Parameters
+    ----------
+    job : dict
+        A job, as returned by the API.
+
+    Returns
+    -------
+    dict
+        Column name -> value, for every JOB_LIST_COLUMNS column.
+    """
+    record = {}
+    for column in JOB_LIST_COLUMNS:
+        value = job
+        for key in column.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, dict):
+            value = value.get('id', value.get('_id'))
+        record[column] = value
+    return record
+
+
+def write_ndjson(jobs, filename, all_fields=False):
+    """Write jobs to a newline-delimited JSON file, one job per line.
+
+    Parameters
+    ----------
+    jobs : iterable
+        The job dicts, e.g. from Cloudos.iter_jobs. They are written as they
+        are received.
+    filename : str
+        The name of the NDJSON file.
+    all_fields : bool
+        Whether to write the jobs as returned by the API instead of the
+        fixed JOB_LIST_COLUMNS records.
+
+    Returns
+    -------
+    int
+        The number of jobs written.
+    """
+    n_jobs = 0
+    with open(filename, 'w') as out:
+        for job in jobs:
+            out.write(json.dumps(job if all_fields else job_record(job)) + '\n')
+            n_jobs += 1
+    return n_jobs
+
+
+def parquet_available():
+    """Whether pyarrow, needed for Parquet output, is installed."""
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def job_list_schema():
+    """Return the pyarrow schema of the exported job records."""
+    import pyarrow as pa
+    types = {
+        'timestamp': pa.timestamp('ms', tz='UTC'),
+        'float': pa.float64(),
+        'bool': pa.bool_()
+    }
+    return pa.schema([(column, types.get(JOB_LIST_TYPES.get(column), pa.string()))
+                      for column in JOB_LIST_COLUMNS])
+
+
+def _timestamp(value):
+    """Parse an ISO 8601 time from the API, in UTC when it has no offset."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _records_frame(records):
+    """Convert job records to a DataFrame with the types of JOB_LIST_TYPES."""
+    df = pd.DataFrame.from_records(records, columns=JOB_LIST_COLUMNS)
+    for column in JOB_LIST_COLUMNS:
+        kind = JOB_LIST_TYPES.get(column)
+        if kind == 'timestamp':
+            df[column] = pd.to_datetime(df[column].map(_timestamp), utc=True)
+        elif kind == 'float':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
+        elif kind == 'bool':
+            df[column] = df[column].map(lambda x: x if isinstance(x, bool) else None).astype(object)
+        else:
+            df[column] = df[column].map(lambda x: x if x is None or isinstance(x, str) else str(x)).astype(object)
+    return df
+
+
+def write_parquet(jobs, filename, row_group_size=10000):
+    """Write jobs to a Parquet file with the fixed job list schema.
+
+    Jobs are converted and written one row group at a time, so memory does
+    not grow with the number of jobs. Requires pyarrow.
+
+    Parameters
+    ----------
+    jobs : iterable
+        The job dicts, e.g. from Cloudos.iter_jobs.
+    filename : str
+        The name of the Parquet file.
+    row_group_size : int
+        Number of jobs per Parquet row group.
+
+    Returns
+    -------
+    int
+        The number of jobs written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    schema = job_list_schema()
+    n_jobs = 0
+    records = []
+
+    def flush():
+        # Times are stored with millisecond precision, as sent by the API
+        table = pa.Table.from_pandas(_records_frame(records), schema=schema, preserve_index=False,
+                                     safe=False)
+        writer.write_table(table)
+        records.clear()
+
+    with pq.ParquetWriter(filename, schema) as writer:
+        for job in jobs:
+            records.append(job_record(job))
+            n_jobs += 1
+            if len(records) == row_group_size:
+                flush()
+        if records:
+            flush()
+    return n_jobs
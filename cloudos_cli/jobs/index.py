@@ -0,0 +1,422 @@
+"""
+Local SQLite index of the jobs of a workspace.
+
+The index is stored under ~/.cloudos/index/<workspace_id>.db (or
+$CLOUDOS_INDEX_DIR) and kept up to date incrementally with JobIndex.sync:
+jobs are requested by descending updatedAt and paging stops as soon as
+jobs older than the last synced one are reached.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import pandas as pd
+from cloudos_cli.clos import JOB_LIST_COLUMNS, JobListQuery, job_cost
+from cloudos_cli.constants import JOB_LIST_PREFETCH_WORKERS
+
+SCHEMA_VERSION = 2
+# Jobs requested per page by sync
+SYNC_PAGE_SIZE = 100
+
+# Fields kept for every job: those used by process_job_list and the job table,
+# plus the ids used by the filters.
+INDEXED_FIELDS = JOB_LIST_COLUMNS + ['project._id', 'project.id', 'workflow._id', 'user.id',
+                                     'user._id', 'user.username', 'batch.jobQueue.id',
+                                     'batch.jobQueue.name', 'batch.jobQueue.label',
+                                     'archived.status', 'jobType', 'computeCostSpent',
+                                     'revision.digest']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    name TEXT,
+    project_name TEXT,
+    workflow_name TEXT,
+    user_id TEXT,
+    owner TEXT,
+    username TEXT,
+    queue_id TEXT,
+    queue_name TEXT,
+    archived INTEGER,
+    created_at TEXT,
+    updated_at TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    cost REAL,
+    job TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_created_at ON jobs (archived, created_at);
+CREATE INDEX IF NOT EXISTS jobs_updated_at ON jobs (updated_at);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_project ON jobs (project_name, created_at);
+CREATE INDEX IF NOT EXISTS jobs_workflow ON jobs (workflow_name, created_at);
+CREATE INDEX IF NOT EXISTS jobs_user ON jobs (user_id, created_at);
+CREATE INDEX IF NOT EXISTS jobs_owner ON jobs (owner, created_at);
+CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (queue_id, created_at);
+"""
+
+
+def index_path(workspace_id):
+    """Return the path of the index of a workspace."""
+    index_dir = os.environ.get('CLOUDOS_INDEX_DIR', os.path.join(Path.home(), '.cloudos', 'index'))
+    return os.path.join(index_dir, f'{workspace_id}.db')
+
+
+def utc_time(value, end_of_day=False):
+    """Normalise an ISO 8601 time to 'YYYY-mm-ddTHH:MM:SS.fffZ' in UTC.
+
+    Times without an offset are taken as UTC. With `end_of_day`, a date
+    without a time means the end of that day.
+
+    Returns
+    -------
+    str or None
+        The normalised time, or None if value is not a valid time.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    if end_of_day and len(value) == 10:
+        parsed += timedelta(days=1)
+    parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime('%Y-%m-%dT%H:%M:%S.') + f'{parsed.microsecond // 1000:03d}Z'
+
+
+def _get(job, path):
+    """Return the value of a dotted field of a job, or None."""
+    value = job
+    for key in path.split('.'):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def prune_job(job):
+    """Return a copy of a job with only the INDEXED_FIELDS."""
+    pruned = {}
+    for path in INDEXED_FIELDS:
+        value = _get(job, path)
+        if value is None:
+            continue
+        *parents, leaf = path.split('.')
+        target = pruned
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = value
+    return pruned
+
+
+# Columns of the jobs table, but for the pruned job JSON
+JOB_COLUMNS = ['id', 'status', 'name', 'project_name', 'workflow_name', 'user_id', 'owner',
+               'username', 'queue_id', 'queue_name', 'archived', 'created_at', 'updated_at',
+               'start_time', 'end_time', 'cost']
+
+
+def job_row(job, archived=None):
+    """Return the JOB_COLUMNS values of a job, as stored in the index.
+
+    Times are normalised with utc_time and the cost is job_cost, as used by
+    the online --min-cost/--max-cost filters.
+
+    Parameters
+    ----------
+    job : dict
+        A job, as returned by /api/v2/jobs.
+    archived : bool, optional
+        Whether the job is archived. Read from the job if None.
+
+    Returns
+    -------
+    tuple
+    """
+    user = job.get('user') or {}
+    owner = ' '.join(p for p in (user.get('name'), user.get('surname')) if p) or None
+    queue = _get(job, 'batch.jobQueue')
+    return (
+        job.get('_id'),
+        job.get('status'),
+        job.get('name'),
+        _get(job, 'project.name'),
+        _get(job, 'workflow.name'),
+        user.get('id') or user.get('_id'),
+        owner,
+        user.get('username'),
+        (queue.get('id') or queue.get('_id')) if isinstance(queue, dict) else queue,
+        (queue.get('label') or queue.get('name')) if isinstance(queue, dict) else None,
+        1 if (_get(job, 'archived.status') if archived is None else archived) else 0,
+        utc_time(job.get('createdAt')),
+        utc_time(job.get('updatedAt')),
+        utc_time(job.get('startTime')),
+        utc_time(job.get('endTime')),
+        job_cost(job)
+    )
+
+
+def _regexp(pattern, value):
+    return value is not None and re.search(pattern, value) is not None
+
+
+class JobIndex:
+    """SQLite index of the jobs of a workspace.
+
+    Parameters
+    ----------
+    path : str
+        Path of the SQLite database. It is created if missing.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.create_function('REGEXP', 2, _regexp, deterministic=True)
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)",
+                              (str(SCHEMA_VERSION),))
+            if int(self.get_meta('schema_version')) < 2:
+                # Version 1 stored computeCostSpent when set: use job_cost instead
+                rows = self.conn.execute('SELECT id, job FROM jobs').fetchall()
+                self.conn.executemany('UPDATE jobs SET cost = ? WHERE id = ?',
+                                      [(job_cost(json.loads(job)), job_id) for job_id, job in rows])
+                self.conn.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'",
+                                  (str(SCHEMA_VERSION),))
+
+    @classmethod
+    def for_workspace(cls, workspace_id):
+        """Open the index of a workspace, at its default location."""
+        return cls(index_path(workspace_id))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    def upsert(self, jobs, archived=None):
+        """Insert or update jobs in the index.
+
+        Parameters
+        ----------
+        jobs : iterable
+            Job dicts, as returned by /api/v2/jobs.
+        archived : bool, optional
+            Whether the jobs are archived. Read from every job if None.
+
+        Returns
+        -------
+        int
+            The number of jobs written.
+        """
+        rows = [job_row(job, archived) + (json.dumps(prune_job(job)),) for job in jobs]
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO jobs VALUES '
+                                  '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def sync(self, cl, workspace_id, verify=True, full=False, on_page=None):
+        """Fetch the jobs updated since the last sync and store them.
+
+        Jobs are requested by descending updatedAt, once for active and once
+        for archived jobs, and paging stops at the first job older than the
+        watermark (the latest updatedAt already stored).
+
+        Parameters
+        ----------
+        cl : cloudos_cli.clos.Cloudos
+            The client used to fetch the jobs.
+        workspace_id : str
+            The Lifebit Platform workspace id.
+        verify: [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+        full : bool
+            Whether to ignore the watermark and fetch every job.
+        on_page : callable, optional
+            Called with the number of jobs stored after every page.
+
+        Returns
+        -------
+        dict
+            'fetched': number of jobs stored, 'total': number of jobs in
+            the index and 'watermark': the new watermark.
+        """
+        watermark = None if full else self.get_meta('watermark')
+        newest = watermark
+        fetched = 0
+        for archived in (False, True):
+            query = JobListQuery(workspace_id=workspace_id,
+                                 params={'teamId': workspace_id,
+                                         'archived.status': str(archived).lower(),
+                                         'sort': '-updatedAt'})
+            params = {**query.params, 'page': 1, 'limit': SYNC_PAGE_SIZE}
+            headers = {'Content-type': 'application/json', 'apikey': cl.apikey}
+            # An incremental sync usually stops within the first pages: they
+            # are requested one by one so that none is fetched past the watermark
+            pages = cl._iter_job_pages(params, headers, verify,
+                                       max_workers=JOB_LIST_PREFETCH_WORKERS if watermark is None else 1)
+            try:
+                for content in pages:
+                    page = []
+                    crossed = False
+                    for job in content.get('jobs', []):
+                        updated_at = utc_time(job.get('updatedAt'))
+                        if watermark and updated_at and updated_at < watermark:
+                            crossed = True
+                            break
+                        if updated_at and (newest is None or updated_at > newest):
+                            newest = updated_at
+                        page.append(job)
+                    fetched += self.upsert(page, archived=archived)
+                    if on_page is not None:
+                        on_page(fetched)
+                    if crossed or len(content.get('jobs', [])) < SYNC_PAGE_SIZE:
+                        break
+            finally:
+                pages.close()
+        # The watermark only moves once every pass is complete, so an
+        # interrupted sync is simply resumed by the next one
+        if newest:
+            self.set_meta('watermark', newest)
+        self.set_meta('synced_at', utc_time(datetime.now(timezone.utc).isoformat()))
+        try:
+            user = cl.get_user_info(verify=verify)
+            self.set_meta('user_id', user.get('id') or user.get('_id'))
+        except Exception:
+            pass  # --filter-only-mine is then not available offline
+        return {'fetched': fetched, 'total': self.count(), 'watermark': newest}
+
+    def _where(self, archived=False, status=None, project=None, workflow=None, owner=None,
+               only_mine=False, queue=None, job_name=None, job_id=None, since=None, until=None,
+               name_regex=None, min_cost=None, max_cost=None, min_runtime=None, max_runtime=None):
+        """Build the WHERE clause of a query and its arguments."""
+        clauses, args = ['archived = ?'], [1 if archived else 0]
+        if status:
+            clauses.append('status = ?')
+            args.append(status.lower())
+        if project:
+            clauses.append('project_name = ?')
+            args.append(project)
+        if workflow:
+            clauses.append('workflow_name = ?')
+            args.append(workflow)
+        if owner:
+            clauses.append('(owner = ? OR username = ?)')
+            args += [owner, owner]
+        if only_mine:
+            user_id = self.get_meta('user_id')
+            if not user_id:
+                raise ValueError('The current user is not known by the index. Please, run "cloudos job sync" first.')
+            clauses.append('user_id = ?')
+            args.append(user_id)
+        if queue:
+            clauses.append('(queue_id = ? OR queue_name = ?)')
+            args += [queue, queue]
+        if job_name:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            args.append('%' + re.sub(r'([%_\\])', r'\\\1', job_name) + '%')
+        if job_id:
+            clauses.append('id = ?')
+            args.append(job_id)
+        for value, op, end_of_day in ((since, '>=', False), (until, '<', True)):
+            if value:
+                bound = utc_time(value, end_of_day=end_of_day)
+                if bound is None:
+                    raise ValueError(f"Invalid date '{value}'. Please, use the YYYY-MM-DD or ISO 8601 format.")
+                clauses.append(f'created_at {op} ?')
+                args.append(bound)
+        if name_regex:
+            try:
+                re.compile(name_regex)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression '{name_regex}'. {e}")
+            clauses.append('name REGEXP ?')
+            args.append(name_regex)
+        if min_cost is not None:
+            clauses.append('cost >= ?')
+            args.append(min_cost)
+        if max_cost is not None:
+            clauses.append('cost <= ?')
+            args.append(max_cost)
+        # Jobs still running are measured up to now
+        runtime = ("(julianday(COALESCE(end_time, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))) - "
+                   "julianday(start_time)) * 86400")
+        if min_runtime is not None:
+            clauses.append(f'start_time IS NOT NULL AND {runtime} >= ?')
+            args.append(min_runtime)
+        if max_runtime is not None:
+            clauses.append(f'start_time IS NOT NULL AND {runtime} <= ?')
+            args.append(max_runtime)
+        return ' AND '.join(clauses), args
+
+    def query(self, limit=None, offset=0, **filters):
+        """Return the indexed jobs matching the filters, newest first.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of jobs to return. All if None.
+        offset : int
+            Number of matching jobs to skip.
+        **filters
+            archived, status, project, workflow, owner, only_mine, queue,
+            job_name, job_id, since, until (on the submit time), name_regex,
+            min_cost, max_cost, min_runtime and max_runtime.
+
+        Returns
+        -------
+        list
+            The jobs, with the INDEXED_FIELDS of the API response.
+        """
+        where, args = self._where(**filters)
+        rows = self.conn.execute(f'SELECT job FROM jobs WHERE {where} ORDER BY created_at DESC '
+                                 'LIMIT ? OFFSET ?', args + [-1 if limit is None else limit, offset])
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, **filters):
+        """Return the number of indexed jobs matching the filters.
+
+        Without filters, every job of the index is counted, archived or not.
+        """
+        if not filters:
+            return self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+        where, args = self._where(**filters)
+        return self.conn.execute(f'SELECT COUNT(*) FROM jobs WHERE {where}', args).fetchone()[0]
+
+    def frame(self, **filters):
+        """Return the indexed jobs matching the filters as a DataFrame.
+
+        Parameters
+        ----------
+        **filters
+            The filters of JobIndex.query.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The JOB_COLUMNS of the matching jobs, newest first.
+        """
+        where, args = self._where(**filters)
+        return pd.read_sql_query(f'SELECT {", ".join(JOB_COLUMNS)} FROM jobs WHERE {where} '
+                                 'ORDER BY created_at DESC', self.conn, params=args)
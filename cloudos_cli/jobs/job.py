@@ -2,18 +2,21 @@
 This is the main class to create jobs.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Union
 import json
 from cloudos_cli.clos import Cloudos
+from cloudos_cli.constants import JOB_LIST_PAGE_TIMEOUT
 from cloudos_cli.utils.errors import BadRequestException
 from cloudos_cli.utils.requests import retry_requests_post, retry_requests_get, retry_requests_delete
 from pathlib import Path
 from urllib.parse import urlparse
 import base64
 import re
-from cloudos_cli.utils.array_job import classify_pattern, get_file_or_folder_id, extract_project
+from cloudos_cli.utils.array_job import classify_pattern, get_file_or_folder_id, extract_project, PathResolver
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import click
 from datetime import datetime
 
@@ -63,6 +66,15 @@ class Job(Cloudos):
     repository_platform: str = 'github'
     project_id: str = None
     workflow_id: str = None
+    _path_resolver: PathResolver = field(init=False, repr=False, compare=False, default=None)
+
+    @property
+    def path_resolver(self) -> PathResolver:
+        """File Explorer path cache shared by all the parameters of this job."""
+        if self._path_resolver is None:
+            self._path_resolver = PathResolver(self.cloudos_url, self.apikey,
+                                               self.workspace_id, self.verify)
+        return self._path_resolver
 
     @property
     def project_id(self) -> str:
@@ -153,28 +165,9 @@ class Job(Cloudos):
             raise ValueError('Your specified resource is not supported. ' +
                              f'Use one of the following: {allowed_resources}')
         if resource == 'workflows':
-            content = self.get_workflow_content(workspace_id, name, verify=verify, last=self.last)
-            for element in content["workflows"]:
-                if (element["name"] == name and element["workflowType"] == "docker" and
-                        not element["archived"]["status"]):
-                    return element["_id"]  # no mainfile or importsfile
-                if (element["name"] == name and
-                        element["repository"]["platform"] == repository_platform and
-                        not element["archived"]["status"]):
-                    if mainfile is None:
-                        return element["_id"]
-                    elif element["mainFile"] == mainfile:
-                        if importsfile is None and "importsFile" not in element.keys():
-                            return element["_id"]
-                        elif "importsFile" in element.keys() and element["importsFile"] == importsfile:
-                            return element["_id"]
-        elif resource == 'projects':
-            return self.get_project_id_from_name(workspace_id, self.project_name, verify=verify)
-        if mainfile is not None:
-            raise ValueError(f'A workflow named \'{name}\' with a mainFile \'{mainfile}\'' +
-                             f' and an importsFile \'{importsfile}\' was not found')
-        else:
-            raise ValueError(f'No {name} element in {resource} was found')
+            workflow = self.resolve_workflow(workspace_id, name, verify=verify, last=self.last)
+            return workflow.find_id(mainfile, importsfile, repository_platform)
+        return self.get_project_id_from_name(workspace_id, self.project_name, verify=verify)
 
     def build_parameters_file_payload(self, params_file):
         """Build the parametersFile payload for a params file path."""
@@ -276,7 +269,8 @@ class Job(Cloudos):
             self.verify,
             command_dir,
             command_name,
-            is_file=True
+            is_file=True,
+            resolver=self.path_resolver
         )
         return {
             "parametersFile": {
@@ -476,6 +470,9 @@ class Job(Cloudos):
 
         # general parameters (from --parameter)
         if len(parameter) > 0:
+            if workflow_type == 'docker':
+                # list every directory referenced by the parameters concurrently
+                self.prefetch_docker_paths(parameter, self.project_name)
             for p in parameter:
                 p_split = p.split('=')
                 if len(p_split) < 2:
@@ -693,16 +690,10 @@ class Job(Cloudos):
         j_id : string
             The Lifebit Platform job id of the job just launched.
         """
-        apikey = self.apikey
         cloudos_url = self.cloudos_url
-        workspace_id = self.workspace_id
         workflow_id = self.workflow_id
         project_id = self.project_id
         # Prepare api request for Lifebit Platform to run a job
-        headers = {
-            "Content-type": "application/json",
-            "apikey": apikey
-        }
         params = self.convert_nextflow_to_json(job_config,
                                                params_file,
                                                parameter,
@@ -738,16 +729,39 @@ class Job(Cloudos):
                                                command=command,
                                                cpus=cpus,
                                                memory=memory)
-        r = retry_requests_post("{}/api/v2/jobs?teamId={}".format(cloudos_url,
-                                                                  workspace_id),
-                                data=json.dumps(params), headers=headers, verify=verify)
-        if r.status_code >= 400:
-            raise BadRequestException(r)
-        j_id = json.loads(r.content)["jobId"]
+        j_id = self.post_job(params, verify=verify)
         print('\tJob successfully launched to Lifebit Platform, please check the ' +
               f'following link: {cloudos_url}/app/advanced-analytics/analyses/{j_id}')
         return j_id
 
+    def post_job(self, params, verify=True):
+        """Submit an already built job payload to Lifebit Platform.
+
+        Parameters
+        ----------
+        params : dict
+            The job payload, as returned by convert_nextflow_to_json.
+        verify : [bool|string]
+            Whether to use SSL verification or not. Alternatively, if
+            a string is passed, it will be interpreted as the path to
+            the SSL certificate file.
+
+        Returns
+        -------
+        j_id : string
+            The Lifebit Platform job id of the job just launched.
+        """
+        headers = {
+            "Content-type": "application/json",
+            "apikey": self.apikey
+        }
+        r = retry_requests_post("{}/api/v2/jobs?teamId={}".format(self.cloudos_url,
+                                                                  self.workspace_id),
+                                data=json.dumps(params), headers=headers, verify=verify)
+        if r.status_code >= 400:
+            raise BadRequestException(r)
+        return json.loads(r.content)["jobId"]
+
     def retrieve_cols_from_array_file(self, array_file, ds, separator, verify_ssl):
         """
         Retrieve metadata for columns from an array file stored in a directory.
@@ -966,6 +980,47 @@ class Job(Cloudos):
         - If the parameter does not match any specific pattern or file extension, it is treated as a simple text value.
         """
 
+        name, rest, prefix, lookup = self._parse_docker_param(param, project_name)
+        if lookup is None:
+            return {
+                "name": f"{name.lstrip('-')}",
+                "prefix": f"{prefix}",
+                "parameterKind": "textValue",
+                "textValue": f"{rest}"
+            }
+        current_project, command_dir, command_name, is_file = lookup
+        item_id = get_file_or_folder_id(self.cloudos_url, self.apikey, self.workspace_id, current_project,
+                                        self.verify, command_dir, command_name, is_file=is_file,
+                                        resolver=self.path_resolver)
+        if not is_file:
+            return {
+                "name": f"{name.lstrip('-')}",
+                "prefix": f"{prefix}",
+                'globPattern': command_name,
+                "parameterKind": "globPattern",
+                "folder": f"{item_id}"
+            }
+        return {
+            "name": f"{name.lstrip('-')}",
+            "prefix": f"{prefix}",
+            "parameterKind": "dataItem",
+            "dataItem": {
+                "kind": "File",
+                "item": f"{item_id}"
+            }
+        }
+
+    @staticmethod
+    def _parse_docker_param(param, project_name):
+        """Split a Docker workflow parameter and find the File Explorer item it refers to.
+
+        Returns
+        -------
+        tuple
+            (name, value, prefix, lookup) where lookup is None for text values
+            or (project, command_dir, command_name, is_file) for files and
+            glob patterns.
+        """
         # split '--param_name=example_test'
         # name -> '--param_name'
         # rest -> 'example_test'
@@ -983,39 +1038,34 @@ class Job(Cloudos):
         command_name = command_path.name
         _, ext = os.path.splitext(command_name)
         prefix = "--" if name.startswith('--') else ("-" if name.startswith('-') else "")
-        if classify_pattern(rest) in ["regex", "glob"]:
-            if not (file_path.startswith('/Data') or file_path.startswith('Data')):
-                raise ValueError("The file path inside the project must start with '/Data' or 'Data'. ")
+        is_pattern = classify_pattern(rest) in ["regex", "glob"]
+        if not is_pattern and not ext:
+            return name, rest, prefix, None
+        if not (file_path.startswith('/Data') or file_path.startswith('Data')):
+            raise ValueError("The file path inside the project must start with '/Data' or 'Data'. ")
+        return name, rest, prefix, (current_project, command_dir, command_name, not is_pattern)
 
-            folder = get_file_or_folder_id(self.cloudos_url, self.apikey, self.workspace_id, current_project, self.verify, command_dir, command_name, is_file=False)
-            return {
-                "name": f"{name.lstrip('-')}",
-                "prefix": f"{prefix}",
-                'globPattern': command_name,
-                "parameterKind": "globPattern",
-                "folder": f"{folder}"
-            }
-        elif ext:
-            if not (file_path.startswith('/Data') or file_path.startswith('Data')):
-                raise ValueError("The file path inside the project must start with '/Data' or 'Data'. ")
+    def prefetch_docker_paths(self, parameter, project_name):
+        """List the directories referenced by Docker workflow parameters concurrently.
 
-            file = get_file_or_folder_id(self.cloudos_url, self.apikey, self.workspace_id, current_project, self.verify, command_dir, command_name, is_file=True)
-            return {
-                "name": f"{name.lstrip('-')}",
-                "prefix": f"{prefix}",
-                "parameterKind": "dataItem",
-                "dataItem": {
-                    "kind": "File",
-                    "item": f"{file}"
-                }
-            }
-        else:
-            return {
-                "name": f"{name.lstrip('-')}",
-                "prefix": f"{prefix}",
-                "parameterKind": "textValue",
-                "textValue": f"{rest}"
-            }
+        Parameters
+        ----------
+        parameter : tuple
+            Parameters in the form 'name=value', as passed to docker_workflow_param_processing.
+        project_name : str
+            The name of the project used when a parameter does not include one.
+        """
+        entries = []
+        for p in parameter:
+            try:
+                lookup = self._parse_docker_param(p, project_name)[3]
+            except ValueError:
+                # reported when the parameter itself is processed
+                continue
+            if lookup is not None:
+                current_project, command_dir, _, is_file = lookup
+                entries.append((current_project, command_dir, is_file))
+        self.path_resolver.prefetch(entries)
 
     def get_job_request_payload(self, job_id, verify=True):
         """Get the original request payload for a job.
@@ -1098,16 +1148,9 @@ class Job(Cloudos):
         str
             The resume work directory id.
         """
-        headers = {
-            "Content-type": "application/json",
-            "apikey": self.apikey
-        }
-        url = f"{self.cloudos_url}/api/v1/jobs/{job_id}?teamId={self.workspace_id}"
-        r = retry_requests_get(url, headers=headers, verify=verify)
-        if r.status_code >= 400:
-            raise BadRequestException(r)
-        if field in json.loads(r.content).keys():
-            return json.loads(r.content)[field]
+        job = self.get_job_snapshot(job_id, self.workspace_id, verify).document
+        if field in job.keys():
+            return job[field]
         else:
             raise ValueError(f"Field '{field}' not found in endpoint 'jobs'.")
 
@@ -1594,6 +1637,7 @@ class Job(Cloudos):
         }
         url = f"{self.cloudos_url}/api/v1/jobs/{job_id}/data?properties[]={mode}&teamId={self.workspace_id}"
         response = retry_requests_delete(url, headers=headers, verify=verify)
+        self.invalidate_job_snapshot(job_id)
 
         # Handle specific status codes according to API specification
         if response.status_code == 204:
@@ -1710,7 +1754,8 @@ class Job(Cloudos):
 
 def fetch_job_page(cl, workspace_id, page_num, page_size, last_n_jobs, archived, verify_ssl,
                    filter_status, filter_job_name, filter_project, filter_workflow,
-                   filter_job_id, filter_only_mine, filter_owner, filter_queue, last):
+                   filter_job_id, filter_only_mine, filter_owner, filter_queue, last, query=None,
+                   timeout=None):
     """Helper function to fetch a specific page of jobs.
     Parameters
     ----------
@@ -1746,6 +1791,11 @@ def fetch_job_page(cl, workspace_id, page_num, page_size, last_n_jobs, archived,
         Queue filter
     last : bool
         Use latest workflow for duplicates
+    query : JobListQuery, optional
+        Filters already resolved with Cloudos.prepare_job_list_query. When
+        given, archived and the filter arguments are ignored.
+    timeout : float, optional
+        Timeout in seconds of the page request. No timeout if None.
     Returns
     -------
     dict
@@ -1766,16 +1816,88 @@ def fetch_job_page(cl, workspace_id, page_num, page_size, last_n_jobs, archived,
         filter_only_mine=filter_only_mine,
         filter_owner=filter_owner,
         filter_queue=filter_queue,
-        last=last
+        last=last,
+        query=query,
+        timeout=timeout
     )
     return result
 
 
+class JobPageFetcher:
+    """Fetch pages of a prepared job list query, keeping the neighbours of the
+    current page fetched in the background.
+
+    Calling the object with a page number returns that page, as
+    fetch_job_page does. prefetch() starts fetching a page in a background
+    thread so that a later call for it returns without waiting. Page
+    requests time out after JOB_LIST_PAGE_TIMEOUT seconds, and close()
+    drops the pages not fetched yet.
+
+    Parameters
+    ----------
+    cl : Cloudos
+        Lifebit Platform API client instance
+    query : JobListQuery
+        The query, as returned by Cloudos.prepare_job_list_query
+    page_size : int
+        Number of jobs per page
+    verify_ssl : bool or str
+        SSL verification setting
+    """
+
+    def __init__(self, cl, query, page_size, verify_ssl):
+        self.cl = cl
+        self.query = query
+        self.page_size = page_size
+        self.verify_ssl = verify_ssl
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1)
+
+    def _fetch(self, page_num):
+        return fetch_job_page(
+            self.cl, self.query.workspace_id, page_num, self.page_size, None, None, self.verify_ssl,
+            None, None, None, None, None, None, None, None, None, query=self.query,
+            timeout=JOB_LIST_PAGE_TIMEOUT
+        )
+
+    def close(self):
+        """Stop the background thread without waiting for a page in flight."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch(self, page_num):
+        """Start fetching a page in the background, unless already fetched."""
+        with self._lock:
+            if page_num >= 1 and page_num not in self._pages:
+                self._pages[page_num] = self._pool.submit(self._fetch, page_num)
+
+    def __call__(self, page_num):
+        self.prefetch(page_num)
+        with self._lock:
+            future = self._pages[page_num]
+        try:
+            result = future.result()
+        except Exception:
+            # A failed page is not kept, so asking for it again retries it
+            with self._lock:
+                self._pages.pop(page_num, None)
+            raise
+        # Only the pages next to the current one are worth keeping
+        with self._lock:
+            for other in [p for p in self._pages if abs(p - page_num) > 1]:
+                self._pages.pop(other).cancel()
+        return result
+
+
 def create_api_pagination_callback(cl, workspace_id, page_size, archived, verify_ssl,
                                     filter_status, filter_job_name, filter_project, filter_workflow,
-                                    filter_job_id, filter_only_mine, filter_owner, filter_queue, last):
+                                    filter_job_id, filter_only_mine, filter_owner, filter_queue, last,
+                                    query=None):
     """Create a pagination callback that fetches pages from the API.
-    
+
+    The filters are resolved to IDs once, and the returned callback fetches
+    the next page in the background while the current one is displayed.
+
     Parameters
     ----------
     cl : Cloudos
@@ -1806,55 +1928,102 @@ def create_api_pagination_callback(cl, workspace_id, page_size, archived, verify
         Queue filter
     last : bool
         Use latest workflow for duplicates
-        
+    query : JobListQuery, optional
+        Filters already resolved with Cloudos.prepare_job_list_query. When
+        given, archived and the filter arguments are ignored.
+
     Returns
     -------
-    callable
-        Callback function that takes page_num and returns job page data
+    JobPageFetcher
+        Callback that takes page_num and returns job page data
     """
-    def api_fetch_callback(page_num):
-        return fetch_job_page(
-            cl, workspace_id, page_num, page_size, None, archived, verify_ssl,
-            filter_status, filter_job_name, filter_project, filter_workflow,
-            filter_job_id, filter_only_mine, filter_owner, filter_queue, last
+    if query is None:
+        query = cl.prepare_job_list_query(
+            workspace_id, archived=archived, verify=verify_ssl,
+            filter_status=filter_status, filter_job_name=filter_job_name,
+            filter_project=filter_project, filter_workflow=filter_workflow,
+            filter_job_id=filter_job_id, filter_only_mine=filter_only_mine,
+            filter_owner=filter_owner, filter_queue=filter_queue, last=last
         )
-    return api_fetch_callback
+    return JobPageFetcher(cl, query, page_size, verify_ssl)
+
+
+def create_stream_pagination_callback(jobs, page_size):
+    """Create a pagination callback that reads jobs from an iterator on demand.
 
+    Used with Cloudos.iter_jobs when jobs are filtered client-side (e.g., by
+    queue), so that only the pages actually viewed are fetched. The jobs read
+    so far are kept to go back to previous pages.
 
-def create_client_pagination_callback(all_jobs, page_size):
-    """Create a pagination callback that paginates already-fetched jobs client-side.
-    
-    Used when jobs have been pre-filtered client-side (e.g., by queue) and we
-    want to paginate through the cached results.
-    
     Parameters
     ----------
-    all_jobs : list
-        List of all jobs to paginate through
+    jobs : iterator
+        Iterator of jobs, e.g. from Cloudos.iter_jobs
     page_size : int
         Number of jobs per page
-        
+
     Returns
     -------
     callable
-        Callback function that takes page_num and returns job page data
+        Callback function that takes page_num and returns job page data.
+        The total number of jobs is only known once the iterator is
+        exhausted; until then '_more' is True in the pagination metadata.
     """
-    def client_fetch_callback(page_num):
-        """Paginate client-side filtered results"""
-        start_idx = (page_num - 1) * page_size
-        end_idx = start_idx + page_size
-        page_jobs = all_jobs[start_idx:end_idx]
-        
-        # Return with updated pagination metadata
+    jobs = iter(jobs)
+    seen = []
+    state = {'exhausted': False}
+
+    def stream_fetch_callback(page_num):
+        """Read jobs up to one past the requested page, to know if there are more"""
+        end_idx = page_num * page_size
+        while not state['exhausted'] and len(seen) <= end_idx:
+            job = next(jobs, None)
+            if job is None:
+                state['exhausted'] = True
+            else:
+                seen.append(job)
+        more = len(seen) > end_idx
         return {
-            'jobs': page_jobs,
+            'jobs': seen[end_idx - page_size:end_idx],
             'pagination_metadata': {
-                'Pagination-Count': len(all_jobs),
+                'Pagination-Count': len(seen),
                 'Pagination-Page': page_num,
                 'Pagination-Limit': page_size,
-                '_client_filtered': True
+                'totalPages': page_num + 1 if more else max(1, -(-len(seen) // page_size)),
+                '_client_filtered': True,
+                '_more': more
             }
         }
-    return client_fetch_callback
+    return stream_fetch_callback
+
 
+def create_index_pagination_callback(index, page_size, filters):
+    """Create a pagination callback that reads pages from the local job index.
 
+    Parameters
+    ----------
+    index : cloudos_cli.jobs.index.JobIndex
+        The job index of the workspace
+    page_size : int
+        Number of jobs per page
+    filters : dict
+        Filters passed to JobIndex.query and JobIndex.count
+
+    Returns
+    -------
+    callable
+        Callback function that takes page_num and returns job page data
+    """
+    total = index.count(**filters)
+
+    def index_fetch_callback(page_num):
+        """Query one page of the index"""
+        return {
+            'jobs': index.query(limit=page_size, offset=(page_num - 1) * page_size, **filters),
+            'pagination_metadata': {
+                'Pagination-Count': total,
+                'Pagination-Page': page_num,
+                'Pagination-Limit': page_size
+            }
+        }
+    return index_fetch_callback
@@ -0,0 +1,186 @@
+"""
+Local copies of the log files of jobs, for `job logs --download`.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from cloudos_cli.jobs.paths import job_path_record
+from cloudos_cli.jobs.wait import TERMINAL_STATUSES
+from cloudos_cli.utils.requests import ensure_pool_size
+
+# Written in the directory of a job once all its log files are downloaded
+LOGS_MANIFEST = '.cloudos-logs.json'
+CHUNK_SIZE = 1024 * 1024
+
+
+class LogStorage(ABC):
+    """Where the log files of the jobs are read from.
+
+    The Lifebit Platform does not expose a download endpoint for the log
+    files yet, so the storage is always given to download_job_logs.
+    MirrorLogStorage reads a local or mounted copy of the buckets.
+    """
+
+    @abstractmethod
+    def iter_chunks(self, uri, chunk_size=CHUNK_SIZE):
+        """Yield the content of the object at `uri` (s3:// or az://) as bytes."""
+
+
+class MirrorLogStorage(LogStorage):
+    """Read log files from a local or mounted mirror of the buckets.
+
+    s3://<bucket>/<key> is read from <root>/<bucket>/<key> and
+    az://<account>.blob.core.windows.net/<container>/<blob> from
+    <root>/<container>/<blob>, e.g. a directory where the buckets are
+    mounted with s3fs or blobfuse.
+
+    Parameters
+    ----------
+    root : str
+        The directory holding the mirror of the buckets.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def local_path(self, uri):
+        """Return the path of an s3:// or az:// object in the mirror."""
+        scheme, _, location = uri.partition('://')
+        if scheme == 's3':
+            relative = location
+        elif scheme == 'az':
+            relative = location.partition('/')[2]
+        else:
+            raise ValueError(f"Unsupported storage URI '{uri}'.")
+        if not relative or '..' in relative.split('/'):
+            raise ValueError(f"Unsupported storage URI '{uri}'.")
+        return os.path.join(self.root, *relative.split('/'))
+
+    def iter_chunks(self, uri, chunk_size=CHUNK_SIZE):
+        with open(self.local_path(uri), 'rb') as fh:
+            while True:
+                chunk = fh.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+def read_logs_manifest(job_dir):
+    """Return the manifest of a downloaded job, or None if it is missing or incomplete."""
+    try:
+        with open(os.path.join(job_dir, LOGS_MANIFEST)) as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    files = manifest.get('files', {})
+    if not all(os.path.isfile(os.path.join(job_dir, name)) for name in files.values()):
+        return None
+    return manifest
+
+
+def download_log_file(storage, uri, path, chunk_size=CHUNK_SIZE):
+    """Stream one object to `path`, which only appears once it is complete.
+
+    Returns
+    -------
+    int
+        The number of bytes written.
+    """
+    part = f'{path}.part'
+    size = 0
+    try:
+        with open(part, 'wb') as fh:
+            for chunk in storage.iter_chunks(uri, chunk_size):
+                fh.write(chunk)
+                size += len(chunk)
+        os.replace(part, path)
+    finally:
+        if os.path.exists(part):
+            os.remove(part)
+    return size
+
+
+def _download_job(cl, workspace_id, job_id, directory, storage, verify, file_pool, chunk_size):
+    """Download the log files of one job, unless they are cached and final."""
+    job_dir = os.path.join(directory, job_id)
+    manifest = read_logs_manifest(job_dir)
+    if manifest is not None and manifest.get('status') in TERMINAL_STATUSES:
+        # The logs of a finished job never change: nothing is requested
+        return {'job_id': job_id, 'name': manifest.get('name'), 'status': manifest['status'],
+                'directory': job_dir, 'files': sorted(manifest['files'].values()), 'bytes': 0,
+                'cached': True}
+    record = job_path_record(cl, workspace_id, job_id, 'logs', verify)
+    if 'error' in record:
+        return {**record, 'directory': job_dir, 'files': [], 'bytes': 0, 'cached': False}
+    os.makedirs(job_dir, exist_ok=True)
+    files = {label: uri.rstrip('/').rsplit('/', 1)[-1] for label, uri in record['logs'].items()}
+    futures = [file_pool.submit(download_log_file, storage, uri, os.path.join(job_dir, files[label]),
+                                chunk_size)
+               for label, uri in record['logs'].items()]
+    summary = {'job_id': job_id, 'name': record['name'], 'status': record['status'],
+               'directory': job_dir, 'files': sorted(files.values()), 'bytes': 0, 'cached': False}
+    try:
+        summary['bytes'] = sum(future.result() for future in futures)
+    except Exception as e:
+        summary['error'] = str(e) or type(e).__name__
+        summary['error_type'] = type(e).__name__
+        return summary
+    with open(os.path.join(job_dir, LOGS_MANIFEST), 'w') as fh:
+        json.dump({'job_id': job_id, 'name': record['name'], 'status': record['status'],
+                   'files': files}, fh)
+    return summary
+
+
+def download_job_logs(cl, workspace_id, job_ids, directory, storage, verify=True,
+                      max_workers=8, chunk_size=CHUNK_SIZE):
+    """Download the log files of many jobs concurrently, one sub-directory per job.
+
+    The files of a job are written to `<directory>/<job_id>/`, together with
+    a manifest recording the status of the job. Jobs already downloaded in a
+    terminal status (completed, failed or aborted) are skipped without any
+    request. The logs of the other jobs are downloaded again.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_ids : iterable
+        The job ids, consumed lazily.
+    directory : str
+        The directory to download the logs to.
+    storage : LogStorage
+        Where the log files are read from.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    max_workers : int
+        Maximum number of jobs resolved, and of files downloaded, at the
+        same time.
+    chunk_size : int
+        Size (in bytes) of the chunks streamed to disk.
+
+    Yields
+    ------
+    dict
+        One summary per job, in the order of job_ids: 'job_id', 'name',
+        'status', 'directory', 'files', 'bytes' downloaded and whether it
+        was 'cached', or 'error' and 'error_type' if it failed.
+    """
+    ensure_pool_size(2 * max_workers)
+    os.makedirs(directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as job_pool, \
+            ThreadPoolExecutor(max_workers=max_workers) as file_pool:
+        pending = deque()
+        for job_id in job_ids:
+            pending.append(job_pool.submit(_download_job, cl, workspace_id, job_id, directory,
+                                           storage, verify, file_pool, chunk_size))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,153 @@
+"""
+Logs, results and working directory locations of jobs: many jobs at once, and
+the full results tree of a job.
+"""
+
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from cloudos_cli.utils.requests import ensure_pool_size
+
+# Kind of location -> name of the Cloudos method resolving it for one job
+JOB_PATH_KINDS = {
+    'logs': 'get_job_logs',
+    'results': 'get_job_results',
+    'workdir': 'get_job_workdir'
+}
+
+
+def job_path_record(cl, workspace_id, job_id, kind, verify=True):
+    """Resolve a location of a job, reporting errors instead of raising them.
+
+    The job document is requested once (see Cloudos.get_job_snapshot) and
+    the cloud descriptor of the workspace comes from the metadata cache, so
+    that only the storage listing is specific to every job.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the job, shared by all the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_id : str
+        The Lifebit Platform job id.
+    kind : str
+        One of JOB_PATH_KINDS.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+
+    Returns
+    -------
+    dict
+        'job_id', 'name' and 'status' of the job and, under `kind`, the
+        location (a dict of log name -> URI for logs, a URI otherwise), or
+        'error' and 'error_type' if it could not be resolved.
+    """
+    record = {'job_id': job_id, 'name': None, 'status': None}
+    try:
+        snapshot = cl.get_job_snapshot(job_id, workspace_id, verify)
+        record['name'] = snapshot.name
+        record['status'] = snapshot.status
+        location = getattr(cl, JOB_PATH_KINDS[kind])(job_id, workspace_id, verify)
+        record[kind] = location.strip() if isinstance(location, str) else location
+    except Exception as e:
+        record['error'] = str(e) or type(e).__name__
+        record['error_type'] = type(e).__name__
+    return record
+
+
+def iter_job_paths(cl, workspace_id, job_ids, kind, verify=True, max_workers=8):
+    """Resolve a location of many jobs concurrently.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_ids : iterable
+        The job ids. It is consumed lazily, so it can be a stream of jobs
+        being listed.
+    kind : str
+        One of JOB_PATH_KINDS.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    max_workers : int
+        Maximum number of jobs resolved at the same time.
+
+    Yields
+    ------
+    dict
+        One record per job, in the order of job_ids, see job_path_record.
+    """
+    if kind not in JOB_PATH_KINDS:
+        raise ValueError(f"Unknown location '{kind}'. Please, use one of: {', '.join(JOB_PATH_KINDS)}.")
+    ensure_pool_size(max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+        for job_id in job_ids:
+            pending.append(pool.submit(job_path_record, cl, workspace_id, job_id, kind, verify))
+            # Only a few jobs are resolved ahead of the consumer
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_job_paths(records, fh):
+    """Write job path records as NDJSON, one line per job as soon as resolved.
+
+    Returns
+    -------
+    tuple
+        The number of records written and of records with an error.
+    """
+    n_records = n_errors = 0
+    for record in records:
+        fh.write(json.dumps(record) + '\n')
+        fh.flush()
+        n_records += 1
+        n_errors += 'error' in record
+    return n_records, n_errors
+
+
+def iter_results_tree(cl, workspace_id, job_id, verify=True, max_depth=None, max_workers=8,
+                      exclude=None, on_error=None):
+    """Crawl the results directory of a job, yielding its objects as they are listed.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the job and its storage.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_id : str
+        The Lifebit Platform job id.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    max_depth, max_workers, exclude, on_error
+        As in Cloudos.walk_storage.
+
+    Yields
+    ------
+    dict
+        'path' (relative to the results directory), 'uri', 'size' (None for
+        directories), 'is_dir' and 'depth' of every object found.
+    """
+    location = cl.get_job_results_location(job_id, workspace_id, verify)
+    base_uri = location['uri'].rstrip('/')
+    for item_path, item, depth in cl.walk_storage(location['cloud'], location['meta'],
+                                                  location['container'], location['path'],
+                                                  workspace_id, verify, max_depth=max_depth,
+                                                  max_workers=max_workers, exclude=exclude,
+                                                  on_error=on_error):
+        is_dir = bool(item.get('isDir'))
+        size = None if is_dir else int(item.get('sizeInBytes', item.get('size')) or 0)
+        yield {'path': item_path, 'uri': f'{base_uri}/{item_path}', 'size': size,
+               'is_dir': is_dir, 'depth': depth}
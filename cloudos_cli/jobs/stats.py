@@ -0,0 +1,194 @@
+"""
+Aggregated run time, cost and failure statistics over many jobs.
+"""
+
+import os
+import sqlite3
+import numpy as np
+import pandas as pd
+from cloudos_cli.clos import _parse_iso_times
+from cloudos_cli.constants import JOB_COMPLETED
+from cloudos_cli.jobs.index import JOB_COLUMNS, JobIndex, index_path, job_row, utc_time
+
+# Columns that jobs can be grouped by -> column of the job frame
+STATS_GROUPS = {
+    'workflow': 'workflow_name',
+    'project': 'project_name',
+    'owner': 'owner',
+    'queue': 'queue_name',
+    'status': 'status'
+}
+
+# Statuses of the jobs that are no longer running
+ENDED_STATUSES = ['completed', 'failed', 'aborted']
+
+STATS_COLUMNS = ['jobs', 'completed', 'failed', 'aborted', 'failure_rate', 'runtime_p50',
+                 'runtime_p95', 'total_cost', 'mean_cost']
+
+
+def jobs_frame(jobs, since=None, until=None):
+    """Collect the columns needed by the statistics from a stream of jobs.
+
+    Only a few fields are kept per job, so memory stays low for large
+    workspaces. Jobs are expected newest first, as returned by the API:
+    reading stops at the first job submitted before `since`.
+
+    Parameters
+    ----------
+    jobs : iterable
+        Job dicts, e.g. from Cloudos.iter_jobs.
+    since, until : str, optional
+        Keep only the jobs submitted within these dates (YYYY-MM-DD or ISO
+        8601). A date-only `until` includes that whole day.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The JOB_COLUMNS of the jobs, as in JobIndex.frame.
+    """
+    since_bound = _bound(since)
+    until_bound = _bound(until, end_of_day=True)
+    created_at = JOB_COLUMNS.index('created_at')
+    rows = []
+    try:
+        for job in jobs:
+            row = job_row(job)
+            created = row[created_at]
+            if until_bound and created and created >= until_bound:
+                continue
+            if since_bound and created and created < since_bound:
+                break
+            rows.append(row)
+    finally:
+        close = getattr(jobs, 'close', None)
+        if close is not None:
+            close()
+    return pd.DataFrame.from_records(rows, columns=JOB_COLUMNS)
+
+
+def _bound(value, end_of_day=False):
+    if not value:
+        return None
+    bound = utc_time(value, end_of_day=end_of_day)
+    if bound is None:
+        raise ValueError(f"Invalid date '{value}'. Please, use the YYYY-MM-DD or ISO 8601 format.")
+    return bound
+
+
+def job_stats(frame, group_by=('workflow',)):
+    """Aggregate the jobs of a frame by workflow, project, owner...
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        The JOB_COLUMNS of the jobs, from jobs_frame or JobIndex.frame.
+    group_by : sequence of str
+        Keys of STATS_GROUPS to group the jobs by.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per group, with the group_by columns and:
+        'jobs', 'completed', 'failed' and 'aborted' (number of jobs),
+        'failure_rate' (failed jobs over ended jobs, NaN if none ended),
+        'runtime_p50' and 'runtime_p95' (run time percentiles, in seconds,
+        of the jobs that have ended) and 'total_cost' and 'mean_cost' (in
+        the units shown by `job list`). Groups are sorted by number of
+        jobs, descending.
+    """
+    group_by = list(group_by)
+    unknown = [key for key in group_by if key not in STATS_GROUPS]
+    if unknown or not group_by:
+        raise ValueError(f"Cannot group jobs by {', '.join(unknown) or 'nothing'}. "
+                         f"Please, use one or more of: {', '.join(STATS_GROUPS)}.")
+    status = frame['status'].astype(object).fillna('').astype(str).str.lower()
+    start = _parse_iso_times(frame['start_time'])
+    end = _parse_iso_times(frame['end_time'])
+    ended = start['parsed'].to_numpy() & end['parsed'].to_numpy()
+    runtime = np.where(ended, (end['instant'].to_numpy() - start['instant'].to_numpy()) / 1e9,
+                       np.nan)
+    data = pd.DataFrame({key: frame[STATS_GROUPS[key]].astype(object).fillna('-').astype(str)
+                         for key in group_by}, index=frame.index)
+    data['completed'] = (status == 'completed').to_numpy()
+    data['failed'] = (status == 'failed').to_numpy()
+    data['aborted'] = (status == 'aborted').to_numpy()
+    data['runtime'] = runtime
+    data['cost'] = pd.to_numeric(frame['cost'], errors='coerce').astype(float).to_numpy()
+    if data.empty:
+        return pd.DataFrame(columns=group_by + STATS_COLUMNS)
+
+    grouped = data.groupby(group_by, sort=False)
+    stats = grouped[['completed', 'failed', 'aborted']].sum()
+    stats.insert(0, 'jobs', grouped.size())
+    n_ended = stats[['completed', 'failed', 'aborted']].sum(axis=1)
+    stats['failure_rate'] = stats['failed'] / n_ended.where(n_ended > 0)
+    percentiles = grouped['runtime'].quantile([0.5, 0.95]).unstack()
+    stats['runtime_p50'] = percentiles[0.5]
+    stats['runtime_p95'] = percentiles[0.95]
+    stats['total_cost'] = grouped['cost'].sum(min_count=1)
+    stats['mean_cost'] = grouped['cost'].mean()
+    stats = stats.reset_index()
+    return stats.sort_values(['jobs'] + group_by, ascending=[False] + [True] * len(group_by),
+                             kind='stable', ignore_index=True)[group_by + STATS_COLUMNS]
+
+
+def format_duration(seconds):
+    """Format a number of seconds as 'Hh Mm Ss', or '-' if missing."""
+    if seconds is None or pd.isna(seconds):
+        return '-'
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f'{hours}h {minutes}m {secs}s'
+    if minutes:
+        return f'{minutes}m {secs}s'
+    return f'{secs}s'
+
+
+def stats_records(stats):
+    """Convert job_stats results to JSON-serialisable dicts, with None for missing values."""
+    stats = stats.astype(object).where(stats.notna(), None)
+    records = stats.to_dict(orient='records')
+    for record in records:
+        for column in ('jobs', 'completed', 'failed', 'aborted'):
+            record[column] = int(record[column])
+        for column in ('failure_rate', 'runtime_p50', 'runtime_p95', 'total_cost', 'mean_cost'):
+            if record[column] is not None:
+                record[column] = float(record[column])
+    return records
+
+
+def expected_runtime(workspace_id, workflow_name, n_jobs=50, min_jobs=3):
+    """Predict the run time of a job from the local job index.
+
+    Parameters
+    ----------
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    workflow_name : str
+        The name of the workflow of the job.
+    n_jobs : int
+        Number of most recent completed jobs of the workflow considered.
+    min_jobs : int
+        Minimum number of such jobs needed for a prediction.
+
+    Returns
+    -------
+    float or None
+        The median run time (in seconds) of the last completed jobs of the
+        workflow, or None without an index or enough jobs.
+    """
+    path = index_path(workspace_id)
+    if not workflow_name or not os.path.exists(path):
+        return None
+    try:
+        with JobIndex(path) as index:
+            frame = index.frame(workflow=workflow_name, status=JOB_COMPLETED).head(n_jobs)
+    except sqlite3.Error:
+        return None
+    if len(frame) < min_jobs:
+        return None
+    stats = job_stats(frame, ['workflow'])
+    runtime = stats['runtime_p50'].iloc[0]
+    return None if pd.isna(runtime) else float(runtime)
@@ -0,0 +1,225 @@
+"""
+Waiting for many jobs at once, with batched job list requests.
+"""
+
+import json
+from cloudos_cli.clos import JobListQuery, job_runtime
+from cloudos_cli.constants import JOB_COMPLETED, JOB_FAILED, JOB_ABORTED
+from cloudos_cli.jobs.index import utc_time
+from cloudos_cli.utils.concurrency import run_lookups, raise_lookup_errors
+from cloudos_cli.utils.polling import PollSchedule
+
+TERMINAL_STATUSES = (JOB_COMPLETED, JOB_FAILED, JOB_ABORTED)
+
+
+class JobSetTracker:
+    """Keep the status of a set of jobs up to date with job list requests.
+
+    Jobs are listed by descending updatedAt. The first refresh reads the
+    list until every tracked job is found (at most `max_scan_pages` pages,
+    the remaining jobs are then requested one by one). The following ones
+    only read the jobs updated since the previous refresh, which is usually
+    a single request however many jobs are tracked.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_ids : iterable
+        The ids of the jobs to track.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    max_scan_pages : int
+        Maximum number of job list pages read to find the jobs on the first
+        refresh.
+    """
+
+    def __init__(self, cl, workspace_id, job_ids, verify=True, max_scan_pages=5):
+        self.cl = cl
+        self.workspace_id = workspace_id
+        self.verify = verify
+        self.max_scan_pages = max_scan_pages
+        self.jobs = {job_id: None for job_id in job_ids}
+        self.watermark = None
+
+    def _scan(self, limit=None):
+        """Read the jobs updated since the watermark, newest first.
+
+        Returns
+        -------
+        dict
+            Job id -> job, for the tracked jobs read.
+        """
+        query = JobListQuery(workspace_id=self.workspace_id,
+                             params={'teamId': self.workspace_id,
+                                     'archived.status': 'false',
+                                     'sort': '-updatedAt'})
+        watermark = self.watermark
+        newest = watermark
+        missing = set(self.jobs) if watermark is None else None
+        found = {}
+        jobs = self.cl.iter_jobs(self.workspace_id, limit=limit, verify=self.verify, query=query)
+        try:
+            for job in jobs:
+                updated_at = utc_time(job.get('updatedAt'))
+                if watermark and updated_at and updated_at < watermark:
+                    break
+                if updated_at and (newest is None or updated_at > newest):
+                    newest = updated_at
+                if job.get('_id') in self.jobs:
+                    found[job['_id']] = job
+                    if missing is not None:
+                        missing.discard(job['_id'])
+                        if not missing:
+                            break
+        finally:
+            jobs.close()
+        self.watermark = newest
+        return found
+
+    def _get_jobs(self, job_ids):
+        """Request jobs one by one, concurrently."""
+        lookups = {job_id: (lambda job_id=job_id: json.loads(
+            self.cl.get_job_status(job_id, self.workspace_id, self.verify).content))
+            for job_id in job_ids}
+        results, errors, _ = run_lookups(lookups, max_workers=8)
+        raise_lookup_errors(errors)
+        return results
+
+    def refresh(self):
+        """Update the status of the tracked jobs.
+
+        Returns
+        -------
+        list
+            The ids of the jobs whose status changed (all of them on the
+            first refresh).
+        """
+        if self.watermark is None:
+            found = self._scan(limit=self.max_scan_pages * 100)
+            missing = [job_id for job_id in self.jobs if job_id not in found]
+            found.update(self._get_jobs(missing))
+        else:
+            found = self._scan()
+        changed = []
+        for job_id, job in found.items():
+            old = self.jobs[job_id]
+            self.jobs[job_id] = {'id': job_id, 'name': job.get('name'),
+                                 'status': job.get('status'), 'runtime': job_runtime(job)}
+            if old is None or old['status'] != job.get('status'):
+                changed.append(job_id)
+        return changed
+
+    def completions(self, wait_time=3600, request_interval=30, verbose=False):
+        """Refresh the jobs until they end, yielding every job as soon as it ends.
+
+        Refreshes are spaced out with a PollSchedule.
+
+        Parameters
+        ----------
+        wait_time : int
+            Max time to wait (in seconds) for all the jobs.
+        request_interval : int
+            Base time interval (in seconds) between refreshes.
+        verbose : bool
+            Whether to print every status change or not.
+
+        Yields
+        ------
+        dict
+            'id', 'name', 'status', 'runtime' (seconds, from the job start
+            and end times) and 'elapsed' (seconds waited until the job was
+            seen ending). Once `wait_time` is exceeded, the jobs still
+            running are yielded with their current status.
+        """
+        pending = list(self.jobs)
+        schedule = PollSchedule(request_interval, timeout=wait_time)
+        while True:
+            changed = self.refresh()
+            elapsed = round(schedule.elapsed())
+            if verbose:
+                for job_id in changed:
+                    job = self.jobs[job_id]
+                    print(f'\tJob "{job["name"]}" (ID: {job_id}) status is: {job["status"]}.')
+            for job_id in list(pending):
+                if self.jobs[job_id]['status'] in TERMINAL_STATUSES:
+                    pending.remove(job_id)
+                    yield {**self.jobs[job_id], 'elapsed': elapsed}
+            if not pending:
+                return
+            if schedule.expired():
+                break
+            # Polls back off while no job changes, and are fast while any initialises
+            statuses = {self.jobs[job_id]['status'] for job_id in pending}
+            fast = statuses & schedule.fast_statuses
+            schedule.wait(min(fast) if fast else tuple(sorted(map(str, statuses))) + (len(pending),))
+        for job_id in pending:
+            yield {**self.jobs[job_id], 'elapsed': elapsed}
+
+
+def iter_job_completions(cl, workspace_id, job_ids, wait_time=3600, request_interval=30,
+                         verbose=False, verify=True):
+    """Wait for several jobs, yielding every job as soon as it ends.
+
+    The jobs are refreshed together every `request_interval` seconds, see
+    JobSetTracker.completions.
+    """
+    tracker = JobSetTracker(cl, workspace_id, job_ids, verify=verify)
+    return tracker.completions(wait_time=wait_time, request_interval=request_interval,
+                               verbose=verbose)
+
+
+def wait_jobs(cl, workspace_id, job_ids, wait_time=3600, request_interval=30, fail_fast=False,
+              verbose=False, verify=True, on_job_end=None):
+    """Wait for several jobs to end.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    job_ids : list
+        The ids of the jobs to wait for.
+    wait_time : int
+        Max time to wait (in seconds) for all the jobs.
+    request_interval : int
+        Base time interval (in seconds) between job status requests.
+    fail_fast : bool
+        Whether to stop waiting as soon as a job fails or is aborted.
+    verbose : bool
+        Whether to print every status change or not.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    on_job_end : callable, optional
+        Called with every job, as yielded by JobSetTracker.completions, as
+        soon as it ends (or when wait_time is exceeded).
+
+    Returns
+    -------
+    list
+        One dict per job, in the order of job_ids, as yielded by
+        JobSetTracker.completions. With fail_fast, the jobs no longer
+        waited for have their last known status and 'elapsed' None.
+    """
+    tracker = JobSetTracker(cl, workspace_id, job_ids, verify=verify)
+    results = {}
+    completions = tracker.completions(wait_time=wait_time, request_interval=request_interval,
+                                      verbose=verbose)
+    try:
+        for job in completions:
+            results[job['id']] = job
+            if on_job_end is not None:
+                on_job_end(job)
+            if fail_fast and job['status'] in (JOB_FAILED, JOB_ABORTED):
+                break
+    finally:
+        completions.close()
+    return [results.get(job_id) or {**(tracker.jobs[job_id] or {'id': job_id}), 'elapsed': None}
+            for job_id in tracker.jobs]
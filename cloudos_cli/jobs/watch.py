@@ -0,0 +1,174 @@
+"""
+Live job list with delta refreshes, for `job list --watch`.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from cloudos_cli.clos import job_matcher
+from cloudos_cli.jobs.index import utc_time
+from cloudos_cli.utils.polling import PollSchedule
+
+
+class JobListWatcher:
+    """Keep the last jobs of a workspace up to date with small job list requests.
+
+    The first refresh lists the `limit` newest jobs matching the query. The
+    following ones only read the jobs updated since the previous refresh
+    (listed by descending updatedAt, stopping at the last updatedAt seen),
+    which is usually a single request: the jobs shown are updated, new
+    matching jobs are added and the jobs that no longer match the filters
+    are removed. When removed jobs leave fewer than `limit` jobs shown, the
+    newest matching jobs are listed again to fill the gap.
+
+    Parameters
+    ----------
+    cl : cloudos_cli.clos.Cloudos
+        The client used to request the jobs.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    query : JobListQuery
+        The filters of the job list, from Cloudos.prepare_job_list_query.
+    limit : int
+        Number of jobs shown.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+    **client_filters
+        Client-side filters (name_regex, min_cost...), as in job_matcher.
+    """
+
+    def __init__(self, cl, workspace_id, query, limit=10, verify=True, **client_filters):
+        self.cl = cl
+        self.workspace_id = workspace_id
+        self.query = query
+        self.limit = limit
+        self.verify = verify
+        self.client_filters = client_filters
+        self.matches = job_matcher(queue_id=query.queue_id, **client_filters)
+        self.status = query.params.get('status')
+        self.jobs = {}
+        self.watermark = None
+        self.loaded = False
+        # Whether every job matching the filters is shown
+        self.complete = False
+
+    def _delta_query(self):
+        """The query listing every job updated, newest update first.
+
+        The status filter is left out, so that jobs leaving it are seen.
+        """
+        params = {key: value for key, value in self.query.params.items() if key != 'status'}
+        params['sort'] = '-updatedAt'
+        return replace(self.query, params=params, queue_id=None)
+
+    def _matches(self, job):
+        if self.status and str(job.get('status', '')).lower() != self.status:
+            return False
+        return self.matches is None or self.matches(job)
+
+    def _scan(self, limit=None):
+        """Read the jobs updated since the watermark and move it forward."""
+        watermark = self.watermark
+        newest = watermark
+        found = []
+        jobs = self.cl.iter_jobs(self.workspace_id, limit=limit, verify=self.verify,
+                                 query=self._delta_query())
+        try:
+            for job in jobs:
+                updated_at = utc_time(job.get('updatedAt'))
+                if watermark and updated_at and updated_at < watermark:
+                    break
+                if updated_at and (newest is None or updated_at > newest):
+                    newest = updated_at
+                found.append(job)
+        finally:
+            jobs.close()
+        self.watermark = newest
+        return found
+
+    def _load(self):
+        """List the `limit` newest jobs matching the query."""
+        jobs = self.cl.iter_jobs(self.workspace_id, limit=self.limit, verify=self.verify,
+                                 query=self.query, **self.client_filters)
+        try:
+            self.jobs = {job['_id']: job for job in jobs}
+        finally:
+            jobs.close()
+        self.complete = len(self.jobs) < self.limit
+
+    def refresh(self):
+        """Update the jobs shown.
+
+        Returns
+        -------
+        list
+            The ids of the jobs added, updated or removed (all the jobs
+            shown on the first refresh).
+        """
+        if not self.loaded:
+            # The latest update is read first, so that no later one is missed
+            self._scan(limit=1)
+            self._load()
+            self.loaded = True
+            return list(self.jobs)
+
+        changed = []
+        removed = False
+        for job in self._scan():
+            job_id = job.get('_id')
+            old = self.jobs.get(job_id)
+            if not self._matches(job):
+                if old is not None:
+                    del self.jobs[job_id]
+                    changed.append(job_id)
+                    removed = True
+            elif old != job:
+                self.jobs[job_id] = job
+                changed.append(job_id)
+        if removed and not self.complete and len(self.jobs) < self.limit:
+            # Older matching jobs take the place of the removed ones
+            previous = self.jobs
+            self._load()
+            changed.extend(job_id for job_id, job in self.jobs.items()
+                           if job_id not in changed and previous.get(job_id) != job)
+        # Jobs pushed out by newer ones are no longer shown
+        shown = self.view()
+        dropped = set(self.jobs) - {job['_id'] for job in shown}
+        if dropped:
+            self.complete = False
+        self.jobs = {job['_id']: job for job in shown}
+        return [job_id for job_id in changed if job_id not in dropped]
+
+    def view(self):
+        """The jobs shown, newest first."""
+        jobs = sorted(self.jobs.values(), key=lambda job: utc_time(job.get('createdAt')) or '',
+                      reverse=True)
+        return jobs[:self.limit]
+
+
+def watch_job_list(watcher, render, interval=10, max_refreshes=None):
+    """Refresh a JobListWatcher every `interval` seconds, rendering every refresh.
+
+    Parameters
+    ----------
+    watcher : JobListWatcher
+        The jobs to refresh.
+    render : callable
+        Called after every refresh with the jobs shown and a status line.
+    interval : float
+        Time (in seconds) between refreshes.
+    max_refreshes : int, optional
+        Stop after this number of refreshes. Runs until interrupted if None.
+    """
+    schedule = PollSchedule(interval, min_interval=interval, backoff=1, jitter=0)
+    refreshes = 0
+    while True:
+        changed = watcher.refresh()
+        refreshes += 1
+        render(watcher.view(),
+               f'Refreshed at {datetime.now().strftime("%H:%M:%S")} | {len(changed)} job(s) '
+               f'changed | Every {interval}s, press Ctrl+C to stop.')
+        if max_refreshes is not None and refreshes >= max_refreshes:
+            return
+        schedule.wait()
@@ -7,11 +7,11 @@ from typing import Union, List, Dict
 from cloudos_cli.clos import Cloudos
 from cloudos_cli.utils.requests import retry_requests_post, retry_requests_get
 from cloudos_cli.utils.errors import JoBNotCompletedException
+from cloudos_cli.utils.polling import PollSchedule
 from cloudos_cli.datasets import Datasets
 from urllib.parse import urlparse
 from cloudos_cli.utils.array_job import extract_project, get_file_or_folder_id
 import json
-import time
 import rich_click as click
 
 
@@ -555,9 +555,10 @@ class Link(Cloudos):
         ValueError
             If the mount is not found or timeout is reached.
         """
-        start_time = time.time()
+        # Mounts are already checked often: only back off while they take long
+        schedule = PollSchedule(check_interval, timeout=timeout, min_interval=check_interval)
 
-        while time.time() - start_time < timeout:
+        while not schedule.expired():
             filesystems = self.get_fuse_filesystems_status(session_id)
 
             # Find the mount by name
@@ -571,7 +572,7 @@ class Link(Cloudos):
                 return target_mount
             # If mount not found or still in progress, continue waiting
 
-            time.sleep(check_interval)
+            schedule.wait(target_mount.get("status") if target_mount else None)
 
         raise ValueError(f"Timeout waiting for mount '{mount_name}' to complete after {timeout} seconds")
 
@@ -601,9 +602,8 @@ class Link(Cloudos):
             if verbose:
                 print('\tFetching job results...')
 
-            # Create a temporary Cloudos client for API calls
-            cl = Cloudos(self.cloudos_url, self.apikey, None)
-            results_path = cl.get_job_results(job_id, workspace_id, verify_ssl)
+            # The job is requested once for results, workdir and logs
+            results_path = self.get_job_results(job_id, workspace_id, verify_ssl)
 
             if results_path:
                 print('\tLinking results directory...')
@@ -648,9 +648,8 @@ class Link(Cloudos):
             if verbose:
                 print('\tFetching job working directory...')
 
-            # Create a temporary Cloudos client for API calls
-            cl = Cloudos(self.cloudos_url, self.apikey, None)
-            workdir_path = cl.get_job_workdir(job_id, workspace_id, verify_ssl)
+            # The job is requested once for results, workdir and logs
+            workdir_path = self.get_job_workdir(job_id, workspace_id, verify_ssl)
 
             if workdir_path:
                 print('\tLinking working directory...')
@@ -693,9 +692,8 @@ class Link(Cloudos):
             if verbose:
                 print('\tFetching job logs...')
 
-            # Create a temporary Cloudos client for API calls
-            cl = Cloudos(self.cloudos_url, self.apikey, None)
-            logs_dict = cl.get_job_logs(job_id, workspace_id, verify_ssl)
+            # The job is requested once for results, workdir and logs
+            logs_dict = self.get_job_logs(job_id, workspace_id, verify_ssl)
 
             if logs_dict:
                 # Extract the parent logs directory from any log file path
@@ -2,13 +2,14 @@
 This is the main class to create job queues.
 """
 
-import requests
 import json
 import pandas as pd
 from dataclasses import dataclass
 from typing import Union
 from cloudos_cli.clos import Cloudos
 from cloudos_cli.utils.errors import BadRequestException
+from cloudos_cli.utils.requests import retry_requests_get
+from cloudos_cli.utils.cache import get_cache, DiskCache
 
 
 @dataclass
@@ -46,10 +47,16 @@ class Queue(Cloudos):
         r : list
             A list of dicts, each corresponding to a job queue.
         """
+        cache = get_cache()
+        cache_key = DiskCache.make_key(self.cloudos_url, self.apikey, self.workspace_id,
+                                       'job-queues', exclude_system_queues)
+        queues = cache.get('job_queues', cache_key)
+        if queues is not None:
+            return queues
         headers = {"apikey": self.apikey}
-        r = requests.get("{}/api/v1/teams/aws/v2/job-queues?teamId={}".format(self.cloudos_url,
-                                                                              self.workspace_id),
-                         headers=headers, verify=self.verify)
+        r = retry_requests_get("{}/api/v1/teams/aws/v2/job-queues?teamId={}".format(self.cloudos_url,
+                                                                                    self.workspace_id),
+                               headers=headers, verify=self.verify)
         if r.status_code >= 400:
             raise BadRequestException(r)
         queues = json.loads(r.content)
@@ -57,7 +64,8 @@ class Queue(Cloudos):
         if not exclude_system_queues:
             system_queues = self.get_system_job_queues()
             queues.extend(system_queues)
-        
+
+        cache.set('job_queues', cache_key, queues, self.cloudos_url, self.workspace_id)
         return queues
 
     def get_system_job_queues(self):
@@ -69,9 +77,9 @@ class Queue(Cloudos):
             A list of dicts, each corresponding to a system job queue.
         """
         headers = {"apikey": self.apikey}
-        r = requests.get("{}/api/v1/teams/aws/v2/system-job-queues?teamId={}".format(self.cloudos_url,
-                                                                                       self.workspace_id),
-                         headers=headers, verify=self.verify)
+        r = retry_requests_get("{}/api/v1/teams/aws/v2/system-job-queues?teamId={}".format(self.cloudos_url,
+                                                                                           self.workspace_id),
+                               headers=headers, verify=self.verify)
         if r.status_code >= 400:
             raise BadRequestException(r)
         return json.loads(r.content)
@@ -109,7 +117,7 @@ class Queue(Cloudos):
             df = df_full.loc[:, COLUMNS]
         return df
 
-    def fetch_job_queue_id(self, workflow_type, batch=True, job_queue=None):
+    def fetch_job_queue_id(self, workflow_type, batch=True, job_queue=None, job_queues=None):
         """Fetches Lifebit Platform ID for a given job queue.
 
         This method will try to find the
@@ -126,6 +134,9 @@ class Queue(Cloudos):
             Whether to create a batch job or an ignite one.
         job_queue : str or None
             The name of the job queue to search. If None, a default one will be selected.
+        job_queues : list or None
+            The job queues of the workspace, as returned by get_job_queues. If None,
+            they are retrieved from Lifebit Platform.
 
         Returns
         -------
@@ -139,7 +150,8 @@ class Queue(Cloudos):
         if workflow_type not in ['cromwell', 'nextflow']:
             raise ValueError('Only nextflow or cromwell workflows are allowed when ' +
                              'running using AWS batch.')
-        job_queues = self.get_job_queues()
+        if job_queues is None:
+            job_queues = self.get_job_queues()
         available_queues = [q for q in job_queues if q['status'] == 'Ready' and
                             q['executor'] == workflow_type]
         if len(available_queues) == 0:
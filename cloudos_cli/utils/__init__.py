@@ -3,7 +3,7 @@ Utility functions and classes to use across the package.
 """
 
 from .errors import BadRequestException, TimeOutException, AccountNotLinkedException, JoBNotCompletedException, NotAuthorisedException, NoCloudForWorkspaceException
-from .requests import retry_requests_get, retry_requests_post, retry_requests_put, retry_requests_delete
+from .requests import retry_requests_get, retry_requests_post, retry_requests_put, retry_requests_delete, get_session, close_sessions, configure_sessions, ensure_pool_size
 from .resources import format_bytes, ssl_selector
 from .cloud import find_cloud
 from .cloud import find_cloud
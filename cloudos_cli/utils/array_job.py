@@ -1,6 +1,9 @@
+import functools
 import re
 import sys
+import threading
 from cloudos_cli.utils.errors import BadRequestException
+from cloudos_cli.utils.concurrency import run_lookups
 
 
 def is_valid_regex(s):
@@ -158,7 +161,101 @@ def generate_datasets_for_project(cloudos_url, apikey, workspace_id, project_nam
 
     return ds
 
-def get_file_or_folder_id(cloudos_url, apikey, workspace_id, project_name, verify_ssl, command_dir, command_name, is_file=True):
+class PathResolver:
+    """Per-invocation cache resolving File Explorer paths to file and folder ids.
+
+    All the parameters of a job share one resolver, so each project id is
+    looked up once and each distinct directory is listed once, however many
+    files are referenced from it.
+
+    Parameters
+    ----------
+    cloudos_url : str
+        The base URL of the Lifebit Platform API.
+    apikey : str
+        The API key for authenticating requests to the Lifebit Platform API.
+    workspace_id : str
+        The ID of the workspace containing the projects.
+    verify_ssl : bool
+        Whether to verify SSL certificates for the API requests.
+    """
+
+    def __init__(self, cloudos_url, apikey, workspace_id, verify_ssl):
+        self.cloudos_url = cloudos_url
+        self.apikey = apikey
+        self.workspace_id = workspace_id
+        self.verify_ssl = verify_ssl
+        self._datasets = {}
+        self._listings = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _memo(self, store, key, func):
+        """Return store[key], computing it once even under concurrent calls."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault((id(store), key), threading.Lock())
+        with key_lock:
+            if key not in store:
+                store[key] = func()
+            return store[key]
+
+    def datasets(self, project_name):
+        """Return the Datasets object of a project, resolving its id once."""
+        return self._memo(self._datasets, project_name,
+                          lambda: generate_datasets_for_project(self.cloudos_url, self.apikey,
+                                                                self.workspace_id, project_name,
+                                                                self.verify_ssl))
+
+    def list_content(self, project_name, path):
+        """Return the content of a project directory, listing it once.
+
+        An empty path lists the root of the project.
+        """
+        def fetch():
+            ds = self.datasets(project_name)
+            return ds.list_folder_content(path) if path else ds.list_project_content()
+        return self._memo(self._listings, (project_name, path), fetch)
+
+    @staticmethod
+    def listing_path(command_dir, is_file=True):
+        """Return the directory listed to resolve a file or folder of command_dir."""
+        if is_file:
+            return command_dir
+        # Folders are searched in the first folder below the project
+        return command_dir.split("/")[0] if len(command_dir.split("/")) > 1 else ''
+
+    def prefetch(self, entries):
+        """List several directories concurrently.
+
+        Parameters
+        ----------
+        entries : iterable
+            (project_name, command_dir, is_file) tuples, as passed to get_id.
+            Failed listings are not cached, so their errors are raised by the
+            get_id call that needs them.
+        """
+        paths = {(project, self.listing_path(command_dir, is_file))
+                 for project, command_dir, is_file in entries}
+        if len(paths) > 1:
+            run_lookups({key: functools.partial(self.list_content, *key) for key in paths})
+
+    def get_id(self, project_name, command_dir, command_name, is_file=True):
+        """Retrieve the ID of a file or folder. See get_file_or_folder_id."""
+        content = self.list_content(project_name, self.listing_path(command_dir, is_file))
+        if is_file:
+            for file in content['files']:
+                if file.get("name") == command_name:
+                    return file.get("_id", '')
+            raise ValueError(f"File '{command_name}' not found in directory '{command_dir}'.")
+        # use the last folder as is listed in the first folder
+        folder_to_search = command_dir.split("/")[-1]
+        for folder in content['folders']:
+            if folder.get("name") == folder_to_search:
+                return folder.get("_id", '')
+        raise ValueError(f"Folder '{folder_to_search}' not found in project.")
+
+def get_file_or_folder_id(cloudos_url, apikey, workspace_id, project_name, verify_ssl, command_dir, command_name, is_file=True,
+                          resolver=None):
     """Retrieve the ID of a specific file or folder within a Lifebit Platform workspace.
 
     Parameters
@@ -177,6 +274,8 @@ def get_file_or_folder_id(cloudos_url, apikey, workspace_id, project_name, verif
         The name of the file or folder whose ID is to be retrieved.
     is_file : bool, optional
         Whether to retrieve a file ID (True) or folder ID (False). Default is True.
+    resolver : PathResolver, optional
+        Cache shared by several lookups. A new one is used if None.
 
     Returns
     -------
@@ -195,32 +294,9 @@ def get_file_or_folder_id(cloudos_url, apikey, workspace_id, project_name, verif
     - The `list_folder_content` method is used for files, and `list_project_content` is used for folders.
     - The function assumes that the IDs are stored in the `"_id"` field of the metadata.
     """
-    # create a Datasets() class
-    ds = generate_datasets_for_project(cloudos_url, apikey, workspace_id, project_name, verify_ssl)
-
-    if is_file:
-        # get all files from a folder
-        content = ds.list_folder_content(command_dir)
-        for file in content['files']:
-            if file.get("name") == command_name:
-                return file.get("_id", '')
-        raise ValueError(f"File '{command_name}' not found in directory '{command_dir}'.")
-    else:
-        # get all folders from the project
-        # check if the command_dir has a sub-folder
-        if len(command_dir.split("/")) > 1:
-            # get the first folder which is just below the project
-            folders = ds.list_folder_content(command_dir.split("/")[0])
-            # use the last folder as is listed in the first folder
-            folder_to_search = command_dir.split("/")[-1]
-        else:
-            folders = ds.list_project_content()
-            folder_to_search = command_dir
-
-        for folder in folders['folders']:
-            if folder.get("name") == folder_to_search:
-                return folder.get("_id", '')
-        raise ValueError(f"Folder '{folder_to_search}' not found in project.")
+    if resolver is None:
+        resolver = PathResolver(cloudos_url, apikey, workspace_id, verify_ssl)
+    return resolver.get_id(project_name, command_dir, command_name, is_file=is_file)
 
 def extract_project(path):
     """
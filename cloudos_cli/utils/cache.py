@@ -0,0 +1,263 @@
+"""
+Persistent on-disk cache for read-mostly Lifebit Platform metadata.
+
+Entries are stored as one JSON file per key under ~/.cloudos/cache (or
+$CLOUDOS_CACHE_DIR), and kept in memory once read so that lookups repeated
+within a command (e.g. for every job of a bulk operation) do not read and
+parse the file again. Each resource type has its own time-to-live, the least recently used
+entries are evicted when the cache grows over its size caps and mutating
+commands invalidate the entries of the affected workspace.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from cloudos_cli.constants import CACHE_TTLS, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+
+# None until set_cache_enabled is called: CLOUDOS_NO_CACHE decides
+_CACHE_ENABLED = None
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _digest(*parts):
+    """Return a stable hash for the given key parts."""
+    return hashlib.sha256('\x1f'.join(str(p) for p in parts).encode()).hexdigest()
+
+
+class DiskCache:
+    """LRU cache of JSON-serialisable values with per-resource TTLs.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where the entries are stored.
+    max_entries : int
+        Maximum number of entries kept on disk.
+    max_bytes : int
+        Maximum total size of the entries kept on disk.
+    """
+
+    def __init__(self, cache_dir, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (resource, key) -> entry, for the entries read or written by this process
+        self._memory = {}
+        # File name -> size of the entries on disk, scanned on the first write
+        # and then kept up to date, so that writes do not list the directory
+        self._sizes = None
+        self._total = 0
+
+    def _path(self, resource, key):
+        return self.cache_dir / f'{resource}.{key}.json'
+
+    @staticmethod
+    def make_key(cloudos_url, apikey, workspace_id, *parts):
+        """Build the key of an entry.
+
+        The API key is only stored hashed and makes entries user specific.
+        """
+        return _digest(cloudos_url, _digest(apikey), workspace_id, *parts)
+
+    def get(self, resource, key):
+        """Return the cached value or None if missing or expired."""
+        if not is_cache_enabled():
+            return None
+        path = self._path(resource, key)
+        entry = self._memory.get((resource, key))
+        if entry is None:
+            try:
+                with open(path) as fh:
+                    entry = json.load(fh)
+            except (OSError, ValueError):
+                return None
+        if entry.get('expires', 0) < time.time():
+            self._memory.pop((resource, key), None)
+            self._remove(path)
+            return None
+        try:
+            # Mark as recently used for the LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        self._memory[(resource, key)] = entry
+        # A copy, so that callers modifying the value do not alter the cache
+        return copy.deepcopy(entry.get('value'))
+
+    def set(self, resource, key, value, cloudos_url=None, workspace_id=None, ttl=None):
+        """Store a value.
+
+        Parameters
+        ----------
+        resource : str
+            Resource type, one of the keys of CACHE_TTLS.
+        key : str
+            Entry key, as returned by make_key.
+        value : object
+            JSON-serialisable value to store.
+        cloudos_url : str, optional
+            The Lifebit Platform url the entry belongs to, used by invalidate.
+        workspace_id : str, optional
+            The workspace the entry belongs to, used by invalidate.
+        ttl : int, optional
+            Time-to-live in seconds. Defaults to the resource TTL.
+        """
+        if not is_cache_enabled():
+            return
+        ttl = CACHE_TTLS.get(resource, 0) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        entry = {
+            'resource': resource,
+            'scope': _digest(cloudos_url, workspace_id),
+            'expires': time.time() + ttl,
+            'value': value
+        }
+        try:
+            self._memory[(resource, key)] = json.loads(json.dumps(entry))
+        except (TypeError, ValueError):
+            return
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write atomically so concurrent invocations never read partial files
+            data = json.dumps(entry)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as fh:
+                fh.write(data)
+            path = self._path(resource, key)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            return
+        self._track(path.name, len(data.encode()))
+        self._evict()
+
+    def invalidate(self, resource, cloudos_url=None, workspace_id=None):
+        """Remove the entries of a resource type for a workspace.
+
+        Parameters
+        ----------
+        resource : str
+            Resource type to invalidate.
+        cloudos_url : str, optional
+            The Lifebit Platform url of the entries to remove.
+        workspace_id : str, optional
+            The workspace of the entries to remove.
+        """
+        scope = _digest(cloudos_url, workspace_id)
+        for memory_key in [k for k, entry in list(self._memory.items())
+                           if k[0] == resource and entry.get('scope') == scope]:
+            self._memory.pop(memory_key, None)
+        for path in self.cache_dir.glob(f'{resource}.*.json'):
+            try:
+                with open(path) as fh:
+                    if json.load(fh).get('scope') != scope:
+                        continue
+            except (OSError, ValueError):
+                pass
+            self._remove(path)
+
+    def clear(self, resource=None):
+        """Remove every cache entry, or only those of a resource type.
+
+        Parameters
+        ----------
+        resource : str, optional
+            Resource type to remove. All entries are removed if None.
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        removed = 0
+        for memory_key in [k for k in list(self._memory) if resource is None or k[0] == resource]:
+            self._memory.pop(memory_key, None)
+        for path in self.cache_dir.glob(f'{resource or "*"}.*.json'):
+            removed += self._remove(path)
+        return removed
+
+    def _scan(self):
+        """List the entries on disk: (mtime, size, path) for every entry."""
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _track(self, name, size):
+        """Record the size of an entry just written."""
+        with self._lock:
+            if self._sizes is None:
+                self._sizes = {path.name: st_size for _, st_size, path in self._scan()}
+                self._total = sum(self._sizes.values())
+            self._total += size - self._sizes.get(name, 0)
+            self._sizes[name] = size
+
+    def _evict(self):
+        """Drop the least recently used entries while over the size caps.
+
+        The directory is only listed when the tracked usage is over a cap.
+        Entries are then dropped until the usage is a tenth below the caps,
+        so that a full cache is not listed again on every write.
+        """
+        with self._lock:
+            if self._sizes is None or (len(self._sizes) <= self.max_entries
+                                       and self._total <= self.max_bytes):
+                return
+            max_entries = self.max_entries - self.max_entries // 10
+            max_bytes = self.max_bytes - self.max_bytes // 10
+            # Listed again, since other processes may have written entries too
+            entries = sorted(self._scan())
+            self._sizes = {path.name: size for _, size, path in entries}
+            self._total = sum(self._sizes.values())
+            while entries and (len(self._sizes) > max_entries or self._total > max_bytes):
+                _, _, path = entries.pop(0)
+                self._remove_file(path)
+                self._memory.pop(tuple(path.name[:-len('.json')].split('.', 1)), None)
+
+    def _remove(self, path):
+        with self._lock:
+            return self._remove_file(path)
+
+    def _remove_file(self, path):
+        """Remove an entry file and stop tracking it. The lock must be held."""
+        if self._sizes is not None and path.name in self._sizes:
+            self._total -= self._sizes.pop(path.name)
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+def get_cache():
+    """Return the cache for the configured cache directory."""
+    cache_dir = os.environ.get('CLOUDOS_CACHE_DIR', os.path.join(Path.home(), '.cloudos', 'cache'))
+    cache = _CACHES.get(cache_dir)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.setdefault(cache_dir, DiskCache(cache_dir))
+    return cache
+
+
+def set_cache_enabled(enabled):
+    """Enable or disable reads and writes of the cache for this process."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = enabled
+
+
+def is_cache_enabled():
+    """Whether the cache is currently enabled."""
+    if _CACHE_ENABLED is None:
+        return os.environ.get('CLOUDOS_NO_CACHE', '').lower() in ('', '0', 'false', 'no')
+    return _CACHE_ENABLED
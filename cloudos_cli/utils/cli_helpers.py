@@ -5,6 +5,7 @@ import sys
 import logging
 from rich.console import Console
 from cloudos_cli.logging.logger import setup_logging
+from cloudos_cli.utils.cache import set_cache_enabled
 
 # Global debug state
 _global_debug = False
@@ -55,6 +56,17 @@ def pass_debug_to_subcommands(group_cls=click.RichGroup):
                         callback=self._debug_callback
                     )
                     cmd.params.insert(-1, debug_option)  # Insert at the end for precedence
+                has_no_cache = any(param.name == 'no_cache' for param in cmd.params)
+                if not has_no_cache:
+                    no_cache_option = click.Option(
+                        ['--no-cache'],
+                        is_flag=True,
+                        help='Bypass the local metadata cache (~/.cloudos/cache)',
+                        is_eager=True,
+                        expose_value=False,
+                        callback=self._no_cache_callback
+                    )
+                    cmd.params.insert(-1, no_cache_option)
 
             super().add_command(cmd, name)
 
@@ -68,6 +80,12 @@ def pass_debug_to_subcommands(group_cls=click.RichGroup):
                 ctx.meta['debug'] = False
             return value
 
+        def _no_cache_callback(self, ctx, param, value):
+            """Callback to handle no-cache flag"""
+            if value:
+                set_cache_enabled(False)
+            return value
+
     return DebugGroup
 
 
@@ -85,3 +103,10 @@ def setup_debug(ctx, param, value):
     else:
         ctx.meta['debug'] = False
     return value
+
+
+def setup_no_cache(ctx, param, value):
+    """Disable the local metadata cache for this invocation if --no-cache is given"""
+    if value:
+        set_cache_enabled(False)
+    return value
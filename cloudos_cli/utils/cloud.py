@@ -1,9 +1,39 @@
 from cloudos_cli.utils.requests import retry_requests_get
 from cloudos_cli.utils import BadRequestException
 from cloudos_cli.utils.errors import NoCloudForWorkspaceException
+from cloudos_cli.utils.cache import get_cache, DiskCache
 
 
-def find_cloud(cloudos_url, apikey, workspace_id, logs):
+def find_cloud(cloudos_url, apikey, workspace_id, logs, verify=True):
+    """Find the cloud provider and storage layout of a workspace.
+
+    AWS is recognised from the job logs object. The Azure descriptor of a
+    workspace is requested from the API once and then kept in the metadata
+    cache (in memory and on disk, see cloudos_cli.utils.cache), so resolving
+    the logs, results or workdir of many jobs makes no further requests.
+
+    Parameters
+    ----------
+    cloudos_url : str
+        The Lifebit Platform service url.
+    apikey : str
+        Your Lifebit Platform API key.
+    workspace_id : str
+        The Lifebit Platform workspace id.
+    logs : dict
+        The logs object of a job.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
+
+    Returns
+    -------
+    tuple
+        The cloud name ('aws' or 'azure'), its metadata (e.g. the Azure
+        storageAccount) and the keys of the container, prefix and scheme of
+        the storage paths.
+    """
     if "s3BucketName" in logs:
         cloud_name = "aws"
         meta = {}
@@ -19,19 +49,25 @@ def find_cloud(cloudos_url, apikey, workspace_id, logs):
             "Accept": "application/json",
             "apikey": apikey
         }
+        storage = {
+            "container": "blobContainerName",
+            "prefix": "blobPrefix",
+            "scheme": "az"
+        }
+        cache = get_cache()
+        cache_key = DiskCache.make_key(cloudos_url, apikey, workspace_id, 'cloud/azure')
+        cloud_data = cache.get('cloud', cache_key)
+        if cloud_data is not None:
+            return "azure", cloud_data, storage
         params = dict(teamId=workspace_id)
         url = f"{cloudos_url}/api/v1/cloud/azure"
-        r = retry_requests_get(url, headers=headers, params=params)
+        r = retry_requests_get(url, headers=headers, params=params, verify=verify)
         if r.status_code >= 400:
             raise BadRequestException(r)
         if r.json() and r.text != "null":
             cloud_data = r.json()
             cloud_name = "azure"
-            storage = {
-                "container": "blobContainerName",
-                "prefix": "blobPrefix",
-                "scheme": "az"
-            }
+            cache.set('cloud', cache_key, cloud_data, cloudos_url, workspace_id)
             return cloud_name, cloud_data, storage
 
     raise NoCloudForWorkspaceException(workspace_id)
@@ -0,0 +1,103 @@
+"""
+Helpers to run independent API lookups concurrently.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from cloudos_cli.utils.errors import LookupsFailedException
+
+
+def run_lookups(lookups, max_workers=None):
+    """Run independent lookups concurrently and collect their outcome.
+
+    Wall-clock time approaches that of the slowest lookup instead of the sum
+    of all of them. The HTTP connections are shared through the pooled
+    sessions of cloudos_cli.utils.requests.
+
+    Parameters
+    ----------
+    lookups : dict
+        Lookup name -> callable without arguments.
+    max_workers : int, optional
+        Maximum number of lookups running at the same time. Defaults to
+        one thread per lookup.
+
+    Returns
+    -------
+    results : dict
+        Lookup name -> returned value, for the lookups that succeeded.
+    errors : dict
+        Lookup name -> raised exception, for the lookups that failed.
+    timings : dict
+        Lookup name -> elapsed seconds.
+    """
+    results, errors, timings = {}, {}, {}
+    if not lookups:
+        return results, errors, timings
+
+    def timed(name, func):
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(lookups)) as pool:
+        futures = {name: pool.submit(timed, name, func) for name, func in lookups.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+    return results, errors, timings
+
+
+def raise_lookup_errors(errors, required=None):
+    """Raise the errors of the lookups whose result is actually needed.
+
+    Parameters
+    ----------
+    errors : dict
+        Lookup name -> raised exception, as returned by run_lookups.
+    required : iterable, optional
+        Names of the needed lookups. All of them if None.
+
+    Raises
+    ------
+    Exception
+        The original exception when a single needed lookup failed.
+    LookupsFailedException
+        When several needed lookups failed, aggregating all their errors.
+    """
+    failed = {name: e for name, e in errors.items() if required is None or name in required}
+    if len(failed) == 1:
+        raise next(iter(failed.values()))
+    if failed:
+        raise LookupsFailedException(failed)
+
+
+class RateLimiter:
+    """Space out calls shared by several threads to a maximum rate.
+
+    Parameters
+    ----------
+    rate : float
+        Maximum number of calls per second. 0 or None disables the limit.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,71 @@
+"""
+Bounded concurrent crawl of folder trees, shared by datasets and storage listings.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def walk_tree(root, list_folder, children, max_depth=None, max_workers=8, exclude=None,
+              on_error=None):
+    """Crawl a folder tree breadth-first, yielding items as folders are listed.
+
+    Folders are listed concurrently on a bounded thread pool, and only the
+    folders still to be listed are kept in memory, so trees with millions of
+    objects can be streamed.
+
+    Parameters
+    ----------
+    root : object
+        The handle of the folder to crawl, passed to list_folder.
+    list_folder : callable
+        Called with the relative path and the handle of a folder ('' and
+        `root` for the crawled folder); returns its listing.
+    children : callable
+        Called with a listing; returns (name, item, handle) for every item
+        it contains, handle being None for items that are not folders.
+    max_depth : int, optional
+        Maximum depth to descend to, 1 being the content of `root`. No
+        limit if None.
+    max_workers : int
+        Maximum number of folders listed at the same time.
+    exclude : callable, optional
+        Predicate receiving the relative path of a folder. Matching
+        folders are not descended into.
+    on_error : callable, optional
+        Called with the relative path of a sub-folder and the exception
+        raised while listing it. If None, the exception is raised. A
+        failure to list `root` itself is always raised.
+
+    Yields
+    ------
+    tuple
+        (relative path, item, depth) for every item found.
+    """
+    pending = deque([('', root, 0)])
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            while pending and len(running) < max_workers:
+                folder_path, handle, depth = pending.popleft()
+                running[pool.submit(list_folder, folder_path, handle)] = (folder_path, depth)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder_path, depth = running.pop(future)
+                try:
+                    listing = future.result()
+                except Exception as e:
+                    if on_error is None or not folder_path:
+                        raise
+                    on_error(folder_path, e)
+                    continue
+                for name, item, handle in children(listing):
+                    item_path = f"{folder_path}/{name}" if folder_path else name
+                    yield item_path, item, depth + 1
+                    if handle is None:
+                        continue
+                    if max_depth is not None and depth + 1 >= max_depth:
+                        continue
+                    if exclude is not None and exclude(item_path):
+                        continue
+                    pending.append((item_path, handle, depth + 1))
@@ -517,7 +517,7 @@ def _create_status_legend():
     return "[cyan]Legend:[/cyan] " + "  |  ".join(legend_items)
 
 
-def _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, column_configs):
+def _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, column_configs, row_cache=None):
     """Helper function to build a complete job table.
     
     Parameters
@@ -532,6 +532,10 @@ def _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, column_
         List of column keys to include
     column_configs : dict
         Dictionary of all column configurations
+    row_cache : dict, optional
+        Job ID -> ((updatedAt, columns, width), row values) of the rows
+        already built. Rows of unchanged jobs are reused, and the cache is updated
+        with the rows built.
         
     Returns
     -------
@@ -554,7 +558,16 @@ def _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, column_
 
     # Add rows for each job
     for job in jobs:
-        row_values = _build_job_row_values(job, cloudos_url, terminal_width, columns_to_show)
+        if row_cache is None:
+            row_values = _build_job_row_values(job, cloudos_url, terminal_width, columns_to_show)
+        else:
+            key = (job.get("updatedAt"), tuple(columns_to_show), terminal_width)
+            cached = row_cache.get(job.get("_id"))
+            if cached is not None and cached[0] == key:
+                row_values = cached[1]
+            else:
+                row_values = _build_job_row_values(job, cloudos_url, terminal_width, columns_to_show)
+                row_cache[job.get("_id")] = (key, row_values)
         table.add_row(*row_values)
 
     return table
@@ -642,8 +655,20 @@ def _fit_columns_to_terminal(cols, terminal_w, col_configs, preserve_order=False
     return result
 
 
-def create_job_list_table(jobs, cloudos_url, pagination_metadata=None, selected_columns=None, fetch_page_callback=None):
-    """Creates a formatted job list table with responsive design and pagination."""
+def _select_job_list_columns(selected_columns=None):
+    """Choose the job list columns that fit in the terminal.
+
+    Parameters
+    ----------
+    selected_columns : [str | list], optional
+        Columns requested by the user (comma-separated string or list). If
+        None, the columns are auto-selected based on terminal width.
+
+    Returns
+    -------
+    tuple
+        The columns to show, the terminal width and the Console to print to.
+    """
     # Get terminal width for responsive design
     try:
         terminal_width = os.get_terminal_size().columns
@@ -711,6 +736,13 @@ def create_job_list_table(jobs, cloudos_url, pagination_metadata=None, selected_
             console.print(f"[yellow]Warning: Terminal too narrow. Showing {len(columns_to_show)} of {original_count} requested columns.[/yellow]")
             console.print(f"[yellow]Increase terminal width to see all columns.[/yellow]\n")
 
+    return columns_to_show, terminal_width, console
+
+
+def create_job_list_table(jobs, cloudos_url, pagination_metadata=None, selected_columns=None, fetch_page_callback=None):
+    """Creates a formatted job list table with responsive design and pagination."""
+    columns_to_show, terminal_width, console = _select_job_list_columns(selected_columns)
+
     if not jobs:
         console.print("\n[yellow]No jobs found matching the criteria.[/yellow]")
         return
@@ -735,77 +767,127 @@ def create_job_list_table(jobs, cloudos_url, pagination_metadata=None, selected_
     current_page = pagination_metadata.get('Pagination-Page', 1) or 1
     total_jobs = pagination_metadata.get('Pagination-Count', 0)
     page_size_value = pagination_metadata.get('Pagination-Limit', 10)
-    total_pages = (total_jobs + page_size_value - 1) // page_size_value if total_jobs > 0 else 1
+    total_pages = pagination_metadata.get('totalPages',
+                                          (total_jobs + page_size_value - 1) // page_size_value if total_jobs > 0 else 1)
     show_error = None
 
-    while True:
-        console.clear()
-        console.print(table)
-        legend = _create_status_legend()
-        console.print(f"{legend}\n")
-        console.print(f"\n[cyan]Total jobs:[/cyan] {total_jobs}")
-        if total_pages > 1:
-            console.print(f"[cyan]Page:[/cyan] {current_page} of {total_pages}")
-            console.print(f"[cyan]Jobs on this page:[/cyan] {len(jobs)}")
+    try:
+        while True:
+            console.clear()
+            console.print(table)
+            legend = _create_status_legend()
+            console.print(f"{legend}\n")
+            # Jobs streamed with client-side filters are only counted up to the current page
+            more = '+' if pagination_metadata.get('_more') else ''
+            console.print(f"\n[cyan]Total jobs:[/cyan] {total_jobs}{more}")
+            if total_pages > 1:
+                console.print(f"[cyan]Page:[/cyan] {current_page} of {total_pages}")
+                console.print(f"[cyan]Jobs on this page:[/cyan] {len(jobs)}")
         
-        # Show error message if any
-        if show_error:
-            console.print(show_error)
-            show_error = None
+            # Show error message if any
+            if show_error:
+                console.print(show_error)
+                show_error = None
         
-        # Show pagination controls only if there are multiple pages
-        if total_pages > 1:
-            if not sys.stdin.isatty():
-                console.print("\n[yellow]Note: Pagination not available in non-interactive mode. Showing page 1 of {0}.[/yellow]".format(total_pages))
-                console.print("[yellow]Run in an interactive terminal to navigate through all pages.[/yellow]")
+            # Show pagination controls only if there are multiple pages
+            if total_pages > 1:
+                if not sys.stdin.isatty():
+                    console.print("\n[yellow]Note: Pagination not available in non-interactive mode. Showing page 1 of {0}.[/yellow]".format(total_pages))
+                    console.print("[yellow]Run in an interactive terminal to navigate through all pages.[/yellow]")
+                    break
+
+                console.print(f"\n[bold cyan]n[/] = next, [bold cyan]p[/] = prev, [bold cyan]q[/] = quit")
+
+                # Fetch the next page while the user reads this one
+                prefetch = getattr(fetch_page_callback, 'prefetch', None)
+                if prefetch is not None and current_page < total_pages:
+                    prefetch(current_page + 1)
+
+                try:
+                    choice = input(">>> ").strip().lower()
+                except (EOFError, KeyboardInterrupt):
+                    console.print("\n[yellow]Pagination interrupted.[/yellow]")
+                    break
+
+                if choice in ("q", "quit"):
+                    break
+                elif choice in ("n", "next"):
+                    if current_page < total_pages:
+                        try:
+                            result = fetch_page_callback(current_page + 1)
+                            jobs = result.get('jobs', [])
+                            pagination_metadata = result.get('pagination_metadata', {})
+                            current_page = pagination_metadata.get('Pagination-Page', current_page + 1)
+                            total_jobs = pagination_metadata.get('Pagination-Count', total_jobs)
+                            total_pages = pagination_metadata.get('totalPages',
+                                                                 (pagination_metadata.get('Pagination-Count', 0) + page_size_value - 1) // page_size_value
+                                                                 if pagination_metadata.get('Pagination-Count', 0) > 0 else 1)
+                            # Use terminal_width (not effective_width) for consistent date formatting
+                            table = _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, COLUMN_CONFIGS)
+                        except Exception as e:
+                            show_error = f"[red]Error fetching page: {str(e)}[/red]"
+                    else:
+                        show_error = "[yellow]Already on last page[/yellow]"
+                elif choice in ("p", "prev", "previous"):
+                    if current_page > 1:
+                        try:
+                            result = fetch_page_callback(current_page - 1)
+                            jobs = result.get('jobs', [])
+                            pagination_metadata = result.get('pagination_metadata', {})
+                            current_page = pagination_metadata.get('Pagination-Page', current_page - 1)
+                            total_jobs = pagination_metadata.get('Pagination-Count', total_jobs)
+                            total_pages = pagination_metadata.get('totalPages',
+                                                                 (pagination_metadata.get('Pagination-Count', 0) + page_size_value - 1) // page_size_value
+                                                                 if pagination_metadata.get('Pagination-Count', 0) > 0 else 1)
+                            # Use terminal_width (not effective_width) for consistent date formatting
+                            table = _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, COLUMN_CONFIGS)
+                        except Exception as e:
+                            show_error = f"[red]Error fetching page: {str(e)}[/red]"
+                    else:
+                        show_error = "[yellow]Already on first page[/yellow]"
+                else:
+                    show_error = "[yellow]Invalid choice. Use 'n' (next), 'p' (previous), or 'q' (quit)[/yellow]"
+            else:
                 break
+    finally:
+        # Drop the pages still being fetched in the background
+        close = getattr(fetch_page_callback, 'close', None)
+        if close is not None:
+            close()
 
-            console.print(f"\n[bold cyan]n[/] = next, [bold cyan]p[/] = prev, [bold cyan]q[/] = quit")
 
-            try:
-                choice = input(">>> ").strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                console.print("\n[yellow]Pagination interrupted.[/yellow]")
-                break
+def create_job_watch_table(jobs, cloudos_url, selected_columns=None, row_cache=None, status_line=None):
+    """Redraw the job list table of `job list --watch`.
 
-            if choice in ("q", "quit"):
-                break
-            elif choice in ("n", "next"):
-                if current_page < total_pages:
-                    try:
-                        result = fetch_page_callback(current_page + 1)
-                        jobs = result.get('jobs', [])
-                        pagination_metadata = result.get('pagination_metadata', {})
-                        current_page = pagination_metadata.get('Pagination-Page', current_page + 1)
-                        total_pages = pagination_metadata.get('totalPages',
-                                                             (pagination_metadata.get('Pagination-Count', 0) + page_size_value - 1) // page_size_value
-                                                             if pagination_metadata.get('Pagination-Count', 0) > 0 else 1)
-                        # Use terminal_width (not effective_width) for consistent date formatting
-                        table = _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, COLUMN_CONFIGS)
-                    except Exception as e:
-                        show_error = f"[red]Error fetching page: {str(e)}[/red]"
-                else:
-                    show_error = "[yellow]Already on last page[/yellow]"
-            elif choice in ("p", "prev", "previous"):
-                if current_page > 1:
-                    try:
-                        result = fetch_page_callback(current_page - 1)
-                        jobs = result.get('jobs', [])
-                        pagination_metadata = result.get('pagination_metadata', {})
-                        current_page = pagination_metadata.get('Pagination-Page', current_page - 1)
-                        total_pages = pagination_metadata.get('totalPages',
-                                                             (pagination_metadata.get('Pagination-Count', 0) + page_size_value - 1) // page_size_value
-                                                             if pagination_metadata.get('Pagination-Count', 0) > 0 else 1)
-                        # Use terminal_width (not effective_width) for consistent date formatting
-                        table = _build_job_table(jobs, cloudos_url, terminal_width, columns_to_show, COLUMN_CONFIGS)
-                    except Exception as e:
-                        show_error = f"[red]Error fetching page: {str(e)}[/red]"
-                else:
-                    show_error = "[yellow]Already on first page[/yellow]"
-            else:
-                show_error = "[yellow]Invalid choice. Use 'n' (next), 'p' (previous), or 'q' (quit)[/yellow]"
-        else:
-            break
+    Parameters
+    ----------
+    jobs : list
+        The jobs to show, in display order.
+    cloudos_url : str
+        Lifebit Platform service URL for generating job links.
+    selected_columns : [str | list], optional
+        Columns to show, as in create_job_list_table.
+    row_cache : dict, optional
+        Rows built on previous refreshes, see _build_job_table. Only the
+        rows of the jobs updated since are built again.
+    status_line : str, optional
+        Text printed below the table (e.g. the time of the last refresh).
+    """
+    # Cleared first, so that column warnings stay visible
+    Console().clear()
+    columns_to_show, terminal_width, console = _select_job_list_columns(selected_columns)
+    if row_cache is not None:
+        shown = {job.get("_id") for job in jobs}
+        for job_id in [job_id for job_id in row_cache if job_id not in shown]:
+            del row_cache[job_id]
+    if not jobs:
+        console.print("\n[yellow]No jobs found matching the criteria.[/yellow]")
+    else:
+        console.print(_build_job_table(jobs, cloudos_url, terminal_width, columns_to_show,
+                                       COLUMN_CONFIGS, row_cache=row_cache))
+        console.print(f"{_create_status_legend()}\n")
+    if status_line:
+        console.print(f"[cyan]{status_line}[/cyan]")
 
 
 def create_workflow_list_table(workflows, cloudos_url="https://cloudos.lifebit.ai", page_size=10):
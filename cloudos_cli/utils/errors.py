@@ -96,3 +96,18 @@ class JobAccessDeniedException(Exception):
         self.job_id = job_id
         self.job_owner_name = job_owner_name
         self.current_user_name = current_user_name
+
+
+class LookupsFailedException(Exception):
+    """Aggregate the errors of several lookups run concurrently.
+
+    Parameters
+    ----------
+    errors : dict
+        Lookup name -> the exception raised by that lookup.
+    """
+    def __init__(self, errors):
+        details = '\n'.join(f"\t- {name}: {error}" for name, error in errors.items())
+        msg = f"{len(errors)} lookup(s) failed:\n{details}"
+        super(LookupsFailedException, self).__init__(msg)
+        self.errors = errors
@@ -0,0 +1,108 @@
+"""
+Polling schedule shared by the commands that wait for a job, session or mount.
+"""
+
+import random
+import time
+
+# Statuses that usually change within seconds: polled at the fast interval
+FAST_STATUSES = ('initializing', 'initialising', 'scheduled', 'queued', 'pending',
+                 'provisioning', 'starting', 'stopping', 'pausing', 'resuming', 'aborting',
+                 'mounting')
+
+
+class PollSchedule:
+    """Decide how long to wait before the next status request.
+
+    - While the status is one of `fast_statuses`, every `min_interval`.
+    - After a status change, every `interval`. While the status stays the
+      same (e.g. a long running phase), the interval grows by `backoff` on
+      every poll, up to `max_interval`.
+    - With `expected_duration`, a poll is made at the predicted end, and
+      polls stop backing off once it has passed.
+    - Every delay varies by +/- `jitter` (a fraction), so that many waits do
+      not poll in lockstep, and never goes past the deadline.
+
+    Parameters
+    ----------
+    interval : float
+        Base time (in seconds) between requests.
+    timeout : float, optional
+        Seconds from now to the absolute deadline. No deadline if None.
+    min_interval : float, optional
+        Time between requests during fast statuses. Default: a third of
+        `interval`, but at least 1 second.
+    max_interval : float, optional
+        Longest time between requests. Default: 4 times `interval`.
+    backoff : float
+        Growth of the interval on every poll without a status change.
+    jitter : float
+        Maximum relative random variation of every delay.
+    expected_duration : float, optional
+        Predicted number of seconds, from now, until the end of the wait.
+    fast_statuses : iterable
+        Statuses polled at `min_interval` (compared in lower case).
+    """
+
+    def __init__(self, interval, timeout=None, min_interval=None, max_interval=None,
+                 backoff=1.5, jitter=0.1, expected_duration=None, fast_statuses=FAST_STATUSES):
+        self.interval = interval
+        if min_interval is None:
+            min_interval = max(1, interval / 3)
+        self.min_interval = min(min_interval, interval)
+        self.max_interval = max(interval, max_interval if max_interval is not None else interval * 4)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.expected_duration = expected_duration
+        self.fast_statuses = {status.lower() for status in fast_statuses}
+        self.start = time.monotonic()
+        self.deadline = None if timeout is None else self.start + timeout
+        self._current = interval
+        self._status = None
+
+    def elapsed(self):
+        """Seconds since the schedule started."""
+        return time.monotonic() - self.start
+
+    def remaining(self):
+        """Seconds until the deadline, or None without deadline."""
+        if self.deadline is None:
+            return None
+        return max(0, self.deadline - time.monotonic())
+
+    def expired(self):
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def next_delay(self, status=None):
+        """Return the time to wait before the next request, given the last status."""
+        status = status.lower() if isinstance(status, str) else status
+        if status != self._status:
+            self._current = self.interval
+        else:
+            self._current = min(self._current * self.backoff, self.max_interval)
+        self._status = status
+        if status in self.fast_statuses:
+            delay = self.min_interval
+        else:
+            delay = self._current
+            if self.expected_duration is not None:
+                left = self.expected_duration - self.elapsed()
+                if left > 0:
+                    delay = min(delay, max(self.min_interval, left))
+                else:
+                    # Past the predicted end: completion is likely at any time
+                    delay = min(delay, self.interval)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        remaining = self.remaining()
+        if remaining is not None:
+            delay = min(delay, remaining)
+        return max(0, delay)
+
+    def wait(self, status=None):
+        """Sleep until the next request is due. Returns the time slept."""
+        delay = self.next_delay(status)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -2,43 +2,179 @@
 Specific functions to wrapp error strategy for requests
 """
 
+import os
+import threading
+import warnings
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
+from cloudos_cli.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE
 
+# Process-wide registry of pooled sessions. Sessions are keyed by the
+# request origin (scheme://host[:port]), the SSL verification setting and the
+# retry strategy, so every API call to the same Lifebit Platform host reuses
+# the same TCP/TLS connections instead of opening a new one per request.
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
 
-def retry_requests_get(url, total=5, status_forcelist=[429, 500, 502, 503, 504], **kwargs):
-    """Wrap normal requests get with an error strategy.
+
+def _env_pool_size(name, default):
+    """Read a positive pool size from the environment, warning and using `default` if invalid."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        size = int(value)
+        if size < 1:
+            raise ValueError
+    except ValueError:
+        warnings.warn(f"Ignoring {name}={value!r}: expected a positive integer. Using {default}.")
+        return default
+    return size
+
+
+_POOL_SETTINGS = {
+    'pool_connections': _env_pool_size('CLOUDOS_HTTP_POOL_CONNECTIONS', HTTP_POOL_CONNECTIONS),
+    'pool_maxsize': _env_pool_size('CLOUDOS_HTTP_POOL_MAXSIZE', HTTP_POOL_MAXSIZE),
+    'keep_alive': os.environ.get('CLOUDOS_HTTP_KEEP_ALIVE', str(HTTP_KEEP_ALIVE)).lower() not in ('0', 'false', 'no')
+}
+
+
+def configure_sessions(pool_connections=None, pool_maxsize=None, keep_alive=None):
+    """Set the connection pool settings used by newly created sessions.
+
+    Existing sessions are closed so that the new settings apply to every
+    subsequent request.
+
+    Parameters
+    ----------
+    pool_connections : int, optional
+        Number of per-host connection pools to cache.
+    pool_maxsize : int, optional
+        Maximum number of connections kept open per host. Should be at least
+        the number of threads issuing concurrent requests.
+    keep_alive : bool, optional
+        Whether to keep connections open between requests. When False, a
+        'Connection: close' header is sent with every request.
+    """
+    with _SESSIONS_LOCK:
+        if pool_connections is not None:
+            _POOL_SETTINGS['pool_connections'] = pool_connections
+        if pool_maxsize is not None:
+            _POOL_SETTINGS['pool_maxsize'] = pool_maxsize
+        if keep_alive is not None:
+            _POOL_SETTINGS['keep_alive'] = keep_alive
+    close_sessions()
+
+
+def ensure_pool_size(pool_maxsize):
+    """Grow the per-host connection pool to serve `pool_maxsize` concurrent requests.
+
+    Parameters
+    ----------
+    pool_maxsize : int
+        Number of concurrent requests the pools must be able to serve. The
+        pool is never shrunk.
+    """
+    if pool_maxsize > _POOL_SETTINGS['pool_maxsize']:
+        configure_sessions(pool_maxsize=pool_maxsize)
+
+
+def close_sessions():
+    """Close all the pooled sessions and release their connections."""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
+
+
+def get_session(url, verify=True, total=5, status_forcelist=[429, 500, 502, 503, 504],
+                backoff_factor=0, allowed_methods=None):
+    """Return the shared session for the origin of a URL.
 
     Parameters
     ----------
     url : string
-        The request URL
+        The request URL. Only the scheme, host and port are used as key.
+    verify: [bool|string]
+        Whether to use SSL verification or not. Alternatively, if
+        a string is passed, it will be interpreted as the path to
+        the SSL certificate file.
     total : int
         Total number of retries
     status_forcelist : list
         A list of ints with the status codes to trigger the retries
+    backoff_factor : float
+        Backoff factor applied between retries.
+    allowed_methods : list, optional
+        HTTP methods to retry. The urllib3 default methods if None.
 
     Return
     ------
-    response : requests.Response
-        The Response object returned by the API server
+    session : requests.Session
+        A thread-safe pooled session with the retry strategy mounted.
     """
+    parts = urlsplit(url)
+    key = (f'{parts.scheme}://{parts.netloc}', str(verify), total, tuple(status_forcelist),
+           backoff_factor, tuple(allowed_methods) if allowed_methods is not None else None)
+    session = _SESSIONS.get(key)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _create_session(verify, total, status_forcelist, backoff_factor, allowed_methods)
+            _SESSIONS[key] = session
+    return session
+
+
+def _create_session(verify, total, status_forcelist, backoff_factor=0, allowed_methods=None):
+    """Create a pooled session with the given retry strategy."""
+    # DELETE is already part of the default allowed methods, so a single
+    # strategy covers every verb issued by the retry_requests_* wrappers.
     retry_strategy = Retry(
         total=total,
-        status_forcelist=status_forcelist
+        status_forcelist=status_forcelist,
+        backoff_factor=backoff_factor,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS if allowed_methods is None else allowed_methods
     )
     # Create an HTTP adapter with the retry strategy and mount it to session
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-
-    # Create a new session object
+    adapter = HTTPAdapter(max_retries=retry_strategy,
+                          pool_connections=_POOL_SETTINGS['pool_connections'],
+                          pool_maxsize=_POOL_SETTINGS['pool_maxsize'])
     session = requests.Session()
     session.mount('http://', adapter)
     session.mount('https://', adapter)
+    session.verify = verify
+    # Requests are stateless: never carry cookies from one call to the next
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    if not _POOL_SETTINGS['keep_alive']:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def retry_requests_get(url, total=5, status_forcelist=[429, 500, 502, 503, 504], **kwargs):
+    """Wrap normal requests get with an error strategy.
+
+    Parameters
+    ----------
+    url : string
+        The request URL
+    total : int
+        Total number of retries
+    status_forcelist : list
+        A list of ints with the status codes to trigger the retries
 
-    # Make a request using the session object
-    response = session.get(url, **kwargs)
-    return response
+    Return
+    ------
+    response : requests.Response
+        The Response object returned by the API server
+    """
+    session = get_session(url, kwargs.get('verify', True), total, status_forcelist)
+    return session.get(url, **kwargs)
 
 
 def retry_requests_post(url, total=5, status_forcelist=[429, 500, 502, 503, 504], **kwargs):
@@ -58,21 +194,8 @@ def retry_requests_post(url, total=5, status_forcelist=[429, 500, 502, 503, 504]
     response : requests.Response
         The Response object returned by the API server
     """
-    retry_strategy = Retry(
-        total=total,
-        status_forcelist=status_forcelist
-    )
-    # Create an HTTP adapter with the retry strategy and mount it to session
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-
-    # Create a new session object
-    session = requests.Session()
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-
-    # Make a request using the session object
-    response = session.post(url, **kwargs)
-    return response
+    session = get_session(url, kwargs.get('verify', True), total, status_forcelist)
+    return session.post(url, **kwargs)
 
 
 def retry_requests_put(url, total=5, status_forcelist=[429, 500, 502, 503, 504], **kwargs):
@@ -92,21 +215,8 @@ def retry_requests_put(url, total=5, status_forcelist=[429, 500, 502, 503, 504],
     response : requests.Response
         The Response object returned by the API server
     """
-    retry_strategy = Retry(
-        total=total,
-        status_forcelist=status_forcelist
-    )
-    # Create an HTTP adapter with the retry strategy and mount it to session
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-
-    # Create a new session object
-    session = requests.Session()
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-
-    # Make a request using the session object
-    response = session.put(url, **kwargs)
-    return response
+    session = get_session(url, kwargs.get('verify', True), total, status_forcelist)
+    return session.put(url, **kwargs)
 
 
 def retry_requests_delete(url, total=5, status_forcelist=[429, 500, 502, 503, 504], **kwargs):
@@ -129,16 +239,5 @@ def retry_requests_delete(url, total=5, status_forcelist=[429, 500, 502, 503, 50
     requests.Response
         The Response object returned by the API server.
     """
-    retry_strategy = Retry(
-        total=total,
-        status_forcelist=status_forcelist,
-        allowed_methods=["DELETE"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-
-    session = requests.Session()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-
-    response = session.delete(url, **kwargs)
-    return response
\ No newline at end of file
+    session = get_session(url, kwargs.get('verify', True), total, status_forcelist)
+    return session.delete(url, **kwargs)
@@ -25,7 +25,8 @@ setuptools.setup(
     ]},
     install_requires=["click>=8.0.1", "rich-click>=1.8.2", "pandas>=1.3.4", "numpy>=1.26.4", "requests>=2.26.0"],
     extras_require={
-        "test": ["pytest", "mock", "responses", "requests_mock"]
+        "test": ["pytest", "mock", "responses", "requests_mock"],
+        "parquet": ["pyarrow>=10.0.0"]
     },
     include_package_data=True
 )
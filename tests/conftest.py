@@ -0,0 +1,72 @@
+import json
+import re
+import pytest
+import responses
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep every test on its own empty, enabled metadata cache and job index."""
+    monkeypatch.setattr('cloudos_cli.utils.cache._CACHE_ENABLED', None)
+    monkeypatch.delenv('CLOUDOS_NO_CACHE', raising=False)
+    monkeypatch.setenv('CLOUDOS_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('CLOUDOS_INDEX_DIR', str(tmp_path / 'index'))
+
+
+class FakeWorkspace:
+    """Serves /api/v2/jobs and /api/v1/jobs/<id> from in-memory jobs and records the requests.
+
+    Every change of a job moves a clock forward, so that the jobs can be
+    listed by descending createdAt (the default) or updatedAt (with
+    sort=-updatedAt), optionally filtered by status.
+    """
+
+    def __init__(self):
+        self.clock = 0
+        self.jobs = {}
+        self.requests = []
+        self.status_requests = []
+
+    def _time(self):
+        self.clock += 1
+        return f'2024-05-01T{self.clock // 3600:02d}:{self.clock // 60 % 60:02d}:{self.clock % 60:02d}.000Z'
+
+    def add(self, job_id, status):
+        now = self._time()
+        self.jobs[job_id] = {'_id': job_id, 'name': f'name-{job_id}', 'status': status,
+                             'startTime': '2024-05-01T10:00:00.000Z',
+                             'endTime': '2024-05-01T10:30:00.000Z' if status != 'running' else None,
+                             'createdAt': now, 'updatedAt': now}
+
+    def set_status(self, job_id, status):
+        self.jobs[job_id] = {**self.jobs[job_id], 'status': status, 'updatedAt': self._time(),
+                             'endTime': '2024-05-01T10:30:00.000Z' if status != 'running' else None}
+
+    def mock(self, cloudos_url, unlisted=()):
+        """Register the endpoints; the `unlisted` jobs are only served one by one."""
+        def list_jobs(request):
+            params = request.params
+            page, limit = int(params['page']), int(params['limit'])
+            self.requests.append(dict(params))
+            key = 'updatedAt' if params.get('sort') == '-updatedAt' else 'createdAt'
+            jobs = sorted((j for k, j in self.jobs.items() if k not in unlisted
+                           and ('status' not in params or j['status'] == params['status'])),
+                          key=lambda j: j[key], reverse=True)
+            body = {'jobs': jobs[(page - 1) * limit:page * limit],
+                    'paginationMetadata': {'Pagination-Count': len(jobs),
+                                           'Pagination-Page': page, 'Pagination-Limit': limit}}
+            return 200, {}, json.dumps(body)
+
+        def get_job(request):
+            job_id = request.path_url.split('?')[0].split('/')[-1]
+            self.status_requests.append(job_id)
+            return 200, {}, json.dumps(self.jobs[job_id])
+        responses.add_callback(responses.GET, f'{cloudos_url}/api/v2/jobs', callback=list_jobs)
+        responses.add_callback(responses.GET, re.compile(f'{cloudos_url}/api/v1/jobs/.*'),
+                               callback=get_job)
+
+
+@pytest.fixture
+def fake_workspace():
+    """An empty FakeWorkspace; add jobs, then call mock() within responses.activate."""
+    return FakeWorkspace()
@@ -0,0 +1,82 @@
+"""Benchmark: connections opened by the retry_requests_* helpers.
+
+A local HTTP/1.1 server counts the TCP connections it accepts while the
+helpers issue a burst of sequential and threaded requests. With the pooled
+sessions every request reuses the keep-alive connections of its host.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from cloudos_cli.utils.requests import retry_requests_get, close_sessions
+
+N_REQUESTS = 100
+N_THREADS = 8
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    close_sessions()
+    yield server
+    close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f'http://127.0.0.1:{server.server_address[1]}/api/v1/jobs'
+
+
+def test_sequential_requests_reuse_one_connection(mock_server):
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        assert retry_requests_get(_url(mock_server)).status_code == 200
+    pooled = time.perf_counter() - start
+    assert mock_server.connections == 1
+
+    mock_server.connections = 0
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        with requests.Session() as session:
+            session.get(_url(mock_server))
+    unpooled = time.perf_counter() - start
+    assert mock_server.connections == N_REQUESTS
+    print(f'\n{N_REQUESTS} sequential requests: pooled {pooled:.3f}s (1 connection), '
+          f'one session per request {unpooled:.3f}s ({N_REQUESTS} connections)')
+
+
+def test_threaded_requests_bounded_by_pool(mock_server):
+    with ThreadPoolExecutor(max_workers=N_THREADS) as pool:
+        codes = list(pool.map(lambda _: retry_requests_get(_url(mock_server)).status_code,
+                              range(N_REQUESTS)))
+    assert codes == [200] * N_REQUESTS
+    assert mock_server.connections <= N_THREADS
@@ -0,0 +1,52 @@
+"""Benchmark: formatting a 100k-job list with process_job_list + reorder_job_list.
+
+Runs in CI with a generous time bound, to catch a return to row-wise
+processing (which took minutes at this size).
+"""
+import time
+from cloudos_cli.clos import Cloudos
+
+N_JOBS = 100000
+TIME_LIMIT = 30
+
+
+def _jobs(n_jobs):
+    return [{
+        'status': 'completed',
+        'name': f'job-{i}',
+        'project': {'name': 'project'},
+        'user': {'name': 'Ada', 'surname': 'Lovelace'},
+        'workflow': {'name': 'rnatoy', 'repository': {'url': 'https://github.com/lifebit-ai/rnatoy'}},
+        '_id': f'{i:024x}',
+        'startTime': f'2024-03-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000Z',
+        'endTime': f'2024-03-02T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.500Z',
+        'createdAt': '2024-03-01T00:00:00.000Z',
+        'updatedAt': '2024-03-02T00:00:00.000Z',
+        'revision': {'commit': 'abc123'},
+        'realInstancesExecutionCost': i % 1000,
+        'masterInstance': {'usedInstance': {'type': 'c5.xlarge'}},
+        'storageMode': 'regular',
+        'nextflowVersion': '22.10.8',
+        'batch': {'enabled': i % 2 == 0},
+        'storageSizeInGb': 500,
+        'usesFusionFileSystem': False
+    } for i in range(n_jobs)]
+
+
+def test_process_and_reorder_100k_jobs():
+    jobs = _jobs(N_JOBS)
+    cl = Cloudos('http://cloudos.lifebit.ai', 'key', None)
+
+    start = time.perf_counter()
+    df = cl.process_job_list(jobs)
+    processed = time.perf_counter() - start
+    start = time.perf_counter()
+    reordered = cl.reorder_job_list(df)
+    elapsed = time.perf_counter() - start
+
+    print(f'\n{N_JOBS} jobs: process_job_list {processed:.2f}s, reorder_job_list {elapsed:.2f}s')
+    assert len(reordered) == N_JOBS
+    assert reordered['Run time'].iloc[0] == '24h 0m 0s'
+    assert reordered['Cost'].iloc[999] == '9.9900'
+    assert reordered['Owner'].iloc[-1] == 'Ada Lovelace'
+    assert processed + elapsed < TIME_LIMIT
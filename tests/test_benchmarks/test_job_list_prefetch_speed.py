@@ -0,0 +1,88 @@
+"""Benchmark: listing every job of a workspace with concurrent page prefetch.
+
+A local HTTP server serves /api/v2/jobs with a fixed per-request latency.
+Pages are fetched one at a time (the previous behaviour) and with the
+concurrent prefetch of Cloudos.get_job_list, at 1k, 10k and 100k jobs.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import pytest
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.utils.requests import close_sessions
+
+LATENCY = 0.002
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        page, limit = int(query['page'][0]), int(query['limit'][0])
+        start = (page - 1) * limit
+        jobs = [{'_id': f'job{i}', 'status': 'completed'}
+                for i in range(start, min(start + limit, self.server.n_jobs))]
+        body = json.dumps({'jobs': jobs,
+                           'paginationMetadata': {'Pagination-Count': self.server.n_jobs,
+                                                  'Pagination-Page': page,
+                                                  'Pagination-Limit': limit}}).encode()
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    close_sessions()
+    yield server
+    close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def _sequential_job_count(cl):
+    """Walk every page one at a time."""
+    params = {'teamId': WORKSPACE_ID, 'archived.status': 'false', 'page': 1, 'limit': 100}
+    headers = {'Content-type': 'application/json', 'apikey': 'key'}
+    n = 0
+    for content in cl._iter_job_pages(params, headers, max_workers=1):
+        n += len(content['jobs'])
+        if len(content['jobs']) < 100:
+            break
+    return n
+
+
+@pytest.mark.parametrize('n_jobs', [1000, 10000, 100000])
+def test_prefetch_speedup(mock_server, n_jobs):
+    mock_server.n_jobs = n_jobs
+    cl = Cloudos(f'http://127.0.0.1:{mock_server.server_address[1]}', 'key', None)
+
+    start = time.perf_counter()
+    assert _sequential_job_count(cl) == n_jobs
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    jobs = cl.get_job_list(WORKSPACE_ID, last_n_jobs='all')['jobs']
+    prefetched = time.perf_counter() - start
+    assert len(jobs) == n_jobs
+    assert jobs[0]['_id'] == 'job0' and jobs[-1]['_id'] == f'job{n_jobs - 1}'
+
+    print(f'\n{n_jobs} jobs ({n_jobs // 100} pages): sequential {sequential:.2f}s, '
+          f'prefetched {prefetched:.2f}s ({sequential / prefetched:.1f}x)')
+    if n_jobs >= 10000:
+        assert prefetched < sequential
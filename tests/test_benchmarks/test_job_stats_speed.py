@@ -0,0 +1,44 @@
+"""Benchmark: aggregating 100k jobs with jobs_frame + job_stats.
+
+Runs in CI with a generous time bound, to catch a return to per-group
+Python loops.
+"""
+import time
+from cloudos_cli.jobs.stats import jobs_frame, job_stats
+
+N_JOBS = 100000
+TIME_LIMIT = 20
+
+
+def _jobs(n_jobs):
+    return [{
+        '_id': f'{i:024x}',
+        'status': ('completed', 'failed', 'running', 'aborted')[i % 4],
+        'name': f'job-{i}',
+        'project': {'name': f'project-{i % 7}'},
+        'workflow': {'name': f'workflow-{i % 50}'},
+        'user': {'id': 'u1', 'name': 'Ada', 'surname': 'Lovelace'},
+        'createdAt': '2024-03-01T00:00:00.000Z',
+        'updatedAt': '2024-03-02T00:00:00.000Z',
+        'startTime': f'2024-03-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000Z',
+        'endTime': None if i % 4 == 2 else '2024-03-02T00:00:00.000Z',
+        'computeCostSpent': i % 1000
+    } for i in range(n_jobs)]
+
+
+def test_stats_100k_jobs():
+    jobs = _jobs(N_JOBS)
+
+    start = time.perf_counter()
+    frame = jobs_frame(iter(jobs))
+    collected = time.perf_counter() - start
+    start = time.perf_counter()
+    stats = job_stats(frame, ['project', 'workflow'])
+    elapsed = time.perf_counter() - start
+
+    print(f'\n{N_JOBS} jobs: jobs_frame {collected:.2f}s, job_stats {elapsed:.2f}s')
+    assert stats['jobs'].sum() == N_JOBS
+    assert len(stats) == 350
+    assert stats['failed'].sum() == N_JOBS // 4
+    assert stats['runtime_p95'].notna().all()
+    assert collected + elapsed < TIME_LIMIT
@@ -0,0 +1,94 @@
+"""Pytests for the AsyncCloudos client"""
+import asyncio
+import json
+import threading
+import time
+import mock
+import pytest
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos_async import AsyncCloudos, run_async
+from cloudos_cli.utils.errors import BadRequestException
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+JOB_IDS = [f'job{i}' for i in range(10)]
+
+
+def _status_body(job_id, status='running'):
+    return json.dumps({'_id': job_id, 'name': job_id, 'status': status})
+
+
+@responses.activate
+def test_get_jobs_status_returns_all_responses():
+    for job_id in JOB_IDS:
+        responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/jobs/{job_id}?teamId={WORKSPACE_ID}',
+                      body=_status_body(job_id), status=200)
+    acl = AsyncCloudos(CLOUDOS_URL, APIKEY, None, max_concurrency=4)
+    statuses = run_async(acl.get_jobs_status(JOB_IDS, WORKSPACE_ID))
+    acl.close()
+    assert list(statuses) == JOB_IDS
+    assert all(json.loads(r.content)['_id'] == j for j, r in statuses.items())
+
+
+@responses.activate
+def test_abort_jobs_returns_exceptions_per_job():
+    responses.add(responses.PUT, f'{CLOUDOS_URL}/api/v2/jobs/ok/abort?forceAbort=false&teamId={WORKSPACE_ID}',
+                  status=204)
+    responses.add(responses.PUT, f'{CLOUDOS_URL}/api/v2/jobs/bad/abort?forceAbort=false&teamId={WORKSPACE_ID}',
+                  status=400)
+    acl = AsyncCloudos(CLOUDOS_URL, APIKEY, None)
+    results = run_async(acl.abort_jobs(['ok', 'bad'], WORKSPACE_ID))
+    acl.close()
+    assert results['ok'].status_code == 204
+    assert isinstance(results['bad'], BadRequestException)
+
+
+def test_concurrency_is_bounded():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_status(j_id, workspace_id, verify):
+        with lock:
+            active.append(j_id)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(j_id)
+        return j_id
+
+    async def fan_out():
+        async with AsyncCloudos(CLOUDOS_URL, APIKEY, None, max_concurrency=3) as acl:
+            with mock.patch.object(acl._client, 'get_job_status', side_effect=fake_status):
+                return await acl.get_jobs_status(JOB_IDS, WORKSPACE_ID)
+
+    results = asyncio.run(fan_out())
+    assert list(results.values()) == JOB_IDS
+    assert max(peak) <= 3
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncCloudos(CLOUDOS_URL, APIKEY, None, max_concurrency=0)
+
+
+@responses.activate
+def test_cli_abort_runs_jobs_concurrently():
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/jobs/job1?teamId={WORKSPACE_ID}',
+                  body=_status_body('job1'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/jobs/job2?teamId={WORKSPACE_ID}',
+                  body=_status_body('job2', 'completed'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/jobs/job3?teamId={WORKSPACE_ID}', status=404)
+    responses.add(responses.PUT, f'{CLOUDOS_URL}/api/v2/jobs/job1/abort?forceAbort=false&teamId={WORKSPACE_ID}',
+                  status=204)
+    runner = CliRunner()
+    result = runner.invoke(run_cloudos_cli, ['job', 'abort', '--apikey', APIKEY, '--cloudos-url', CLOUDOS_URL,
+                                             '--workspace-id', WORKSPACE_ID, '--job-ids', 'job1,job2,job3'])
+    assert result.exit_code == 0
+    assert "Job 'job1' aborted successfully." in result.output
+    assert 'Job job2 is not in a state that can be aborted' in result.output
+    assert 'Failed to get status for job job3' in result.output
+    assert result.output.index('job1') < result.output.index('job2') < result.output.index('job3')
@@ -37,6 +37,24 @@ def test_get_user_info_correct_response():
     assert response['dockerRegistriesCredentials'] == []
 
 
+@responses.activate
+def test_get_user_info_refresh_skips_the_cache():
+    """
+    Test 'get_user_info' with refresh to request the user again
+    """
+    for credentials in ([], [{"registry": "docker.io"}]):
+        responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/users/me",
+                      json={"dockerRegistriesCredentials": credentials})
+    clos = Cloudos(apikey=APIKEY, cromwell_token=None, cloudos_url=CLOUDOS_URL)
+    assert clos.get_user_info()['dockerRegistriesCredentials'] == []
+    assert clos.get_user_info()['dockerRegistriesCredentials'] == []
+    assert len(responses.calls) == 1
+    assert clos.get_user_info(refresh=True)['dockerRegistriesCredentials'] == [{"registry": "docker.io"}]
+    # The fresh user information replaces the cached one
+    assert clos.get_user_info()['dockerRegistriesCredentials'] == [{"registry": "docker.io"}]
+    assert len(responses.calls) == 2
+
+
 @mock.patch('cloudos_cli.clos', mock.MagicMock())
 @responses.activate
 def test_get_user_info_incorrect_response():
@@ -0,0 +1,110 @@
+"""Pytests for the lazy Cloudos.iter_jobs generator and the streaming writers"""
+import csv
+import json
+import threading
+import pytest
+import responses
+from cloudos_cli.clos import Cloudos, job_matcher
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _job(i):
+    return {'_id': f'job{i}', 'name': f'sample-{i}', 'status': 'completed',
+            'realInstancesExecutionCost': i * 100,
+            'startTime': '2024-01-01T00:00:00.000Z',
+            'endTime': f'2024-01-01T00:{i % 60:02d}:00.000Z',
+            'batch': {'jobQueue': {'id': 'q1' if i % 3 == 0 else 'q2'}}}
+
+
+def _mock_jobs(n_jobs, with_count=True):
+    """Serve n_jobs jobs honouring page and limit, recording the requested pages."""
+    requested = []
+    lock = threading.Lock()
+
+    def callback(request):
+        page = int(request.params['page'])
+        limit = int(request.params['limit'])
+        with lock:
+            requested.append(page)
+        start = (page - 1) * limit
+        body = {'jobs': [_job(i) for i in range(start, min(start + limit, n_jobs))]}
+        if with_count:
+            body['paginationMetadata'] = {'Pagination-Count': n_jobs, 'Pagination-Page': page,
+                                          'Pagination-Limit': limit}
+        return 200, {}, json.dumps(body)
+    responses.add_callback(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+    return requested
+
+
+@responses.activate
+def test_iter_jobs_yields_every_job_in_order():
+    _mock_jobs(250)
+    jobs = Cloudos(CLOUDOS_URL, APIKEY, None).iter_jobs(WORKSPACE_ID)
+    assert [j['_id'] for j in jobs] == [f'job{i}' for i in range(250)]
+
+
+@responses.activate
+def test_iter_jobs_stops_fetching_when_consumer_stops():
+    requested = _mock_jobs(5000, with_count=False)
+    jobs = Cloudos(CLOUDOS_URL, APIKEY, None).iter_jobs(WORKSPACE_ID, page_size=10)
+    first = [next(jobs) for _ in range(15)]
+    jobs.close()
+    assert first[-1]['_id'] == 'job14'
+    assert requested == [1, 2]
+
+
+@responses.activate
+def test_iter_jobs_limit_fetches_only_needed_pages():
+    requested = _mock_jobs(5000, with_count=False)
+    jobs = list(Cloudos(CLOUDOS_URL, APIKEY, None).iter_jobs(WORKSPACE_ID, limit=30))
+    assert len(jobs) == 30
+    assert requested == [1]
+
+
+@responses.activate
+def test_iter_jobs_applies_client_side_filters():
+    _mock_jobs(300)
+    jobs = Cloudos(CLOUDOS_URL, APIKEY, None).iter_jobs(
+        WORKSPACE_ID, limit=5, name_regex=r'-\d*7$', min_cost=10, max_runtime=50 * 60)
+    assert [j['_id'] for j in jobs] == ['job17', 'job27', 'job37', 'job47', 'job67']
+
+
+def test_job_matcher():
+    assert job_matcher() is None
+    matches = job_matcher(queue_id='q1', min_runtime=120)
+    assert matches(_job(3))
+    assert not matches(_job(1))
+    assert not matches(_job(0))
+    assert not job_matcher(max_cost=1)({'name': 'no-cost'})
+    with pytest.raises(ValueError):
+        job_matcher(name_regex='(')
+
+
+@pytest.mark.parametrize('limit', [0, -1, 'some'])
+def test_iter_jobs_rejects_invalid_limit(limit):
+    with pytest.raises(ValueError):
+        next(Cloudos(CLOUDOS_URL, APIKEY, None).iter_jobs(WORKSPACE_ID, limit=limit))
+
+
+def test_save_job_stream_to_json(tmp_path):
+    outfile = tmp_path / 'jobs.json'
+    jobs = [_job(i) for i in range(3)]
+    n = Cloudos(CLOUDOS_URL, APIKEY, None).save_job_stream_to_json(iter(jobs), str(outfile))
+    assert n == 3
+    assert outfile.read_text() == json.dumps(jobs)
+
+
+def test_save_job_stream_to_csv_matches_single_chunk(tmp_path):
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    jobs = [_job(i) for i in range(25)]
+    chunked, whole = tmp_path / 'chunked.csv', tmp_path / 'whole.csv'
+    assert cl.save_job_stream_to_csv(iter(jobs), str(chunked), chunk_size=10) == 25
+    cl.save_job_stream_to_csv(iter(jobs), str(whole), chunk_size=100)
+    assert chunked.read_text() == whole.read_text()
+    with open(chunked) as fh:
+        rows = list(csv.DictReader(fh))
+    assert len(rows) == 25
+    assert rows[3]['ID'] == 'job3' and rows[3]['Cost'] == '3.0000' and rows[3]['Run time'] == '3m 0s'
@@ -0,0 +1,68 @@
+"""Pytests for the concurrent page prefetch of Cloudos.get_job_list"""
+import json
+import threading
+import responses
+from cloudos_cli.clos import Cloudos
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _mock_jobs(n_jobs, queue_every=None):
+    """Serve n_jobs jobs, newest first, honouring page and limit."""
+    requested = []
+    lock = threading.Lock()
+
+    def callback(request):
+        page = int(request.params['page'])
+        limit = int(request.params['limit'])
+        with lock:
+            requested.append(page)
+        start = (page - 1) * limit
+        jobs = []
+        for i in range(start, min(start + limit, n_jobs)):
+            queue = 'q1' if queue_every and i % queue_every == 0 else 'q2'
+            jobs.append({'_id': f'job{i}', 'batch': {'jobQueue': {'id': queue}}})
+        body = {'jobs': jobs, 'paginationMetadata': {'Pagination-Count': n_jobs,
+                                                     'Pagination-Page': page,
+                                                     'Pagination-Limit': limit}}
+        return 200, {}, json.dumps(body)
+    responses.add_callback(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+    return requested
+
+
+@responses.activate
+def test_all_jobs_are_fetched_once_and_in_order():
+    requested = _mock_jobs(1050)
+    result = Cloudos(CLOUDOS_URL, APIKEY, None).get_job_list(WORKSPACE_ID, last_n_jobs='all')
+    assert [j['_id'] for j in result['jobs']] == [f'job{i}' for i in range(1050)]
+    assert sorted(requested) == list(range(1, 12))
+
+
+@responses.activate
+def test_last_n_jobs_only_fetches_needed_pages():
+    requested = _mock_jobs(5000)
+    result = Cloudos(CLOUDOS_URL, APIKEY, None).get_job_list(WORKSPACE_ID, last_n_jobs=250)
+    assert [j['_id'] for j in result['jobs']] == [f'job{i}' for i in range(250)]
+    assert sorted(requested) == [1, 2, 3]
+
+
+@responses.activate
+def test_direct_page_does_not_prefetch():
+    requested = _mock_jobs(5000)
+    result = Cloudos(CLOUDOS_URL, APIKEY, None).get_job_list(WORKSPACE_ID, page=3, page_size=20)
+    assert [j['_id'] for j in result['jobs']] == [f'job{i}' for i in range(40, 60)]
+    assert requested == [3]
+
+
+@responses.activate
+def test_queue_filter_stops_early(monkeypatch):
+    requested = _mock_jobs(5000, queue_every=10)
+    monkeypatch.setattr('cloudos_cli.queue.queue.Queue.get_job_queues',
+                        lambda self: [{'label': 'my-queue', 'id': 'q1'}])
+    result = Cloudos(CLOUDOS_URL, APIKEY, None).get_job_list(WORKSPACE_ID, last_n_jobs=25,
+                                                             filter_queue='my-queue')
+    assert [j['_id'] for j in result['jobs']] == [f'job{i}' for i in range(0, 250, 10)]
+    # 10 pages of 25 jobs are needed; at most one window of prefetched pages is wasted
+    assert 10 <= len(requested) <= 10 + 8
@@ -0,0 +1,81 @@
+"""Pytests for the job document shared by the commands touching a job"""
+import responses
+from responses import matchers
+from cloudos_cli.clos import Cloudos
+
+CLOUD_OS_URL = "https://cloudos.lifebit.ai"
+BUCKET = "bucketname"
+OBJ_PREFIX = "path/to"
+WS_ID = "workspace123"
+JOB = "jobid123"
+DETAILS = {
+    "_id": JOB,
+    "name": "my-job",
+    "logs": {"s3BucketName": BUCKET, "s3Prefix": OBJ_PREFIX},
+    "results": {"s3BucketName": BUCKET, "s3Prefix": f"{OBJ_PREFIX}/results"},
+    "workDirectory": {"folderId": None},
+    "status": "completed",
+    "team": WS_ID
+}
+
+
+def _job_requests():
+    return [call for call in responses.calls if f'/api/v1/jobs/{JOB}' in call.request.url]
+
+
+def _mock_job():
+    responses.add(responses.GET, url=f"{CLOUD_OS_URL}/api/v1/jobs/{JOB}", json=DETAILS)
+
+
+def _mock_storage():
+    for path, contents in ((OBJ_PREFIX, [{"name": "stdout.txt", "path": f"{OBJ_PREFIX}/stdout.txt",
+                                          "isDir": False}]),
+                           (f"{OBJ_PREFIX}/results", [{"name": "results", "isDir": True,
+                                                       "path": f"{OBJ_PREFIX}/results"}])):
+        responses.add(responses.GET, url=f"{CLOUD_OS_URL}/api/v1/data-access/s3/bucket-contents",
+                      match=[matchers.query_param_matcher(dict(bucket=BUCKET, path=path,
+                                                                teamId=WS_ID))],
+                      json={"contents": contents})
+    for provider in ["aws", "azure"]:
+        responses.add(responses.GET, url=f"{CLOUD_OS_URL}/api/v1/cloud/{provider}",
+                      json=dict(notNone=1) if provider == "aws" else {})
+
+
+@responses.activate
+def test_snapshot_accessors():
+    _mock_job()
+    snapshot = Cloudos(CLOUD_OS_URL, "", None).get_job_snapshot(JOB, WS_ID)
+    assert (snapshot.name, snapshot.status, snapshot.team) == ("my-job", "completed", WS_ID)
+    assert snapshot.logs == DETAILS["logs"]
+    assert snapshot.results == DETAILS["results"]
+    assert snapshot.work_directory == {"folderId": None}
+    assert snapshot.analysis_results is None
+    assert snapshot.get("_id") == JOB
+
+
+@responses.activate
+def test_logs_and_results_request_the_job_once():
+    _mock_job()
+    _mock_storage()
+    cl = Cloudos(CLOUD_OS_URL, "", None)
+    assert cl.get_job_results(JOB, WS_ID) == f"s3://{BUCKET}/{OBJ_PREFIX}/results"
+    assert cl.get_job_logs(JOB, WS_ID) == {"Nextflow standard output": f"s3://{BUCKET}/{OBJ_PREFIX}/stdout.txt"}
+    assert cl.get_job_snapshot(JOB, WS_ID).status == "completed"
+    assert len(_job_requests()) == 1
+
+
+@responses.activate
+def test_status_requests_and_mutations_refresh_the_snapshot():
+    _mock_job()
+    responses.add(responses.PUT, url=f"{CLOUD_OS_URL}/api/v2/jobs/{JOB}/abort", json={})
+    cl = Cloudos(CLOUD_OS_URL, "", None)
+    cl.get_job_snapshot(JOB, WS_ID)
+    # Status requests always reach the API, and update the snapshot
+    cl.get_job_status(JOB, WS_ID)
+    cl.get_job_snapshot(JOB, WS_ID)
+    assert len(_job_requests()) == 2
+    cl.abort_job(JOB, WS_ID)
+    cl.get_job_snapshot(JOB, WS_ID)
+    assert len(_job_requests()) == 3
+    cl.get_job_snapshot(JOB, WS_ID, refresh=True)
+    assert len(_job_requests()) == 4
@@ -0,0 +1,57 @@
+"""Pytest for method Cloudos.resolve_workflow"""
+import responses
+from responses import matchers
+from cloudos_cli.clos import Cloudos, ResolvedWorkflow
+from cloudos_cli.utils.cache import set_cache_enabled
+from tests.functions_for_pytest import load_json_file
+
+INPUT = "tests/test_data/process_workflow_list_initial_request.json"
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+WORKFLOW_NAME = 'picard'
+PAGE_SIZE = 10
+
+
+def _mock_workflow_requests():
+    json_data = load_json_file(INPUT)
+    responses.add(
+            responses.GET,
+            url=f"{CLOUDOS_URL}/api/v3/workflows",
+            body=json_data,
+            match=[matchers.query_param_matcher({"search": WORKFLOW_NAME, "teamId": WORKSPACE_ID,
+                                                 "pageSize": PAGE_SIZE})],
+            status=200)
+    responses.add(
+            responses.GET,
+            url=f"{CLOUDOS_URL}/api/v3/workflows",
+            body=json_data,
+            match=[matchers.query_param_matcher({"search": WORKFLOW_NAME, "teamId": WORKSPACE_ID})],
+            status=200)
+
+
+@responses.activate
+def test_workflow_resolved_once_per_object():
+    """detect_workflow, is_module and the workflow id share a single lookup"""
+    _mock_workflow_requests()
+    set_cache_enabled(False)
+    try:
+        clos = Cloudos(apikey=APIKEY, cromwell_token=None, cloudos_url=CLOUDOS_URL)
+        assert clos.detect_workflow(WORKFLOW_NAME, WORKSPACE_ID) == 'docker'
+        assert clos.is_module(WORKFLOW_NAME, WORKSPACE_ID) is False
+        workflow = clos.resolve_workflow(WORKSPACE_ID, WORKFLOW_NAME)
+        assert isinstance(workflow, ResolvedWorkflow)
+        assert workflow.find_id() == workflow.query('_id')[0]
+    finally:
+        set_cache_enabled(True)
+    # one pagination request plus one content request
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_workflow_persisted_across_objects():
+    """A second invocation is served from the on-disk cache"""
+    _mock_workflow_requests()
+    Cloudos(CLOUDOS_URL, APIKEY, None).detect_workflow(WORKFLOW_NAME, WORKSPACE_ID)
+    Cloudos(CLOUDOS_URL, APIKEY, None).detect_workflow(WORKFLOW_NAME, WORKSPACE_ID)
+    assert len(responses.calls) == 2
@@ -0,0 +1,51 @@
+"""Pytests for 'cloudos datasets du'"""
+import json
+import numpy as np
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.datasets.datasets import FolderUsage
+from tests.test_datasets.test_ls_recursive import APIKEY, CLOUDOS_URL, WORKSPACE_ID, PROJECT_NAME, _mock_tree
+
+
+def _du(*extra):
+    runner = CliRunner()
+    return runner.invoke(run_cloudos_cli, ['datasets', 'du', 'AnalysesResults', '--apikey', APIKEY,
+                                           '--cloudos-url', CLOUDOS_URL, '--workspace-id', WORKSPACE_ID,
+                                           '--project-name', PROJECT_NAME, *extra])
+
+
+def test_folder_usage_aggregates_bottom_up():
+    items = [('a', {'folderType': 'S3Folder'}, 1),
+             ('top.txt', {'sizeInBytes': 1}, 1),
+             ('a/b', {'isDir': True}, 2),
+             ('a/x.txt', {'size': 10}, 2),
+             ('a/b/y.txt', {'sizeInBytes': 100}, 3),
+             ('a/b/z.txt', {'sizeInBytes': None}, 3)]
+    usage = FolderUsage.from_walk(iter(items))
+    assert usage.paths == ['', 'a', 'a/b']
+    assert usage.total_bytes.tolist() == [111, 110, 100]
+    assert usage.total_files.tolist() == [4, 3, 2]
+    assert [usage.paths[i] for i in usage.top(max_depth=1)] == ['a']
+    assert isinstance(usage.top(), np.ndarray)
+
+
+@responses.activate
+def test_du_json_output():
+    _mock_tree()
+    result = _du('--output-format', 'json', '--top', '3')
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output[result.output.index('{'):])
+    assert data['total_bytes'] == 50 and data['total_files'] == 5
+    assert data['folders'][0] == {'path': 'run1', 'depth': 1, 'bytes': 50, 'files': 5}
+    assert [f['path'] for f in data['folders']] == ['run1', 'run1/results', 'run1/results/bam']
+    assert data['incomplete_folders'] == []
+
+
+@responses.activate
+def test_du_table_output_with_max_depth():
+    _mock_tree()
+    result = _du('--max-depth', '2')
+    assert result.exit_code == 0, result.output
+    assert 'run1/results' in result.output and 'run1/results/bam' not in result.output
+    assert 'Total: 50.0 B in 5 files' in result.output
@@ -0,0 +1,85 @@
+"""Pytests for the folder listing cache of Datasets.list_folder_content"""
+import json
+import pytest
+import responses
+from cloudos_cli.datasets import Datasets
+from cloudos_cli.utils.cache import set_cache_enabled
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+PROJECT_ID = '1234bc123125'
+DATASET_ID = 'dataset-results'
+BUCKET = 'results-bucket'
+DEPTH = 5
+
+
+def _mock_tree():
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/datasets',
+                  body=json.dumps({'datasets': [{'_id': DATASET_ID, 'name': 'Analyses Results'}]}))
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/datasets/{DATASET_ID}/items',
+                  body=json.dumps({'folders': [{'name': 'level1', 'folderType': 'S3Folder',
+                                                's3BucketName': BUCKET, 's3Prefix': 'level1'}],
+                                   'files': []}))
+    for depth in range(1, DEPTH + 1):
+        prefix = '/'.join(f'level{i}' for i in range(1, depth + 1))
+        contents = [{'name': 'report.txt', 'path': f'{prefix}/report.txt', 'isDir': False}]
+        if depth < DEPTH:
+            contents.append({'name': f'level{depth + 1}', 'path': f'{prefix}/level{depth + 1}',
+                             'isDir': True})
+        responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents',
+                      match=[responses.matchers.query_param_matcher(
+                          {'bucket': BUCKET, 'path': prefix, 'teamId': WORKSPACE_ID})],
+                      body=json.dumps({'contents': contents}))
+
+
+def _datasets():
+    return Datasets(cloudos_url=CLOUDOS_URL, apikey=APIKEY, workspace_id=WORKSPACE_ID,
+                    project_name='lifebit-testing', verify=True, project_id=PROJECT_ID,
+                    cromwell_token=None)
+
+
+@pytest.fixture
+def no_disk_cache():
+    set_cache_enabled(False)
+    yield
+    set_cache_enabled(True)
+
+
+@responses.activate
+def test_deep_path_lists_each_level_once(no_disk_cache):
+    _mock_tree()
+    datasets = _datasets()
+    deep = 'AnalysesResults/' + '/'.join(f'level{i}' for i in range(1, DEPTH + 1))
+    result = datasets.list_folder_content(deep)
+    assert [f['name'] for f in result['files']] == ['report.txt']
+    # project root + dataset items + one listing per level
+    assert len(responses.calls) == 2 + DEPTH
+
+    # ancestors, repeated lookups and files are answered from the trie
+    assert datasets.list_folder_content('Analyses Results/level1/level2')['folders'][0]['name'] == 'level3'
+    assert datasets.list_folder_content(deep + '/report.txt')['files'][0]['name'] == 'report.txt'
+    assert datasets.list_folder_content(deep)['files'] == result['files']
+    assert len(responses.calls) == 2 + DEPTH
+
+    # a mutation drops the cached listings
+    datasets._invalidate_cache()
+    datasets.list_folder_content('AnalysesResults/level1')
+    assert len(responses.calls) == 2 + DEPTH + 3
+
+
+@responses.activate
+def test_listings_are_persisted_across_invocations():
+    _mock_tree()
+    _datasets().list_folder_content('AnalysesResults/level1/level2')
+    assert len(responses.calls) == 4
+    result = _datasets().list_folder_content('AnalysesResults/level1/level2')
+    assert result['folders'][0]['name'] == 'level3'
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_missing_folder_is_reported(no_disk_cache):
+    _mock_tree()
+    with pytest.raises(ValueError, match="Folder 'missing' not found under dataset 'Analyses Results'"):
+        _datasets().list_folder_content('AnalysesResults/missing/level2')
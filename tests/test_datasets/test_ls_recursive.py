@@ -0,0 +1,97 @@
+"""Pytests for 'cloudos datasets ls --recursive'"""
+import json
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.datasets.datasets import path_matcher
+from tests.functions_for_pytest import load_json_file
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+PROJECT_NAME = 'lifebit-testing'
+BUCKET = 'results-bucket'
+
+
+def _s3_listing(prefix, folders, files):
+    contents = [{'name': f, 'path': f'{prefix}/{f}', 'isDir': True} for f in folders]
+    contents += [{'name': f, 'path': f'{prefix}/{f}', 'isDir': False, 'size': 10} for f in files]
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents',
+                  match=[responses.matchers.query_param_matcher(
+                      {'bucket': BUCKET, 'path': prefix, 'teamId': WORKSPACE_ID})],
+                  body=json.dumps({'contents': contents}))
+
+
+def _mock_tree():
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/projects',
+                  body=load_json_file('tests/test_data/projects.json'))
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/datasets',
+                  body=json.dumps({'datasets': [{'_id': 'results-id', 'name': 'Analyses Results'}]}))
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/datasets/results-id/items',
+                  body=json.dumps({'folders': [{'name': 'run1', 'folderType': 'S3Folder',
+                                                's3BucketName': BUCKET, 's3Prefix': 'run1'}],
+                                   'files': []}))
+    _s3_listing('run1', ['results', 'work'], ['report.html'])
+    _s3_listing('run1/results', ['bam'], ['summary.tsv'])
+    _s3_listing('run1/results/bam', [], ['a.bam', 'b.bam'])
+    _s3_listing('run1/work', [], ['tmp.bam'])
+
+
+def _ls(*extra):
+    runner = CliRunner()
+    return runner.invoke(run_cloudos_cli, ['datasets', 'ls', 'AnalysesResults', '--apikey', APIKEY,
+                                           '--cloudos-url', CLOUDOS_URL, '--workspace-id', WORKSPACE_ID,
+                                           '--project-name', PROJECT_NAME, '--recursive', *extra])
+
+
+def test_path_matcher_kinds():
+    assert path_matcher('*.bam')('run1/results/bam/a.bam')
+    assert path_matcher('run1/*/bam')('run1/results/bam')
+    assert path_matcher('work')('run1/work')
+    assert not path_matcher('work')('run1/workdir')
+    assert path_matcher(r'^run1/results/.*\.tsv$')('run1/results/summary.tsv')
+
+
+@responses.activate
+def test_recursive_ls_lists_whole_tree():
+    _mock_tree()
+    result = _ls()
+    assert result.exit_code == 0, result.output
+    lines = [line for line in result.output.splitlines() if line.startswith('run1')]
+    assert sorted(lines) == sorted(['run1', 'run1/results', 'run1/work', 'run1/report.html',
+                                    'run1/results/bam', 'run1/results/summary.tsv',
+                                    'run1/results/bam/a.bam', 'run1/results/bam/b.bam',
+                                    'run1/work/tmp.bam'])
+    # breadth-first: shallower items come first
+    assert lines.index('run1') < lines.index('run1/results') < lines.index('run1/results/bam/a.bam')
+
+
+@responses.activate
+def test_recursive_ls_filters_and_depth(tmp_path, monkeypatch):
+    _mock_tree()
+    monkeypatch.chdir(tmp_path)
+    result = _ls('--include', '*.bam', '--exclude', 'work', '--output-format', 'ndjson')
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in (tmp_path / 'datasets_ls.ndjson').read_text().splitlines()]
+    assert sorted(r['name'] for r in records) == ['run1/results/bam/a.bam', 'run1/results/bam/b.bam']
+    assert all(r['depth'] == 4 and r['size_bytes'] == 10 for r in records)
+    # excluded folders are not crawled
+    assert not any('path=run1%2Fwork' in c.request.url or 'path=run1/work' in c.request.url
+                   for c in responses.calls)
+
+    result = _ls('--max-depth', '2', '--output-format', 'csv')
+    assert result.exit_code == 0, result.output
+    rows = (tmp_path / 'datasets_ls.csv').read_text().splitlines()
+    assert rows[0] == 'Name,Storage Path'
+    assert sorted(r.split(',')[0] for r in rows[1:]) == ['run1', 'run1/report.html', 'run1/results',
+                                                         'run1/work']
+
+
+@responses.activate
+def test_recursive_ls_fails_if_the_path_cannot_be_listed():
+    _mock_tree()
+    responses.replace(responses.GET, f'{CLOUDOS_URL}/api/v1/datasets/results-id/items',
+                      status=500, body=json.dumps({'message': 'Internal error'}))
+    result = _ls()
+    assert result.exit_code != 0
+    assert 'Failed to list files' in str(result.exception)
@@ -0,0 +1,163 @@
+"""Pytests for the local SQLite job index and 'job list --from-index'"""
+import json
+import os
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos, job_matcher
+from cloudos_cli.jobs.index import JobIndex, index_path, utc_time
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _job(i, updated_day, status='completed', project='proj-a', archived=False, **extra):
+    job = {
+        '_id': f'job{i}',
+        'name': f'run-{i}',
+        'status': status,
+        'createdAt': f'2024-01-{(i % 28) + 1:02d}T10:00:00.000Z',
+        'updatedAt': f'2024-02-{updated_day:02d}T10:{i // 60 % 60:02d}:{i % 60:02d}.000Z',
+        'startTime': f'2024-01-{(i % 28) + 1:02d}T10:00:00.000Z',
+        'endTime': f'2024-01-{(i % 28) + 1:02d}T10:{i % 60:02d}:00.000Z',
+        'project': {'name': project},
+        'workflow': {'name': 'wf'},
+        'user': {'id': 'u1', 'name': 'Ada', 'surname': 'Lovelace', 'username': 'ada'},
+        'archived': {'status': archived},
+        'realInstancesExecutionCost': i * 100,
+        'heavy': 'x' * 100
+    }
+    job.update(extra)
+    return job
+
+
+def _mock_api(active, archived=()):
+    """Serve jobs sorted by descending updatedAt, recording every page requested."""
+    requested = []
+
+    def callback(request):
+        jobs = archived if request.params['archived.status'] == 'true' else active
+        assert request.params['sort'] == '-updatedAt'
+        jobs = sorted(jobs, key=lambda j: j['updatedAt'], reverse=True)
+        page = int(request.params['page'])
+        limit = int(request.params['limit'])
+        requested.append((request.params['archived.status'], page))
+        body = {'jobs': jobs[(page - 1) * limit:page * limit],
+                'paginationMetadata': {'Pagination-Count': len(jobs),
+                                       'Pagination-Page': page,
+                                       'Pagination-Limit': limit}}
+        return 200, {}, json.dumps(body)
+    responses.add_callback(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/users/me',
+                  json={'id': 'u1'}, status=200)
+    return requested
+
+
+def test_utc_time_normalises_offsets_and_dates():
+    assert utc_time('2024-03-01T12:00:00+02:00') == '2024-03-01T10:00:00.000Z'
+    assert utc_time('2024-03-01') == '2024-03-01T00:00:00.000Z'
+    assert utc_time('2024-03-01', end_of_day=True) == '2024-03-02T00:00:00.000Z'
+    assert utc_time('not a date') is None
+
+
+@responses.activate
+def test_sync_stops_paging_at_the_watermark():
+    active = [_job(i, updated_day=1) for i in range(250)]
+    requested = _mock_api(active, archived=[_job(900, updated_day=1, archived=True)])
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    with JobIndex.for_workspace(WORKSPACE_ID) as index:
+        first = index.sync(cl, WORKSPACE_ID, verify=True)
+        assert first['fetched'] == 251
+        assert first['watermark'] == '2024-02-01T10:15:00.000Z'
+        assert index.get_meta('user_id') == 'u1'
+
+        requested.clear()
+        active[3] = _job(3, updated_day=5, status='failed')
+        active.append(_job(250, updated_day=6, status='running'))
+        second = index.sync(cl, WORKSPACE_ID, verify=True)
+        # Only the first page of each pass is needed to reach the watermark
+        assert requested == [('false', 1), ('true', 1)]
+        assert second['total'] == 252
+        assert second['watermark'] == '2024-02-06T10:04:10.000Z'
+        assert index.count(status='failed') == 1
+        assert index.count(archived=True) == 1
+
+
+@responses.activate
+def test_incremental_sync_does_not_fetch_pages_past_the_watermark():
+    active = [_job(i, updated_day=1) for i in range(1200)]
+    requested = _mock_api(active)
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    with JobIndex.for_workspace(WORKSPACE_ID) as index:
+        index.sync(cl, WORKSPACE_ID, verify=True)
+        requested.clear()
+        for i in range(250):
+            active[i] = _job(i, updated_day=2 + i % 20, status='failed')
+        second = index.sync(cl, WORKSPACE_ID, verify=True)
+        # The watermark is crossed on the third page: no page is prefetched after it
+        assert requested == [('false', 1), ('false', 2), ('false', 3), ('true', 1)]
+        # The 250 updated jobs, and the job at the watermark read again
+        assert second['fetched'] == 251
+        assert index.count(status='failed') == 250
+
+
+def test_query_filters():
+    with JobIndex(os.path.join(os.environ['CLOUDOS_INDEX_DIR'], 'test.db')) as index:
+        index.upsert([_job(i, updated_day=1, status='failed' if i % 3 == 0 else 'completed',
+                           project='proj-b' if i < 10 else 'proj-a') for i in range(28)])
+        assert index.count(archived=False) == 28
+        assert index.count(status='FAILED') == 10
+        assert index.count(project='proj-b', status='failed') == 4
+        assert index.count(owner='Ada Lovelace') == index.count(owner='ada') == 28
+        assert [j['_id'] for j in index.query(limit=2)] == ['job27', 'job26']
+        assert [j['_id'] for j in index.query(limit=2, offset=26)] == ['job1', 'job0']
+        assert index.count(since='2024-01-10', until='2024-01-12') == 3
+        assert index.count(job_name='RUN-1') == 11
+        assert index.count(name_regex=r'^run-2\d$') == 8
+        assert index.count(min_cost=20, max_cost=25) == 6
+        assert index.count(min_runtime=25 * 60) == 3
+        assert 'heavy' not in index.query(limit=1)[0]
+
+
+def test_cost_matches_the_online_filter():
+    path = os.path.join(os.environ['CLOUDOS_INDEX_DIR'], 'test.db')
+    jobs = [_job(1, updated_day=1, computeCostSpent=9000), _job(2, updated_day=1)]
+    matches = job_matcher(min_cost=5)
+    with JobIndex(path) as index:
+        index.upsert(jobs)
+        assert [j['_id'] for j in index.query(min_cost=5)] == [j['_id'] for j in jobs if matches(j)]
+        # Indexes written by version 1 stored computeCostSpent: it is replaced on open
+        with index.conn:
+            index.conn.execute("UPDATE jobs SET cost = 90 WHERE id = 'job1'")
+            index.conn.execute("UPDATE meta SET value = '1' WHERE key = 'schema_version'")
+    with JobIndex(path) as index:
+        assert index.count(min_cost=5) == 0
+        assert index.get_meta('schema_version') == '2'
+
+
+def test_list_from_index_is_answered_offline(tmp_path):
+    with JobIndex.for_workspace(WORKSPACE_ID) as index:
+        index.upsert([_job(i, updated_day=1, status='failed' if i % 2 else 'completed')
+                      for i in range(20)])
+    runner = CliRunner()
+    result = runner.invoke(run_cloudos_cli, [
+        'job', 'list', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WORKSPACE_ID, '--from-index', '--filter-status', 'failed',
+        '--since', '2024-01-05', '--output-format', 'json',
+        '--output-basename', str(tmp_path / 'jobs')])
+    assert result.exit_code == 0, result.output
+    with open(tmp_path / 'jobs.json') as jobs_file:
+        jobs = json.load(jobs_file)
+    assert [j['_id'] for j in jobs] == ['job19', 'job17', 'job15', 'job13', 'job11', 'job9',
+                                        'job7', 'job5']
+
+
+def test_list_from_index_requires_sync():
+    runner = CliRunner()
+    result = runner.invoke(run_cloudos_cli, [
+        'job', 'list', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WORKSPACE_ID, '--from-index'])
+    assert result.exit_code == 1
+    assert 'cloudos job sync' in result.output
+    assert not os.path.exists(index_path(WORKSPACE_ID))
@@ -0,0 +1,101 @@
+"""Pytests for the NDJSON and Parquet job list exports"""
+import json
+import threading
+import pytest
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import JOB_LIST_COLUMNS
+from cloudos_cli.jobs.export import job_record, write_ndjson, write_parquet
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _job(i):
+    return {'_id': f'job{i}', 'name': f'sample-{i}', 'status': 'completed',
+            'user': {'name': 'Ada', 'surname': 'Lovelace', 'id': 'u1'},
+            'project': {'name': 'research'},
+            'realInstancesExecutionCost': i * 10,
+            'startTime': '2024-01-01T00:00:00.000Z',
+            'endTime': '2024-01-01T01:00:00.000Z',
+            'batch': {'enabled': True, 'jobQueue': {'id': 'q1', 'name': 'queue'}},
+            'extra': {'not': 'exported'}}
+
+
+def _mock_jobs(n_jobs):
+    requested = []
+    lock = threading.Lock()
+
+    def callback(request):
+        page = int(request.params['page'])
+        limit = int(request.params['limit'])
+        with lock:
+            requested.append(page)
+        start = (page - 1) * limit
+        body = {'jobs': [_job(i) for i in range(start, min(start + limit, n_jobs))],
+                'paginationMetadata': {'Pagination-Count': n_jobs, 'Pagination-Page': page,
+                                       'Pagination-Limit': limit}}
+        return 200, {}, json.dumps(body)
+    responses.add_callback(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+    return requested
+
+
+def test_job_record_has_fixed_columns():
+    record = job_record(_job(3))
+    assert list(record) == JOB_LIST_COLUMNS
+    assert record['user.name'] == 'Ada' and record['project.name'] == 'research'
+    assert record['batch.jobQueue'] == 'q1'
+    assert record['realInstancesExecutionCost'] == 30
+    assert record['revision.commit'] is None
+    assert list(job_record({})) == JOB_LIST_COLUMNS
+
+
+def test_write_ndjson_streams_records(tmp_path):
+    outfile = tmp_path / 'jobs.ndjson'
+    assert write_ndjson((_job(i) for i in range(3)), str(outfile)) == 3
+    lines = [json.loads(line) for line in outfile.read_text().splitlines()]
+    assert [line['_id'] for line in lines] == ['job0', 'job1', 'job2']
+    assert all(list(line) == JOB_LIST_COLUMNS for line in lines)
+    write_ndjson([_job(0)], str(outfile), all_fields=True)
+    assert json.loads(outfile.read_text()) == _job(0)
+
+
+def test_write_parquet_uses_fixed_schema(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    outfile = tmp_path / 'jobs.parquet'
+    assert write_parquet((_job(i) for i in range(25)), str(outfile), row_group_size=10) == 25
+    parquet = pq.ParquetFile(str(outfile))
+    assert parquet.schema_arrow.names == JOB_LIST_COLUMNS
+    assert parquet.num_row_groups == 3
+    table = parquet.read()
+    assert table.column('_id').to_pylist()[-1] == 'job24'
+    assert table.column('batch.enabled').to_pylist()[0] is True
+    assert str(table.schema.field('startTime').type) == 'timestamp[ms, tz=UTC]'
+
+
+@responses.activate
+def test_job_list_ndjson_output(tmp_path):
+    requested = _mock_jobs(250)
+    outfile = tmp_path / 'joblist'
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'list', '--apikey', APIKEY, '--cloudos-url', CLOUDOS_URL,
+        '--workspace-id', WORKSPACE_ID, '--last-n-jobs', 'all',
+        '--output-format', 'ndjson', '--output-basename', str(outfile)])
+    assert result.exit_code == 0, result.output
+    assert 'Job list collected with a total of 250 jobs.' in result.output
+    lines = (tmp_path / 'joblist.ndjson').read_text().splitlines()
+    assert len(lines) == 250
+    assert json.loads(lines[-1])['_id'] == 'job249'
+    assert sorted(requested) == [1, 2, 3]
+
+
+def test_job_list_parquet_requires_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr('cloudos_cli.jobs.cli.parquet_available', lambda: False)
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'list', '--apikey', APIKEY, '--cloudos-url', CLOUDOS_URL,
+        '--workspace-id', WORKSPACE_ID, '--output-format', 'parquet',
+        '--output-basename', str(tmp_path / 'joblist')])
+    assert result.exit_code == 1
+    assert 'requires pyarrow' in result.output
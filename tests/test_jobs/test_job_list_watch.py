@@ -0,0 +1,125 @@
+"""Pytests for the live job list with delta refreshes"""
+from unittest import mock
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos, JobListQuery
+from cloudos_cli.jobs.watch import JobListWatcher, watch_job_list
+from cloudos_cli.utils.details import _build_job_table, COLUMN_CONFIGS
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _populate(workspace, n_jobs):
+    """Add n_jobs completed jobs: job000, job001..."""
+    for i in range(n_jobs):
+        workspace.add(f'job{i:03d}', 'completed')
+    return workspace
+
+
+def _watcher(workspace, limit=10, **params):
+    query = JobListQuery(WORKSPACE_ID, {'teamId': WORKSPACE_ID, 'archived.status': 'false', **params})
+    return JobListWatcher(Cloudos(CLOUDOS_URL, APIKEY, None), WORKSPACE_ID, query, limit=limit)
+
+
+def _ids(watcher):
+    return [job['_id'] for job in watcher.view()]
+
+
+@responses.activate
+def test_refresh_only_reads_jobs_updated_since_last_one(fake_workspace):
+    workspace = _populate(fake_workspace, 300)
+    workspace.mock(CLOUDOS_URL)
+    watcher = _watcher(workspace)
+    assert len(watcher.refresh()) == 10
+    assert _ids(watcher) == [f'job{i}' for i in range(299, 289, -1)]
+
+    workspace.requests.clear()
+    workspace.set_status('job295', 'failed')
+    workspace.add('job300', 'running')
+    workspace.set_status('job010', 'aborted')
+    assert sorted(watcher.refresh()) == ['job295', 'job300']
+    # One page of the jobs updated since the previous refresh
+    assert len(workspace.requests) == 1
+    assert workspace.requests[0]['sort'] == '-updatedAt'
+    assert _ids(watcher) == ['job300'] + [f'job{i}' for i in range(299, 290, -1)]
+    assert watcher.jobs['job295']['status'] == 'failed'
+
+    workspace.requests.clear()
+    assert watcher.refresh() == []
+    assert len(workspace.requests) == 1
+
+
+@responses.activate
+def test_jobs_leaving_the_status_filter_are_removed(fake_workspace):
+    workspace = _populate(fake_workspace, 5)
+    workspace.add('run1', 'running')
+    workspace.add('run2', 'running')
+    workspace.mock(CLOUDOS_URL)
+    watcher = _watcher(workspace, status='running')
+    watcher.refresh()
+    assert _ids(watcher) == ['run2', 'run1']
+
+    workspace.set_status('run1', 'completed')
+    workspace.add('run3', 'running')
+    assert sorted(watcher.refresh()) == ['run1', 'run3']
+    assert _ids(watcher) == ['run3', 'run2']
+    # The status filter is not sent with the delta requests
+    assert 'status' not in workspace.requests[-1]
+
+
+@responses.activate
+def test_older_matching_jobs_fill_the_places_of_removed_ones(fake_workspace):
+    workspace = fake_workspace
+    for i in range(15):
+        workspace.add(f'run{i:02d}', 'running')
+    workspace.mock(CLOUDOS_URL)
+    watcher = _watcher(workspace, status='running')
+    watcher.refresh()
+    assert _ids(watcher) == [f'run{i:02d}' for i in range(14, 4, -1)]
+
+    for job_id in ['run14', 'run10', 'run07']:
+        workspace.set_status(job_id, 'completed')
+    assert sorted(watcher.refresh()) == ['run02', 'run03', 'run04', 'run07', 'run10', 'run14']
+    assert _ids(watcher) == [f'run{i:02d}' for i in [13, 12, 11, 9, 8, 6, 5, 4, 3, 2]]
+
+    workspace.requests.clear()
+    assert watcher.refresh() == []
+    # Nothing was removed, so the jobs are not listed again
+    assert len(workspace.requests) == 1
+
+
+def test_rows_of_unchanged_jobs_are_reused():
+    jobs = [{'_id': 'a', 'name': 'a', 'status': 'running', 'updatedAt': '1'},
+            {'_id': 'b', 'name': 'b', 'status': 'running', 'updatedAt': '1'}]
+    row_cache = {}
+    with mock.patch('cloudos_cli.utils.details._build_job_row_values',
+                    return_value=['x', 'y']) as build:
+        _build_job_table(jobs, CLOUDOS_URL, 120, ['status', 'name'], COLUMN_CONFIGS, row_cache)
+        jobs[1] = {**jobs[1], 'status': 'completed', 'updatedAt': '2'}
+        _build_job_table(jobs, CLOUDOS_URL, 120, ['status', 'name'], COLUMN_CONFIGS, row_cache)
+    assert [call.args[0]['_id'] for call in build.call_args_list] == ['a', 'b', 'b']
+
+
+@responses.activate
+def test_watch_job_list_renders_every_refresh(fake_workspace):
+    workspace = _populate(fake_workspace, 3)
+    workspace.mock(CLOUDOS_URL)
+    rendered = []
+    with mock.patch('cloudos_cli.utils.polling.time') as clock:
+        clock.monotonic.return_value = 0
+        clock.sleep.side_effect = lambda seconds: workspace.set_status('job001', 'failed')
+        watch_job_list(_watcher(workspace), lambda jobs, line: rendered.append(
+            [job['status'] for job in jobs]), interval=5, max_refreshes=2)
+    assert rendered == [['completed'] * 3, ['completed', 'failed', 'completed']]
+    assert [call.args for call in clock.sleep.call_args_list] == [(5,)]
+
+
+def test_watch_requires_stdout():
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'list', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WORKSPACE_ID, '--watch', '--output-format', 'csv'])
+    assert result.exit_code == 1
+    assert '--watch can only be used with --output-format=stdout' in result.output
@@ -0,0 +1,118 @@
+"""Pytests for downloading the log files of jobs"""
+import os
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from responses import matchers
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.jobs.logs import LogStorage, MirrorLogStorage, download_job_logs, LOGS_MANIFEST
+
+CLOUDOS_URL = "https://cloudos.lifebit.ai"
+APIKEY = "vnoiweur89u2ongs"
+WS_ID = "workspace123"
+BUCKET = "bucketname"
+STATUSES = {"done1": "completed", "live1": "running"}
+LOG_FILES = {".nextflow.log": b"nextflow log\n" * 100, "stdout.txt": b"hello\n", "trace.txt": b"task\n"}
+
+
+class LocalStorage(LogStorage):
+    """Stand-in for the bucket, recording the objects read."""
+
+    def __init__(self):
+        self.read = []
+
+    def iter_chunks(self, uri, chunk_size=1024):
+        self.read.append(uri)
+        content = LOG_FILES[uri.rsplit('/', 1)[-1]]
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+
+def _mock_jobs():
+    for job_id, status in STATUSES.items():
+        responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/jobs/{job_id}",
+                      json={"_id": job_id, "name": f"name-{job_id}", "status": status, "team": WS_ID,
+                            "logs": {"s3BucketName": BUCKET, "s3Prefix": f"{job_id}/logs"}})
+        responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents",
+                      match=[matchers.query_param_matcher(dict(bucket=BUCKET, path=f"{job_id}/logs",
+                                                                teamId=WS_ID))],
+                      json={"contents": [{"name": name, "path": f"{job_id}/logs/{name}", "isDir": False}
+                                         for name in LOG_FILES]})
+
+
+def _job_requests():
+    return [call for call in responses.calls if '/api/v1/jobs/' in call.request.url]
+
+
+@responses.activate
+def test_finished_jobs_are_only_downloaded_once(tmp_path):
+    _mock_jobs()
+    storage = LocalStorage()
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    summaries = list(download_job_logs(cl, WS_ID, list(STATUSES), str(tmp_path), storage=storage,
+                                       max_workers=2, chunk_size=64))
+    assert [s["job_id"] for s in summaries] == list(STATUSES)
+    assert not any(s["cached"] for s in summaries)
+    for job_id in STATUSES:
+        for name, content in LOG_FILES.items():
+            assert (tmp_path / job_id / name).read_bytes() == content
+        assert (tmp_path / job_id / LOGS_MANIFEST).exists()
+    assert len(storage.read) == 6
+
+    responses.calls.reset()
+    storage.read.clear()
+    summaries = list(download_job_logs(Cloudos(CLOUDOS_URL, APIKEY, None), WS_ID, list(STATUSES),
+                                       str(tmp_path), storage=storage))
+    assert [s["cached"] for s in summaries] == [True, False]
+    # Nothing is requested for the completed job, the running one is downloaded again
+    assert [call.request.path_url.split('?')[0] for call in _job_requests()] == ["/api/v1/jobs/live1"]
+    assert all("live1" in uri for uri in storage.read)
+
+
+class FailingStorage(LocalStorage):
+    def iter_chunks(self, uri, chunk_size=1024):
+        yield b"partial"
+        raise ConnectionError("connection reset")
+
+
+@responses.activate
+def test_failed_downloads_leave_no_partial_files(tmp_path):
+    _mock_jobs()
+    summary, = download_job_logs(Cloudos(CLOUDOS_URL, APIKEY, None), WS_ID, ["done1"], str(tmp_path),
+                                 storage=FailingStorage())
+    assert summary["error_type"] == "ConnectionError"
+    assert os.listdir(tmp_path / "done1") == []
+
+
+def test_mirror_paths_of_s3_and_azure_objects(tmp_path):
+    storage = MirrorLogStorage(str(tmp_path))
+    assert storage.local_path(f"s3://{BUCKET}/done1/logs/stdout.txt") == str(
+        tmp_path / BUCKET / "done1" / "logs" / "stdout.txt")
+    assert storage.local_path("az://account.blob.core.windows.net/cromwell/done1/logs/stdout.txt") == str(
+        tmp_path / "cromwell" / "done1" / "logs" / "stdout.txt")
+
+
+@responses.activate
+def test_cli_downloads_from_the_mirror(tmp_path):
+    _mock_jobs()
+    mirror = tmp_path / "mirror" / BUCKET / "done1" / "logs"
+    mirror.mkdir(parents=True)
+    for name, content in LOG_FILES.items():
+        (mirror / name).write_bytes(content)
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'logs', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-ids', 'done1,live1', '--download', str(tmp_path / "logs"),
+        '--mirror-root', str(tmp_path / "mirror")])
+    # The logs of live1 are not in the mirror
+    assert result.exit_code == 1, result.output
+    assert 'done1 (completed): 3 files' in result.output
+    assert '1 jobs could not be downloaded' in result.output
+    assert (tmp_path / "logs" / "done1" / "stdout.txt").read_bytes() == b"hello\n"
+
+
+def test_cli_download_requires_a_mirror(tmp_path):
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'logs', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-id', 'done1', '--download', str(tmp_path)])
+    assert result.exit_code == 2
+    assert '--download requires --mirror-root' in result.output
@@ -0,0 +1,121 @@
+"""Pytests for the prepared job list query used by the interactive pagination"""
+import json
+import threading
+from unittest import mock
+import pytest
+import responses
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.jobs.job import create_api_pagination_callback
+from cloudos_cli.utils.errors import BadRequestException
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _mock_jobs(n_jobs, fail_pages=()):
+    """Serve n_jobs jobs honouring page and limit, recording every request."""
+    requested = []
+    lock = threading.Lock()
+
+    def callback(request):
+        page = int(request.params['page'])
+        limit = int(request.params['limit'])
+        with lock:
+            requested.append(dict(request.params))
+        if page in fail_pages:
+            fail_pages.remove(page)
+            return 400, {}, json.dumps({'message': 'boom'})
+        start = (page - 1) * limit
+        jobs = [{'_id': f'job{i}'} for i in range(start, min(start + limit, n_jobs))]
+        body = {'jobs': jobs, 'paginationMetadata': {'Pagination-Count': n_jobs,
+                                                     'Pagination-Page': page,
+                                                     'Pagination-Limit': limit}}
+        return 200, {}, json.dumps(body)
+    responses.add_callback(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+    return requested
+
+
+def _callback(cl, **filters):
+    args = dict(filter_status=None, filter_job_name=None, filter_project=None,
+                filter_workflow=None, filter_job_id=None, filter_only_mine=False,
+                filter_owner=None, filter_queue=None, last=False)
+    args.update(filters)
+    return create_api_pagination_callback(cl, WORKSPACE_ID, 10, False, True, **args)
+
+
+@responses.activate
+def test_filters_are_resolved_once_for_all_pages():
+    requested = _mock_jobs(50)
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    with mock.patch.object(Cloudos, 'get_project_id_from_name', return_value='proj1') as resolve:
+        fetch_page = _callback(cl, filter_project='my-project', filter_status='completed')
+        pages = [fetch_page(n) for n in (2, 3, 2, 1)]
+    assert resolve.call_count == 1
+    assert [p['jobs'][0]['_id'] for p in pages] == ['job10', 'job20', 'job10', 'job0']
+    assert all(r['project.id'] == 'proj1' and r['status'] == 'completed' for r in requested)
+
+
+@responses.activate
+def test_prefetched_page_is_not_requested_again():
+    requested = _mock_jobs(50)
+    fetch_page = _callback(Cloudos(CLOUDOS_URL, APIKEY, None))
+    fetch_page.prefetch(2)
+    fetch_page._pages[2].result()
+    assert [r['page'] for r in requested] == ['2']
+    assert fetch_page(2)['jobs'][0]['_id'] == 'job10'
+    assert [r['page'] for r in requested] == ['2']
+
+
+@responses.activate
+def test_only_neighbour_pages_are_kept():
+    _mock_jobs(100)
+    fetch_page = _callback(Cloudos(CLOUDOS_URL, APIKEY, None))
+    for n in (1, 2, 3, 4, 5):
+        fetch_page(n)
+    assert set(fetch_page._pages) == {4, 5}
+    fetch_page.prefetch(6)
+    fetch_page(6)
+    assert set(fetch_page._pages) == {5, 6}
+
+
+@responses.activate
+def test_failed_page_is_retried_on_next_call():
+    _mock_jobs(50, fail_pages=[3])
+    fetch_page = _callback(Cloudos(CLOUDOS_URL, APIKEY, None))
+    with pytest.raises(BadRequestException):
+        fetch_page(3)
+    assert fetch_page(3)['jobs'][0]['_id'] == 'job20'
+
+
+@responses.activate
+def test_close_cancels_pages_not_fetched_yet():
+    _mock_jobs(100)
+    fetch_page = _callback(Cloudos(CLOUDOS_URL, APIKEY, None))
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch(page_num):
+        started.set()
+        release.wait(5)
+        return {'jobs': [], 'pagination_metadata': {}}
+    with mock.patch.object(fetch_page, '_fetch', side_effect=slow_fetch):
+        fetch_page.prefetch(2)
+        started.wait(5)
+        fetch_page.prefetch(3)
+        fetch_page.close()
+        assert fetch_page._pages[3].cancelled()
+        release.set()
+        assert fetch_page._pages[2].result() == {'jobs': [], 'pagination_metadata': {}}
+
+
+def test_pagination_exit_closes_the_fetcher():
+    from cloudos_cli.utils.details import create_job_list_table
+    fetch_page = mock.Mock()
+    metadata = {'Pagination-Count': 30, 'Pagination-Page': 1, 'Pagination-Limit': 10}
+    with mock.patch('sys.stdin.isatty', return_value=True), \
+            mock.patch('builtins.input', return_value='q'):
+        create_job_list_table([{'_id': 'job0', 'status': 'completed'}], CLOUDOS_URL,
+                              metadata, fetch_page_callback=fetch_page)
+    fetch_page.prefetch.assert_called_once_with(2)
+    fetch_page.close.assert_called_once_with()
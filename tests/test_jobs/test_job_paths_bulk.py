@@ -0,0 +1,69 @@
+"""Pytests for resolving the logs/results/workdir of many jobs at once"""
+import json
+import responses
+from responses import matchers
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.jobs.paths import iter_job_paths
+
+CLOUDOS_URL = "https://cloudos.lifebit.ai"
+APIKEY = "vnoiweur89u2ongs"
+WS_ID = "workspace123"
+BUCKET = "bucketname"
+JOBS = ["job1", "job2", "job3"]
+
+
+def _mock_jobs():
+    for job_id in JOBS[:2]:
+        responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/jobs/{job_id}",
+                      json={"_id": job_id, "name": f"name-{job_id}", "status": "completed",
+                            "team": WS_ID, "logs": {"s3BucketName": BUCKET, "s3Prefix": job_id},
+                            "results": {"s3BucketName": BUCKET, "s3Prefix": f"{job_id}/results"}})
+        responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents",
+                      match=[matchers.query_param_matcher(dict(bucket=BUCKET, path=f"{job_id}/results",
+                                                                teamId=WS_ID))],
+                      json={"contents": [{"name": "results", "isDir": True,
+                                          "path": f"{job_id}/results"}]})
+    responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/jobs/job3", status=400,
+                  json={"message": "Job not found"})
+
+
+def _requests(path):
+    return [call for call in responses.calls if path in call.request.url]
+
+
+@responses.activate
+def test_records_keep_order_and_report_errors():
+    _mock_jobs()
+    records = list(iter_job_paths(Cloudos(CLOUDOS_URL, APIKEY, None), WS_ID, JOBS, 'results',
+                                  max_workers=2))
+    assert [r["job_id"] for r in records] == JOBS
+    assert records[0] == {"job_id": "job1", "name": "name-job1", "status": "completed",
+                          "results": f"s3://{BUCKET}/job1/results"}
+    assert records[2]["error_type"] == "BadRequestException"
+    assert "results" not in records[2]
+    # Every job document is requested once, by the job and its location
+    assert all(len(_requests(f"/api/v1/jobs/{job_id}")) == 1 for job_id in JOBS[:2])
+
+
+@responses.activate
+def test_cli_writes_one_ndjson_line_per_job(tmp_path):
+    _mock_jobs()
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'results', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-ids', 'job1,job2,job3,job1',
+        '--output-basename', str(tmp_path / 'paths')])
+    assert result.exit_code == 0, result.output
+    assert '1 of them could not be resolved' in result.output
+    lines = [json.loads(line) for line in (tmp_path / 'paths.ndjson').read_text().splitlines()]
+    assert [line["job_id"] for line in lines] == JOBS
+    assert lines[1]["results"] == f"s3://{BUCKET}/job2/results"
+
+
+def test_cli_rejects_job_id_with_job_ids():
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'logs', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-id', 'job1', '--job-ids', 'job2,job3'])
+    assert result.exit_code != 0
+    assert '--job-id cannot be combined with --job-ids or job filters' in result.output
@@ -0,0 +1,97 @@
+"""Pytests for the recursive listing of the results of a job"""
+import json
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.jobs.paths import iter_results_tree
+
+CLOUDOS_URL = "https://cloudos.lifebit.ai"
+APIKEY = "vnoiweur89u2ongs"
+WS_ID = "workspace123"
+JOB = "jobid123"
+BUCKET = "bucketname"
+PREFIX = "path/to"
+TREE = {
+    PREFIX: [{"name": "results", "path": f"{PREFIX}/results", "isDir": True}],
+    f"{PREFIX}/results": [{"name": "summary.txt", "path": f"{PREFIX}/results/summary.txt",
+                           "isDir": False, "size": 10},
+                          {"name": "align", "path": f"{PREFIX}/results/align", "isDir": True}],
+    f"{PREFIX}/results/align": [{"name": "s1.bam", "path": f"{PREFIX}/results/align/s1.bam",
+                                 "isDir": False, "size": 2048},
+                                {"name": "s1.log.txt", "path": f"{PREFIX}/results/align/s1.log.txt",
+                                 "isDir": False, "size": 5}]
+}
+
+
+def _mock_results():
+    responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/jobs/{JOB}",
+                  json={"_id": JOB, "name": "my-job", "status": "completed", "team": WS_ID,
+                        "logs": {"s3BucketName": BUCKET, "s3Prefix": PREFIX},
+                        "results": {"s3BucketName": BUCKET, "s3Prefix": PREFIX}})
+
+    def contents(request):
+        return 200, {}, json.dumps({"contents": TREE[request.params["path"]]})
+    responses.add_callback(responses.GET, f"{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents",
+                           callback=contents)
+
+
+def _results_tree(*args):
+    return CliRunner().invoke(run_cloudos_cli, [
+        'job', 'results', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-id', JOB, '--tree', *args])
+
+
+@responses.activate
+def test_tree_walks_every_directory():
+    _mock_results()
+    entries = list(iter_results_tree(Cloudos(CLOUDOS_URL, APIKEY, None), WS_ID, JOB, max_workers=2))
+    uris = {entry["uri"]: entry["size"] for entry in entries}
+    base = f"s3://{BUCKET}/{PREFIX}/results"
+    assert uris == {f"{base}/summary.txt": 10, f"{base}/align": None,
+                    f"{base}/align/s1.bam": 2048, f"{base}/align/s1.log.txt": 5}
+    assert {entry["path"]: entry["depth"] for entry in entries}["align/s1.bam"] == 2
+
+
+@responses.activate
+def test_cli_filters_and_totals():
+    _mock_results()
+    result = _results_tree('--include', '*.txt')
+    assert result.exit_code == 0, result.output
+    assert f"s3://{BUCKET}/{PREFIX}/results/align/s1.log.txt" in result.output
+    assert "s1.bam" not in result.output
+    assert "Total: 15.0 B (15 bytes) in 2 files" in result.output
+
+
+@responses.activate
+def test_cli_max_depth_and_exclude_skip_listings():
+    _mock_results()
+    result = _results_tree('--max-depth', '1')
+    assert result.exit_code == 0, result.output
+    assert "Total: 10.0 B (10 bytes) in 1 files" in result.output
+    result = _results_tree('--exclude', 'align')
+    assert "Total: 10.0 B (10 bytes) in 1 files" in result.output
+    listed = [call.request.params["path"] for call in responses.calls
+              if "bucket-contents" in call.request.url]
+    assert f"{PREFIX}/results/align" not in listed
+
+
+@responses.activate
+def test_cli_fails_if_the_results_cannot_be_listed():
+    responses.add(responses.GET, url=f"{CLOUDOS_URL}/api/v1/jobs/{JOB}",
+                  json={"_id": JOB, "name": "my-job", "status": "completed", "team": WS_ID,
+                        "results": {"s3BucketName": BUCKET, "s3Prefix": PREFIX}})
+    responses.add(responses.GET, f"{CLOUDOS_URL}/api/v1/data-access/s3/bucket-contents",
+                  status=500, json={"message": "Internal error"})
+    result = _results_tree()
+    assert result.exit_code != 0
+    assert "Total:" not in result.output
+    assert "Failed to retrieve results" in str(result.exception)
+
+
+def test_cli_tree_options_require_tree():
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'results', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WS_ID, '--job-id', JOB, '--include', '*.bam'])
+    assert result.exit_code != 0
+    assert '--include, --exclude and --max-depth can only be used with --tree' in result.output
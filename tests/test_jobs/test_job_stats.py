@@ -0,0 +1,127 @@
+"""Pytests for the job statistics aggregation and 'job stats'"""
+import json
+import numpy as np
+import pytest
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.jobs.index import JobIndex
+from cloudos_cli.jobs.stats import (expected_runtime, format_duration, jobs_frame, job_stats,
+                                   stats_records)
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+def _job(i, workflow, status, minutes, cost, day=1, project='proj'):
+    return {
+        '_id': f'job{i}',
+        'name': f'run-{i}',
+        'status': status,
+        'workflow': {'name': workflow},
+        'project': {'name': project},
+        'createdAt': f'2024-05-{day:02d}T08:00:00.000Z',
+        'startTime': f'2024-05-{day:02d}T09:00:00.000Z',
+        'endTime': (None if minutes is None else
+                    f'2024-05-{day:02d}T{9 + minutes // 60:02d}:{minutes % 60:02d}:00.000Z'),
+        'realInstancesExecutionCost': cost
+    }
+
+
+JOBS = [
+    _job(0, 'rnatoy', 'completed', 10, 100, day=9),
+    _job(1, 'rnatoy', 'completed', 20, 300, day=8),
+    _job(2, 'rnatoy', 'failed', 30, 200, day=7),
+    _job(3, 'rnatoy', 'running', None, None, day=6),
+    _job(4, 'sarek', 'completed', 120, 1000, day=5, project='other'),
+    _job(5, 'sarek', 'aborted', 5, 50, day=4, project='other'),
+    _job(6, 'sarek', 'failed', 15, 150, day=3, project='other'),
+]
+
+
+def test_stats_by_workflow():
+    stats = job_stats(jobs_frame(JOBS), ['workflow'])
+    assert list(stats['workflow']) == ['rnatoy', 'sarek']
+    rnatoy, sarek = stats_records(stats)
+    assert rnatoy['jobs'] == 4 and rnatoy['failed'] == 1
+    assert rnatoy['failure_rate'] == pytest.approx(1 / 3)
+    # Only ended jobs have a run time
+    assert rnatoy['runtime_p50'] == np.percentile([600, 1200, 1800], 50)
+    assert rnatoy['runtime_p95'] == pytest.approx(np.percentile([600, 1200, 1800], 95))
+    assert rnatoy['total_cost'] == pytest.approx(6.0)
+    assert rnatoy['mean_cost'] == pytest.approx(2.0)
+    assert sarek['aborted'] == 1
+    assert sarek['runtime_p95'] == pytest.approx(np.percentile([7200, 300, 900], 95))
+
+
+def test_stats_by_several_fields_and_missing_values():
+    jobs = JOBS + [{'_id': 'bare', 'status': 'running'}]
+    stats = job_stats(jobs_frame(jobs), ['project', 'workflow'])
+    assert stats[['project', 'workflow', 'jobs']].values.tolist() == [
+        ['proj', 'rnatoy', 4], ['other', 'sarek', 3], ['-', '-', 1]]
+    bare = stats_records(stats)[-1]
+    assert bare['failure_rate'] is None and bare['total_cost'] is None
+    assert bare['runtime_p50'] is None
+
+
+def test_stats_rejects_unknown_groups():
+    with pytest.raises(ValueError, match='Cannot group jobs by pipeline'):
+        job_stats(jobs_frame(JOBS), ['pipeline'])
+
+
+def test_jobs_frame_stops_reading_before_since():
+    read = []
+
+    def jobs():
+        for job in JOBS:
+            read.append(job['_id'])
+            yield job
+    frame = jobs_frame(jobs(), since='2024-05-05', until='2024-05-08')
+    assert list(frame['id']) == ['job1', 'job2', 'job3', 'job4']
+    assert read == ['job0', 'job1', 'job2', 'job3', 'job4', 'job5']
+
+
+def test_expected_runtime_from_index():
+    assert expected_runtime(WORKSPACE_ID, 'rnatoy') is None
+    with JobIndex.for_workspace(WORKSPACE_ID) as index:
+        index.upsert(JOBS)
+    # Only two completed rnatoy jobs: not enough for a prediction
+    assert expected_runtime(WORKSPACE_ID, 'rnatoy') is None
+    assert expected_runtime(WORKSPACE_ID, 'rnatoy', min_jobs=2) == 900
+    assert expected_runtime(WORKSPACE_ID, 'unknown', min_jobs=1) is None
+
+
+def test_format_duration():
+    assert format_duration(None) == '-'
+    assert format_duration(42.4) == '42s'
+    assert format_duration(3725) == '1h 2m 5s'
+
+
+@responses.activate
+def test_stats_command_streams_jobs_from_the_api(tmp_path):
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/jobs',
+                  json={'jobs': JOBS, 'paginationMetadata': {'Pagination-Count': len(JOBS),
+                                                             'Pagination-Page': 1,
+                                                             'Pagination-Limit': 100}},
+                  status=200)
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'stats', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WORKSPACE_ID, '--group-by', 'project', '--since', '2024-05-04',
+        '--output-format', 'json', '--output-basename', str(tmp_path / 'stats')])
+    assert result.exit_code == 0, result.output
+    with open(tmp_path / 'stats.json') as stats_file:
+        stats = json.load(stats_file)
+    assert [(s['project'], s['jobs']) for s in stats] == [('proj', 4), ('other', 2)]
+
+
+def test_stats_command_from_index():
+    with JobIndex.for_workspace(WORKSPACE_ID) as index:
+        index.upsert(JOBS)
+    result = CliRunner().invoke(run_cloudos_cli, [
+        'job', 'stats', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+        '--workspace-id', WORKSPACE_ID, '--from-index', '--filter-status', 'failed'])
+    assert result.exit_code == 0, result.output
+    assert 'Job statistics (2 jobs)' in result.output
+    assert 'rnatoy' in result.output and 'sarek' in result.output
+    assert '100.0%' in result.output
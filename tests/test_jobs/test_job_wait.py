@@ -0,0 +1,119 @@
+"""Pytests for waiting on several jobs with batched job list requests"""
+import contextlib
+from unittest import mock
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.jobs.wait import wait_jobs
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+
+
+class FakeClock:
+    """Stands for the time module: every sleep advances the clock and runs on_sleep."""
+
+    def __init__(self, on_sleep=None):
+        self.now = 0
+        self.on_sleep = on_sleep
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        if self.on_sleep is not None:
+            self.on_sleep(self.now)
+
+
+@contextlib.contextmanager
+def fake_time(on_sleep=None):
+    """Patch the time used by the polling schedule, without jitter."""
+    clock = FakeClock(on_sleep)
+    with mock.patch('cloudos_cli.utils.polling.time', clock), \
+            mock.patch('cloudos_cli.utils.polling.random.uniform', return_value=0):
+        yield clock
+
+
+def _populate(workspace, n_jobs, n_other=150):
+    """Add n_other completed jobs, then n_jobs running jobs (job0, job1...)."""
+    for i in range(n_other):
+        workspace.add(f'other{i}', 'completed')
+    for i in range(n_jobs):
+        workspace.add(f'job{i}', 'running')
+    return workspace
+
+
+@responses.activate
+def test_one_list_request_per_poll_for_many_jobs(fake_workspace):
+    workspace = _populate(fake_workspace, 200)
+    workspace.mock(CLOUDOS_URL)
+    job_ids = [f'job{i}' for i in range(200)]
+
+    def finish_some(now):
+        workspace.requests.clear()
+        for i in range(int(now // 30 - 1) * 50, int(now // 30) * 50):
+            workspace.set_status(f'job{i}', 'failed' if i == 120 else 'completed')
+    with fake_time(finish_some):
+        results = wait_jobs(Cloudos(CLOUDOS_URL, APIKEY, None), WORKSPACE_ID, job_ids,
+                            request_interval=30)
+        # After the first scan, every poll reads the 50 jobs just updated in one page
+        assert [int(r['page']) for r in workspace.requests] == [1]
+    assert workspace.status_requests == []
+    assert [r['id'] for r in results] == job_ids
+    assert [r['elapsed'] for r in results[::50]] == [30, 60, 90, 120]
+    assert results[120]['status'] == 'failed'
+    assert results[0]['runtime'] == 1800
+
+
+@responses.activate
+def test_jobs_not_listed_are_requested_one_by_one(fake_workspace):
+    workspace = _populate(fake_workspace, 3)
+    workspace.mock(CLOUDOS_URL, unlisted={'job1'})
+    workspace.set_status('job1', 'completed')
+
+    def finish(now):
+        workspace.set_status('job0', 'completed')
+        workspace.set_status('job2', 'completed')
+    with fake_time(finish):
+        results = wait_jobs(Cloudos(CLOUDOS_URL, APIKEY, None), WORKSPACE_ID,
+                            ['job0', 'job1', 'job2'])
+    assert workspace.status_requests == ['job1']
+    assert [r['elapsed'] for r in results] == [30, 0, 30]
+
+
+@responses.activate
+def test_fail_fast_and_timeout(fake_workspace):
+    workspace = _populate(fake_workspace, 3)
+    workspace.mock(CLOUDOS_URL)
+    with fake_time(lambda now: workspace.set_status('job1', 'aborted')):
+        results = wait_jobs(Cloudos(CLOUDOS_URL, APIKEY, None), WORKSPACE_ID,
+                            ['job0', 'job1', 'job2'], fail_fast=True)
+    assert [(r['status'], r['elapsed']) for r in results] == [
+        ('running', None), ('aborted', 30), ('running', None)]
+
+    with fake_time() as clock:
+        results = wait_jobs(Cloudos(CLOUDOS_URL, APIKEY, None), WORKSPACE_ID, ['job0'],
+                            wait_time=100, request_interval=30)
+    assert clock.now == 100
+    assert results == [{'id': 'job0', 'name': 'name-job0', 'status': 'running',
+                        'runtime': mock.ANY, 'elapsed': 100}]
+
+
+@responses.activate
+def test_wait_command_summary_and_exit_code(fake_workspace):
+    workspace = _populate(fake_workspace, 2)
+    workspace.mock(CLOUDOS_URL)
+
+    def finish(now):
+        workspace.set_status('job0', 'completed')
+        workspace.set_status('job1', 'failed')
+    with fake_time(finish):
+        result = CliRunner().invoke(run_cloudos_cli, [
+            'job', 'wait', '--cloudos-url', CLOUDOS_URL, '--apikey', APIKEY,
+            '--workspace-id', WORKSPACE_ID, '--job-ids', 'job0,job1'])
+    assert result.exit_code == 1
+    assert 'Job "name-job1" (ID: job1) ended with status failed after 30 seconds' in result.output
+    assert 'Job wait summary' in result.output
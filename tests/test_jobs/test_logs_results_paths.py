@@ -1,9 +1,11 @@
+from unittest import mock
 import responses
 from responses import matchers
 from cloudos_cli.clos import Cloudos
 from pytest import raises
 from cloudos_cli.utils.errors import JoBNotCompletedException, NoCloudForWorkspaceException
 from cloudos_cli.utils.cloud import find_cloud
+from cloudos_cli.utils.requests import retry_requests_get
 import pytest
 
 CLOUD_OS_URL = "https://cloudos.lifebit.ai"
@@ -94,6 +96,24 @@ def test_cloud_providers(cloud_provider, response_data, logs_obj):
     assert cloud_name == cloud_provider
 
 
+@responses.activate
+def test_azure_descriptor_is_requested_once_per_workspace():
+    responses.add(
+        responses.GET,
+        url=f"{CLOUD_OS_URL}/api/v1/cloud/azure",
+        match=[matchers.query_param_matcher(dict(teamId=WS_ID))],
+        json=FIND_CLOUD_PAYLOAD["azure"]
+    )
+    with mock.patch('cloudos_cli.utils.cloud.retry_requests_get', wraps=retry_requests_get) as get:
+        for _ in range(3):
+            cloud_name, cloud_meta, storage = find_cloud(CLOUD_OS_URL, API_KEY, WS_ID, LOGS["azure"],
+                                                         verify=False)
+    assert (cloud_name, cloud_meta["storage"]["storageAccount"]) == ("azure", "someaccountname")
+    assert storage["scheme"] == "az"
+    assert get.call_count == 1
+    assert get.call_args.kwargs["verify"] is False
+
+
 @responses.activate
 def test_cloud_no_provider():
     """Test when no cloud provider is configured"""
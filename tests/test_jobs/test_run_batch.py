@@ -0,0 +1,141 @@
+"""Pytests for 'cloudos job run-batch'"""
+import json
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.jobs.batch import read_manifest, row_parameters, row_keys
+from tests.functions_for_pytest import load_json_file
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+PROJECT_NAME = 'lifebit-testing'
+WORKFLOW_NAME = 'nf-core-deepvariant'
+
+
+def _mock_lookups():
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v3/workflows',
+                  body=load_json_file('tests/test_data/workflows.json'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/projects',
+                  body=load_json_file('tests/test_data/projects.json'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/teams/aws/v2/job-queues',
+                  body=load_json_file('tests/test_data/queue/queues.json'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/teams/aws/v2/system-job-queues',
+                  body='[]', status=200)
+
+
+def _mock_submissions():
+    counter = iter(range(1000))
+
+    def callback(request):
+        return 200, {}, json.dumps({'jobId': f'job{next(counter)}'})
+    responses.add_callback(responses.POST, f'{CLOUDOS_URL}/api/v2/jobs', callback=callback)
+
+
+def _run(manifest, output, *extra):
+    runner = CliRunner()
+    return runner.invoke(run_cloudos_cli, ['job', 'run-batch', '--apikey', APIKEY,
+                                           '--cloudos-url', CLOUDOS_URL,
+                                           '--workspace-id', WORKSPACE_ID,
+                                           '--project-name', PROJECT_NAME,
+                                           '--workflow-name', WORKFLOW_NAME,
+                                           '--manifest', str(manifest), '--output', str(output),
+                                           '--rate-limit', '0', *extra])
+
+
+def test_read_manifest_csv_and_jsonl(tmp_path):
+    csv_file = tmp_path / 'runs.csv'
+    csv_file.write_text('job_name,input,job_id\nsample1,s3://a.bam,\nsample2,s3://b.bam,abc\n')
+    jsonl_file = tmp_path / 'runs.jsonl'
+    jsonl_file.write_text('{"job_name": "sample1", "input": "s3://a.bam"}\n\n'
+                          '{"job_name": "sample2", "input": "s3://b.bam", "job_id": "abc"}\n')
+    expected = [{'job_name': 'sample1', 'input': 's3://a.bam', 'job_id': None},
+                {'job_name': 'sample2', 'input': 's3://b.bam', 'job_id': 'abc'}]
+    assert read_manifest(str(csv_file)) == expected
+    assert read_manifest(str(jsonl_file))[1] == expected[1]
+
+
+def test_row_parameters_override_shared_parameters():
+    row = {'job_name': 'sample1', 'input': 's3://a.bam', 'genome': None}
+    assert row_parameters(row, ('input=s3://default.bam', 'outdir=results')) == \
+        ('input=s3://a.bam', 'outdir=results')
+
+
+@responses.activate
+def test_run_batch_submits_rows_once_and_resumes(tmp_path):
+    _mock_lookups()
+    _mock_submissions()
+    manifest = tmp_path / 'runs.csv'
+    manifest.write_text('job_name,input,job_id\n'
+                        'sample1,s3://a.bam,\n'
+                        'sample2,s3://b.bam,\n'
+                        'sample3,s3://c.bam,existing\n')
+    output = tmp_path / 'results.jsonl'
+    result = _run(manifest, output, '-p', 'outdir=results')
+    assert result.exit_code == 0, result.output
+    assert 'Submitted: 2, failed: 0, skipped: 1' in result.output
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(r['row'] for r in records) == [1, 2]
+    assert all(r['status'] == 'submitted' and r['error'] is None for r in records)
+    posts = [json.loads(c.request.body) for c in responses.calls if c.request.method == 'POST']
+    assert sorted(p['name'] for p in posts) == ['sample1', 'sample2']
+    for p in posts:
+        assert p['project'] == '1234bc123125'
+        assert p['batch']['jobQueue'] == 'xxxxx'
+        assert {'prefix': '--', 'name': 'outdir', 'parameterKind': 'textValue',
+                'textValue': 'results'} in p['parameters']
+    # shared lookups are resolved once for the whole manifest
+    paths = [c.request.url.split('?')[0] for c in responses.calls]
+    assert paths.count(f'{CLOUDOS_URL}/api/v2/projects') == 1
+
+    # Re-running skips every row already recorded in the results file
+    responses.calls.reset()
+    result = _run(manifest, output)
+    assert result.exit_code == 0, result.output
+    assert 'Submitted: 0, failed: 0, skipped: 3' in result.output
+    assert not [c for c in responses.calls if c.request.method == 'POST']
+
+    # Rows inserted and reordered before a resume are matched by content
+    responses.calls.reset()
+    manifest.write_text('job_name,input,job_id\n'
+                        'sample0,s3://z.bam,\n'
+                        'sample2,s3://b.bam,\n'
+                        'sample1,s3://a.bam,\n')
+    result = _run(manifest, output)
+    assert result.exit_code == 0, result.output
+    assert 'Submitted: 1, failed: 0, skipped: 2' in result.output
+    posts = [json.loads(c.request.body) for c in responses.calls if c.request.method == 'POST']
+    assert [p['name'] for p in posts] == ['sample0']
+
+    # A submitted row that was edited cannot be matched: nothing is submitted
+    responses.calls.reset()
+    manifest.write_text('job_name,input,job_id\n'
+                        'sample1,s3://a2.bam,\n')
+    result = _run(manifest, output)
+    assert result.exit_code != 0
+    assert 'rows that are not in the manifest' in str(result.exception)
+    assert not [c for c in responses.calls if c.request.method == 'POST']
+
+
+def test_row_keys_identify_rows_by_content():
+    rows = [{'job_name': 'a', 'input': '1'}, {'input': '1', 'job_name': 'a'},
+            {'job_name': 'a', 'input': '1', 'job_id': 'x'}, {'job_name': 'b', 'input': '1'}]
+    keys = row_keys(rows)
+    # Identical rows are numbered, job_id is not part of the key
+    assert keys[0].endswith('-1') and keys[1] == keys[0][:-1] + '2' and keys[2] == keys[0][:-1] + '3'
+    assert keys[3] not in keys[:3]
+
+
+@responses.activate
+def test_run_batch_records_failed_rows(tmp_path):
+    _mock_lookups()
+    responses.add(responses.POST, f'{CLOUDOS_URL}/api/v2/jobs', status=400)
+    manifest = tmp_path / 'runs.jsonl'
+    manifest.write_text('{"job_name": "sample1", "input": "s3://a.bam"}\n')
+    output = tmp_path / 'results.jsonl'
+    result = _run(manifest, output)
+    assert result.exit_code == 1
+    assert 'Submitted: 0, failed: 1, skipped: 0' in result.output
+    record = json.loads(output.read_text())
+    assert record['status'] == 'failed' and record['job_id'] is None
+    assert '400' in record['error']
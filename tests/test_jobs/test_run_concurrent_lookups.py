@@ -0,0 +1,60 @@
+"""Pytests for the concurrent pre-submission lookups of 'cloudos job run'"""
+import json
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from tests.functions_for_pytest import load_json_file
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+PROJECT_NAME = 'lifebit-testing'
+WORKFLOW_NAME = 'nf-core-deepvariant'
+JOB_ID = '1223334444'
+
+
+def _mock_lookups(project_status=200):
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v3/workflows',
+                  body=load_json_file('tests/test_data/workflows.json'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v2/projects',
+                  body=load_json_file('tests/test_data/projects.json'), status=project_status)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/teams/aws/v2/job-queues',
+                  body=load_json_file('tests/test_data/queue/queues.json'), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/teams/aws/v2/system-job-queues',
+                  body='[]', status=200)
+
+
+def _run(*extra):
+    runner = CliRunner()
+    return runner.invoke(run_cloudos_cli, ['job', 'run', '--apikey', APIKEY, '--cloudos-url', CLOUDOS_URL,
+                                           '--workspace-id', WORKSPACE_ID, '--project-name', PROJECT_NAME,
+                                           '--workflow-name', WORKFLOW_NAME, *extra])
+
+
+@responses.activate
+def test_run_resolves_lookups_once_and_reports_timings():
+    _mock_lookups()
+    responses.add(responses.POST, f'{CLOUDOS_URL}/api/v2/jobs',
+                  body=json.dumps({'jobId': JOB_ID}), status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/api/v1/jobs/{JOB_ID}',
+                  body=json.dumps({'_id': JOB_ID, 'status': 'initializing'}), status=200)
+    result = _run('--verbose')
+    assert result.exit_code == 0, result.output
+    assert f'Your assigned job id is: {JOB_ID}' in result.output
+    for lookup in ('workflow', 'project', 'job queues'):
+        assert f'{lookup}: ' in result.output
+    payload = json.loads([c for c in responses.calls if c.request.method == 'POST'][0].request.body)
+    assert payload['project'] == '1234bc123125'
+    assert payload['batch']['jobQueue'] == 'xxxxx'
+    # each lookup endpoint is requested once (workflows: pagination + content)
+    paths = [c.request.url.split('?')[0] for c in responses.calls]
+    assert paths.count(f'{CLOUDOS_URL}/api/v3/workflows') == 2
+    assert paths.count(f'{CLOUDOS_URL}/api/v2/projects') == 1
+
+
+@responses.activate
+def test_run_surfaces_lookup_error():
+    _mock_lookups(project_status=400)
+    result = _run()
+    assert result.exit_code != 0
+    assert 'Server returned status 400' in str(result.exception)
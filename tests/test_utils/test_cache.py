@@ -0,0 +1,165 @@
+"""Pytests for the on-disk metadata cache"""
+import json
+import os
+import time
+from unittest import mock
+import responses
+from click.testing import CliRunner
+from cloudos_cli.__main__ import run_cloudos_cli
+from cloudos_cli.clos import Cloudos
+from cloudos_cli.utils.cache import DiskCache, get_cache, set_cache_enabled, is_cache_enabled
+
+APIKEY = 'vnoiweur89u2ongs'
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+WORKSPACE_ID = 'lv89ufc838sdig'
+PROJECT_NAME = 'lifebit-testing'
+
+
+def _key(*parts):
+    return DiskCache.make_key(CLOUDOS_URL, APIKEY, WORKSPACE_ID, *parts)
+
+
+def test_set_and_get(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set('project_id', _key('p'), 'abc123', CLOUDOS_URL, WORKSPACE_ID)
+    assert cache.get('project_id', _key('p')) == 'abc123'
+    assert cache.get('project_id', _key('other')) is None
+
+
+def test_entries_expire(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set('project_id', _key('p'), 'abc123', ttl=1)
+    cache.set('project_id', _key('q'), 'def456', ttl=-1)
+    assert cache.get('project_id', _key('q')) is None
+    time.sleep(1.1)
+    assert cache.get('project_id', _key('p')) is None
+    assert list(tmp_path.glob('*.json')) == []
+
+
+def test_entries_are_read_from_disk_once(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set('cloud', _key('azure'), {'storage': {'storageAccount': 'acc'}})
+    other_process = DiskCache(tmp_path)
+    assert other_process.get('cloud', _key('azure')) == {'storage': {'storageAccount': 'acc'}}
+    for path in tmp_path.glob('*.json'):
+        path.write_text('not json')
+    value = other_process.get('cloud', _key('azure'))
+    assert value == {'storage': {'storageAccount': 'acc'}}
+    # Values returned are copies
+    value['storage']['storageAccount'] = 'changed'
+    assert other_process.get('cloud', _key('azure'))['storage']['storageAccount'] == 'acc'
+    other_process.clear('cloud')
+    assert other_process.get('cloud', _key('azure')) is None
+
+
+def test_apikey_is_not_stored(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set('user_info', _key('me'), {'id': 1})
+    for path in tmp_path.glob('*.json'):
+        assert APIKEY not in path.read_text() and APIKEY not in path.name
+
+
+def test_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path, max_entries=2)
+    cache.set('workflow', _key('a'), 1)
+    cache.set('workflow', _key('b'), 2)
+    old = time.time() - 100
+    for i, path in enumerate(sorted(tmp_path.glob('*.json'))):
+        os.utime(path, (old + i, old + i))
+    # 'a' becomes the most recently used entry
+    cache.get('workflow', _key('a'))
+    cache.set('workflow', _key('c'), 3)
+    assert cache.get('workflow', _key('a')) == 1
+    assert cache.get('workflow', _key('b')) is None
+    assert cache.get('workflow', _key('c')) == 3
+
+
+def test_size_cap(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=300)
+    for i in range(5):
+        cache.set('workflow', _key(i), 'x' * 100)
+    assert sum(p.stat().st_size for p in tmp_path.glob('*.json')) <= 300
+
+
+def test_writes_do_not_list_the_cache_directory(tmp_path):
+    cache = DiskCache(tmp_path, max_entries=100)
+    with mock.patch.object(DiskCache, '_scan', autospec=True, side_effect=DiskCache._scan) as scan:
+        for i in range(100):
+            cache.set('workflow', _key(i), i)
+        # Only the first write lists the directory
+        assert scan.call_count == 1
+        for path in tmp_path.glob('*.json'):
+            os.utime(path, (time.time() - 100, time.time() - 100))
+        cache.set('workflow', _key(100), 100)
+        assert scan.call_count == 2
+    # Evicted down to a tenth below the cap
+    assert len(list(tmp_path.glob('*.json'))) == 90
+    assert cache.get('workflow', _key(100)) == 100
+
+
+def test_invalidate_only_matching_workspace(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set('project_id', _key('p'), 'abc', CLOUDOS_URL, WORKSPACE_ID)
+    cache.set('project_id', _key('other-ws'), 'def', CLOUDOS_URL, 'another')
+    cache.set('workflow', _key('w'), {}, CLOUDOS_URL, WORKSPACE_ID)
+    cache.invalidate('project_id', CLOUDOS_URL, WORKSPACE_ID)
+    assert cache.get('project_id', _key('p')) is None
+    assert cache.get('project_id', _key('other-ws')) == 'def'
+    assert cache.get('workflow', _key('w')) == {}
+
+
+def test_disabled_cache(tmp_path):
+    cache = DiskCache(tmp_path)
+    set_cache_enabled(False)
+    try:
+        cache.set('project_id', _key('p'), 'abc')
+        assert cache.get('project_id', _key('p')) is None
+    finally:
+        set_cache_enabled(True)
+
+
+@responses.activate
+def test_project_id_cached_and_invalidated_on_create():
+    responses.add(responses.GET,
+                  f'{CLOUDOS_URL}/api/v2/projects?teamId={WORKSPACE_ID}&search={PROJECT_NAME}',
+                  body=json.dumps({'projects': [{'_id': 'p1', 'name': PROJECT_NAME}]}), status=200)
+    responses.add(responses.POST, f'{CLOUDOS_URL}/api/v1/projects?teamId={WORKSPACE_ID}',
+                  body=json.dumps({'_id': 'p2'}), status=200)
+    cl = Cloudos(CLOUDOS_URL, APIKEY, None)
+    assert cl.get_project_id_from_name(WORKSPACE_ID, PROJECT_NAME) == 'p1'
+    assert cl.get_project_id_from_name(WORKSPACE_ID, PROJECT_NAME) == 'p1'
+    assert len(responses.calls) == 1
+    cl.create_project(WORKSPACE_ID, 'new-project')
+    assert cl.get_project_id_from_name(WORKSPACE_ID, PROJECT_NAME) == 'p1'
+    assert len(responses.calls) == 3
+
+
+def test_cli_cache_clear():
+    get_cache().set('project_id', _key('p'), 'abc')
+    get_cache().set('workflow', _key('w'), {})
+    runner = CliRunner()
+    result = runner.invoke(run_cloudos_cli, ['cache', 'clear', '--resource', 'workflow'])
+    assert result.exit_code == 0
+    assert 'Removed 1 cached entries' in result.output
+    result = runner.invoke(run_cloudos_cli, ['cache', 'clear'])
+    assert 'Removed 1 cached entries' in result.output
+
+
+def test_cli_no_cache_flag():
+    runner = CliRunner()
+    runner.invoke(run_cloudos_cli, ['cache', 'clear'])
+    assert is_cache_enabled()
+    runner.invoke(run_cloudos_cli, ['cache', 'clear', '--no-cache'])
+    assert not is_cache_enabled()
+    set_cache_enabled(True)
+    runner.invoke(run_cloudos_cli, ['--no-cache', 'cache', 'clear'])
+    assert not is_cache_enabled()
+    set_cache_enabled(True)
+
+
+def test_cli_keeps_the_cache_disabled_by_environment(monkeypatch):
+    monkeypatch.setenv('CLOUDOS_NO_CACHE', '1')
+    assert not is_cache_enabled()
+    CliRunner().invoke(run_cloudos_cli, ['cache', 'clear'])
+    # Without --no-cache, the flag does not override CLOUDOS_NO_CACHE
+    assert not is_cache_enabled()
@@ -0,0 +1,47 @@
+"""Pytests for cloudos_cli.utils.concurrency"""
+import time
+import pytest
+from cloudos_cli.utils.concurrency import run_lookups, raise_lookup_errors
+from cloudos_cli.utils.errors import LookupsFailedException
+
+
+def _slow(value, delay=0.2):
+    def lookup():
+        time.sleep(delay)
+        return value
+    return lookup
+
+
+def _fail(msg):
+    def lookup():
+        raise ValueError(msg)
+    return lookup
+
+
+def test_run_lookups_concurrently():
+    start = time.perf_counter()
+    results, errors, timings = run_lookups({'a': _slow(1), 'b': _slow(2), 'c': _slow(3)})
+    elapsed = time.perf_counter() - start
+    assert results == {'a': 1, 'b': 2, 'c': 3}
+    assert errors == {}
+    assert set(timings) == {'a', 'b', 'c'}
+    assert elapsed < 0.5
+
+
+def test_run_lookups_collects_errors():
+    results, errors, _ = run_lookups({'ok': _slow(1, 0), 'bad': _fail('boom')})
+    assert results == {'ok': 1}
+    assert isinstance(errors['bad'], ValueError)
+
+
+def test_raise_lookup_errors():
+    _, errors, _ = run_lookups({'a': _fail('first'), 'b': _fail('second'), 'c': _slow(1, 0)})
+    # a single needed failure is raised unchanged
+    with pytest.raises(ValueError, match='first'):
+        raise_lookup_errors(errors, required=['a', 'c'])
+    # several failures are aggregated
+    with pytest.raises(LookupsFailedException) as e:
+        raise_lookup_errors(errors)
+    assert 'first' in str(e.value) and 'second' in str(e.value)
+    # failures of lookups that are not needed are ignored
+    raise_lookup_errors(errors, required=['c'])
@@ -0,0 +1,44 @@
+"""Pytests for the bounded concurrent crawl of folder trees"""
+import pytest
+from cloudos_cli.utils.crawl import walk_tree
+
+TREE = {'': ['a', 'b', 'f.txt'], 'a': ['c', 'g.txt'], 'a/c': ['h.txt'], 'b': []}
+
+
+def _children(names):
+    return ((name, name, None if name.endswith('.txt') else name) for name in names)
+
+
+def _walk(tree, **kwargs):
+    def list_folder(folder_path, handle):
+        return tree[folder_path]
+    return [(path, depth) for path, _, depth in walk_tree('', list_folder, _children,
+                                                          max_workers=2, **kwargs)]
+
+
+def test_walk_tree_is_breadth_first_and_bounded():
+    entries = _walk(TREE)
+    assert sorted(entries) == sorted([('a', 1), ('b', 1), ('f.txt', 1), ('a/c', 2),
+                                      ('a/g.txt', 2), ('a/c/h.txt', 3)])
+    assert [depth for _, depth in entries] == sorted(depth for _, depth in entries)
+    assert _walk(TREE, max_depth=1) == [('a', 1), ('b', 1), ('f.txt', 1)]
+    assert ('a/c', 2) not in _walk(TREE, exclude=lambda path: path == 'a')
+
+
+def test_walk_tree_errors():
+    def list_folder(folder_path, handle):
+        if folder_path == 'a':
+            raise ConnectionError('reset')
+        return TREE[folder_path]
+    errors = []
+    entries = list(walk_tree('', list_folder, _children, on_error=lambda *e: errors.append(e)))
+    assert 'b' in [path for path, _, _ in entries]
+    assert [path for path, _ in errors] == ['a']
+    with pytest.raises(ConnectionError):
+        list(walk_tree('', list_folder, _children))
+
+    def broken_root(folder_path, handle):
+        raise ConnectionError('reset')
+    # The crawled folder itself failing is always raised
+    with pytest.raises(ConnectionError):
+        list(walk_tree('', broken_root, _children, on_error=lambda *e: errors.append(e)))
@@ -0,0 +1,66 @@
+"""Pytests for the per-invocation File Explorer path cache"""
+import threading
+from collections import Counter
+import pytest
+from cloudos_cli.jobs.job import Job
+import cloudos_cli.utils.array_job as array_job
+
+
+class FakeDatasets:
+    """Datasets double counting the listings it serves."""
+
+    def __init__(self, project_name, calls):
+        self.project_name = project_name
+        self.calls = calls
+
+    def list_folder_content(self, path):
+        self.calls[(self.project_name, path)] += 1
+        files = [{'name': f'sample{i}.bam', '_id': f'{path}/{i}'} for i in range(50)]
+        return {'files': files, 'folders': [{'name': 'Downloads', '_id': 'downloads-id'}]}
+
+    def list_project_content(self):
+        self.calls[(self.project_name, '')] += 1
+        return {'folders': [{'name': 'Data', '_id': 'data-id'}]}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = Counter()
+    projects = Counter()
+    lock = threading.Lock()
+
+    def fake_generate(cloudos_url, apikey, workspace_id, project_name, verify_ssl):
+        with lock:
+            projects[project_name] += 1
+        return FakeDatasets(project_name, calls)
+    monkeypatch.setattr(array_job, 'generate_datasets_for_project', fake_generate)
+    calls.projects = projects
+    return calls
+
+
+def test_docker_parameters_share_project_lookups_and_listings(calls):
+    job = Job('https://cloudos.example', 'key', None, 'ws', 'project', 'workflow',
+              project_id='p', workflow_id='w')
+    parameter = tuple(f'--in{i}=project/Data/batch{i % 2}/sample{i}.bam' for i in range(50))
+    parameter += ('--reads=other/Data/Downloads/*.bam', '--label=text')
+    params = job.convert_nextflow_to_json(
+        None, None, parameter, None, None, False, [], None, None, None, 'p', 'w', 'job',
+        False, True, True, None, None, None, 'c5.xlarge', 500, 'aws', None, 'docker', None,
+        'Standard_D4as_v4', 100, False, 30.0, False, False, False,
+        command={'command': 'echo'}, cpus=1, memory=4)['parameters']
+    assert params[0]['dataItem']['item'] == 'Data/batch0/0'
+    assert params[49]['dataItem']['item'] == 'Data/batch1/49'
+    assert params[50]['folder'] == 'downloads-id'
+    assert params[51]['textValue'] == 'text'
+    assert calls.projects == {'project': 1, 'other': 1}
+    assert dict(calls) == {('project', 'Data/batch0'): 1, ('project', 'Data/batch1'): 1,
+                           ('other', 'Data'): 1}
+
+
+def test_missing_file_is_reported(calls):
+    resolver = array_job.PathResolver('https://cloudos.example', 'key', 'ws', True)
+    with pytest.raises(ValueError, match="File 'missing.bam' not found"):
+        array_job.get_file_or_folder_id(None, None, None, 'project', True, 'Data', 'missing.bam',
+                                        resolver=resolver)
+    assert resolver.get_id('project', 'Data', '', is_file=False) == 'data-id'
+    assert calls[('project', 'Data')] == 1
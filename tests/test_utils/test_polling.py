@@ -0,0 +1,60 @@
+"""Pytests for the shared polling schedule"""
+from unittest import mock
+import pytest
+from cloudos_cli.utils.polling import PollSchedule
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with mock.patch('cloudos_cli.utils.polling.time', clock):
+        yield clock
+
+
+def _delays(schedule, statuses):
+    return [round(schedule.wait(status), 3) for status in statuses]
+
+
+def test_fast_while_initialising_then_back_off_while_running(clock):
+    schedule = PollSchedule(30, jitter=0)
+    assert _delays(schedule, ['initializing', 'Initializing', 'running', 'running', 'running',
+                              'running', 'running', 'running']) == [10, 10, 30, 45, 67.5, 101.25,
+                                                                    120, 120]
+    # A status change polls at the base interval again
+    assert _delays(schedule, ['aborting', 'running']) == [10, 30]
+
+
+def test_deadline_caps_every_delay(clock):
+    schedule = PollSchedule(30, timeout=50, jitter=0)
+    assert _delays(schedule, ['running', 'running']) == [30, 20]
+    assert schedule.expired()
+    assert schedule.wait('running') == 0
+
+
+def test_expected_duration_polls_at_the_predicted_end(clock):
+    schedule = PollSchedule(60, jitter=0, expected_duration=200)
+    assert _delays(schedule, ['running'] * 6) == [60, 90, 50, 60, 60, 60]
+
+
+def test_jitter_stays_within_bounds(clock):
+    schedule = PollSchedule(100, jitter=0.1, backoff=1)
+    delays = _delays(schedule, ['running'] * 200)
+    assert all(90 <= d <= 110 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_small_intervals():
+    schedule = PollSchedule(0.01, timeout=0.05)
+    assert schedule.min_interval == 0.01
+    assert schedule.next_delay('initializing') <= 0.05
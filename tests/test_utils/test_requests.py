@@ -0,0 +1,95 @@
+"""Pytests for the pooled sessions in cloudos_cli.utils.requests"""
+import threading
+import pytest
+import responses
+from cloudos_cli.utils.requests import (get_session, close_sessions, configure_sessions,
+                                        retry_requests_get, retry_requests_delete, _env_pool_size)
+
+CLOUDOS_URL = 'http://cloudos.lifebit.ai'
+
+
+def test_get_session_reuses_session_per_origin():
+    """Calls to the same host share one session, whatever the path."""
+    close_sessions()
+    s1 = get_session(f'{CLOUDOS_URL}/api/v1/jobs/1')
+    s2 = get_session(f'{CLOUDOS_URL}/api/v2/projects?teamId=1')
+    assert s1 is s2
+
+
+def test_get_session_keyed_by_verify_and_host():
+    """Different SSL settings or hosts get separate sessions."""
+    close_sessions()
+    s1 = get_session(f'{CLOUDOS_URL}/api', verify=True)
+    s2 = get_session(f'{CLOUDOS_URL}/api', verify=False)
+    s3 = get_session('http://other.lifebit.ai/api', verify=True)
+    assert s1 is not s2
+    assert s1 is not s3
+
+
+def test_get_session_keyed_by_retry_strategy():
+    """Sessions with another backoff or retried methods are not shared."""
+    close_sessions()
+    default = get_session(f'{CLOUDOS_URL}/api')
+    backoff = get_session(f'{CLOUDOS_URL}/api', total=3, backoff_factor=1, allowed_methods=['GET'])
+    assert backoff is not default
+    retries = backoff.get_adapter(CLOUDOS_URL).max_retries
+    assert (retries.total, retries.backoff_factor, retries.allowed_methods) == (3, 1, ['GET'])
+    assert get_session(f'{CLOUDOS_URL}/other', total=3, backoff_factor=1, allowed_methods=['GET']) is backoff
+
+
+def test_get_session_is_thread_safe():
+    """Concurrent callers end up with a single shared session."""
+    close_sessions()
+    sessions = []
+
+    def worker():
+        sessions.append(get_session(f'{CLOUDOS_URL}/api'))
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_close_sessions_creates_new_session():
+    s1 = get_session(f'{CLOUDOS_URL}/api')
+    close_sessions()
+    s2 = get_session(f'{CLOUDOS_URL}/api')
+    assert s1 is not s2
+
+
+def test_configure_sessions_disables_keep_alive():
+    configure_sessions(keep_alive=False)
+    try:
+        assert get_session(f'{CLOUDOS_URL}/api').headers['Connection'] == 'close'
+    finally:
+        configure_sessions(keep_alive=True)
+    assert get_session(f'{CLOUDOS_URL}/api').headers.get('Connection') != 'close'
+
+
+@responses.activate
+def test_pooled_session_does_not_keep_cookies():
+    """Cookies from one response are not sent with the next request."""
+    close_sessions()
+    responses.add(responses.GET, f'{CLOUDOS_URL}/login', headers={'Set-Cookie': 'sid=abc; Path=/'}, status=200)
+    responses.add(responses.GET, f'{CLOUDOS_URL}/next', status=200)
+    retry_requests_get(f'{CLOUDOS_URL}/login')
+    retry_requests_get(f'{CLOUDOS_URL}/next')
+    assert 'Cookie' not in responses.calls[1].request.headers
+
+
+@responses.activate
+def test_retry_requests_delete_uses_pooled_session():
+    responses.add(responses.DELETE, f'{CLOUDOS_URL}/api/v1/item', status=204)
+    r = retry_requests_delete(f'{CLOUDOS_URL}/api/v1/item')
+    assert r.status_code == 204
+
+
+@pytest.mark.parametrize('value', ['lots', '0', '-4', ''])
+def test_invalid_pool_sizes_fall_back_to_the_default(monkeypatch, value):
+    monkeypatch.setenv('CLOUDOS_HTTP_POOL_MAXSIZE', value)
+    with pytest.warns(UserWarning, match='CLOUDOS_HTTP_POOL_MAXSIZE'):
+        assert _env_pool_size('CLOUDOS_HTTP_POOL_MAXSIZE', 10) == 10
+    monkeypatch.setenv('CLOUDOS_HTTP_POOL_MAXSIZE', '32')
+    assert _env_pool_size('CLOUDOS_HTTP_POOL_MAXSIZE', 10) == 32